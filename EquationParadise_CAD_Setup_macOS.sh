@@ -136,7 +136,7 @@ fi
 
 # Install PythonOCC
 print_status "Installing PythonOCC-Core (this may take several minutes)..."
-"$CONDA_EXE" install -n "$ENV_NAME" -c conda-forge pythonocc-core requests pillow -y -q
+"$CONDA_EXE" install -n "$ENV_NAME" -c conda-forge pythonocc-core requests pillow numpy scipy -y -q
 print_success "PythonOCC-Core installed"
 
 # ============================================================
@@ -185,6 +185,20 @@ SCRIPTS_TO_DOWNLOAD=(
     "generate_lap_joint_flange.py"
     "generate_pipe.py"
     "flow_calculator_enhanced.py"
+    "batch_engine.py"
+    "cadgen_cli.py"
+    "step_cache.py"
+    "step_assembly.py"
+    "bolt_pattern.py"
+    "shape_templates.py"
+    "step_writer.py"
+    "standards_catalog.py"
+    "nps_key.py"
+    "option_model.py"
+    "steel_shape_index.py"
+    "standards_validator.py"
+    "pipe_network.py"
+    "pipe_data_complete.py"
     "CAD_GENERATOR_USER_GUIDE.md"
     "cadgen.png"
 )
@@ -332,6 +346,13 @@ LAUNCHER_SCRIPT="$INSTALL_DIR/cadgen"
 cat > "$LAUNCHER_SCRIPT" << EOF
 #!/bin/bash
 # EquationParadise CAD Generator launcher
+# "cadgen batch <manifest>" and "cadgen validate" run headless, anything
+# else opens the GUI
+case "\$1" in
+    batch|validate)
+        exec "$PYTHON_EXE" "$SCRIPTS_DIR/cadgen_cli.py" "\$@"
+        ;;
+esac
 "$PYTHON_EXE" "$GUI_SCRIPT" "\$@"
 EOF
 chmod +x "$LAUNCHER_SCRIPT"
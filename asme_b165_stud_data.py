@@ -4,6 +4,8 @@ All dimensions for standard ASME B16.5 Raised Face flanges
 Diameter in inches, length in millimeters
 """
 
+from nps_key import sorted_keys
+
 # ASME B16.5 Class 150 RF Stud Dimensions
 B165_CLASS_150_STUDS = {
     '1/2': {
@@ -1238,7 +1240,7 @@ def list_b165_sizes(pressure_class):
         pressure_class (int): Pressure class (150, 300, 400, 600, 900, 1500, 2500)
     
     Returns:
-        list: Available NPS sizes sorted
+        tuple: Available NPS sizes sorted (cached - the same tuple every call)
     """
     class_map = {
         150: B165_CLASS_150_STUDS,
@@ -1251,25 +1253,8 @@ def list_b165_sizes(pressure_class):
     
     stud_dict = class_map.get(pressure_class)
     if stud_dict:
-        # Custom sort for fractional NPS
-        def nps_to_float(nps_str):
-            if '-' in nps_str and '/' in nps_str:
-                # Handle '1-1/2' format
-                parts = nps_str.split('-')
-                whole = float(parts[0])
-                frac_parts = parts[1].split('/')
-                frac = float(frac_parts[0]) / float(frac_parts[1])
-                return whole + frac
-            elif '/' in nps_str:
-                # Handle '1/2' format
-                parts = nps_str.split('/')
-                return float(parts[0]) / float(parts[1])
-            else:
-                # Handle '1', '2', etc.
-                return float(nps_str)
-        
-        return sorted(stud_dict.keys(), key=nps_to_float)
-    return []
+        return sorted_keys(stud_dict)
+    return ()
 
 
 # Example usage and testing
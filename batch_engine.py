@@ -0,0 +1,412 @@
+"""
+Batch Generation Engine
+Runs lists of generation jobs across a pool of worker processes.
+
+Each worker is a separate Python interpreter with its own OCC session, so
+generators that are independent of each other (pipe joints, fittings, the
+parts of a flange connection) build in parallel - one worker per CPU core.
+
+A job is a plain dict so it can be pickled to the workers:
+    {
+        'label':       'Pipe 4in Sch40 #01',         # shown in progress/errors
+        'module':      'generate_pipe',              # generator module name
+        'function':    'generate_pipe',              # function inside module
+        'kwargs':      {'nps': 4.0, ...},            # keyword arguments
+        'output_file': '/path/Pipe_4in_Sch40.step',  # expected output (optional)
+        'cache':       True,                         # use the STEP cache (optional)
+        'copies':      ['/path/..._02.step', ...],   # duplicates of the output (optional)
+        'assembly_file': '/path/..._x4.step',        # instanced assembly (optional)
+        'id':          'conn-flange-a',              # name other jobs refer to (optional)
+        'inputs':      {'flange_a_file': 'conn-flange-a', ...},  # (optional)
+    }
+
+'inputs' maps a keyword argument to the id of another job. The job waits
+until those jobs finish and is called with the files they produced; if one
+fails the job is skipped. Independent jobs still run side by side.
+
+merge_duplicate_jobs folds jobs that only differ by output path into one
+build plus file copies (or one shared-instance assembly).
+
+Jobs that write to an explicit output_file / output_dir go through the
+step_cache: identical parameters on the same generator version are served
+from disk instead of being rebuilt.
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import importlib
+import traceback
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+import step_cache
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def make_job(label, module, function, kwargs=None, output_file=None, job_id=None, inputs=None):
+    """
+    Build a generation job dict.
+
+    Args:
+        label: Human readable description used in progress and error messages
+        module: Generator module name (e.g., 'generate_pipe')
+        function: Function name in the module (e.g., 'generate_pipe')
+        kwargs: Keyword arguments passed to the generator function
+        output_file: Path the job is expected to write (optional)
+        job_id: Id other jobs use to take this job's file as input (optional)
+        inputs: {kwarg name: job id} - files from other jobs (optional)
+
+    Returns:
+        dict: Job description
+    """
+    job = {
+        'label': label,
+        'module': module,
+        'function': function,
+        'kwargs': dict(kwargs or {}),
+        'output_file': str(output_file) if output_file else None,
+    }
+    if job_id:
+        job['id'] = job_id
+    if inputs:
+        job['inputs'] = dict(inputs)
+    return job
+
+
+def generator_available(module):
+    """True if the generator module ships with this install (next to the engine)."""
+    return os.path.isfile(os.path.join(SCRIPT_DIR, f"{module}.py"))
+
+
+def merge_duplicate_jobs(jobs, instance_mode='files'):
+    """
+    Fold jobs that build identical geometry into a single build.
+
+    Jobs match when module, function, inputs and every non-output parameter
+    are the same. The first job is kept and builds the part (and answers to
+    the ids of the jobs folded into it); for the others:
+      - output_file jobs become 'copies' of the first job's file
+        (instance_mode='files') or instances in one STEP assembly
+        (instance_mode='assembly', see step_assembly.write_instanced_assembly)
+      - output_dir jobs writing to the same folder would write the same
+        file, so they are dropped
+
+    Args:
+        jobs: List of job dicts
+        instance_mode: 'files' or 'assembly'
+
+    Returns:
+        list: Merged jobs, in first-seen order
+    """
+    merged = []
+    groups = {}
+    for job in jobs:
+        kwargs = job.get('kwargs', {})
+        params = {k: v for k, v in kwargs.items() if k not in step_cache.OUTPUT_PARAMS}
+        output_dir = None if kwargs.get('output_file') else (kwargs.get('output_dir') or kwargs.get('output_path'))
+        key = (job['module'], job['function'],
+               json.dumps(step_cache.normalize_params(params), sort_keys=True),
+               json.dumps(job.get('inputs', {}), sort_keys=True), output_dir)
+
+        primary = groups.get(key)
+        if primary is None:
+            primary = dict(job, copies=[])
+            groups[key] = primary
+            merged.append(primary)
+            continue
+        if job.get('id'):
+            primary.setdefault('aliases', []).append(job['id'])
+        if kwargs.get('output_file') and kwargs['output_file'] != primary['kwargs'].get('output_file'):
+            primary['copies'].append(kwargs['output_file'])
+
+    for job in merged:
+        count = len(job['copies']) + 1
+        if count > 1:
+            job['label'] = f"{job['label']} (x{count})"
+            if instance_mode == 'assembly':
+                stem, ext = os.path.splitext(job['kwargs']['output_file'])
+                job['assembly_file'] = f"{stem}_x{count}_Assembly{ext or '.step'}"
+                job['instances'] = count
+                job['copies'] = []
+    return merged
+
+
+def _write_copies(job, result):
+    """Duplicate a finished job's file to its copies / instanced assembly."""
+    produced = result['file']
+    if job.get('assembly_file'):
+        import step_assembly
+        result['file'] = step_assembly.write_instanced_assembly(
+            produced, job['instances'], job['assembly_file']
+        )
+        # Jobs taking this part as an input still need the single part file
+        if job.get('keep_part'):
+            result['part_file'] = produced
+        else:
+            os.remove(produced)
+        return
+
+    result['copies'] = []
+    for copy_path in job.get('copies', []):
+        os.makedirs(os.path.dirname(os.path.abspath(copy_path)), exist_ok=True)
+        if os.path.exists(copy_path):
+            os.remove(copy_path)
+        shutil.copyfile(produced, copy_path)
+        result['copies'].append(copy_path)
+
+
+def default_worker_count():
+    """One worker per CPU core."""
+    return max(1, os.cpu_count() or 1)
+
+
+def run_job(job):
+    """
+    Execute a single job. Runs inside a worker process (or in-process for
+    max_workers=1), so it must stay a module-level function.
+
+    Returns:
+        dict with 'label', 'success', 'file', 'error', 'elapsed'
+        ('cached': True when served from the STEP cache)
+    """
+    if SCRIPT_DIR not in sys.path:
+        sys.path.insert(0, SCRIPT_DIR)
+
+    start = time.perf_counter()
+    result = {
+        'label': job.get('label', job['module']),
+        'success': False,
+        'file': job.get('output_file'),
+        'error': None,
+        'elapsed': 0.0,
+    }
+
+    kwargs = job.get('kwargs', {})
+    output_file = kwargs.get('output_file')
+    output_dir = kwargs.get('output_dir') or kwargs.get('output_path')
+    cache_key = None
+
+    try:
+        # Only jobs with an explicit destination can be served from the cache
+        if job.get('cache', True) and (output_file or output_dir):
+            cache_key = step_cache.make_key(job['module'], job['function'], kwargs)
+            cached_file = step_cache.lookup(cache_key, output_file=output_file, output_dir=output_dir)
+            if cached_file:
+                result.update(success=True, file=cached_file, cached=True)
+                if job.get('copies') or job.get('assembly_file'):
+                    _write_copies(job, result)
+                result['elapsed'] = time.perf_counter() - start
+                return result
+
+        # Older versions placed cache hits as hard links to the cache entry -
+        # break such a link before the generator rewrites the file in place
+        if output_file and os.path.isfile(output_file) and os.stat(output_file).st_nlink > 1:
+            os.unlink(output_file)
+
+        module = importlib.import_module(job['module'])
+        func = getattr(module, job['function'])
+        value = func(**kwargs)
+
+        # Generators report success in a few different ways:
+        #   file path string, (success, message) tuple, or {'success', 'message'} dict
+        if isinstance(value, tuple) and len(value) == 2 and isinstance(value[0], bool):
+            result['success'], message = value
+            if not result['success']:
+                result['error'] = str(message)
+        elif isinstance(value, dict) and 'success' in value:
+            result['success'] = bool(value['success'])
+            if not result['success']:
+                result['error'] = str(value.get('message', 'Generation failed'))
+            elif value.get('filepath'):
+                result['file'] = str(value['filepath'])
+        else:
+            result['success'] = True
+            if isinstance(value, str) and value.lower().endswith(('.step', '.stp')):
+                result['file'] = value
+
+        # Some generators return their output path even when the STEP write
+        # failed - a job only succeeds once the file is on disk
+        if result['success'] and result['file'] and not os.path.isfile(result['file']):
+            result['success'] = False
+            result['error'] = f"output not written: {result['file']}"
+
+        if cache_key and result['success'] and result['file']:
+            step_cache.store(cache_key, job['module'], job['function'], kwargs, result['file'])
+
+        if result['success'] and result['file'] and (job.get('copies') or job.get('assembly_file')):
+            _write_copies(job, result)
+    except Exception as e:
+        result['success'] = False
+        result['error'] = f"{e}"
+        result['traceback'] = traceback.format_exc()
+
+    result['elapsed'] = time.perf_counter() - start
+    return result
+
+
+def _failed_result(job, error):
+    return {
+        'label': job.get('label', job['module']),
+        'success': False,
+        'file': job.get('output_file'),
+        'error': error,
+        'elapsed': 0.0,
+    }
+
+
+def run_batch(jobs, max_workers=None, progress_callback=None, use_cache=True):
+    """
+    Run a list of jobs in parallel worker processes.
+
+    Jobs with 'inputs' are started as soon as the jobs they take files from
+    have finished; everything else starts immediately.
+
+    Args:
+        jobs: List of job dicts (see make_job)
+        max_workers: Number of worker processes (default: one per CPU core).
+                     1 runs everything in the calling process.
+        progress_callback: Optional function(done, total, result) called as
+                           each job finishes. Called from the thread running
+                           run_batch - GUI callers must marshal to their own
+                           main loop (e.g. Tk root.after).
+        use_cache: False forces every job to rebuild (ignores the STEP cache)
+
+    Returns:
+        dict with:
+            'generated_files': list of output paths from successful jobs
+            'errors': list of "label: message" strings for failed jobs
+            'results': list of per-job result dicts, in job order
+            'elapsed': total wall-clock seconds
+    """
+    start = time.perf_counter()
+    jobs = [dict(job) for job in jobs]
+    if not use_cache:
+        for job in jobs:
+            job['cache'] = False
+    total = len(jobs)
+    results = [None] * total
+
+    if max_workers is None:
+        max_workers = default_worker_count()
+    max_workers = max(1, min(max_workers, total)) if total else 1
+
+    # Dependency graph from 'inputs' (ids of merged jobs resolve to the job that builds them)
+    id_index = {}
+    for index, job in enumerate(jobs):
+        for job_id in [job.get('id')] + job.get('aliases', []):
+            if job_id:
+                id_index[job_id] = index
+    requires = {}
+    dependents = {index: [] for index in range(total)}
+    for index, job in enumerate(jobs):
+        requires[index] = set()
+        for dep_id in job.get('inputs', {}).values():
+            if dep_id in id_index:
+                requires[index].add(id_index[dep_id])
+                dependents[id_index[dep_id]].append(index)
+                jobs[id_index[dep_id]]['keep_part'] = True
+    waiting = {index: set(deps) for index, deps in requires.items()}
+
+    done = 0
+    queue = deque()
+    futures = {}
+    executor = None
+
+    def _finish(index, result):
+        nonlocal done
+        results[index] = result
+        done += 1
+        if progress_callback:
+            try:
+                progress_callback(done, total, result)
+            except Exception:
+                pass
+        for dependent in dependents[index]:
+            waiting[dependent].discard(index)
+            if not waiting[dependent] and results[dependent] is None:
+                _launch(dependent)
+
+    def _launch(index):
+        job = jobs[index]
+        missing = [dep_id for dep_id in job.get('inputs', {}).values() if dep_id not in id_index]
+        if missing:
+            _finish(index, _failed_result(job, f"Unknown input job: {', '.join(missing)}"))
+            return
+        failed = [jobs[dep]['label'] for dep in requires[index] if not results[dep]['success']]
+        if failed:
+            _finish(index, _failed_result(job, f"Skipped - input failed: {', '.join(failed)}"))
+            return
+        if job.get('inputs'):
+            kwargs = dict(job['kwargs'])
+            for name, dep_id in job['inputs'].items():
+                dep_result = results[id_index[dep_id]]
+                kwargs[name] = dep_result.get('part_file') or dep_result['file']
+            # Input paths say nothing about file contents - never serve from cache
+            job = dict(job, kwargs=kwargs, cache=False)
+        if executor is None:
+            queue.append((index, job))
+        else:
+            futures[executor.submit(run_job, job)] = index
+
+    def _start_ready():
+        for index in range(total):
+            if not requires[index] and results[index] is None:
+                _launch(index)
+
+    if max_workers == 1:
+        _start_ready()
+        while queue:
+            index, job = queue.popleft()
+            _finish(index, run_job(job))
+    elif total:
+        # 'spawn' gives every worker a clean interpreter - forking a process
+        # that owns a Tk root or a live OCC session is not safe
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=context) as executor:
+            _start_ready()
+            while futures:
+                finished, _ = wait(list(futures), return_when=FIRST_COMPLETED)
+                for future in finished:
+                    index = futures.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        # Worker crashed (e.g. OCC segfault takes the process down)
+                        result = _failed_result(jobs[index], f"Worker process failed: {e}")
+                    _finish(index, result)
+
+    # Anything never started is part of a dependency cycle
+    for index in range(total):
+        if results[index] is None:
+            results[index] = _failed_result(jobs[index], "Skipped - circular inputs")
+
+    generated_files = []
+    for r in results:
+        if r['success'] and r['file']:
+            generated_files.append(r['file'])
+            generated_files.extend(r.get('copies', []))
+    errors = [f"{r['label']}: {r['error']}" for r in results if not r['success']]
+
+    return {
+        'generated_files': generated_files,
+        'errors': errors,
+        'results': results,
+        'elapsed': time.perf_counter() - start,
+    }
+
+
+if __name__ == "__main__":
+    # Smoke test without OCC: time a few stdlib calls through the pool
+    test_jobs = [
+        make_job(f"json {n}", 'json', 'dumps', {'obj': {'n': n}}) for n in range(8)
+    ]
+    summary = run_batch(
+        test_jobs,
+        progress_callback=lambda done, total, r: print(f"[{done}/{total}] {r['label']} ({r['elapsed']*1000:.1f} ms)")
+    )
+    print(f"\n{len(summary['results'])} jobs, {len(summary['errors'])} errors, {summary['elapsed']:.2f}s")
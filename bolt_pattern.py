@@ -0,0 +1,126 @@
+"""
+Bolt Hole Pattern - pythonocc
+Shared bolt-circle hole cutting for the flange and gasket generators.
+
+All hole cylinders are handed to one multi-tool boolean (BRepAlgoAPI_Cut
+with SetArguments/SetTools) instead of cutting one hole per boolean pass.
+A 24-32 hole B16.47 or API 6BX flange then costs a single intersection of
+the flange body instead of 24-32 passes over an ever more complex solid.
+"""
+
+import math
+from OCC.Core.gp import gp_Pnt, gp_Dir, gp_Ax2
+from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakeCylinder
+from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Cut
+from OCC.Core.TopTools import TopTools_ListOfShape
+from shape_templates import template, translation, place
+
+# Let the boolean run its intersection stages on multiple threads
+RUN_PARALLEL = True
+
+
+def bolt_hole_positions(bolt_circle_radius, num_bolts, start_angle=0.0):
+    """
+    (x, y) centers of holes equally spaced on the bolt circle.
+
+    Args:
+        bolt_circle_radius: Bolt circle radius
+        num_bolts: Number of holes
+        start_angle: Angle of the first hole in radians (0 = on +X axis)
+    """
+    return [
+        (bolt_circle_radius * math.cos(start_angle + 2.0 * math.pi * i / num_bolts),
+         bolt_circle_radius * math.sin(start_angle + 2.0 * math.pi * i / num_bolts))
+        for i in range(num_bolts)
+    ]
+
+
+@template("bolt_hole")
+def make_hole_cylinder(hole_diameter, height):
+    """Bolt hole cylinder on the Z axis from z=0 (cached per size, shared)."""
+    return BRepPrimAPI_MakeCylinder(gp_Ax2(gp_Pnt(0, 0, 0), gp_Dir(0, 0, 1)), hole_diameter / 2.0, height).Shape()
+
+
+def make_bolt_hole_tools(bolt_circle_radius, num_bolts, hole_diameter, z_bottom, height, start_angle=0.0):
+    """
+    Hole cylinders for a bolt circle, parallel to Z.
+    One cylinder is built; every hole is a located copy of it.
+
+    Args:
+        bolt_circle_radius: Bolt circle radius
+        num_bolts: Number of holes
+        hole_diameter: Bolt hole diameter
+        z_bottom: Z where the cylinders start (below the part)
+        height: Cylinder height (long enough to pass through the part)
+        start_angle: Angle of the first hole in radians
+
+    Returns:
+        list of TopoDS_Shape
+    """
+    hole = make_hole_cylinder(hole_diameter, height)
+    return [
+        place(hole, translation(x, y, z_bottom))
+        for x, y in bolt_hole_positions(bolt_circle_radius, num_bolts, start_angle)
+    ]
+
+
+def cut_tools(shape, tools, parallel=None):
+    """
+    Subtract all tools from shape in a single boolean operation.
+
+    Falls back to one cut per tool if the combined boolean fails, so a
+    difficult pattern still produces a part.
+
+    Args:
+        shape: Part to cut
+        tools: List of tool shapes (need not be disjoint)
+        parallel: Run the boolean multi-threaded (default RUN_PARALLEL)
+
+    Returns:
+        TopoDS_Shape
+    """
+    if not tools:
+        return shape
+
+    arguments = TopTools_ListOfShape()
+    arguments.Append(shape)
+    tool_list = TopTools_ListOfShape()
+    for tool in tools:
+        tool_list.Append(tool)
+
+    cut = BRepAlgoAPI_Cut()
+    cut.SetArguments(arguments)
+    cut.SetTools(tool_list)
+    cut.SetRunParallel(RUN_PARALLEL if parallel is None else parallel)
+    cut.Build()
+
+    if cut.IsDone() and not cut.HasErrors():
+        return cut.Shape()
+
+    print("Warning: single-pass bolt hole cut failed, cutting holes one at a time")
+    result = shape
+    for tool in tools:
+        result = BRepAlgoAPI_Cut(result, tool).Shape()
+    return result
+
+
+def cut_bolt_pattern(shape, bolt_circle_radius, num_bolts, hole_diameter, z_bottom, height,
+                     start_angle=0.0, parallel=None):
+    """
+    Cut a full bolt circle through a part with one boolean.
+
+    Args:
+        shape: Flange or gasket body
+        bolt_circle_radius: Bolt circle radius
+        num_bolts: Number of holes
+        hole_diameter: Bolt hole diameter
+        z_bottom: Z where the hole cylinders start (below the part)
+        height: Hole cylinder height (through the part)
+        start_angle: Angle of the first hole in radians (0 = on +X axis)
+        parallel: Run the boolean multi-threaded (default RUN_PARALLEL)
+
+    Returns:
+        TopoDS_Shape: Part with bolt holes
+    """
+    tools = make_bolt_hole_tools(bolt_circle_radius, num_bolts, hole_diameter, z_bottom, height, start_angle)
+    return cut_tools(shape, tools, parallel)
@@ -24,6 +24,11 @@ from flow_calculator_enhanced import (
     convert_flow_to_gpm, convert_pressure_to_psi
 )
 
+# Import process-pool batch engine
+from batch_engine import make_job, run_batch, merge_duplicate_jobs, default_worker_count, generator_available
+from nps_key import NPS
+import option_model
+
 # Version and Update Checking
 VERSION = "v1.3.0"
 UPDATE_CHECK_URL = "https://equationparadise.com/api/cad/version"
@@ -80,6 +85,20 @@ UPDATABLE_SCRIPTS = [
     "generate_lap_joint_flange.py",
     "generate_pipe.py",
     "flow_calculator_enhanced.py",
+    "batch_engine.py",
+    "cadgen_cli.py",
+    "step_cache.py",
+    "step_assembly.py",
+    "bolt_pattern.py",
+    "shape_templates.py",
+    "step_writer.py",
+    "standards_catalog.py",
+    "nps_key.py",
+    "option_model.py",
+    "steel_shape_index.py",
+    "standards_validator.py",
+    "pipe_network.py",
+    "pipe_data_complete.py",
     "CAD_GENERATOR_USER_GUIDE.md"
 ]
 
@@ -185,106 +204,13 @@ def check_for_updates():
     return silent_auto_update()
 
 def build_complete_flange_lookup():
-    """Build lookup table for ALL flanges: API 6BX and ASME B16.5."""
+    """Build lookup table for ALL flanges: API 6BX and ASME B16.5 / B16.47."""
     global FLANGE_STANDARDS, ALL_FLANGE_SIZES
     
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    if script_dir not in sys.path:
-        sys.path.insert(0, script_dir)
-    
     try:
-        # API 6BX flanges
-        import generate_all_flanges_test as api_gen
-        api_sizes = {}
-        for pressure, sizes_dict in api_gen.ALL_PRESSURE_CLASSES.items():
-            for size in sizes_dict.keys():
-                if size not in api_sizes:
-                    api_sizes[size] = []
-                api_sizes[size].append(pressure)
-                ALL_FLANGE_SIZES.add(size)
-        
-        # Sort API pressure classes
-        pressure_order = ["2K", "3K", "5K", "10K", "15K", "20K"]
-        for size in api_sizes:
-            api_sizes[size] = sorted(api_sizes[size], 
-                                     key=lambda x: pressure_order.index(x) if x in pressure_order else 99)
-        
-        FLANGE_STANDARDS['API_6BX'] = api_sizes
-        
-        # ASME B16.5 flanges
-        import flange_data as asme_data
-        asme_classes = {
-            '150': asme_data.CLASS_150_RF_WN,
-            '300': asme_data.CLASS_300_RF_WN,
-            '400': asme_data.CLASS_400_RF_WN,
-            '600': asme_data.CLASS_600_RF_WN,
-            '900': asme_data.CLASS_900_RF_WN,
-            '1500': asme_data.CLASS_1500_RF_WN,
-            '2500': asme_data.CLASS_2500_RF_WN,
-        }
-        
-        asme_sizes = {}
-        for pressure_class, sizes_dict in asme_classes.items():
-            for size in sizes_dict.keys():
-                if size not in asme_sizes:
-                    asme_sizes[size] = []
-                asme_sizes[size].append(pressure_class)
-                ALL_FLANGE_SIZES.add(size)
-        
-        # Sort ASME pressure classes
-        class_order = ['150', '300', '400', '600', '900', '1500', '2500']
-        for size in asme_sizes:
-            asme_sizes[size] = sorted(asme_sizes[size],
-                                     key=lambda x: class_order.index(x) if x in class_order else 99)
-        
-        FLANGE_STANDARDS['ASME_B16_5'] = asme_sizes
-        
-        # ASME B16.47 Series A flanges (26"-60")
-        b1647a_classes = {
-            '150': asme_data.B1647_SERIES_A_RF_WN,
-            '300': asme_data.B1647_SERIES_A_CLASS300_RF_WN,
-            '600': asme_data.B1647_SERIES_A_CLASS600_RF_WN,
-            '900': asme_data.B1647_SERIES_A_CLASS900_RF_WN,
-        }
-        
-        b1647a_sizes = {}
-        for pressure_class, sizes_dict in b1647a_classes.items():
-            for size in sizes_dict.keys():
-                if size not in b1647a_sizes:
-                    b1647a_sizes[size] = []
-                b1647a_sizes[size].append(pressure_class)
-                ALL_FLANGE_SIZES.add(size)
-        
-        # Sort pressure classes
-        for size in b1647a_sizes:
-            b1647a_sizes[size] = sorted(b1647a_sizes[size],
-                                        key=lambda x: class_order.index(x) if x in class_order else 99)
-        
-        FLANGE_STANDARDS['ASME_B16_47A'] = b1647a_sizes
-        
-        # ASME B16.47 Series B flanges (26"-60")
-        b1647b_classes = {
-            '150': asme_data.B1647_SERIES_B_RF_WN,
-            '300': asme_data.B1647_SERIES_B_CLASS300_RF_WN,
-            '600': asme_data.B1647_SERIES_B_CLASS600_RF_WN,
-            '900': asme_data.B1647_SERIES_B_CLASS900_RF_WN,
-        }
-        
-        b1647b_sizes = {}
-        for pressure_class, sizes_dict in b1647b_classes.items():
-            for size in sizes_dict.keys():
-                if size not in b1647b_sizes:
-                    b1647b_sizes[size] = []
-                b1647b_sizes[size].append(pressure_class)
-                ALL_FLANGE_SIZES.add(size)
-        
-        # Sort pressure classes
-        for size in b1647b_sizes:
-            b1647b_sizes[size] = sorted(b1647b_sizes[size],
-                                        key=lambda x: class_order.index(x) if x in class_order else 99)
-        
-        FLANGE_STANDARDS['ASME_B16_47B'] = b1647b_sizes
-        
+        # Every option list is precomputed once (or read from the option cache)
+        FLANGE_STANDARDS = option_model.flange_standards()
+        ALL_FLANGE_SIZES = option_model.all_flange_sizes()
     except Exception as e:
         print(f"Error loading flange data: {e}")
         FLANGE_STANDARDS = {'API_6BX': {}, 'ASME_B16_5': {}, 'ASME_B16_47A': {}, 'ASME_B16_47B': {}}
@@ -1367,51 +1293,11 @@ class CADGeneratorApp:
     
     def _get_available_classes_for_flange_type(self, flange_type):
         """Get available pressure classes for a given flange type"""
-        if flange_type in ["Weld Neck", "Blind", "Lap Joint"]:
-            return ['150', '300', '400', '600', '900', '1500', '2500']
-        elif flange_type == "Socket Weld":
-            return ['150', '300', '400', '600', '1500']  # No 900, 2500
-        elif flange_type == "Slip-On":
-            return ['150', '300', '400', '600', '900', '1500']  # No 2500
-        elif flange_type == "Threaded":
-            return ['150', '300', '400', '600', '900', '1500', '2500']
-        return []
+        return list(option_model.flange_type_classes(flange_type))
     
     def _get_available_sizes_for_flange_type(self, flange_type, pressure_class):
-        """Get available sizes for a given flange type and class"""
-        try:
-            if flange_type == "Socket Weld":
-                import socket_weld_flange_data as sw_data
-                data_dict = sw_data.SOCKET_WELD_DATA_MAP.get(pressure_class)
-                if data_dict:
-                    return list(data_dict.keys())
-            elif flange_type == "Slip-On":
-                import slip_on_flange_data as so_data
-                data_dict = so_data.SLIP_ON_DATA_MAP.get(pressure_class)
-                if data_dict:
-                    return list(data_dict.keys())
-            elif flange_type == "Threaded":
-                import threaded_flange_data as thd_data
-                data_dict = thd_data.THREADED_DATA_MAP.get(pressure_class)
-                if data_dict:
-                    return list(data_dict.keys())
-            else:  # WN, Blind - all sizes from flange_data
-                import flange_data
-                class_map = {
-                    '150': flange_data.CLASS_150_RF_WN,
-                    '300': flange_data.CLASS_300_RF_WN,
-                    '400': flange_data.CLASS_400_RF_WN,
-                    '600': flange_data.CLASS_600_RF_WN,
-                    '900': flange_data.CLASS_900_RF_WN,
-                    '1500': flange_data.CLASS_1500_RF_WN,
-                    '2500': flange_data.CLASS_2500_RF_WN
-                }
-                data_dict = class_map.get(pressure_class)
-                if data_dict:
-                    return list(data_dict.keys())
-        except Exception as e:
-            print(f"Error getting sizes: {e}")
-        return []
+        """Get available sizes for a given flange type and class (sorted)"""
+        return option_model.flange_type_sizes(flange_type, pressure_class)
     
     def _update_flange_pressures_for_type(self):
         """Update available pressure classes based on flange type selection"""
@@ -1442,8 +1328,7 @@ class CADGeneratorApp:
         flange_type = self.flange_type_var.get()
         pressure_class = self.flange_pressure_var.get()
         
-        available_sizes = self._get_available_sizes_for_flange_type(flange_type, pressure_class)
-        available_sizes_sorted = sorted(available_sizes, key=self._size_to_num)
+        available_sizes_sorted = self._get_available_sizes_for_flange_type(flange_type, pressure_class)
         
         self.flange_size_dropdown['values'] = available_sizes_sorted
         if available_sizes_sorted:
@@ -1460,7 +1345,7 @@ class CADGeneratorApp:
         """Update size dropdown based on selected standard"""
         standard = self.flange_standard_var.get()
         if standard in FLANGE_STANDARDS:
-            sizes = sorted(FLANGE_STANDARDS[standard].keys(), key=self._size_to_num)
+            sizes = option_model.flange_standard_sizes(standard)
             self.flange_size_dropdown['values'] = sizes
             if sizes:
                 self.flange_size_var.set(sizes[0])
@@ -1476,20 +1361,6 @@ class CADGeneratorApp:
             if pressures:
                 self.flange_pressure_var.set(pressures[0])
     
-    def _size_to_num(self, s):
-        """Convert size string to numeric value for sorting"""
-        s = str(s).replace("-", " ").replace("/", " ")
-        parts = s.split()
-        try:
-            if len(parts) == 1:
-                return float(parts[0])
-            elif len(parts) == 3:  # e.g. "4 1 16" -> 4.0625
-                return float(parts[0]) + float(parts[1]) / float(parts[2])
-            else:
-                return float(parts[0])
-        except:
-            return 0
-    
     def _show_fastener_options(self):
         # Selection mode
         tk.Label(
@@ -1666,60 +1537,14 @@ class CADGeneratorApp:
     def _update_fastener_sizes(self):
         """Update available sizes based on selected fastener standard."""
         fastener_type = self.fastener_type_var.get()
-        
-        # Import data modules to get available sizes
-        import sys
-        import os
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        sys.path.insert(0, script_dir)
-        
-        try:
-            if fastener_type == "B16.5 Stud":
-                from asme_b165_stud_data import B165_CLASS_150_STUDS
-                sizes = sorted(B165_CLASS_150_STUDS.keys(), key=self._nps_to_float)
-            elif fastener_type == "B16.47 Series A Stud":
-                from asme_b165_stud_data import B1647A_CLASS_150_STUDS
-                sizes = sorted(B1647A_CLASS_150_STUDS.keys(), key=self._nps_to_float)
-            elif fastener_type == "B16.47 Series B Stud":
-                from asme_b165_stud_data import B1647B_CLASS_150_STUDS
-                sizes = sorted(B1647B_CLASS_150_STUDS.keys(), key=self._nps_to_float)
-            elif fastener_type == "API 6B Stud":
-                from api_6b_stud_data import API_6B_5000_STUDS
-                sizes = sorted(API_6B_5000_STUDS.keys(), key=self._nps_to_float)
-            else:  # API 6BX Stud
-                from api_6bx_stud_data import API_6BX_10000_STUDS
-                sizes = sorted(API_6BX_10000_STUDS.keys(), key=self._nps_to_float)
-            
-            if hasattr(self, 'fastener_size_dropdown'):
-                self.fastener_size_dropdown['values'] = sizes
-                if sizes:
-                    self.fastener_size_var.set(sizes[0])
-        except Exception as e:
-            print(f"Error updating fastener sizes: {e}")
+        sizes = option_model.fastener_sizes(fastener_type)
+        if not sizes:
             # Fallback to basic sizes
-            if hasattr(self, 'fastener_size_dropdown'):
-                self.fastener_size_dropdown['values'] = ["1/2", "3/4", "1", "1-1/2", "2"]
-                self.fastener_size_var.set("1/2")
-    
-    def _nps_to_float(self, nps_str):
-        """Convert NPS string to float for sorting."""
-        try:
-            if '-' in nps_str and '/' in nps_str:
-                # Handle '1-1/2' format
-                parts = nps_str.split('-')
-                whole = float(parts[0])
-                frac_parts = parts[1].split('/')
-                frac = float(frac_parts[0]) / float(frac_parts[1])
-                return whole + frac
-            elif '/' in nps_str:
-                # Handle '1/2' format
-                parts = nps_str.split('/')
-                return float(parts[0]) / float(parts[1])
-            else:
-                # Handle '1', '2', etc.
-                return float(nps_str)
-        except:
-            return 0
+            sizes = option_model.FASTENER_FALLBACK_SIZES
+        
+        if hasattr(self, 'fastener_size_dropdown'):
+            self.fastener_size_dropdown['values'] = sizes
+            self.fastener_size_var.set(sizes[0])
     
     def _show_gasket_options(self):
         # Gasket type
@@ -1985,25 +1810,7 @@ class CADGeneratorApp:
     
     def _update_steel_sizes(self, event=None):
         """Update steel size dropdown based on selected type"""
-        shape_type = self.steel_type_var.get()
-        
-        # Common sizes for each type
-        if shape_type == "W-Beam":
-            sizes = ["W4X13", "W6X9", "W8X10", "W8X31", "W10X12", "W10X33", "W12X14", "W12X26", "W12X50",
-                    "W14X22", "W14X43", "W16X26", "W16X31", "W18X35", "W21X44", "W24X55", "W27X84", "W30X90"]
-        elif shape_type == "HSS Rectangular":
-            sizes = ["HSS4X4X1/4", "HSS4X4X3/8", "HSS6X6X1/4", "HSS6X6X3/8", "HSS8X4X1/4", "HSS8X4X3/8",
-                    "HSS8X8X1/4", "HSS8X8X3/8", "HSS8X8X1/2", "HSS10X10X1/2", "HSS12X12X1/2", "HSS16X16X5/8"]
-        elif shape_type == "HSS Round":
-            sizes = ["HSS2.375X0.188", "HSS3.500X0.250", "HSS4.500X0.250", "HSS6.625X0.312",
-                    "HSS8.625X0.322", "HSS10.000X0.500", "HSS12.750X0.500"]
-        elif shape_type == "Channel":
-            sizes = ["C3X4.1", "C4X5.4", "C6X8.2", "C8X11.5", "C10X15.3", "C12X20.7", "C15X33.9"]
-        elif shape_type == "Angle":
-            sizes = ["L2X2X1/4", "L3X3X1/4", "L3X3X3/8", "L4X4X1/4", "L4X4X3/8", "L4X4X1/2",
-                    "L6X6X3/8", "L6X6X1/2", "L8X8X1/2"]
-        else:
-            sizes = []
+        sizes = option_model.steel_sizes(self.steel_type_var.get())
         
         self.steel_size_combo['values'] = sizes
         if sizes:
@@ -2175,38 +1982,7 @@ class CADGeneratorApp:
     
     def _update_lumber_sizes(self, event=None):
         """Update lumber size dropdown based on selected type"""
-        lumber_type = self.lumber_type_var.get()
-        
-        if lumber_type == "Dimensional":
-            sizes = ["2x4", "2x6", "2x8", "2x10", "2x12", "4x4", "4x6", "4x8", "4x10", "4x12", 
-                    "6x6", "6x8", "6x10", "6x12", "8x8", "8x10", "8x12", "10x10", "10x12", "12x12"]
-        elif lumber_type == "Wall Studs":
-            # Wall studs are typically 2x4 or 2x6
-            sizes = ["2x4", "2x6", "2x3"]
-        elif lumber_type == "Glulam":
-            # Common glulam sizes (width x depth in inches)
-            sizes = ["3-1/8x9", "3-1/8x10-1/2", "3-1/8x12", "3-1/8x13-1/2", "3-1/8x15", "3-1/8x16-1/2", "3-1/8x18",
-                    "5-1/8x9", "5-1/8x10-1/2", "5-1/8x12", "5-1/8x13-1/2", "5-1/8x15", "5-1/8x16-1/2", "5-1/8x18", "5-1/8x21", "5-1/8x24",
-                    "6-3/4x9", "6-3/4x10-1/2", "6-3/4x12", "6-3/4x13-1/2", "6-3/4x15", "6-3/4x16-1/2", "6-3/4x18", "6-3/4x21", "6-3/4x24"]
-        elif lumber_type == "LVL (Microlam)":
-            # LVL/Microlam sizes (thickness x depth)
-            sizes = ["1-3/4x9-1/2", "1-3/4x11-7/8", "1-3/4x14", "1-3/4x16", "1-3/4x18",
-                    "3-1/2x9-1/2", "3-1/2x11-7/8", "3-1/2x14", "3-1/2x16", "3-1/2x18", "3-1/2x20", "3-1/2x24",
-                    "5-1/4x9-1/2", "5-1/4x11-7/8", "5-1/4x14", "5-1/4x16", "5-1/4x18", "5-1/4x20", "5-1/4x24"]
-        elif lumber_type == "PSL (Parallam)":
-            # PSL/Parallam sizes
-            sizes = ["3-1/2x9-1/4", "3-1/2x11-1/4", "3-1/2x11-7/8", "3-1/2x14", "3-1/2x16", "3-1/2x18",
-                    "5-1/4x9-1/4", "5-1/4x11-1/4", "5-1/4x11-7/8", "5-1/4x14", "5-1/4x16", "5-1/4x18",
-                    "7x9-1/4", "7x11-1/4", "7x11-7/8", "7x14", "7x16", "7x18"]
-        elif lumber_type == "TJI":
-            # TJI I-joists (Series + Depth)
-            sizes = ["TJI 110  9 1/2", "TJI 110 117/8", "TJI 110 14", "TJI 110 16",
-                    "TJI 210 9 1/2", "TJI 210 11 7/8", "TJI 210 14", "TJI 210 16",
-                    "TJI 230 9 1/2", "TJI 230 11 7/8", "TJI 230 14", "TJI 230 16",
-                    "TJI 360 11 7/8", "TJI 360 14", "TJI 360 16",
-                    "TJI 560 11 7/8", "TJI 560 14", "TJI 560 16 "]
-        else:
-            sizes = []
+        sizes = option_model.lumber_sizes(self.lumber_type_var.get())
         
         self.lumber_size_combo['values'] = sizes
         if sizes:
@@ -2331,17 +2107,7 @@ class CADGeneratorApp:
     
     def _update_cfs_sizes(self, event=None):
         """Update CFS size dropdown based on member type"""
-        member_type = self.cfs_type_var.get()
-        
-        if member_type == "Stud":
-            sizes = ["250S (2-1/2\")", "350S (3-1/2\")", "362S (3-5/8\")", "400S (4\")", "600S (6\")", "800S (8\")"]
-            gauges = ["33 (20 ga)", "43 (18 ga)", "54 (16 ga)", "68 (14 ga)"]
-        elif member_type == "Track":
-            sizes = ["250T (2-1/2\")", "350T (3-1/2\")", "362T (3-5/8\")", "400T (4\")", "600T (6\")", "800T (8\")"]
-            gauges = ["33 (20 ga)", "43 (18 ga)", "54 (16 ga)", "68 (14 ga)"]
-        else:  # Floor Joist
-            sizes = ["600J (6\")", "800J (8\")", "1000J (10\")", "1200J (12\")", "1400J (14\")"]
-            gauges = ["43 (18 ga)", "54 (16 ga)", "68 (14 ga)", "97 (12 ga)"]
+        sizes, gauges = option_model.cfs_options(self.cfs_type_var.get())
         
         self.cfs_size_combo['values'] = sizes
         if sizes:
@@ -2578,7 +2344,7 @@ class CADGeneratorApp:
         self.pkg_size_dropdown = ttk.Combobox(
             selection_frame,
             textvariable=self.pkg_size_var,
-            values=["1/2", "3/4", "1", "1-1/4", "1-1/2", "2", "2-1/2", "3", "4", "6", "8", "10", "12", "14", "16", "18", "20", "24"],
+            values=["All Sizes", "1/2", "3/4", "1", "1-1/4", "1-1/2", "2", "2-1/2", "3", "4", "6", "8", "10", "12", "14", "16", "18", "20", "24"],
             state="readonly",
             width=28
         )
@@ -2763,6 +2529,22 @@ class CADGeneratorApp:
         )
         self.pkg_complete_btn.pack(fill="x", pady=(10, 0))
         
+        self.pkg_individual_btn = tk.Button(
+            right_col,
+            text="📄 Generate Individual Files",
+            font=("Segoe UI", 9),
+            bg=self.bg_dark,
+            fg=self.text_primary,
+            activebackground=self.accent,
+            activeforeground="white",
+            relief="flat",
+            cursor="hand2",
+            padx=20,
+            pady=8,
+            command=self._generate_pkg_individual
+        )
+        self.pkg_individual_btn.pack(fill="x", pady=(5, 0))
+        
     def _update_pkg_sizes(self):
         """Update available pipe sizes based on schedule (Phase 1 - UI only)"""
         pass  # Phase 2 will implement actual filtering
@@ -2788,13 +2570,272 @@ class CADGeneratorApp:
         self.pkg_studs_var.set(True)
         self.pkg_nuts_var.set(True)
         
+    def _pkg_selection(self):
+        """Current package selection as (sizes, schedule, flange_type, flange_class, facing)"""
+        size = self.pkg_size_var.get()
+        if size == "All Sizes":
+            sizes = [s for s in self.pkg_size_dropdown['values'] if s != "All Sizes"]
+        else:
+            sizes = [size]
+        schedule = self.pkg_schedule_var.get().replace("Schedule ", "")
+        return sizes, schedule, self.pkg_flange_type_var.get(), self.pkg_class_var.get(), self.pkg_facing_var.get()
+    
+    def _lookup_pkg_data(self, sizes, flange_type, flange_class, facing, errors):
+        """
+        Look up flange, gasket, stud and nut data for every size up front.
+        
+        Sizes with missing data are reported once in errors and left out of
+        the job list, so no worker is started for a build that cannot succeed.
+        A selected flange type whose generator is not installed rejects the
+        whole package.
+        
+        Returns:
+            dict: size -> {'flange', 'gasket', 'stud', 'nut', 'nut_size'}
+        """
+        from standards_catalog import get_joint, get_flange_info
+        
+        selected = []
+        if self.pkg_flange_var.get():
+            selected.append(flange_type)
+        if self.pkg_blind_var.get():
+            selected.append("Blind")
+        for selected_type in selected:
+            module = self._flange_generator_module(selected_type)
+            if not generator_available(module):
+                errors.append(f"{selected_type} flanges: generator {module} is not installed")
+                return {}
+        
+        data = {}
+        for size in sizes:
+            joint = get_joint('B16.5', size, flange_class, facing) or {}
+            flange = joint.get('flange')
+            if flange_type == "Blind":
+                flange = get_flange_info(size, flange_class, 'RF-BLIND')
+            elif flange_type != "Weld Neck":
+                # Only WN/Blind are built from flange_data; the other types carry their own tables
+                flange = {}
+            entry = {
+                'flange': flange,
+                'gasket': joint.get('gasket'),
+                'stud': joint.get('stud'),
+                'nut': joint.get('nut'),
+                'nut_size': joint.get('nut_size'),
+            }
+            missing = [name for name in ('flange', 'gasket', 'stud', 'nut') if entry[name] is None]
+            if missing:
+                errors.append(f"NPS {size}\" Class {flange_class} {facing}: no {', '.join(missing)} data")
+                continue
+            data[size] = entry
+        return data
+    
+    def _build_pkg_jobs(self, pkg_data, schedule, flange_type, flange_class, facing, folders, assemblies=False):
+        """
+        Build the generation jobs for every looked-up size.
+        
+        Args:
+            pkg_data: Output of _lookup_pkg_data
+            folders: dict with 'pipe', 'flange', 'gasket', 'fastener' (and
+                     'assembly' when assemblies=True) output Paths
+            assemblies: Also write one flange connection assembly per size
+                        from the flange, gasket, stud and nut parts
+        """
+        jobs = []
+        for size, data in pkg_data.items():
+            size_tag = size.replace('/', '-')
+            nps_float = NPS(size).inches
+            part_ids = {}
+            
+            if self.pkg_pipe_var.get():
+                pipe_file = folders['pipe'] / f"Pipe_{size_tag}in_Sch{schedule}_12in.step"
+                jobs.append(make_job(
+                    f"Pipe {size}\"", 'generate_pipe', 'generate_pipe',
+                    {'nps': nps_float, 'schedule': schedule,
+                     'length_inches': 12.0, 'output_file': str(pipe_file)},
+                    output_file=pipe_file
+                ))
+            
+            if self.pkg_flange_var.get():
+                for n in (1, 2):
+                    job = self._make_single_flange_job(
+                        flange_type, size, flange_class, facing, folders['flange'],
+                        f"{flange_type.replace(' ', '')}_{size_tag}in_Class{flange_class}_{facing}_{n}.step",
+                        job_id=f"{size}:flange_{n}"
+                    )
+                    if job:
+                        jobs.append(job)
+                        part_ids[f"flange_{'ab'[n - 1]}_file"] = job['id']
+            
+            if self.pkg_blind_var.get():
+                job = self._make_single_flange_job(
+                    "Blind", size, flange_class, facing, folders['flange'],
+                    f"Blind_{size_tag}in_Class{flange_class}_{facing}.step",
+                    job_id=f"{size}:blind"
+                )
+                if job:
+                    jobs.append(job)
+                    # A test package closes the joint with the blind
+                    if 'flange_a_file' in part_ids:
+                        part_ids['flange_b_file'] = job['id']
+            
+            if self.pkg_gasket_var.get():
+                for n in (1, 2):
+                    if facing == "RTJ":
+                        job = make_job(f"Ring Gasket {size}\" {n}", 'generate_ring_joint', 'generate_ring_joint_r', {
+                            'ring_number': data['gasket']['ring_number'],
+                            'output_dir': str(folders['gasket'])
+                        }, output_file=folders['gasket'] / f"Ring_{data['gasket']['ring_number']}_{n}.step",
+                           job_id=f"{size}:gasket_{n}")
+                    else:
+                        job = make_job(f"Gasket {size}\" {n}", 'generate_gasket', 'generate_spiral_wound_gasket', {
+                            'nps': size,
+                            'pressure_class': int(flange_class),
+                            'output_dir': str(folders['gasket'])
+                        }, output_file=folders['gasket'] / f"Gasket_{size_tag}in_Class{flange_class}_{n}.step",
+                           job_id=f"{size}:gasket_{n}")
+                    jobs.append(job)
+                part_ids['gasket_file'] = f"{size}:gasket_1"
+            
+            if self.pkg_studs_var.get():
+                jobs.append(make_job(f"Studs {size}\"", 'generate_stud', 'generate_stud', {
+                    'standard': 'B16.5',
+                    'nps': size,
+                    'pressure_class': int(flange_class),
+                    'facing_type': facing,
+                    'output_dir': str(folders['fastener'])
+                }, output_file=folders['fastener'] / f"StudSet_{size_tag}in_Class{flange_class}.step",
+                   job_id=f"{size}:stud"))
+                part_ids['stud_file'] = f"{size}:stud"
+            
+            if self.pkg_nuts_var.get():
+                jobs.append(make_job(f"Nuts {size}\"", 'generate_hex_nut', 'generate_hex_nut', {
+                    'nut_type': '2h',
+                    'nominal_size': data['nut_size'],
+                    'output_dir': str(folders['fastener'])
+                }, output_file=folders['fastener'] / f"NutSet_{size_tag}in_Class{flange_class}.step",
+                   job_id=f"{size}:nut"))
+                part_ids['nut_file'] = f"{size}:nut"
+            
+            # The assembly starts as soon as its five parts are written
+            if assemblies and len(part_ids) == 5:
+                assembly_file = folders['assembly'] / f"FlangeConnection_{size_tag}in_Class{flange_class}_{facing}.step"
+                jobs.append(make_job(
+                    f"Flange Connection {size}\"", 'step_assembly', 'write_flange_connection_assembly',
+                    {'nps': size, 'pressure_class': int(flange_class), 'facing': facing,
+                     'output_file': str(assembly_file)},
+                    output_file=assembly_file, inputs=part_ids
+                ))
+        
+        return merge_duplicate_jobs(jobs)
+    
+    def _start_pkg_generation(self, title, jobs, errors, on_complete, manifest_path=None):
+        """Run package jobs on a background thread, optionally logging each file as it lands"""
+        if not jobs:
+            self.status_var.set("⚠️ Nothing to generate" + (f" - {errors[0]}" if errors else ""))
+            return
+        
+        self.pkg_complete_btn.config(state="disabled")
+        self.pkg_individual_btn.config(state="disabled")
+        self.status_var.set(f"🔄 {title}: {len(jobs)} parts on {min(len(jobs), default_worker_count())} workers...")
+        
+        def on_result(result):
+            # Runs on the batch thread - plain file append, no Tk calls
+            if manifest_path and result['success'] and result['file']:
+                with open(manifest_path, 'a') as f:
+                    for file in [result['file']] + result.get('copies', []):
+                        f.write(f"{result['label']}\t{Path(file).name}\n")
+        
+        def finish(summary):
+            self.pkg_complete_btn.config(state="normal")
+            self.pkg_individual_btn.config(state="normal")
+            on_complete(summary, errors + summary['errors'])
+        
+        thread = threading.Thread(
+            target=self._run_generation,
+            args=(title,),
+            kwargs={'jobs': jobs, 'on_complete': finish, 'on_result': on_result},
+            daemon=True
+        )
+        thread.start()
+    
     def _generate_pkg_individual(self):
-        """Generate selected components as individual files (Phase 2 implementation)"""
-        self.status_var.set("⚠️ Phase 1: UI only - Generation logic coming in Phase 2")
+        """Generate selected components as individual files in the library folders"""
+        sizes, schedule, flange_type, flange_class, facing = self._pkg_selection()
+        errors = []
+        pkg_data = self._lookup_pkg_data(sizes, flange_type, flange_class, facing, errors)
+        
+        folders = {
+            'pipe': self._get_output_subfolder("Piping", type="Pipe"),
+            'flange': self._get_output_subfolder("Flanges", standard="ASME_B16_5", pressure=f"Class_{flange_class}"),
+            'gasket': self._get_output_subfolder("Gaskets", type="Ring Joint" if facing == "RTJ" else "Spiral Wound"),
+            'fastener': self._get_output_subfolder("Fasteners", type="B16.5 Stud"),
+        }
+        for folder in folders.values():
+            folder.mkdir(parents=True, exist_ok=True)
+        jobs = self._build_pkg_jobs(pkg_data, schedule, flange_type, flange_class, facing, folders)
+        
+        def on_complete(summary, errors):
+            files = summary['generated_files']
+            if errors:
+                self.status_var.set(f"✅ Generated {len(files)} files with {len(errors)} errors")
+                messagebox.showwarning("Partial Success", f"Generated {len(files)} files.\n\n{len(errors)} failed:\n" + "\n".join(errors[:5]))
+            else:
+                self.status_var.set(f"✅ Generated {len(files)} files in {summary['elapsed']:.1f}s")
+            if files:
+                self.last_generated_path = files[0]
+                self.file_location_frame.pack(pady=(0, 10))
+        
+        self._start_pkg_generation("Assembly Package", jobs, errors, on_complete)
         
     def _generate_pkg_complete(self):
-        """Generate complete package in organized folder (Phase 2 implementation)"""
-        self.status_var.set("⚠️ Phase 1: UI only - Generation logic coming in Phase 2")
+        """Generate complete package in organized folder"""
+        sizes, schedule, flange_type, flange_class, facing = self._pkg_selection()
+        errors = []
+        pkg_data = self._lookup_pkg_data(sizes, flange_type, flange_class, facing, errors)
+        
+        size_name = "AllSizes" if len(sizes) > 1 else f"{sizes[0].replace('/', '-')}in"
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        package_path = self.library_path / "Assembly_Packages" / f"Package_{size_name}_Sch{schedule}_Class{flange_class}_{facing}_{timestamp}"
+        folders = {
+            'pipe': package_path / "Pipe",
+            'flange': package_path / "Flanges",
+            'gasket': package_path / "Gaskets",
+            'fastener': package_path / "Fasteners",
+            'assembly': package_path / "Assemblies",
+        }
+        for folder in folders.values():
+            folder.mkdir(parents=True, exist_ok=True)
+        jobs = self._build_pkg_jobs(pkg_data, schedule, flange_type, flange_class, facing, folders, assemblies=True)
+        
+        def on_complete(summary, errors):
+            files = summary['generated_files']
+            with open(package_path / "README.txt", 'w') as f:
+                f.write(f"Assembly Package\n")
+                f.write(f"=" * 50 + "\n\n")
+                f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+                f.write(f"SPECIFICATIONS:\n")
+                f.write(f"  Pipe Sizes: {', '.join(sizes)}\n")
+                f.write(f"  Schedule: {schedule}\n")
+                f.write(f"  Flange: {flange_type} Class {flange_class} {facing}\n\n")
+                f.write(f"BOLTING:\n")
+                for size, data in pkg_data.items():
+                    f.write(f"  NPS {size}\": {data['stud']['number_of_bolts']} studs {data['nut_size']}\" x "
+                            f"{data['stud']['stud_length_mm']}mm, {data['stud']['number_of_bolts'] * 2} 2H nuts\n")
+                f.write(f"\nGENERATED FILES ({len(files)} total) - see MANIFEST.txt\n")
+                if errors:
+                    f.write(f"\nERRORS:\n")
+                    for error in errors:
+                        f.write(f"  - {error}\n")
+            
+            if errors:
+                self.status_var.set(f"✅ Generated {len(files)} files with {len(errors)} errors")
+                messagebox.showwarning("Partial Success", f"Generated {len(files)} files.\n\n{len(errors)} failed:\n" + "\n".join(errors[:5]))
+            else:
+                self.status_var.set(f"✅ Package generated: {len(files)} files in {summary['elapsed']:.1f}s")
+            self.last_generated_path = str(package_path)
+            self.file_location_frame.pack(pady=(0, 10))
+        
+        self._start_pkg_generation("Assembly Package", jobs, errors, on_complete,
+                                   manifest_path=package_path / "MANIFEST.txt")
     
     def _show_flow_calculator_options(self):
         """Flow and pressure calculator for pipe sizing - ENHANCED WORKFLOW
@@ -3105,9 +3146,75 @@ class CADGeneratorApp:
         )
         calc_btn.grid(row=13, column=0, columnspan=2, sticky="ew", pady=(10, 5))
         
+        # ========== OPERATING ENVELOPE SWEEP ==========
+        envelope_frame = tk.Frame(params_frame, bg=self.bg_card)
+        envelope_frame.grid(row=14, column=0, columnspan=2, sticky="ew", pady=(0, 5))
+        
+        envelope_row = tk.Frame(envelope_frame, bg=self.bg_card)
+        envelope_row.pack(fill="x")
+        tk.Label(envelope_row, text="Envelope Temp:", font=("Segoe UI", 9), bg=self.bg_card, fg=self.text_primary).pack(side="left", padx=(0, 5))
+        self.envelope_temp_min_var = tk.StringVar(value="")
+        ttk.Entry(envelope_row, textvariable=self.envelope_temp_min_var, width=6).pack(side="left")
+        tk.Label(envelope_row, text="to", font=("Segoe UI", 9), bg=self.bg_card, fg=self.text_secondary).pack(side="left", padx=3)
+        self.envelope_temp_max_var = tk.StringVar(value="")
+        ttk.Entry(envelope_row, textvariable=self.envelope_temp_max_var, width=6).pack(side="left", padx=(0, 10))
+        tk.Label(envelope_row, text="Pressure:", font=("Segoe UI", 9), bg=self.bg_card, fg=self.text_primary).pack(side="left", padx=(0, 5))
+        self.envelope_pressure_min_var = tk.StringVar(value="")
+        ttk.Entry(envelope_row, textvariable=self.envelope_pressure_min_var, width=6).pack(side="left")
+        tk.Label(envelope_row, text="to", font=("Segoe UI", 9), bg=self.bg_card, fg=self.text_secondary).pack(side="left", padx=3)
+        self.envelope_pressure_max_var = tk.StringVar(value="")
+        ttk.Entry(envelope_row, textvariable=self.envelope_pressure_max_var, width=6).pack(side="left")
+        
+        tk.Button(
+            envelope_frame,
+            text="📈 Sweep Operating Envelope",
+            font=("Segoe UI", 9, "bold"),
+            bg=self.bg_dark,
+            fg=self.text_primary,
+            relief="flat",
+            cursor="hand2",
+            padx=10,
+            pady=4,
+            command=self._sweep_operating_envelope
+        ).pack(fill="x", pady=(5, 0))
+        
+        # ΔP budget - smallest pipe, schedule and material that meet it
+        budget_frame = tk.Frame(params_frame, bg=self.bg_card)
+        budget_frame.grid(row=15, column=0, columnspan=2, sticky="ew", pady=(0, 5))
+        
+        budget_row = tk.Frame(budget_frame, bg=self.bg_card)
+        budget_row.pack(fill="x")
+        tk.Label(budget_row, text="ΔP Budget (psi):", font=("Segoe UI", 9), bg=self.bg_card, fg=self.text_primary).pack(side="left", padx=(0, 5))
+        self.dp_budget_var = tk.StringVar(value="10")
+        ttk.Entry(budget_row, textvariable=self.dp_budget_var, width=6).pack(side="left", padx=(0, 10))
+        self.dp_budget_all_materials_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(
+            budget_row,
+            text="All carbon-steel grades",
+            variable=self.dp_budget_all_materials_var,
+            font=("Segoe UI", 9),
+            bg=self.bg_card,
+            fg=self.text_primary,
+            selectcolor=self.bg_dark,
+            activebackground=self.bg_card
+        ).pack(side="left")
+        
+        tk.Button(
+            budget_frame,
+            text="🎯 Find Minimum Pipe for ΔP Budget",
+            font=("Segoe UI", 9, "bold"),
+            bg=self.bg_dark,
+            fg=self.text_primary,
+            relief="flat",
+            cursor="hand2",
+            padx=10,
+            pady=4,
+            command=self._find_minimum_pipe
+        ).pack(fill="x", pady=(5, 0))
+        
         # ========== BYPASS MODE - Skip calculations, just generate ==========
         bypass_frame = tk.Frame(params_frame, bg="#374151", relief="groove", bd=1)
-        bypass_frame.grid(row=14, column=0, columnspan=2, sticky="ew", pady=(10, 5))
+        bypass_frame.grid(row=16, column=0, columnspan=2, sticky="ew", pady=(10, 5))
         
         self.bypass_mode_var = tk.BooleanVar(value=False)
         bypass_check = tk.Checkbutton(
@@ -3298,14 +3405,7 @@ class CADGeneratorApp:
         mat_grade = self.mat_grade_var.get() if hasattr(self, 'mat_grade_var') else "A106 Gr B"
         
         # Convert NPS to float
-        if '/' in nps:
-            if '-' in nps:  # e.g., "1-1/4"
-                parts = nps.split('-')
-                nps_float = float(parts[0]) + float(eval(parts[1]))
-            else:  # e.g., "1/2"
-                nps_float = float(eval(nps))
-        else:
-            nps_float = float(nps)
+        nps_float = NPS(nps).inches
         
         # Create a fake recommendation for the generation system
         self.flow_recommendation = {
@@ -3434,21 +3534,25 @@ class CADGeneratorApp:
                 return
             
             # Calculate fittings pressure drop using: ΔP = K × ρ × v² / (2 × 144 × g)
-            # Simplified for water at ~62.4 lb/ft³: ΔP ≈ K × v² / 148.8 (psi)
-            # More accurate formula: h = K × v²/(2g) ft of head, then convert to psi
-            
-            gravity = 32.174  # ft/s²
-            velocity_fps = velocity  # Already in ft/s
-            density = 62.4  # lb/ft³ (water at 60°F) - could be enhanced with actual fluid
-            
-            # Head loss from fittings (ft of head)
-            head_loss_ft = total_k * (velocity_fps ** 2) / (2 * gravity)
-            
-            # Convert to psi: ΔP = ρ × h × g / 144 = ρ × h / 144 (for water, approx 0.433 psi/ft)
-            fittings_dp = head_loss_ft * density / 144  # psi
-            
-            # Pipe friction pressure drop
-            pipe_dp = dp_per_100ft * (pipe_length / 100)
+            # with the density of the fluid from the flow calculation
+            from flow_calculator_enhanced import FluidProperties, FlowCalculator
+            fluid_props = getattr(self, 'flow_fluid_props', {})
+            density = fluid_props.get('density', 62.4)  # lb/ft³
+            fittings_dp = FluidProperties.calculate_fitting_pressure_drop(total_k, velocity, density)  # psi
+            
+            # Pipe friction pressure drop - gas density falls with the pressure
+            # along the line, so gases are marched over the actual length
+            gas_choked = False
+            if fluid_props.get('compressible'):
+                roughness_data = FluidProperties.get_pipe_roughness(self.pipe_material_var.get())
+                gas = FlowCalculator.calculate_gas_pressure_drop(
+                    self.flow_design_gpm, pipe_id, pipe_length, self.flow_fluid,
+                    self.flow_operating_pressure, self.flow_temp_f, roughness=roughness_data[0]
+                )
+                gas_choked = gas['choked']
+                pipe_dp = gas['pressure_drop_psi']
+            else:
+                pipe_dp = dp_per_100ft * (pipe_length / 100)
             
             # Total system pressure drop
             total_dp = fittings_dp + pipe_dp
@@ -3480,7 +3584,9 @@ class CADGeneratorApp:
             summary += f"  TOTAL SYSTEM:      {total_dp:.2f} psi\n\n"
             
             # Add warnings if applicable
-            if total_dp > 50:
+            if gas_choked:
+                summary += f"⛔ Choked flow at {gas['choke_length_ft']:.0f} ft - use a larger pipe\n"
+            elif total_dp > 50:
                 summary += "⚠️ High ΔP - consider larger pipe\n"
             elif total_dp > 25:
                 summary += "⚡ Moderate ΔP - verify acceptable\n"
@@ -3488,7 +3594,10 @@ class CADGeneratorApp:
                 summary += "✓ Pressure drop within normal range\n"
             
             self.fittings_summary_label.config(text=summary)
-            self.status_var.set(f"✓ System ΔP: {total_dp:.2f} psi (pipe: {pipe_dp:.2f} + fittings: {fittings_dp:.2f})")
+            if gas_choked:
+                self.status_var.set(f"⛔ Choked gas flow at {gas['choke_length_ft']:.0f} ft of {pipe_length:.0f} ft")
+            else:
+                self.status_var.set(f"✓ System ΔP: {total_dp:.2f} psi (pipe: {pipe_dp:.2f} + fittings: {fittings_dp:.2f})")
             
         except Exception as e:
             self.fittings_summary_label.config(text=f"Error calculating: {str(e)}")
@@ -3519,6 +3628,25 @@ class CADGeneratorApp:
         except:
             return (True, None)
     
+    def _flow_input_converters(self):
+        """Converters from the selected flow / pressure / temperature units to GPM, PSI and °F"""
+        flow_unit = self.flow_unit_var.get()
+        pressure_unit = self.pressure_unit_var.get()
+        temp_unit = self.temp_unit_var.get()
+        
+        def convert_flow(val):
+            conversions = {"GPM": 1, "GPH": 1/60, "BBL/D": 0.0292, "CFM": 7.48, "L/min": 0.264, "m³/hr": 4.403}
+            return val * conversions.get(flow_unit, 1)
+        
+        def convert_pressure(val):
+            conversions = {"PSI": 1, "bar": 14.5, "kPa": 0.145}
+            return val * conversions.get(pressure_unit, 1)
+        
+        def convert_temp(val):
+            return val if temp_unit == "°F" else (val * 9/5) + 32
+        
+        return convert_flow, convert_pressure, convert_temp
+    
     def _calculate_pipe_sizing(self):
         """Calculate optimum pipe size based on flow range and pressure parameters - ENHANCED VERSION
         
@@ -3526,16 +3654,13 @@ class CADGeneratorApp:
         Shows velocity and pressure drop at all three operating points.
         """
         try:
-            from flow_calculator_enhanced import FluidProperties, PipeData, FlowCalculator
+            from flow_calculator_enhanced import FluidProperties, FlowCalculator
             
             # Get input values with new min/max flow range
             flow_min = float(self.flow_min_var.get())
             flow_max = float(self.flow_max_var.get())
-            flow_unit = self.flow_unit_var.get()
             pressure = float(self.pressure_var.get())
-            pressure_unit = self.pressure_unit_var.get()
             temp = float(self.temp_var.get())
-            temp_unit = self.temp_unit_var.get()
             fluid = self.fluid_type_var.get()
             pipe_material = self.pipe_material_var.get()
             
@@ -3543,19 +3668,13 @@ class CADGeneratorApp:
             flow_design = flow_max * 0.70
             
             # Convert to standard units (GPM, PSI, °F)
-            def convert_flow(val):
-                conversions = {"GPM": 1, "GPH": 1/60, "BBL/D": 0.0292, "CFM": 7.48, "L/min": 0.264, "m³/hr": 4.403}
-                return val * conversions.get(flow_unit, 1)
-            
-            def convert_pressure(val):
-                conversions = {"PSI": 1, "bar": 14.5, "kPa": 0.145}
-                return val * conversions.get(pressure_unit, 1)
+            convert_flow, convert_pressure, convert_temp = self._flow_input_converters()
             
             flow_min_gpm = convert_flow(flow_min)
             flow_design_gpm = convert_flow(flow_design)
             flow_max_gpm = convert_flow(flow_max)
             pressure_psi = convert_pressure(pressure)
-            temp_f = temp if temp_unit == "°F" else (temp * 9/5) + 32
+            temp_f = convert_temp(temp)
             
             # Get fluid properties
             fluid_props = FluidProperties.get_properties(fluid, temp_f, pressure_psi)
@@ -3569,57 +3688,18 @@ class CADGeneratorApp:
             # Get max velocity for this fluid
             max_vel, vel_reason = FlowCalculator.get_max_velocity_for_fluid(fluid, density)
             
-            # Calculate for different pipe sizes
-            pipe_sizes = ["1/2", "3/4", "1", "1-1/4", "1-1/2", "2", "2-1/2", "3", "4", "6", "8", "10", "12"]
-            schedules = ["40", "80", "160", "STD", "XS", "XXS"]
-            
-            results = []
-            
-            for size in pipe_sizes:
-                for schedule in schedules:
-                    id_inches = PipeData.get_pipe_id(size, schedule)
-                    if id_inches <= 0:
-                        continue
-                    
-                    # Calculate velocities at all three points
-                    vel_min = FlowCalculator.calculate_velocity(flow_min_gpm, id_inches)
-                    vel_design = FlowCalculator.calculate_velocity(flow_design_gpm, id_inches)
-                    vel_max = FlowCalculator.calculate_velocity(flow_max_gpm, id_inches)
-                    
-                    # Calculate pressure drops
-                    dp_min = FlowCalculator.calculate_pressure_drop(flow_min_gpm, id_inches, 100, density, viscosity, roughness)
-                    dp_design = FlowCalculator.calculate_pressure_drop(flow_design_gpm, id_inches, 100, density, viscosity, roughness)
-                    dp_max = FlowCalculator.calculate_pressure_drop(flow_max_gpm, id_inches, 100, density, viscosity, roughness)
-                    
-                    # Get schedule pressure rating
-                    schedule_rating = FlowCalculator.get_schedule_pressure_rating(schedule, size, temp_f=temp_f)
-                    
-                    # Check if this size/schedule meets requirements
-                    # Velocity at MAX must be <= max velocity limit
-                    # Schedule must meet pressure requirement with 1.2x safety factor
-                    if vel_max <= max_vel and schedule_rating >= pressure_psi * 1.2:
-                        # Calculate Reynolds number at design point
-                        reynolds = FlowCalculator.calculate_reynolds_number(flow_design_gpm, id_inches, density, viscosity)
-                        flow_regime = FlowCalculator.get_flow_regime(reynolds)
-                        
-                        results.append({
-                            'size': size,
-                            'schedule': schedule,
-                            'id': id_inches,
-                            'vel_min': vel_min,
-                            'vel_design': vel_design,
-                            'vel_max': vel_max,
-                            'dp_min': dp_min,
-                            'dp_design': dp_design,
-                            'dp_max': dp_max,
-                            'reynolds': reynolds,
-                            'flow_regime': flow_regime,
-                            'rating': schedule_rating,
-                            'vel_deviation': abs(vel_design - max_vel * 0.7)  # Target 70% of max velocity
-                        })
-            
-            # Sort by velocity deviation (best match to target velocity)
-            results.sort(key=lambda x: x['vel_deviation'])
+            # Every NPS x schedule in one pass, ranked by closeness to the
+            # target velocity (70% of max at design flow). Qualifying cells
+            # have max-flow velocity within the limit and a schedule rating
+            # of at least 1.2x operating pressure; gas and steam lines are
+            # marched at falling density and must not choke.
+            ranked = FlowCalculator.size_pipe_grid(
+                flow_min_gpm, flow_design_gpm, flow_max_gpm, density, viscosity,
+                pressure_psi, max_vel, roughness=roughness, temp_f=temp_f, friction_method='colebrook',
+                fluid_name=fluid
+            )
+            # Only the recommendation and three alternatives are shown
+            results = FlowCalculator.sizing_records(ranked, limit=4)
             
             # Display results
             self.flow_results_text.config(state="normal")
@@ -3705,6 +3785,173 @@ class CADGeneratorApp:
             self.flow_results_text.insert("end", f"❌ Error: {str(e)}")
             self.flow_results_text.config(state="disabled")
     
+    def _sweep_operating_envelope(self):
+        """Sweep flow × temperature × pressure for the best candidate pipes and show each envelope
+        
+        Flow spans min to max; temperature and pressure span the envelope ranges
+        (blank = the operating value). Candidates are the top sizes from the
+        grid search, rated for the highest envelope pressure and temperature.
+        """
+        try:
+            from flow_calculator_enhanced import FluidProperties, FlowCalculator, linspace
+            
+            convert_flow, convert_pressure, convert_temp = self._flow_input_converters()
+            flow_min_gpm = convert_flow(float(self.flow_min_var.get()))
+            flow_max_gpm = convert_flow(float(self.flow_max_var.get()))
+            temp_f = convert_temp(float(self.temp_var.get()))
+            pressure_psi = convert_pressure(float(self.pressure_var.get()))
+            fluid = self.fluid_type_var.get()
+            pipe_material = self.pipe_material_var.get()
+            
+            def envelope_range(min_var, max_var, default, convert):
+                low = convert(float(min_var.get())) if min_var.get().strip() else default
+                high = convert(float(max_var.get())) if max_var.get().strip() else default
+                return min(low, high), max(low, high)
+            
+            temp_low, temp_high = envelope_range(self.envelope_temp_min_var, self.envelope_temp_max_var,
+                                                 temp_f, convert_temp)
+            pressure_low, pressure_high = envelope_range(self.envelope_pressure_min_var, self.envelope_pressure_max_var,
+                                                         pressure_psi, convert_pressure)
+            flows = linspace(flow_min_gpm, flow_max_gpm, 50)
+            temps = linspace(temp_low, temp_high, 20)
+            pressures = linspace(pressure_low, pressure_high, 10)
+            
+            # Candidates from the grid search at the operating point, rated
+            # for the worst corner of the envelope
+            fluid_props = FluidProperties.get_properties(fluid, temp_f, pressure_psi)
+            max_vel, vel_reason = FlowCalculator.get_max_velocity_for_fluid(fluid, fluid_props['density'])
+            roughness_data = FluidProperties.get_pipe_roughness(pipe_material)
+            roughness = roughness_data[0] if isinstance(roughness_data, tuple) else roughness_data
+            ranked = FlowCalculator.size_pipe_grid(
+                flow_min_gpm, flow_max_gpm * 0.70, flow_max_gpm, fluid_props['density'], fluid_props['viscosity'],
+                pressure_high, max_vel, roughness=roughness, temp_f=temp_high, friction_method='colebrook',
+                fluid_name=fluid
+            )
+            candidates = FlowCalculator.sizing_records(ranked, limit=4)
+            
+            self.flow_results_text.config(state="normal")
+            self.flow_results_text.delete("1.0", "end")
+            
+            if not candidates:
+                self.flow_results_text.insert("end", "❌ No suitable pipe sizes for this envelope.\n\n")
+                self.flow_results_text.insert("end", f"Max flow: {flow_max_gpm:.1f} GPM\n")
+                self.flow_results_text.insert("end", f"Max pressure: {pressure_high:.0f} psi @ {temp_high:.0f}°F\n")
+                self.flow_results_text.config(state="disabled")
+                return
+            
+            points = len(flows) * len(temps) * len(pressures)
+            self.flow_results_text.insert("end", "═══ OPERATING ENVELOPE ═══\n\n")
+            self.flow_results_text.insert("end", f"  {fluid} - {points:,} points per pipe\n")
+            self.flow_results_text.insert("end", f"  Flow:     {flow_min_gpm:.1f} - {flow_max_gpm:.1f} GPM\n")
+            self.flow_results_text.insert("end", f"  Temp:     {temp_low:.0f} - {temp_high:.0f} °F\n")
+            self.flow_results_text.insert("end", f"  Pressure: {pressure_low:.0f} - {pressure_high:.0f} psi\n")
+            self.flow_results_text.insert("end", f"  Max V:    {max_vel:.0f} ft/s ({vel_reason})\n")
+            
+            for candidate in candidates:
+                sweep = FlowCalculator.sweep_envelope(
+                    fluid, candidate['size'], candidate['schedule'], flows, temps, pressures,
+                    pipe_material=pipe_material, friction_method='colebrook_grid'
+                )
+                envelope = FlowCalculator.summarize_envelope(sweep, max_vel)
+                regimes = ", ".join(f"{name} {fraction:.0%}"
+                                    for name, fraction in envelope['regime_fraction'].items() if fraction)
+                worst_flow, worst_temp, worst_pressure = envelope['worst']
+                
+                self.flow_results_text.insert("end", f"\n── NPS {candidate['size']}\" Sch {candidate['schedule']} ──\n")
+                self.flow_results_text.insert("end", f"  Velocity:  {envelope['velocity_min']:.2f} - {envelope['velocity_max']:.2f} ft/s\n")
+                self.flow_results_text.insert("end", f"  ΔP/100ft:  {envelope['dp_min']:.3f} - {envelope['dp_max']:.3f} psi\n")
+                self.flow_results_text.insert("end", f"  Regime:    {regimes}\n")
+                self.flow_results_text.insert("end", f"  Worst ΔP @ {worst_flow:.1f} GPM, {worst_temp:.0f}°F, {worst_pressure:.0f} psi\n")
+                if envelope['over_velocity_fraction']:
+                    self.flow_results_text.insert("end", f"  ⚠️ Over velocity limit at {envelope['over_velocity_fraction']:.0%} of points\n")
+            
+            self.flow_results_text.config(state="disabled")
+            
+        except ValueError as e:
+            self.flow_results_text.config(state="normal")
+            self.flow_results_text.delete("1.0", "end")
+            self.flow_results_text.insert("end", f"❌ Error: Invalid input\n\n{str(e)}")
+            self.flow_results_text.config(state="disabled")
+        except Exception as e:
+            self.flow_results_text.config(state="normal")
+            self.flow_results_text.delete("1.0", "end")
+            self.flow_results_text.insert("end", f"❌ Error: {str(e)}")
+            self.flow_results_text.config(state="disabled")
+    
+    def _find_minimum_pipe(self):
+        """Smallest pipe, schedule and material grade that hold the ΔP budget
+        
+        The budget holds at max flow. Pipe length and fittings come from the
+        fittings estimator; the pressure rating uses the design pressure
+        (1.2 × operating) at the operating temperature, for the selected
+        grade or every carbon-steel grade.
+        """
+        try:
+            from flow_calculator_enhanced import FluidProperties, FlowCalculator
+            
+            convert_flow, convert_pressure, convert_temp = self._flow_input_converters()
+            flow_max_gpm = convert_flow(float(self.flow_max_var.get()))
+            temp_f = convert_temp(float(self.temp_var.get()))
+            pressure_psi = convert_pressure(float(self.pressure_var.get()))
+            max_dp_psi = convert_pressure(float(self.dp_budget_var.get()))
+            fluid = self.fluid_type_var.get()
+            pipe_material = self.pipe_material_var.get()
+            try:
+                pipe_length = float(self.pipe_length_var.get())
+            except (AttributeError, ValueError):
+                pipe_length = 100.0
+            
+            fitting_k = 0.0
+            for data in getattr(self, 'fitting_estimates', {}).values():
+                if data.get('var') is not None:
+                    fitting_k += data['var'].get() * data['k']
+            
+            materials = None if self.dp_budget_all_materials_var.get() else [self.mat_grade_var.get()]
+            fluid_props = FluidProperties.get_properties(fluid, temp_f, pressure_psi)
+            max_vel, vel_reason = FlowCalculator.get_max_velocity_for_fluid(fluid, fluid_props['density'])
+            best = FlowCalculator.find_minimum_pipe(
+                flow_max_gpm, fluid_props['density'], fluid_props['viscosity'], pressure_psi, max_dp_psi,
+                length_ft=pipe_length, fitting_k=fitting_k, max_velocity_ft_s=max_vel, temp_f=temp_f,
+                materials=materials, roughness_material=pipe_material, pressure_factor=1.2,
+                fluid_name=fluid
+            )
+            
+            self.flow_results_text.config(state="normal")
+            self.flow_results_text.delete("1.0", "end")
+            
+            if best is None:
+                self.flow_results_text.insert("end", "❌ No pipe meets this ΔP budget.\n\n")
+                self.flow_results_text.insert("end", f"Budget: {max_dp_psi:.2f} psi over {pipe_length:.0f} ft (K={fitting_k:.2f})\n")
+                self.flow_results_text.insert("end", f"Max flow: {flow_max_gpm:.1f} GPM\n")
+                self.flow_results_text.config(state="disabled")
+                return
+            
+            self.flow_results_text.insert("end", "═══ MINIMUM PIPE FOR ΔP BUDGET ═══\n\n")
+            self.flow_results_text.insert("end", f"  NPS {best['size']}\" Sch {best['schedule']}\n")
+            self.flow_results_text.insert("end", f"  Material:  {best['material']}\n")
+            self.flow_results_text.insert("end", f"  OD / ID:   {best['od']:.3f}\" / {best['id']:.3f}\" (wall {best['wall']:.3f}\")\n")
+            self.flow_results_text.insert("end", f"  Weight:    {best['weight_lb_ft']:.2f} lb/ft\n\n")
+            self.flow_results_text.insert("end", f"  Velocity:  {best['velocity_fps']:.2f} ft/s (max {max_vel:.0f}, {vel_reason})\n")
+            self.flow_results_text.insert("end", f"  Pipe ΔP:   {best['pipe_dp_psi']:.3f} psi over {pipe_length:.0f} ft\n")
+            self.flow_results_text.insert("end", f"  Fittings:  {best['fitting_dp_psi']:.3f} psi (K={fitting_k:.2f})\n")
+            self.flow_results_text.insert("end", f"  Total ΔP:  {best['total_dp_psi']:.3f} of {max_dp_psi:.3f} psi\n\n")
+            self.flow_results_text.insert("end", f"  Rated:     {best['allowable_pressure_psi']:.0f} psi @ {temp_f:.0f}°F ")
+            self.flow_results_text.insert("end", f"(design {pressure_psi * 1.2:.0f} psi)\n")
+            self.flow_results_text.insert("end", f"  Min ID:    {best['min_id']:.3f}\" ({best['dp_evaluations']} ΔP evaluations)\n")
+            
+            self.flow_results_text.config(state="disabled")
+            
+        except ValueError as e:
+            self.flow_results_text.config(state="normal")
+            self.flow_results_text.delete("1.0", "end")
+            self.flow_results_text.insert("end", f"❌ Error: Invalid input\n\n{str(e)}")
+            self.flow_results_text.config(state="disabled")
+        except Exception as e:
+            self.flow_results_text.config(state="normal")
+            self.flow_results_text.delete("1.0", "end")
+            self.flow_results_text.insert("end", f"❌ Error: {str(e)}")
+            self.flow_results_text.config(state="disabled")
+    
     def _show_flow_generation_options(self):
         """Show generation options after calculation - with schedule selection and locked flange class"""
         if not hasattr(self, 'flow_recommendation'):
@@ -3759,7 +4006,7 @@ class CADGeneratorApp:
         self.flow_required_class = recommended_class
         
         # Build list of schedules >= minimum (user can pick heavier)
-        schedule_order = ["20", "30", "STD", "40", "60", "XS", "80", "100", "120", "140", "160", "XXS"]
+        schedule_order = ["5", "10", "20", "30", "STD", "40", "60", "XS", "80", "100", "120", "140", "160", "XXS"]
         try:
             min_idx = schedule_order.index(min_schedule)
             available_schedules = schedule_order[min_idx:]
@@ -4183,29 +4430,10 @@ class CADGeneratorApp:
                 # Filter outlet sizes to only show sizes smaller than main pipe
                 all_sizes = ["1/2", "3/4", "1", "1-1/4", "1-1/2", "2", "2-1/2", "3", "4", "6", "8", "10", "12", "14", "16", "18", "20", "24"]
                 # Convert main pipe size to comparable float
-                main_size_str = pipe_size
-                if '/' in main_size_str:
-                    if '-' in main_size_str:  # e.g. "1-1/4"
-                        parts = main_size_str.split('-')
-                        main_size_float = float(parts[0]) + float(eval(parts[1]))
-                    else:  # e.g. "1/2"
-                        main_size_float = float(eval(main_size_str))
-                else:
-                    main_size_float = float(main_size_str)
+                main_size = NPS(pipe_size).value
                 
                 # Filter to only smaller sizes
-                valid_sizes = []
-                for s in all_sizes:
-                    if '/' in s:
-                        if '-' in s:
-                            parts = s.split('-')
-                            s_float = float(parts[0]) + float(eval(parts[1]))
-                        else:
-                            s_float = float(eval(s))
-                    else:
-                        s_float = float(s)
-                    if s_float < main_size_float:
-                        valid_sizes.append(s)
+                valid_sizes = [s for s in all_sizes if NPS(s).value < main_size]
                 
                 if valid_sizes:
                     self.flow_add_size_combo['values'] = valid_sizes
@@ -4294,6 +4522,36 @@ class CADGeneratorApp:
         )
         self.flow_summary_label.pack(anchor="w")
         
+        # Repeated parts (qty > 1) are built once; copies are either separate
+        # files or one assembly that references the shared part
+        self.flow_instance_assembly_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(
+            self.flow_gen_frame,
+            text="Combine repeated parts into one assembly STEP",
+            variable=self.flow_instance_assembly_var,
+            bg=self.bg_card,
+            fg=self.text_primary,
+            activebackground=self.bg_card,
+            activeforeground=self.text_primary,
+            selectcolor=self.bg_dark,
+            font=("Segoe UI", 9)
+        ).pack(anchor="w", pady=(5, 0))
+        
+        # Flange connections as one positioned assembly (flanges, gasket,
+        # studs and nuts) instead of loose part files
+        self.flow_connection_assembly_var = tk.BooleanVar(value=True)
+        tk.Checkbutton(
+            self.flow_gen_frame,
+            text="Write each flange connection as one assembly STEP",
+            variable=self.flow_connection_assembly_var,
+            bg=self.bg_card,
+            fg=self.text_primary,
+            activebackground=self.bg_card,
+            activeforeground=self.text_primary,
+            selectcolor=self.bg_dark,
+            font=("Segoe UI", 9)
+        ).pack(anchor="w")
+        
         # Generate button
         self.flow_gen_btn = tk.Button(
             self.flow_gen_frame,
@@ -4512,7 +4770,7 @@ class CADGeneratorApp:
         facing = self.flow_facing_var.get()
         
         # Convert pipe size to float for generators
-        nps_float = float(eval(pipe_size.replace('"', ''))) if '/' in pipe_size else float(pipe_size)
+        nps_float = NPS(pipe_size).inches
         
         # Create package folder
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -4520,15 +4778,14 @@ class CADGeneratorApp:
         package_path = self.library_path / "Flow_Calculator_Packages" / package_name
         package_path.mkdir(parents=True, exist_ok=True)
         
-        generated_files = []
+        # Build list is snapshotted so edits during generation don't change the README
+        build_list = [dict(item) for item in self.flow_build_list]
+        jobs = []
         errors = []
         
-        self.status_var.set(f"🔄 Generating {len(self.flow_build_list)} items...")
-        self.root.update()
-        
         try:
-            # Process each item in the build list
-            for item in self.flow_build_list:
+            # Turn each item in the build list into generation jobs
+            for row, item in enumerate(build_list, 1):
                 comp_type = item['type']
                 variant = item['variant']
                 qty = item['qty']
@@ -4539,22 +4796,19 @@ class CADGeneratorApp:
                     if comp_type == "Pipe (40ft)":
                         pipe_path = package_path / "Pipe"
                         pipe_path.mkdir(exist_ok=True)
-                        import generate_pipe
                         for i in range(1, qty + 1):
                             pipe_file = pipe_path / f"Pipe_{pipe_size.replace('/', '-')}in_Sch{schedule}_40ft_{i:02d}.step"
-                            generate_pipe.generate_pipe(
-                                nps=nps_float,
-                                schedule=schedule,
-                                length_inches=480.0,
-                                output_file=str(pipe_file)
-                            )
-                            generated_files.append(str(pipe_file))
+                            jobs.append(make_job(
+                                f"Pipe {i:02d}", 'generate_pipe', 'generate_pipe',
+                                {'nps': nps_float, 'schedule': schedule,
+                                 'length_inches': 480.0, 'output_file': str(pipe_file)},
+                                output_file=pipe_file
+                            ))
                     
                     # ELBOWS
                     elif comp_type.startswith("Elbow"):
                         elbow_path = package_path / "Elbows"
                         elbow_path.mkdir(exist_ok=True)
-                        import generate_elbow
                         
                         # Parse angle from comp_type
                         if "90°" in comp_type:
@@ -4572,120 +4826,90 @@ class CADGeneratorApp:
                         
                         for i in range(1, qty + 1):
                             elbow_file = elbow_path / f"Elbow-{angle}deg-{variant}_{pipe_size.replace('/', '-')}in_Sch{schedule}_{i:02d}.step"
-                            generate_elbow.generate_elbow(
-                                nps=nps_float,
-                                schedule=schedule,
-                                elbow_type=elbow_type,
-                                angle=angle,
-                                output_file=str(elbow_file)
-                            )
-                            generated_files.append(str(elbow_file))
+                            jobs.append(make_job(
+                                f"{comp_type} ({variant}) {i:02d}", 'generate_elbow', 'generate_elbow',
+                                {'nps': nps_float, 'schedule': schedule, 'elbow_type': elbow_type,
+                                 'angle': angle, 'output_file': str(elbow_file)},
+                                output_file=elbow_file
+                            ))
                     
                     # 180° RETURNS
                     elif comp_type == "180° Return":
                         return_path = package_path / "Returns"
                         return_path.mkdir(exist_ok=True)
-                        import generate_180_return
                         
                         for i in range(1, qty + 1):
                             return_file = return_path / f"Return180-{variant}_{pipe_size.replace('/', '-')}in_Sch{schedule}_{i:02d}.step"
-                            generate_180_return.generate_180_return(
-                                nps=nps_float,
-                                schedule=schedule,
-                                return_type=variant,
-                                output_file=str(return_file)
-                            )
-                            generated_files.append(str(return_file))
+                            jobs.append(make_job(
+                                f"180° Return ({variant}) {i:02d}", 'generate_180_return', 'generate_180_return',
+                                {'nps': nps_float, 'schedule': schedule, 'return_type': variant,
+                                 'output_file': str(return_file)},
+                                output_file=return_file
+                            ))
                     
                     # TEES
                     elif comp_type == "Tee Equal":
                         tee_path = package_path / "Tees"
                         tee_path.mkdir(exist_ok=True)
-                        import generate_tee
                         
                         for i in range(1, qty + 1):
                             tee_file = tee_path / f"Tee-Equal_{pipe_size.replace('/', '-')}in_Sch{schedule}_{i:02d}.step"
-                            generate_tee.generate_tee(
-                                run_nps=nps_float,
-                                run_schedule=schedule,
-                                branch_nps=None,
-                                branch_schedule=None,
-                                output_file=str(tee_file)
-                            )
-                            generated_files.append(str(tee_file))
+                            jobs.append(make_job(
+                                f"Tee Equal {i:02d}", 'generate_tee', 'generate_tee',
+                                {'run_nps': nps_float, 'run_schedule': schedule,
+                                 'branch_nps': None, 'branch_schedule': None,
+                                 'output_file': str(tee_file)},
+                                output_file=tee_file
+                            ))
                     
                     elif comp_type == "Tee Reducing":
                         tee_path = package_path / "Tees"
                         tee_path.mkdir(exist_ok=True)
-                        import generate_tee
                         
                         outlet_size = details.get("outlet_size", "2")
-                        branch_float = float(eval(outlet_size.replace('"', ''))) if '/' in outlet_size else float(outlet_size)
+                        branch_float = NPS(outlet_size).inches
                         
                         for i in range(1, qty + 1):
                             tee_file = tee_path / f"Tee-Red_{pipe_size.replace('/', '-')}x{outlet_size.replace('/', '-')}in_Sch{schedule}_{i:02d}.step"
-                            generate_tee.generate_tee(
-                                run_nps=nps_float,
-                                run_schedule=schedule,
-                                branch_nps=branch_float,
-                                branch_schedule=schedule,
-                                output_file=str(tee_file)
-                            )
-                            generated_files.append(str(tee_file))
+                            jobs.append(make_job(
+                                f"Tee Reducing {i:02d}", 'generate_tee', 'generate_tee',
+                                {'run_nps': nps_float, 'run_schedule': schedule,
+                                 'branch_nps': branch_float, 'branch_schedule': schedule,
+                                 'output_file': str(tee_file)},
+                                output_file=tee_file
+                            ))
                     
                     # CROSSES
                     elif comp_type == "Cross Equal":
                         cross_path = package_path / "Crosses"
                         cross_path.mkdir(exist_ok=True)
-                        import generate_cross
                         
                         for i in range(1, qty + 1):
                             cross_file = cross_path / f"Cross-Equal_{pipe_size.replace('/', '-')}in_Sch{schedule}_{i:02d}.step"
-                            generate_cross.generate_cross(
-                                nps=nps_float,
-                                schedule=schedule,
-                                output_file=str(cross_file)
-                            )
-                            generated_files.append(str(cross_file))
+                            jobs.append(make_job(
+                                f"Cross Equal {i:02d}", 'generate_cross', 'generate_cross',
+                                {'nps': nps_float, 'schedule': schedule, 'output_file': str(cross_file)},
+                                output_file=cross_file
+                            ))
                     
                     # REDUCERS
-                    elif comp_type == "Reducer Concentric":
-                        reducer_path = package_path / "Reducers"
-                        reducer_path.mkdir(exist_ok=True)
-                        import generate_reducer
-                        
-                        outlet_size = details.get("outlet_size", "2")
-                        smaller_float = float(eval(outlet_size.replace('"', ''))) if '/' in outlet_size else float(outlet_size)
-                        
-                        for i in range(1, qty + 1):
-                            reducer_file = reducer_path / f"Reducer-Con_{pipe_size.replace('/', '-')}x{outlet_size.replace('/', '-')}in_Sch{schedule}_{i:02d}.step"
-                            generate_reducer.generate_reducer(
-                                large_nps=nps_float,
-                                small_nps=smaller_float,
-                                schedule=schedule,
-                                reducer_type="concentric",
-                                output_file=str(reducer_file)
-                            )
-                            generated_files.append(str(reducer_file))
-                    
-                    elif comp_type == "Reducer Eccentric":
+                    elif comp_type in ("Reducer Concentric", "Reducer Eccentric"):
                         reducer_path = package_path / "Reducers"
                         reducer_path.mkdir(exist_ok=True)
-                        import generate_reducer
                         
                         outlet_size = details.get("outlet_size", "2")
-                        smaller_float = float(eval(outlet_size.replace('"', ''))) if '/' in outlet_size else float(outlet_size)
+                        smaller_float = NPS(outlet_size).inches
+                        reducer_type = "concentric" if comp_type == "Reducer Concentric" else "eccentric"
+                        prefix = "Reducer-Con" if reducer_type == "concentric" else "Reducer-Ecc"
                         
                         for i in range(1, qty + 1):
-                            reducer_file = reducer_path / f"Reducer-Ecc_{pipe_size.replace('/', '-')}x{outlet_size.replace('/', '-')}in_Sch{schedule}_{i:02d}.step"
-                            generate_reducer.generate_reducer(
-                                large_nps=nps_float,
-                                small_nps=smaller_float,
-                                schedule=schedule,
-                                reducer_type="eccentric",
-                                output_file=str(reducer_file)
-                            )
-                            generated_files.append(str(reducer_file))
+                            reducer_file = reducer_path / f"{prefix}_{pipe_size.replace('/', '-')}x{outlet_size.replace('/', '-')}in_Sch{schedule}_{i:02d}.step"
+                            jobs.append(make_job(
+                                f"{comp_type} {i:02d}", 'generate_reducer', 'generate_reducer',
+                                {'large_nps': nps_float, 'small_nps': smaller_float, 'schedule': schedule,
+                                 'reducer_type': reducer_type, 'output_file': str(reducer_file)},
+                                output_file=reducer_file
+                            ))
                     
                     # FLANGE CONNECTIONS (includes flange pair + gasket + studs + nuts)
                     elif comp_type == "Flange Connection":
@@ -4706,67 +4930,63 @@ class CADGeneratorApp:
                             "THD": "Threaded", "LJ": "Lap Joint", "Blind": "Blind", "TestBlind": "TestBlind"
                         }
                         
-                        for i in range(1, qty + 1):
-                            # Generate Flange A
-                            self._generate_single_flange(
-                                flange_type_map.get(flange_a_type, "Weld Neck"),
-                                pipe_size, flange_class, facing, flange_path,
-                                f"{flange_a_type}_{pipe_size.replace('/', '-')}in_Class{flange_class}_{facing}_conn{i:02d}_A.step",
-                                generated_files, errors
-                            )
-                            
-                            # Generate Flange B
-                            self._generate_single_flange(
-                                flange_type_map.get(flange_b_type, "Weld Neck"),
-                                pipe_size, flange_class, facing, flange_path,
-                                f"{flange_b_type}_{pipe_size.replace('/', '-')}in_Class{flange_class}_{facing}_conn{i:02d}_B.step",
-                                generated_files, errors
-                            )
+                        if self.flow_connection_assembly_var.get():
+                            # Parts are built once per row; every connection is an
+                            # assembly that references them (studs/nuts instanced)
+                            assembly_path = package_path / "Assemblies"
+                            assembly_path.mkdir(exist_ok=True)
+                            tag = f"row{row:02d}"
+                            part_ids = {}
                             
-                            # Generate Gasket
-                            try:
-                                import generate_gasket
-                                gasket_file = gasket_path / f"Gasket_{pipe_size.replace('/', '-')}in_Class{flange_class}_conn{i:02d}.step"
-                                generate_gasket.generate_spiral_wound_gasket(
-                                    nps=pipe_size,
-                                    pressure_class=int(flange_class),
-                                    output_dir=str(gasket_path)
+                            for side, side_type in (("A", flange_a_type), ("B", flange_b_type)):
+                                job = self._make_single_flange_job(
+                                    flange_type_map.get(side_type, "Weld Neck"),
+                                    pipe_size, flange_class, facing, flange_path,
+                                    f"{side_type}_{pipe_size.replace('/', '-')}in_Class{flange_class}_{facing}_{tag}_{side}.step",
+                                    job_id=f"{tag}:flange_{side.lower()}"
                                 )
-                                generated_files.append(str(gasket_file))
-                            except Exception as e:
-                                errors.append(f"Gasket conn{i}: {str(e)}")
+                                if job:
+                                    jobs.append(job)
+                                    part_ids[f"flange_{side.lower()}_file"] = job['id']
                             
-                            # Generate Studs
-                            try:
-                                import generate_stud
-                                stud_file = fastener_path / f"StudSet_{pipe_size.replace('/', '-')}in_Class{flange_class}_conn{i:02d}.step"
-                                generate_stud.generate_stud(
-                                    standard='B16.5',
-                                    nps=pipe_size,
-                                    pressure_class=int(flange_class),
-                                    facing_type=facing,
-                                    output_dir=str(fastener_path)
-                                )
-                                generated_files.append(str(stud_file))
-                            except Exception as e:
-                                errors.append(f"Studs conn{i}: {str(e)}")
+                            bolting = self._make_bolted_joint_jobs(
+                                pipe_size, flange_class, facing, gasket_path, fastener_path,
+                                tag, errors, id_prefix=tag
+                            )
+                            jobs.extend(bolting)
+                            for job in bolting:
+                                part_ids[f"{job['id'].split(':', 1)[1]}_file"] = job['id']
                             
-                            # Generate Nuts
-                            try:
-                                import generate_hex_nut
-                                nut_file = fastener_path / f"NutSet_{pipe_size.replace('/', '-')}in_Class{flange_class}_conn{i:02d}.step"
-                                # Get stud size for this flange size/class
-                                from asme_b165_stud_data import get_b165_stud_info
-                                stud_info = get_b165_stud_info(pipe_size, int(flange_class), facing)
-                                if stud_info:
-                                    generate_hex_nut.generate_hex_nut(
-                                        nut_type='2h',
-                                        nominal_size=stud_info.get('diameter', '3/4'),
-                                        output_dir=str(fastener_path)
+                            if len(part_ids) == 5:
+                                for i in range(1, qty + 1):
+                                    assembly_file = assembly_path / f"FlangeConnection-{variant}_{pipe_size.replace('/', '-')}in_Class{flange_class}_{facing}_conn{i:02d}.step"
+                                    jobs.append(make_job(
+                                        f"Flange Connection {variant} {i:02d}", 'step_assembly', 'write_flange_connection_assembly',
+                                        {'nps': pipe_size, 'pressure_class': int(flange_class), 'facing': facing,
+                                         'output_file': str(assembly_file)},
+                                        output_file=assembly_file, inputs=part_ids
+                                    ))
+                            else:
+                                errors.append(f"{comp_type} ({variant}): not every part has a generator - assembly skipped")
+                        else:
+                            for i in range(1, qty + 1):
+                                # Flange A and Flange B
+                                for side, side_type in (("A", flange_a_type), ("B", flange_b_type)):
+                                    job = self._make_single_flange_job(
+                                        flange_type_map.get(side_type, "Weld Neck"),
+                                        pipe_size, flange_class, facing, flange_path,
+                                        f"{side_type}_{pipe_size.replace('/', '-')}in_Class{flange_class}_{facing}_conn{i:02d}_{side}.step"
                                     )
-                                    generated_files.append(str(nut_file))
-                            except Exception as e:
-                                errors.append(f"Nuts conn{i}: {str(e)}")
+                                    if job:
+                                        jobs.append(job)
+                                    else:
+                                        errors.append(f"{comp_type} ({variant}) {i:02d}{side}: no {side_type} flange generator installed")
+                                
+                                # Gasket, studs and nuts
+                                jobs.extend(self._make_bolted_joint_jobs(
+                                    pipe_size, flange_class, facing, gasket_path, fastener_path,
+                                    f"conn{i:02d}", errors
+                                ))
                     
                     # VALVES (FB) - Generate placeholder valve body + matching flanges
                     elif "Valve (FB)" in comp_type:
@@ -4789,24 +5009,17 @@ class CADGeneratorApp:
                         # Get F2F from details
                         f2f = details.get("face_to_face", 8.0)
                         
-                        # Generate valve placeholder(s)
-                        try:
-                            import generate_valve_placeholder
-                            
-                            for i in range(1, qty + 1):
-                                valve_file = valve_path / f"{valve_name.replace(' ', '')}_{pipe_size.replace('/', '-')}in_F2F{f2f}in_Class{flange_class}_{i:02d}.step"
-                                generate_valve_placeholder.generate_valve_placeholder(
-                                    nps=nps_float,
-                                    pressure_class=int(flange_class),
-                                    face_to_face=f2f,
-                                    valve_type=valve_type,
-                                    output_file=str(valve_file)
-                                )
-                                generated_files.append(str(valve_file))
-                        except Exception as e:
-                            errors.append(f"{valve_name} body: {str(e)}")
+                        # Valve placeholder(s)
+                        for i in range(1, qty + 1):
+                            valve_file = valve_path / f"{valve_name.replace(' ', '')}_{pipe_size.replace('/', '-')}in_F2F{f2f}in_Class{flange_class}_{i:02d}.step"
+                            jobs.append(make_job(
+                                f"{valve_name} body {i:02d}", 'generate_valve_placeholder', 'generate_valve_placeholder',
+                                {'nps': nps_float, 'pressure_class': int(flange_class), 'face_to_face': f2f,
+                                 'valve_type': valve_type, 'output_file': str(valve_file)},
+                                output_file=valve_file
+                            ))
                         
-                        # Generate matching flanges if needed
+                        # Matching flanges if needed
                         if details.get("needs_flanges"):
                             flange_path = package_path / "Flanges"
                             flange_path.mkdir(exist_ok=True)
@@ -4819,60 +5032,57 @@ class CADGeneratorApp:
                             
                             for i in range(1, qty + 1):
                                 for flg_num in range(1, flanges_per + 1):
-                                    # Generate WN flange for valve connection
-                                    self._generate_single_flange(
+                                    # WN flange for valve connection
+                                    job = self._make_single_flange_job(
                                         "Weld Neck",
                                         pipe_size, flange_class, facing, flange_path,
-                                        f"WN_{valve_name.replace(' ', '')}_{i:02d}_Flg{flg_num}_{pipe_size.replace('/', '-')}in_Class{flange_class}.step",
-                                        generated_files, errors
+                                        f"WN_{valve_name.replace(' ', '')}_{i:02d}_Flg{flg_num}_{pipe_size.replace('/', '-')}in_Class{flange_class}.step"
                                     )
+                                    if job:
+                                        jobs.append(job)
+                                    else:
+                                        errors.append(f"{valve_name} {i} Flg{flg_num}: no Weld Neck flange generator installed")
                                     
-                                    # Generate Gasket
-                                    try:
-                                        import generate_gasket
-                                        gasket_file = gasket_path / f"Gasket_{valve_name.replace(' ', '')}_{i:02d}_Flg{flg_num}_{pipe_size.replace('/', '-')}in.step"
-                                        generate_gasket.generate_spiral_wound_gasket(
-                                            nps=pipe_size,
-                                            pressure_class=int(flange_class),
-                                            output_dir=str(gasket_path)
-                                        )
-                                        generated_files.append(str(gasket_file))
-                                    except Exception as e:
-                                        errors.append(f"Gasket {valve_name} {i} Flg{flg_num}: {str(e)}")
-                                    
-                                    # Generate Studs
-                                    try:
-                                        import generate_stud
-                                        from asme_b165_stud_data import get_b165_stud_info
-                                        stud_info = get_b165_stud_info(pipe_size, int(flange_class), facing)
-                                        if stud_info:
-                                            generate_stud.generate_stud(
-                                                standard='B16.5',
-                                                nps=pipe_size,
-                                                pressure_class=int(flange_class),
-                                                facing_type=facing,
-                                                output_dir=str(fastener_path)
-                                            )
-                                    except Exception as e:
-                                        errors.append(f"Studs {valve_name} {i} Flg{flg_num}: {str(e)}")
-                                    
-                                    # Generate Nuts
-                                    try:
-                                        import generate_hex_nut
-                                        from asme_b165_stud_data import get_b165_stud_info
-                                        stud_info = get_b165_stud_info(pipe_size, int(flange_class), facing)
-                                        if stud_info:
-                                            generate_hex_nut.generate_hex_nut(
-                                                nut_type='2h',
-                                                nominal_size=stud_info.get('diameter', '3/4'),
-                                                output_dir=str(fastener_path)
-                                            )
-                                    except Exception as e:
-                                        errors.append(f"Nuts {valve_name} {i} Flg{flg_num}: {str(e)}")
+                                    # Gasket, studs and nuts
+                                    jobs.extend(self._make_bolted_joint_jobs(
+                                        pipe_size, flange_class, facing, gasket_path, fastener_path,
+                                        f"{valve_name} {i} Flg{flg_num}", errors
+                                    ))
                 
                 except Exception as e:
                     errors.append(f"{comp_type} ({variant}): {str(e)}")
-            
+        
+        except Exception as e:
+            self.status_var.set(f"❌ Error: {str(e)}")
+            messagebox.showerror("Generation Error", f"Failed to generate assembly:\n\n{str(e)}")
+            return
+        
+        # Identical parts (qty copies, matching gaskets/studs/nuts) are built once
+        part_count = len(jobs)
+        instance_mode = 'assembly' if self.flow_instance_assembly_var.get() else 'files'
+        jobs = merge_duplicate_jobs(jobs, instance_mode=instance_mode)
+        
+        self.flow_gen_btn.config(state="disabled")
+        self.status_var.set(f"🔄 Generating {part_count} parts ({len(jobs)} unique) on {min(len(jobs), default_worker_count())} workers...")
+        
+        on_complete = lambda summary: self._flow_calc_package_complete(
+            summary, errors, package_path, build_list, pipe_size, schedule, flange_class, facing
+        )
+        thread = threading.Thread(
+            target=self._run_generation,
+            args=("Flow Calculator Package",),
+            kwargs={'jobs': jobs, 'on_complete': on_complete},
+            daemon=True
+        )
+        thread.start()
+    
+    def _flow_calc_package_complete(self, summary, errors, package_path, build_list, pipe_size, schedule, flange_class, facing):
+        """Write the package README and report results (runs on the Tk main loop)."""
+        generated_files = summary['generated_files']
+        errors = errors + summary['errors']
+        self.flow_gen_btn.config(state="normal")
+        
+        try:
             # Create README
             readme_path = package_path / "README.txt"
             with open(readme_path, 'w') as f:
@@ -4885,7 +5095,7 @@ class CADGeneratorApp:
                 f.write(f"  Flange Class: {flange_class}\n")
                 f.write(f"  Facing: {facing}\n\n")
                 f.write(f"BUILD LIST:\n")
-                for item in self.flow_build_list:
+                for item in build_list:
                     f.write(f"  - {item['display_text']}\n")
                     # Note F2F for valves
                     if item['details'].get('face_to_face'):
@@ -4895,7 +5105,7 @@ class CADGeneratorApp:
                     f.write(f"  - {Path(file).name}\n")
                 
                 # Add valve note if any valves in build list
-                has_valves = any("Valve" in item['type'] for item in self.flow_build_list)
+                has_valves = any("Valve" in item['type'] for item in build_list)
                 if has_valves:
                     f.write(f"\n⚠️  VALVE NOTE:\n")
                     f.write(f"  Valve bodies are PLACEHOLDER shapes for layout purposes.\n")
@@ -4916,7 +5126,7 @@ class CADGeneratorApp:
                     f"Generated {len(generated_files)} files successfully.\n\n{len(errors)} components failed:\n" + "\n".join(errors[:5])
                 )
             else:
-                self.status_var.set(f"✅ Successfully generated {len(generated_files)} files!")
+                self.status_var.set(f"✅ Successfully generated {len(generated_files)} files in {summary['elapsed']:.1f}s!")
                 messagebox.showinfo(
                     "Success",
                     f"Assembly package generated successfully!\n\n{len(generated_files)} files created in:\n{package_path.name}"
@@ -4929,75 +5139,100 @@ class CADGeneratorApp:
         except Exception as e:
             self.status_var.set(f"❌ Error: {str(e)}")
             messagebox.showerror("Generation Error", f"Failed to generate assembly:\n\n{str(e)}")
-        self.root.update()
     
-    def _generate_single_flange(self, flange_type, pipe_size, flange_class, facing, output_path, filename, generated_files, errors):
-        """Helper to generate a single flange"""
+    @staticmethod
+    def _flange_generator_module(flange_type):
+        """Generator module that builds a B16.5 flange type (None for unknown types)"""
+        return {
+            "Weld Neck": 'generate_asme_flange',
+            "Blind": 'generate_asme_flange',
+            "TestBlind": 'generate_test_blind',
+            "Slip-On": 'generate_slip_on_flange',
+            "Socket Weld": 'generate_socket_weld_flange',
+            "Threaded": 'generate_threaded_flange',
+            "Lap Joint": 'generate_lap_joint_flange',
+        }.get(flange_type)
+    
+    def _make_single_flange_job(self, flange_type, pipe_size, flange_class, facing, output_path, filename, job_id=None):
+        """Build the generation job for a single flange (None for unknown types
+        and types whose generator is not installed)"""
+        flange_file = output_path / filename
+        label = f"{flange_type} flange"
+        module = self._flange_generator_module(flange_type)
+        if not module or not generator_available(module):
+            return None
+        
+        if flange_type == "Weld Neck":
+            return make_job(label, 'generate_asme_flange', 'generate_asme_b16_5_wn_flange', {
+                'pressure_class': flange_class,
+                'size': pipe_size,
+                'output_file': str(flange_file),
+                'include_bevel': True,
+                'series': 'B16.5'
+            }, output_file=flange_file, job_id=job_id)
+        elif flange_type == "Blind":
+            return make_job(label, 'generate_asme_flange', 'generate_asme_b16_5_blind_flange', {
+                'pressure_class': flange_class,
+                'size': pipe_size,
+                'output_file': str(flange_file),
+                'series': 'B16.5'
+            }, output_file=flange_file, job_id=job_id)
+        elif flange_type == "TestBlind":
+            return make_job(label, 'generate_test_blind', 'generate_test_blind_flange', {
+                'pressure_class': flange_class,
+                'size': pipe_size,
+                'tap_size': "3/4",
+                'output_file': str(flange_file),
+                'series': 'B16.5'
+            }, output_file=flange_file, job_id=job_id)
+        
+        # These generators name their own files inside output_dir
+        return make_job(label, module, module, {
+            'nps': pipe_size,
+            'pressure_class': int(flange_class),
+            'facing': facing,
+            'output_dir': str(output_path)
+        }, output_file=flange_file, job_id=job_id)
+    
+    def _make_bolted_joint_jobs(self, pipe_size, flange_class, facing, gasket_path, fastener_path, tag, errors, id_prefix=None):
+        """Build the gasket, stud and nut jobs for one flanged joint
+        
+        With id_prefix the jobs get ids '<prefix>:gasket', '<prefix>:stud' and
+        '<prefix>:nut' so an assembly job can take them as inputs.
+        """
+        job_id = (lambda part: f"{id_prefix}:{part}") if id_prefix else (lambda part: None)
+        jobs = [
+            make_job(f"Gasket {tag}", 'generate_gasket', 'generate_spiral_wound_gasket', {
+                'nps': pipe_size,
+                'pressure_class': int(flange_class),
+                'output_dir': str(gasket_path)
+            }, output_file=gasket_path / f"Gasket_{pipe_size.replace('/', '-')}in_Class{flange_class}_{tag}.step",
+               job_id=job_id('gasket')),
+            make_job(f"Studs {tag}", 'generate_stud', 'generate_stud', {
+                'standard': 'B16.5',
+                'nps': pipe_size,
+                'pressure_class': int(flange_class),
+                'facing_type': facing,
+                'output_dir': str(fastener_path)
+            }, output_file=fastener_path / f"StudSet_{pipe_size.replace('/', '-')}in_Class{flange_class}_{tag}.step",
+               job_id=job_id('stud')),
+        ]
+        
+        # Nut size comes from the stud table for this flange size/class
         try:
-            flange_file = output_path / filename
-            
-            if flange_type == "Weld Neck":
-                import generate_asme_flange
-                generate_asme_flange.generate_asme_b16_5_wn_flange(
-                    pressure_class=flange_class,
-                    size=pipe_size,
-                    output_file=str(flange_file),
-                    include_bevel=True,
-                    series='B16.5'
-                )
-            elif flange_type == "Blind":
-                import generate_asme_flange
-                generate_asme_flange.generate_asme_b16_5_blind_flange(
-                    pressure_class=flange_class,
-                    size=pipe_size,
-                    output_file=str(flange_file),
-                    series='B16.5'
-                )
-            elif flange_type == "TestBlind":
-                import generate_test_blind
-                generate_test_blind.generate_test_blind_flange(
-                    pressure_class=flange_class,
-                    size=pipe_size,
-                    tap_size="3/4",
-                    output_file=str(flange_file),
-                    series='B16.5'
-                )
-            elif flange_type == "Slip-On":
-                import generate_slip_on_flange
-                generate_slip_on_flange.generate_slip_on_flange(
-                    nps=pipe_size,
-                    pressure_class=int(flange_class),
-                    facing=facing,
-                    output_dir=str(output_path)
-                )
-            elif flange_type == "Socket Weld":
-                import generate_socket_weld_flange
-                generate_socket_weld_flange.generate_socket_weld_flange(
-                    nps=pipe_size,
-                    pressure_class=int(flange_class),
-                    facing=facing,
-                    output_dir=str(output_path)
-                )
-            elif flange_type == "Threaded":
-                import generate_threaded_flange
-                generate_threaded_flange.generate_threaded_flange(
-                    nps=pipe_size,
-                    pressure_class=int(flange_class),
-                    facing=facing,
-                    output_dir=str(output_path)
-                )
-            elif flange_type == "Lap Joint":
-                import generate_lap_joint_flange
-                generate_lap_joint_flange.generate_lap_joint_flange(
-                    nps=pipe_size,
-                    pressure_class=int(flange_class),
-                    facing=facing,
-                    output_dir=str(output_path)
-                )
-            
-            generated_files.append(str(flange_file))
+            from standards_catalog import get_b165_stud_info, inches_to_nut_size
+            stud_info = get_b165_stud_info(pipe_size, int(flange_class), facing)
+            if stud_info:
+                jobs.append(make_job(f"Nuts {tag}", 'generate_hex_nut', 'generate_hex_nut', {
+                    'nut_type': '2h',
+                    'nominal_size': inches_to_nut_size(stud_info['stud_diameter_inches']),
+                    'output_dir': str(fastener_path)
+                }, output_file=fastener_path / f"NutSet_{pipe_size.replace('/', '-')}in_Class{flange_class}_{tag}.step",
+                   job_id=job_id('nut')))
         except Exception as e:
-            errors.append(f"{flange_type} flange: {str(e)}")
+            errors.append(f"Nuts {tag}: {str(e)}")
+        
+        return jobs
     
     def _convert_flow_to_gpm(self, value, unit):
         """Convert flow rate to GPM"""
@@ -5023,22 +5258,8 @@ class CADGeneratorApp:
         return value * conversions.get(unit, 1.0)
     
     def _get_pipe_id_estimate(self, nps, schedule):
-        """Simplified pipe ID lookup (would use actual pipe_data in full implementation)"""
-        # Simplified estimates - should use actual pipe dimension tables
-        pipe_ids = {
-            ("1", "40"): 1.049, ("1", "80"): 0.957, ("1", "160"): 0.815,
-            ("1-1/4", "40"): 1.380, ("1-1/4", "80"): 1.278, ("1-1/4", "160"): 1.160,
-            ("1-1/2", "40"): 1.610, ("1-1/2", "80"): 1.500, ("1-1/2", "160"): 1.338,
-            ("2", "40"): 2.067, ("2", "80"): 1.939, ("2", "160"): 1.689,
-            ("2-1/2", "40"): 2.469, ("2-1/2", "80"): 2.323, ("2-1/2", "160"): 2.125,
-            ("3", "40"): 3.068, ("3", "80"): 2.900, ("3", "160"): 2.624,
-            ("4", "40"): 4.026, ("4", "80"): 3.826, ("4", "160"): 3.438,
-            ("6", "40"): 6.065, ("6", "80"): 5.761, ("6", "160"): 5.187,
-            ("8", "40"): 7.981, ("8", "80"): 7.625, ("8", "160"): 7.001,
-            ("10", "40"): 10.020, ("10", "80"): 9.562, ("10", "160"): 8.750,
-            ("12", "40"): 11.938, ("12", "80"): 11.374, ("12", "160"): 10.750,
-        }
-        return pipe_ids.get((nps, schedule), 0)
+        """Pipe ID in inches from the B36.10M table (0 when the NPS / schedule is not listed)"""
+        return PipeData.get_pipe_id(nps, schedule)
     
     def _get_schedule_pressure_rating(self, schedule, size):
         """Simplified pressure rating (would use actual ASME B31.3 calculations)"""
@@ -5135,9 +5356,11 @@ class CADGeneratorApp:
         thread = threading.Thread(target=self._run_generation, args=(component,), daemon=True)
         thread.start()
     
-    def _run_generation(self, component):
+    def _run_generation(self, component, jobs=None, on_complete=None, on_result=None):
         try:
-            if component == "Flanges":
+            if jobs is not None:
+                self._run_batch_jobs(component, jobs, on_complete, on_result)
+            elif component == "Flanges":
                 self._generate_flange()
             elif component == "Fasteners":
                 self._generate_fastener()
@@ -5161,6 +5384,35 @@ class CADGeneratorApp:
             error_msg = str(e)
             self.root.after(0, lambda: self._generation_error(error_msg))
     
+    def _run_batch_jobs(self, title, jobs, on_complete=None, on_result=None):
+        """
+        Run a list of batch_engine jobs across worker processes (one per core).
+        Called on a background thread; progress and completion are posted back
+        to the Tk main loop with root.after.
+        
+        on_complete receives the run_batch summary dict
+        ('generated_files', 'errors', 'results', 'elapsed').
+        on_result receives each job result as it finishes, on this thread.
+        """
+        def report_progress(done, total, result):
+            if on_result:
+                on_result(result)
+            mark = "✓" if result['success'] else "✗"
+            msg = f"🔄 {title}: {done}/{total} {mark} {result['label']}"
+            self.root.after(0, lambda: self.status_var.set(msg))
+        
+        summary = run_batch(jobs, progress_callback=report_progress)
+        
+        if on_complete:
+            self.root.after(0, lambda: on_complete(summary))
+        elif summary['generated_files']:
+            files = summary['generated_files']
+            display = f"{len(files)} files" + (f" ({len(summary['errors'])} errors)" if summary['errors'] else "")
+            self.root.after(0, lambda: self._generation_complete_multi(display, files[0]))
+        else:
+            error_msg = summary['errors'][0] if summary['errors'] else "No files generated"
+            self.root.after(0, lambda: self._generation_error(error_msg))
+    
     def _get_output_subfolder(self, category, **params):
         """Determine the correct subfolder path for a component."""
         base_path = self.library_path / category
@@ -5478,93 +5730,18 @@ class CADGeneratorApp:
     
     def _find_longest_stud_for_diameter(self, diameter):
         """Find the longest stud across all standards for a given diameter."""
-        import sys
-        import os
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        sys.path.insert(0, script_dir)
-        
-        # Convert diameter string to float for comparison
-        diameter_float = self._nps_to_float(diameter)
-        
-        longest = None
-        max_length = 0
-        
-        # Check all B16.5 classes
-        from asme_b165_stud_data import (
-            B165_CLASS_150_STUDS, B165_CLASS_300_STUDS, B165_CLASS_600_STUDS,
-            B165_CLASS_900_STUDS, B165_CLASS_1500_STUDS, B165_CLASS_2500_STUDS
-        )
-        
-        for pressure_class, data_dict in [
-            (150, B165_CLASS_150_STUDS), (300, B165_CLASS_300_STUDS),
-            (600, B165_CLASS_600_STUDS), (900, B165_CLASS_900_STUDS),
-            (1500, B165_CLASS_1500_STUDS), (2500, B165_CLASS_2500_STUDS)
-        ]:
-            for size, info in data_dict.items():
-                stud_dia = info.get('stud_diameter_inches', 0)
-                if abs(stud_dia - diameter_float) < 0.001:  # Match with small tolerance
-                    length = info.get('stud_length_mm', 0)
-                    if length > max_length:
-                        max_length = length
-                        longest = {
-                            'standard': 'B16.5',
-                            'size': size,
-                            'pressure_class': pressure_class,
-                            'diameter': diameter,
-                            'length': length
-                        }
-        
-        # Check API 6B
-        from api_6b_stud_data import (
-            API_6B_2000_STUDS, API_6B_3000_STUDS, API_6B_5000_STUDS,
-            API_6B_10000_STUDS, API_6B_15000_STUDS, API_6B_20000_STUDS
-        )
-        
-        for pressure_class, data_dict in [
-            (2000, API_6B_2000_STUDS), (3000, API_6B_3000_STUDS),
-            (5000, API_6B_5000_STUDS), (10000, API_6B_10000_STUDS),
-            (15000, API_6B_15000_STUDS), (20000, API_6B_20000_STUDS)
-        ]:
-            for size, info in data_dict.items():
-                stud_dia = info.get('stud_diameter_inches', 0)
-                if abs(stud_dia - diameter_float) < 0.001:  # Match with small tolerance
-                    length = info.get('stud_length_mm', 0)
-                    if length > max_length:
-                        max_length = length
-                        longest = {
-                            'standard': 'API 6B',
-                            'size': size,
-                            'pressure_class': pressure_class,
-                            'diameter': diameter,
-                            'length': length
-                        }
-        
-        # Check API 6BX
-        from api_6bx_stud_data import (
-            API_6BX_3000_STUDS, API_6BX_5000_STUDS, API_6BX_10000_STUDS,
-            API_6BX_15000_STUDS, API_6BX_20000_STUDS
-        )
-        
-        for pressure_class, data_dict in [
-            (3000, API_6BX_3000_STUDS), (5000, API_6BX_5000_STUDS),
-            (10000, API_6BX_10000_STUDS), (15000, API_6BX_15000_STUDS),
-            (20000, API_6BX_20000_STUDS)
-        ]:
-            for size, info in data_dict.items():
-                stud_dia = info.get('stud_diameter_inches', 0)
-                if abs(stud_dia - diameter_float) < 0.001:  # Match with small tolerance
-                    length = info.get('stud_length_mm', 0)
-                    if length > max_length:
-                        max_length = length
-                        longest = {
-                            'standard': 'API 6BX',
-                            'size': size,
-                            'pressure_class': pressure_class,
-                            'diameter': diameter,
-                            'length': length
-                        }
-        
-        return longest
+        from standards_catalog import longest_stud_for_size
+        
+        joint = longest_stud_for_size(diameter)
+        if not joint:
+            return None
+        return {
+            'standard': joint['standard'],
+            'size': joint['nps'],
+            'pressure_class': joint['pressure_class'],
+            'diameter': diameter,
+            'length': joint['stud']['stud_length_mm']
+        }
     
     def _get_stud_info_for_flange(self, standard, size, pressure_class):
         """Get stud information (including diameter) for a given flange."""
@@ -5678,7 +5855,7 @@ class CADGeneratorApp:
         
         try:
             # Convert NPS string to float for generators
-            nps_float = float(nps.replace('-', '.'))
+            nps_float = NPS(nps).inches
             
             if "90° Elbow" in fitting_type:
                 import generate_elbow as elb_gen
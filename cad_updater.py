@@ -61,6 +61,20 @@ UPDATABLE_FILES = [
     "generate_threaded_flange.py",
     "generate_lap_joint_flange.py",
     "generate_pipe.py",
+    "batch_engine.py",
+    "cadgen_cli.py",
+    "step_cache.py",
+    "step_assembly.py",
+    "bolt_pattern.py",
+    "shape_templates.py",
+    "step_writer.py",
+    "standards_catalog.py",
+    "nps_key.py",
+    "option_model.py",
+    "steel_shape_index.py",
+    "standards_validator.py",
+    "pipe_network.py",
+    "pipe_data_complete.py",
 ]
 
 class AutoUpdater:
@@ -173,11 +187,27 @@ class AutoUpdater:
             
             # Update hash in state
             self.state["file_hashes"][filename] = self._get_file_hash(filepath)
+            
+            # Cached STEP files built by the old version are stale now
+            self._invalidate_step_cache(filename)
             return True
         except Exception as e:
             print(f"[Updater] Failed to update {filename}: {e}")
             return False
     
+    def _invalidate_step_cache(self, filename):
+        """Drop STEP cache entries produced by an updated module."""
+        if not filename.endswith('.py'):
+            return
+        try:
+            if str(self.scripts_dir) not in sys.path:
+                sys.path.insert(0, str(self.scripts_dir))
+            import step_cache
+            step_cache.invalidate_module(Path(filename).stem)
+        except Exception:
+            # Cache module not installed yet (first update) - nothing to invalidate
+            pass
+    
     def check_and_update(self, silent=True):
         """
         Check for updates and apply them.
@@ -0,0 +1,534 @@
+"""
+CAD Generator - Headless Command Line
+Drives the generate_*.py modules from a job manifest, no Tk display needed.
+
+Usage:
+    cadgen batch jobs.json
+    cadgen batch jobs.csv --workers 8 --results nightly_results.json
+    python cadgen_cli.py batch jobs.json --dry-run
+
+Manifest is a JSON list of objects or a CSV file with a header row.
+Columns (case-insensitive, blank = not set):
+    component   pipe, elbow, tee, cross, reducer, return, flange, stud, nut,
+                gasket, steel
+    standard    B16.5 / API 6B / API 6BX (flanges, studs), B16.47 (gaskets)
+    nps         Nominal size ('4', '1-1/2', '13-5/8'), nut thread size,
+                or steel designation ('W12X26')
+    class       Pressure class (150, 300 ... or 5K, 10K for API 6BX)
+    schedule    Pipe schedule (default 40)
+    length      Length in inches (pipe default 480, steel default 240)
+    output      STEP file path, or a directory for generators that name
+                their own files (default: current directory)
+
+Optional columns:
+    variant     Elbow type (LR/SR/LR3...), reducer type (concentric/eccentric),
+                return type, flange type (WN/Blind/SO/SW/THD/LJ),
+                gasket type (full_face/flat_ring/spiral_wound), nut type (2h)
+    angle       Elbow angle in degrees (default 90)
+    outlet      Branch/small-end NPS for reducing tees and reducers
+    facing      RF or RTJ (default RF)
+    series      A or B for B16.47 gaskets
+
+Results are written as JSON with per-job success, output file, error and
+timing. Parts already in the STEP cache (see step_cache.py) are copied
+instead of rebuilt unless --no-cache is given. Exit status is 1 if any job
+failed.
+
+With --validate the flange, stud and gasket rows are first checked against
+the standards tables (see standards_validator.py); any issue stops the run
+before a single part is generated. The whole catalog can be checked with:
+
+    cadgen validate
+    cadgen validate --standard B16.47 --class 600
+"""
+
+import os
+import sys
+import csv
+import json
+import argparse
+from datetime import datetime
+from fractions import Fraction
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, script_dir)
+
+from batch_engine import make_job, run_batch, default_worker_count, generator_available
+
+
+# ============================================================
+# Manifest parsing
+# ============================================================
+
+def load_manifest(path):
+    """
+    Load a JSON or CSV manifest into a list of normalized row dicts.
+    Keys are lower-cased and blank values become None.
+    """
+    if path.lower().endswith('.csv'):
+        with open(path, newline='', encoding='utf-8-sig') as f:
+            raw_rows = list(csv.DictReader(f))
+    else:
+        with open(path, 'r', encoding='utf-8') as f:
+            raw_rows = json.load(f)
+        if isinstance(raw_rows, dict):
+            raw_rows = raw_rows.get('jobs', [])
+
+    rows = []
+    for raw in raw_rows:
+        row = {}
+        for key, value in raw.items():
+            if key is None:
+                continue
+            if isinstance(value, str):
+                value = value.strip()
+                if value == '':
+                    value = None
+            row[key.strip().lower()] = value
+        rows.append(row)
+    return rows
+
+
+def parse_nps(text):
+    """Convert a nominal size ('4', '1-1/2', '3/4', 2.5) to float inches."""
+    if isinstance(text, (int, float)):
+        return float(text)
+    text = str(text).replace('"', '').strip()
+    if '-' in text and '/' in text:
+        whole, frac = text.split('-', 1)
+        return float(int(whole) + Fraction(frac))
+    return float(Fraction(text))
+
+
+def parse_class(value):
+    """Pressure class as int when numeric (150, 300), else string ('10K')."""
+    if value is None:
+        return None
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return str(value).upper()
+
+
+def _size_tag(nps):
+    return str(nps).replace('/', '-').replace(' ', '')
+
+
+def _output_file(row, default_name):
+    """STEP file path for generators that take output_file."""
+    output = row.get('output')
+    if output and str(output).lower().endswith(('.step', '.stp')):
+        path = output
+    else:
+        path = os.path.join(output or os.getcwd(), default_name)
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    return os.path.abspath(path)
+
+
+def _output_dir(row):
+    """Directory for generators that name their own files."""
+    output = row.get('output')
+    if output and str(output).lower().endswith(('.step', '.stp')):
+        output = os.path.dirname(output)
+    output = os.path.abspath(output or os.getcwd())
+    os.makedirs(output, exist_ok=True)
+    return output
+
+
+# ============================================================
+# Component -> generator job builders
+# Each returns (module, function, kwargs, expected_output_file)
+# ============================================================
+
+def _pipe_job(row):
+    nps = parse_nps(row['nps'])
+    schedule = str(row.get('schedule') or '40')
+    length = float(row.get('length') or 480.0)
+    out = _output_file(row, f"Pipe_{_size_tag(row['nps'])}in_Sch{schedule}_{length:g}in.step")
+    return 'generate_pipe', 'generate_pipe', {
+        'nps': nps, 'schedule': schedule, 'length_inches': length, 'output_file': out
+    }, out
+
+
+def _elbow_job(row):
+    nps = parse_nps(row['nps'])
+    schedule = str(row.get('schedule') or '40')
+    elbow_type = row.get('variant') or 'LR'
+    angle = float(row.get('angle') or 90.0)
+    out = _output_file(row, f"Elbow-{angle:g}deg-{elbow_type}_{_size_tag(row['nps'])}in_Sch{schedule}.step")
+    return 'generate_elbow', 'generate_elbow', {
+        'nps': nps, 'schedule': schedule, 'elbow_type': elbow_type, 'angle': angle, 'output_file': out
+    }, out
+
+
+def _tee_job(row):
+    nps = parse_nps(row['nps'])
+    schedule = str(row.get('schedule') or '40')
+    outlet = row.get('outlet')
+    if outlet:
+        name = f"Tee-Red_{_size_tag(row['nps'])}x{_size_tag(outlet)}in_Sch{schedule}.step"
+    else:
+        name = f"Tee-Equal_{_size_tag(row['nps'])}in_Sch{schedule}.step"
+    out = _output_file(row, name)
+    return 'generate_tee', 'generate_tee', {
+        'run_nps': nps, 'run_schedule': schedule,
+        'branch_nps': parse_nps(outlet) if outlet else None,
+        'branch_schedule': schedule if outlet else None,
+        'output_file': out
+    }, out
+
+
+def _cross_job(row):
+    nps = parse_nps(row['nps'])
+    schedule = str(row.get('schedule') or '40')
+    out = _output_file(row, f"Cross-Equal_{_size_tag(row['nps'])}in_Sch{schedule}.step")
+    return 'generate_cross', 'generate_cross', {
+        'nps': nps, 'schedule': schedule, 'output_file': out
+    }, out
+
+
+def _reducer_job(row):
+    if not row.get('outlet'):
+        raise ValueError("reducer requires an 'outlet' (small end) size")
+    schedule = str(row.get('schedule') or '40')
+    reducer_type = (row.get('variant') or 'concentric').lower()
+    prefix = 'Reducer-Ecc' if reducer_type.startswith('ecc') else 'Reducer-Con'
+    out = _output_file(row, f"{prefix}_{_size_tag(row['nps'])}x{_size_tag(row['outlet'])}in_Sch{schedule}.step")
+    return 'generate_reducer', 'generate_reducer', {
+        'large_nps': parse_nps(row['nps']), 'large_schedule': schedule,
+        'small_nps': parse_nps(row['outlet']), 'small_schedule': schedule,
+        'reducer_type': 'eccentric' if prefix == 'Reducer-Ecc' else 'concentric',
+        'output_file': out
+    }, out
+
+
+def _return_job(row):
+    nps = parse_nps(row['nps'])
+    schedule = str(row.get('schedule') or '40')
+    return_type = row.get('variant') or 'LR'
+    out = _output_file(row, f"Return180-{return_type}_{_size_tag(row['nps'])}in_Sch{schedule}.step")
+    return 'generate_180_return', 'generate_180_return', {
+        'nps': nps, 'schedule': schedule, 'return_type': return_type, 'output_file': out
+    }, out
+
+
+# B16.5 flange types whose generators take (nps, pressure_class, facing, output_dir)
+B165_FLANGE_MODULES = {
+    'SO': 'generate_slip_on_flange',
+    'SW': 'generate_socket_weld_flange',
+    'THD': 'generate_threaded_flange',
+    'LJ': 'generate_lap_joint_flange',
+}
+
+
+def _flange_job(row):
+    standard = (row.get('standard') or 'B16.5').upper()
+    pressure_class = parse_class(row.get('class'))
+    flange_type = (row.get('variant') or 'WN').upper()
+
+    if '6BX' in standard:
+        if flange_type != 'WN':
+            raise ValueError(f"API 6BX flanges are weld neck only (got {flange_type})")
+        out_dir = _output_dir(row)
+        return 'generate_all_flanges_test', 'generate_flange', {
+            'size': str(row['nps']), 'pressure_class': str(pressure_class), 'output_path': out_dir
+        }, None
+    if '6B' in standard:
+        raise ValueError(f"No API 6B flange generator (standard {row.get('standard')}) - use API 6BX or B16.5")
+
+    facing = (row.get('facing') or 'RF').upper()
+    if flange_type in B165_FLANGE_MODULES:
+        module = B165_FLANGE_MODULES[flange_type]
+        return module, module, {
+            'nps': str(row['nps']), 'pressure_class': pressure_class,
+            'facing': facing, 'output_dir': _output_dir(row)
+        }, None
+
+    if flange_type in ('WN', 'BLIND'):
+        if not generator_available('generate_asme_flange'):
+            raise ValueError(f"No B16.5 {flange_type} flange generator installed (generate_asme_flange) "
+                             f"- use variant {'/'.join(B165_FLANGE_MODULES)}")
+        function = 'generate_asme_b16_5_blind_flange' if flange_type == 'BLIND' else 'generate_asme_b16_5_wn_flange'
+        out = _output_file(row, f"{flange_type.title()}_{_size_tag(row['nps'])}in_Class{pressure_class}_{facing}.step")
+        kwargs = {'pressure_class': str(pressure_class), 'size': str(row['nps']),
+                  'output_file': out, 'series': 'B16.5'}
+        if flange_type == 'WN':
+            kwargs['include_bevel'] = True
+        return 'generate_asme_flange', function, kwargs, out
+
+    raise ValueError(f"Unknown flange type: {flange_type}")
+
+
+def _stud_job(row):
+    return 'generate_stud', 'generate_stud', {
+        'standard': row.get('standard') or 'B16.5',
+        'nps': str(row['nps']),
+        'pressure_class': parse_class(row.get('class')),
+        'facing_type': (row.get('facing') or 'RF').upper(),
+        'output_dir': _output_dir(row)
+    }, None
+
+
+def _nut_job(row):
+    return 'generate_hex_nut', 'generate_hex_nut', {
+        'nut_type': row.get('variant') or '2h',
+        'nominal_size': str(row['nps']),
+        'output_dir': _output_dir(row)
+    }, None
+
+
+GASKET_FUNCTIONS = {
+    'full_face': 'generate_full_face_gasket',
+    'flat_ring': 'generate_flat_ring_gasket',
+    'spiral_wound': 'generate_spiral_wound_gasket',
+}
+
+
+def _gasket_job(row):
+    gasket_type = (row.get('variant') or 'spiral_wound').lower().replace(' ', '_').replace('-', '_')
+    if gasket_type not in GASKET_FUNCTIONS:
+        raise ValueError(f"Unknown gasket type: {gasket_type}. Available: {list(GASKET_FUNCTIONS)}")
+    series = row.get('series')
+    if not series and 'B16.47' in (row.get('standard') or '').upper():
+        series = 'A'
+    return 'generate_gasket', GASKET_FUNCTIONS[gasket_type], {
+        'nps': str(row['nps']),
+        'pressure_class': parse_class(row.get('class')),
+        'series': series,
+        'output_dir': _output_dir(row)
+    }, None
+
+
+def _steel_job(row):
+    designation = str(row['nps']).upper()
+    length = float(row.get('length') or 240.0)
+    out = _output_file(row, f"{designation.replace('/', '-')}_{length:g}in.step")
+    return 'generate_steel_shapes', 'generate_steel_shape', {
+        'designation': designation, 'length_inches': length, 'output_file': out
+    }, out
+
+
+JOB_BUILDERS = {
+    'pipe': _pipe_job,
+    'elbow': _elbow_job,
+    'tee': _tee_job,
+    'cross': _cross_job,
+    'reducer': _reducer_job,
+    'return': _return_job,
+    '180_return': _return_job,
+    'flange': _flange_job,
+    'stud': _stud_job,
+    'nut': _nut_job,
+    'gasket': _gasket_job,
+    'steel': _steel_job,
+}
+
+
+def build_jobs(rows):
+    """
+    Convert manifest rows into batch_engine jobs.
+
+    Returns:
+        (jobs, errors) - errors are "row N: message" strings for rows that
+        could not be turned into a job (unknown component, missing size, ...)
+    """
+    jobs = []
+    errors = []
+    for index, row in enumerate(rows, start=1):
+        component = (row.get('component') or '').lower().replace(' ', '_')
+        builder = JOB_BUILDERS.get(component)
+        try:
+            if builder is None:
+                raise ValueError(f"Unknown component '{row.get('component')}'. Available: {', '.join(JOB_BUILDERS)}")
+            if not row.get('nps'):
+                raise ValueError("missing 'nps'")
+            module, function, kwargs, output_file = builder(row)
+        except Exception as e:
+            errors.append(f"row {index}: {e}")
+            continue
+
+        label = f"row {index}: {component} {row.get('nps')}"
+        if row.get('class'):
+            label += f" Class {row['class']}"
+        if row.get('schedule') and component in ('pipe', 'elbow', 'tee', 'cross', 'reducer', 'return', '180_return'):
+            label += f" Sch{row['schedule']}"
+        job = make_job(label, module, function, kwargs, output_file=output_file)
+        job['row'] = index
+        jobs.append(job)
+    return jobs, errors
+
+
+# ============================================================
+# Standards table gate
+# ============================================================
+
+# Components whose dimensions come from the joint tables
+VALIDATED_COMPONENTS = ('flange', 'stud', 'gasket')
+
+
+def _joint_selection(row):
+    """(standard, series, class, facing) a flange/stud/gasket row reads, normalized like the catalog."""
+    from standards_catalog import STANDARD_ALIASES
+    standard = (row.get('standard') or 'B16.5').upper()
+    standard = STANDARD_ALIASES.get(standard, standard)
+    series = None
+    if standard == 'B16.47':
+        series = (row.get('series') or 'A').upper()
+    pressure_class = parse_class(row.get('class'))
+    if isinstance(pressure_class, str):
+        pressure_class = int(pressure_class.replace('K', '000'))
+    facing = 'RTJ' if standard.startswith('API') else (row.get('facing') or 'RF').upper()
+    return standard, series, pressure_class, facing
+
+
+def validate_rows(rows):
+    """
+    Standards table issues touching the flange/stud/gasket rows of a manifest.
+
+    The whole catalog is validated once and matched against the rows, so
+    the check costs the same for ten rows or ten thousand.
+
+    Returns:
+        list of "row N: ..." strings (empty when the tables are consistent)
+    """
+    from standards_catalog import get_joint
+    from standards_validator import validate, describe
+
+    by_key = {}
+    for issue in validate():
+        key = (issue['standard'], issue['series'], issue['pressure_class'], issue['nps'])
+        by_key.setdefault(key, []).append(issue)
+
+    problems = []
+    for index, row in enumerate(rows, start=1):
+        component = (row.get('component') or '').lower()
+        if component not in VALIDATED_COMPONENTS or not row.get('nps'):
+            continue
+        try:
+            standard, series, pressure_class, facing = _joint_selection(row)
+        except (TypeError, ValueError):
+            continue  # reported by build_jobs
+        nps = str(row['nps'])
+        issues = [issue for issue in by_key.get((standard, series, pressure_class, nps), ())
+                  if issue['facing'] in (None, facing)]
+        problems.extend(f"row {index}: {describe(issue)}" for issue in issues)
+        if (not issues and component != 'gasket'
+                and get_joint(standard, nps, pressure_class, facing, series=series) is None):
+            problems.append(f"row {index}: no {standard} Class {pressure_class} {facing} joint for NPS {nps}")
+    return problems
+
+
+# ============================================================
+# Commands
+# ============================================================
+
+def cmd_batch(args):
+    rows = load_manifest(args.manifest)
+    jobs, manifest_errors = build_jobs(rows)
+
+    print(f"Manifest: {args.manifest} ({len(rows)} rows, {len(jobs)} jobs)")
+    for error in manifest_errors:
+        print(f"  ✗ {error}")
+
+    if args.validate:
+        problems = validate_rows(rows)
+        if problems:
+            print(f"Standards tables: {len(problems)} issue(s) - nothing generated")
+            for problem in problems:
+                print(f"  ✗ {problem}")
+            return 1
+        print("✓ Standards tables consistent for this manifest")
+
+    if args.dry_run:
+        for job in jobs:
+            print(f"  {job['label']} -> {job['module']}.{job['function']}")
+        return 1 if manifest_errors else 0
+
+    workers = args.workers or default_worker_count()
+    print(f"Running on {min(workers, max(len(jobs), 1))} worker(s)...")
+
+    def report(done, total, result):
+        mark = "✓" if result['success'] else "✗"
+        source = ", cached" if result.get('cached') else ""
+        print(f"[{done}/{total}] {mark} {result['label']} ({result['elapsed']:.2f}s{source})"
+              + (f" - {result['error']}" if result['error'] else ""))
+        sys.stdout.flush()
+
+    started = datetime.now()
+    summary = run_batch(jobs, max_workers=workers, progress_callback=report, use_cache=not args.no_cache)
+
+    job_results = []
+    for job, result in zip(jobs, summary['results']):
+        job_results.append({
+            'row': job['row'],
+            'label': result['label'],
+            'module': job['module'],
+            'function': job['function'],
+            'success': result['success'],
+            'cached': bool(result.get('cached')),
+            'file': result['file'],
+            'error': result['error'],
+            'elapsed': round(result['elapsed'], 4),
+        })
+
+    report_data = {
+        'manifest': os.path.abspath(args.manifest),
+        'started': started.isoformat(timespec='seconds'),
+        'workers': workers,
+        'elapsed': round(summary['elapsed'], 4),
+        'total': len(rows),
+        'succeeded': sum(1 for r in job_results if r['success']),
+        'failed': len(manifest_errors) + sum(1 for r in job_results if not r['success']),
+        'manifest_errors': manifest_errors,
+        'jobs': job_results,
+    }
+
+    results_path = args.results or os.path.splitext(args.manifest)[0] + "_results.json"
+    with open(results_path, 'w', encoding='utf-8') as f:
+        json.dump(report_data, f, indent=2)
+
+    print(f"\n{report_data['succeeded']} succeeded, {report_data['failed']} failed "
+          f"in {summary['elapsed']:.1f}s")
+    print(f"Results: {results_path}")
+    return 1 if report_data['failed'] else 0
+
+
+def cmd_validate(args):
+    from standards_validator import validate, format_report
+    issues = validate(args.standard, args.pressure_class, args.facing, args.series)
+    print(format_report(issues, limit=args.limit or None))
+    return 1 if issues else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='cadgen', description='EquationParadise CAD Generator - headless mode')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    batch = subparsers.add_parser('batch', help='Generate all parts listed in a JSON/CSV manifest')
+    batch.add_argument('manifest', help='Job manifest (.json or .csv)')
+    batch.add_argument('--workers', '-w', type=int, default=None,
+                       help=f'Worker processes (default: one per CPU core, {default_worker_count()} here)')
+    batch.add_argument('--results', '-r', type=str, default=None,
+                       help='Results JSON path (default: <manifest>_results.json)')
+    batch.add_argument('--no-cache', action='store_true',
+                       help='Rebuild every part instead of reusing cached STEP files')
+    batch.add_argument('--dry-run', action='store_true',
+                       help='Validate the manifest and list jobs without generating')
+    batch.add_argument('--validate', action='store_true',
+                       help='Check flange/stud/gasket rows against the standards tables first; stop on any issue')
+    batch.set_defaults(func=cmd_batch)
+
+    check = subparsers.add_parser('validate', help='Cross-check the standards tables (exit status 1 on issues)')
+    check.add_argument('--standard', default=None, help='B16.5, B16.47, API 6B or API 6BX')
+    check.add_argument('--class', dest='pressure_class', default=None, help='Pressure class (150, 600, 5K ...)')
+    check.add_argument('--facing', default=None, help='RF or RTJ')
+    check.add_argument('--series', default=None, help='A or B (B16.47)')
+    check.add_argument('--limit', type=int, default=50, help='Issues listed (default 50, 0 = all)')
+    check.set_defaults(func=cmd_validate)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
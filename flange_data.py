@@ -4,6 +4,8 @@ All dimensions in millimeters
 Data source: ASME B16.5 standard flange dimension tables
 """
 
+from nps_key import sorted_keys
+
 # Class 150 RF Weld Neck Flanges
 CLASS_150_RF_WN = {
     '1/2': {
@@ -1154,6 +1156,51 @@ B1647_SERIES_B_CLASS900_RF_BLIND = {
 }
 
 
+# Class maps per (series, flange type) - built once at import
+FLANGE_TABLES = {
+    ('B16.5', 'RF-WN'): {
+        '150': CLASS_150_RF_WN,
+        '300': CLASS_300_RF_WN,
+        '400': CLASS_400_RF_WN,
+        '600': CLASS_600_RF_WN,
+        '900': CLASS_900_RF_WN,
+        '1500': CLASS_1500_RF_WN,
+        '2500': CLASS_2500_RF_WN,
+    },
+    ('B16.5', 'RF-BLIND'): {
+        '150': CLASS_150_RF_BLIND,
+        '600': CLASS_600_RF_BLIND,
+        '900': CLASS_900_RF_BLIND,
+        '1500': CLASS_1500_RF_BLIND,
+        '2500': CLASS_2500_RF_BLIND,
+    },
+    ('B16.47-A', 'RF-WN'): {
+        '150': B1647_SERIES_A_RF_WN,
+        '300': B1647_SERIES_A_CLASS300_RF_WN,
+        '600': B1647_SERIES_A_CLASS600_RF_WN,
+        '900': B1647_SERIES_A_CLASS900_RF_WN,
+    },
+    ('B16.47-A', 'RF-BLIND'): {
+        '150': B1647_SERIES_A_CLASS150_RF_BLIND,
+        '300': B1647_SERIES_A_CLASS300_RF_BLIND,
+        '600': B1647_SERIES_A_CLASS600_RF_BLIND,
+        '900': B1647_SERIES_A_CLASS900_RF_BLIND,
+    },
+    ('B16.47-B', 'RF-WN'): {
+        '150': B1647_SERIES_B_RF_WN,
+        '300': B1647_SERIES_B_CLASS300_RF_WN,
+        '600': B1647_SERIES_B_CLASS600_RF_WN,
+        '900': B1647_SERIES_B_CLASS900_RF_WN,
+    },
+    ('B16.47-B', 'RF-BLIND'): {
+        '150': B1647_SERIES_B_CLASS150_RF_BLIND,
+        '300': B1647_SERIES_B_CLASS300_RF_BLIND,
+        '600': B1647_SERIES_B_CLASS600_RF_BLIND,
+        '900': B1647_SERIES_B_CLASS900_RF_BLIND,
+    },
+}
+
+
 def get_flange_info(nps, pressure_class='150', flange_type='RF-WN', series='B16.5'):
     """
     Look up flange properties by NPS, pressure class, and series
@@ -1167,56 +1214,8 @@ def get_flange_info(nps, pressure_class='150', flange_type='RF-WN', series='B16.
     Returns:
         Dictionary with flange dimensions or None if not found
     """
-    if series == 'B16.5':
-        if flange_type == 'RF-BLIND':
-            class_map = {
-                '150': CLASS_150_RF_BLIND,
-                '600': CLASS_600_RF_BLIND,
-                '900': CLASS_900_RF_BLIND,
-                '1500': CLASS_1500_RF_BLIND,
-                '2500': CLASS_2500_RF_BLIND,
-            }
-        else:  # RF-WN
-            class_map = {
-                '150': CLASS_150_RF_WN,
-                '300': CLASS_300_RF_WN,
-                '400': CLASS_400_RF_WN,
-                '600': CLASS_600_RF_WN,
-                '900': CLASS_900_RF_WN,
-                '1500': CLASS_1500_RF_WN,
-                '2500': CLASS_2500_RF_WN,
-            }
-    elif series == 'B16.47-A':
-        if flange_type == 'RF-BLIND':
-            class_map = {
-                '150': B1647_SERIES_A_CLASS150_RF_BLIND,
-                '300': B1647_SERIES_A_CLASS300_RF_BLIND,
-                '600': B1647_SERIES_A_CLASS600_RF_BLIND,
-                '900': B1647_SERIES_A_CLASS900_RF_BLIND,
-            }
-        else:  # RF-WN
-            class_map = {
-                '150': B1647_SERIES_A_RF_WN,
-                '300': B1647_SERIES_A_CLASS300_RF_WN,
-                '600': B1647_SERIES_A_CLASS600_RF_WN,
-                '900': B1647_SERIES_A_CLASS900_RF_WN,
-            }
-    elif series == 'B16.47-B':
-        if flange_type == 'RF-BLIND':
-            class_map = {
-                '150': B1647_SERIES_B_CLASS150_RF_BLIND,
-                '300': B1647_SERIES_B_CLASS300_RF_BLIND,
-                '600': B1647_SERIES_B_CLASS600_RF_BLIND,
-                '900': B1647_SERIES_B_CLASS900_RF_BLIND,
-            }
-        else:  # RF-WN
-            class_map = {
-                '150': B1647_SERIES_B_RF_WN,
-                '300': B1647_SERIES_B_CLASS300_RF_WN,
-                '600': B1647_SERIES_B_CLASS600_RF_WN,
-                '900': B1647_SERIES_B_CLASS900_RF_WN,
-            }
-    else:
+    class_map = FLANGE_TABLES.get((series, 'RF-BLIND' if flange_type == 'RF-BLIND' else 'RF-WN'))
+    if class_map is None:
         return None
     
     flange_db = class_map.get(pressure_class)
@@ -1235,59 +1234,17 @@ def list_available_sizes(pressure_class='150', series='B16.5'):
         series: Flange standard series: 'B16.5' (NPS 1/2-24), 'B16.47-A' (NPS 26-60), 'B16.47-B' (NPS 26-60)
     
     Returns:
-        Sorted list of available NPS sizes
+        Sorted tuple of available NPS sizes (cached - the same tuple every call)
     """
-    if series == 'B16.5':
-        class_map = {
-            '150': CLASS_150_RF_WN,
-            '300': CLASS_300_RF_WN,
-            '400': CLASS_400_RF_WN,
-            '600': CLASS_600_RF_WN,
-            '900': CLASS_900_RF_WN,
-            '1500': CLASS_1500_RF_WN,
-            '2500': CLASS_2500_RF_WN,
-        }
-    elif series == 'B16.47-A':
-        class_map = {
-            '150': B1647_SERIES_A_RF_WN,
-            '300': B1647_SERIES_A_CLASS300_RF_WN,
-            '600': B1647_SERIES_A_CLASS600_RF_WN,
-            '900': B1647_SERIES_A_CLASS900_RF_WN,
-        }
-    elif series == 'B16.47-B':
-        class_map = {
-            '150': B1647_SERIES_B_RF_WN,
-            '300': B1647_SERIES_B_CLASS300_RF_WN,
-            '600': B1647_SERIES_B_CLASS600_RF_WN,
-            '900': B1647_SERIES_B_CLASS900_RF_WN,
-        }
-    else:
-        return []
+    class_map = FLANGE_TABLES.get((series, 'RF-WN'))
+    if class_map is None:
+        return ()
     
     flange_db = class_map.get(pressure_class)
     if not flange_db:
-        return []
-    
-    def nps_to_float(nps):
-        """Convert NPS string to float for sorting"""
-        if '/' in nps:
-            # Handle fractions like '1/2', '3/4', '1-1/2', '2-1/2'
-            if '-' in nps:
-                # e.g., '1-1/2' -> whole part '1' + fraction '1/2'
-                parts = nps.split('-')
-                whole = float(parts[0])
-                frac_parts = parts[1].split('/')
-                return whole + float(frac_parts[0]) / float(frac_parts[1])
-            else:
-                # e.g., '1/2' -> just fraction
-                frac_parts = nps.split('/')
-                return float(frac_parts[0]) / float(frac_parts[1])
-        else:
-            return float(nps)
-    
-    return sorted(flange_db.keys(), key=nps_to_float)
+        return ()
     
-    return sorted(flange_db.keys(), key=lambda x: float(x.replace('-', '.')) if '-' in x else float(x.split()[0]))
+    return sorted_keys(flange_db)
 
 
 if __name__ == "__main__":
@@ -8,8 +8,168 @@ Fluid Properties Source Data:
 - NIST Chemistry WebBook
 - ASME Steam Tables
 - Perry's Chemical Engineers' Handbook
+
+Temperature tables are sorted into interpolation curves once, when the
+class is defined. With NumPy installed every temperature argument may also
+be an array, so a whole temperature sweep is one call:
+
+    temps = numpy.linspace(40, 200, 500)
+    FluidProperties.get_water_viscosity(temps)          # 500 viscosities
+    FluidProperties.get_properties('Diesel', temps)     # arrays per property
+
+Scalar get_properties queries are cached (LRU on fluid, °F, psia rounded
+to two decimals - the properties are computed at the rounded point) and
+return read-only mappings that cannot be pickled - take dict(props) to
+edit or pickle one.
+
+Pipe sizing evaluates the whole PipeData.PIPE_DIMENSIONS grid (every NPS
+1/8 - 48 and B36.10M schedule from pipe_data_complete, min / design / max
+flow) in one NumPy pass and ranks the result:
+
+    ranked = FlowCalculator.size_pipe_grid(10, 70, 100, 62.4, 1.1, 150, 10)
+    ranked[0]['size'], ranked[0]['schedule'], ranked[0]['dp_design']
+
+Turbulent friction is Swamee-Jain by default; friction_method='colebrook'
+solves Colebrook-White exactly (Newton, arrays too) and 'colebrook_grid'
+reads a cached Colebrook grid for repeated sweeps.
+
+Gases and steam lose density as they lose pressure; calculate_gas_pressure_drop
+marches a line (or many candidate lines at once) with adaptive steps,
+isothermal or adiabatic, and reports choking. Given a compressible
+fluid_name, size_pipe_grid and find_minimum_pipe rank pipes by these
+marched drops and drop the lines that choke.
+
+The inverse problem - smallest (or lightest) NPS / schedule / material that
+holds a ΔP budget, a velocity limit and the B31.3 rating at temperature -
+bisects on the diameter and the sorted wall table instead of trying every pipe
+(carbon-steel grades unless materials are given; weight is not a cost
+ranking across materials):
+
+    FlowCalculator.find_minimum_pipe(300, 62.4, 1.0, 600, max_dp_psi=5,
+                                     length_ft=500, max_velocity_ft_s=10)
+
+The operating envelope of one pipe - ΔP, velocity and flow regime over a
+flow × temperature × pressure grid - is a single call as well:
+
+    sweep = FlowCalculator.sweep_envelope('Diesel Fuel (#2)', '4', '40',
+                                          linspace(50, 400, 50), linspace(40, 250, 20),
+                                          linspace(100, 900, 10))
+    FlowCalculator.summarize_envelope(sweep, max_velocity_ft_s=10)
 """
 import math
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from types import MappingProxyType
+
+from pipe_data_complete import PIPE_WALLS, B3610_SCHEDULES
+
+LN_10 = math.log(10)
+
+# Turbulent friction factor methods of FlowCalculator.calculate_friction_factor
+FRICTION_METHODS = ('swamee_jain', 'colebrook', 'colebrook_grid')
+
+# NumPy is optional - without it temperature lists are interpolated
+# one value at a time
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+
+# ==========================================================================
+# INTERPOLATION CURVES
+# ==========================================================================
+
+def _curve(table, log=False):
+    """
+    {x: y} table -> (xs, ys) sorted by x, as arrays when NumPy is present.
+    log=True stores ln(y) for log-space interpolation.
+    """
+    xs = sorted(table)
+    ys = [math.log(table[x]) if log else table[x] for x in xs]
+    if HAS_NUMPY:
+        return np.array(xs, dtype=float), np.array(ys, dtype=float)
+    return tuple(xs), tuple(ys)
+
+
+def _interp_scalar(x, xs, ys):
+    """Linear interpolation of one value, clamped to the table ends."""
+    if x <= xs[0]:
+        return ys[0]
+    if x >= xs[-1]:
+        return ys[-1]
+    i = bisect_right(xs, x) - 1
+    x1, x2 = xs[i], xs[i + 1]
+    return ys[i] + (ys[i + 1] - ys[i]) * (x - x1) / (x2 - x1)
+
+
+def interpolate(x, curve):
+    """
+    Linear interpolation on a curve from _curve(), clamped to its ends.
+    x may be a scalar (returns float) or an array (returns an array).
+    """
+    xs, ys = curve
+    if HAS_NUMPY:
+        result = np.interp(x, xs, ys)
+        return float(result) if np.ndim(result) == 0 else result
+    if isinstance(x, (int, float)):
+        return float(_interp_scalar(x, xs, ys))
+    return [float(_interp_scalar(v, xs, ys)) for v in x]
+
+
+def _exp(x):
+    """math.exp for scalars, element-wise for arrays."""
+    if HAS_NUMPY and np.ndim(x):
+        return np.exp(x)
+    if isinstance(x, (list, tuple)):
+        return [math.exp(v) for v in x]
+    return math.exp(x)
+
+
+def linspace(start, stop, num):
+    """Evenly spaced values from start to stop (one value when they are equal)."""
+    num = 1 if start == stop else max(int(num), 2)
+    if HAS_NUMPY:
+        return np.linspace(start, stop, num)
+    if num == 1:
+        return [float(start)]
+    step = (stop - start) / (num - 1)
+    return [start + i * step for i in range(num - 1)] + [float(stop)]
+
+
+def _log10(x):
+    """math.log10 for scalars, element-wise for arrays."""
+    if HAS_NUMPY and np.ndim(x):
+        return np.log10(x)
+    return math.log10(x)
+
+
+def interpolate_log(x, curve):
+    """Log-space interpolation on a _curve(..., log=True) curve (viscosities)."""
+    return _exp(interpolate(x, curve))
+
+
+# ==========================================================================
+# FLUID CORRECTION MODELS
+# ==========================================================================
+
+# Temperature corrections of FluidProperties.get_properties
+FLUID_MODELS = ('water', 'salt_water', 'crude', 'petroleum', 'glycol', 'none')
+
+
+def _fluid_model(fluid_name, props):
+    """Correction model of a fluid, from its name and its FLUIDS entry."""
+    if 'Water' in fluid_name:
+        return 'salt_water' if 'Salt' in fluid_name or 'Produced' in fluid_name else 'water'
+    if 'Crude' in fluid_name and 'api_gravity' in props:
+        return 'crude'
+    if props.get('api_gravity'):
+        return 'petroleum'
+    if 'Glycol' in fluid_name:
+        return 'glycol'
+    return 'none'
+
 
 class FluidProperties:
     """
@@ -1143,23 +1303,9 @@ class FluidProperties:
             }
         
         mat = FluidProperties.PIPE_MATERIAL_GRADES[material_grade]
-        stress_table = mat['allowable_stress']
-        
-        # Interpolate allowable stress at temperature
-        temps = sorted(stress_table.keys())
         
-        if temperature_f <= temps[0]:
-            allowable = stress_table[temps[0]]
-        elif temperature_f >= temps[-1]:
-            allowable = stress_table[temps[-1]]
-        else:
-            # Linear interpolation
-            for i in range(len(temps) - 1):
-                if temps[i] <= temperature_f <= temps[i+1]:
-                    t1, t2 = temps[i], temps[i+1]
-                    s1, s2 = stress_table[t1], stress_table[t2]
-                    allowable = s1 + (s2 - s1) * (temperature_f - t1) / (t2 - t1)
-                    break
+        # Interpolate allowable stress at temperature (scalar or array)
+        allowable = interpolate(temperature_f, FluidProperties.ALLOWABLE_STRESS_CURVES[material_grade])
         
         return {
             'allowable_stress': allowable,
@@ -1331,6 +1477,26 @@ class FluidProperties:
         50: {60: 1.5, 100: 1.2, 150: 1.0, 200: 0.8}
     }
     
+    # ==========================================================================
+    # INTERPOLATION CURVES (built once from the tables above)
+    # ==========================================================================
+    WATER_VISCOSITY_CURVE = _curve(WATER_VISCOSITY_TABLE)
+    CRUDE_OIL_API_VALUES = tuple(sorted(CRUDE_OIL_VISCOSITY_TABLE))
+    # API gravity -> log-viscosity curve over temperature
+    CRUDE_OIL_LOG_VISCOSITY_CURVES = {api: _curve(temps, log=True)
+                                      for api, temps in CRUDE_OIL_VISCOSITY_TABLE.items()}
+    # Material grade -> allowable stress curve over temperature
+    ALLOWABLE_STRESS_CURVES = {grade: _curve(mat['allowable_stress'])
+                               for grade, mat in PIPE_MATERIAL_GRADES.items()}
+    # Fluid -> correction model (see FLUID_MODELS)
+    FLUID_CORRECTIONS = {name: _fluid_model(name, props) for name, props in FLUIDS.items()}
+    
+    # get_properties cache: scalar queries, keyed on (fluid, °F, psia) rounded
+    # to PROPERTY_CACHE_DECIMALS, least recently used dropped past the size
+    PROPERTY_CACHE_SIZE = 1024
+    PROPERTY_CACHE_DECIMALS = 2
+    _property_cache = OrderedDict()
+    
     @staticmethod
     def api_to_specific_gravity(api_gravity):
         """
@@ -1362,28 +1528,12 @@ class FluidProperties:
         Get water viscosity at specified temperature using interpolation
         
         Args:
-            temperature_f: Temperature in Fahrenheit
+            temperature_f: Temperature in Fahrenheit (scalar or array)
             
         Returns:
-            Viscosity in centipoise (cP)
+            Viscosity in centipoise (cP), clamped to the table range
         """
-        table = FluidProperties.WATER_VISCOSITY_TABLE
-        temps = sorted(table.keys())
-        
-        # Clamp to table range
-        if temperature_f <= temps[0]:
-            return table[temps[0]]
-        if temperature_f >= temps[-1]:
-            return table[temps[-1]]
-        
-        # Linear interpolation
-        for i in range(len(temps) - 1):
-            if temps[i] <= temperature_f <= temps[i + 1]:
-                t1, t2 = temps[i], temps[i + 1]
-                v1, v2 = table[t1], table[t2]
-                return v1 + (v2 - v1) * (temperature_f - t1) / (t2 - t1)
-        
-        return 1.0  # Default
+        return interpolate(temperature_f, FluidProperties.WATER_VISCOSITY_CURVE)
     
     @staticmethod
     def get_crude_oil_viscosity(api_gravity, temperature_f):
@@ -1393,64 +1543,30 @@ class FluidProperties:
         
         Args:
             api_gravity: API gravity (10-50 typical range)
-            temperature_f: Temperature in Fahrenheit
+            temperature_f: Temperature in Fahrenheit (scalar or array)
             
         Returns:
             Viscosity in centipoise (cP)
         """
-        table = FluidProperties.CRUDE_OIL_VISCOSITY_TABLE
-        api_values = sorted(table.keys())
+        api_values = FluidProperties.CRUDE_OIL_API_VALUES
         
         # Clamp API gravity to table range
         api_gravity = max(min(api_gravity, api_values[-1]), api_values[0])
         
         # Find bracketing API values
-        api_low = api_values[0]
-        api_high = api_values[-1]
-        for i in range(len(api_values) - 1):
-            if api_values[i] <= api_gravity <= api_values[i + 1]:
-                api_low = api_values[i]
-                api_high = api_values[i + 1]
-                break
-        
-        # Get temperature-viscosity data for bracketing API values
-        temps_low = table[api_low]
-        temps_high = table[api_high]
+        i = min(bisect_right(api_values, api_gravity), len(api_values) - 1)
+        api_low, api_high = api_values[i - 1], api_values[i]
         
-        # Interpolate viscosity at low API
-        visc_low = FluidProperties._interpolate_temp_viscosity(temps_low, temperature_f)
-        # Interpolate viscosity at high API
-        visc_high = FluidProperties._interpolate_temp_viscosity(temps_high, temperature_f)
+        # Log-viscosity over temperature at the bracketing API values
+        curves = FluidProperties.CRUDE_OIL_LOG_VISCOSITY_CURVES
+        log_low = interpolate(temperature_f, curves[api_low])
+        log_high = interpolate(temperature_f, curves[api_high])
         
         # Interpolate between API values (log scale for viscosity)
-        if api_high == api_low:
-            return visc_low
-        
         api_fraction = (api_gravity - api_low) / (api_high - api_low)
-        # Use logarithmic interpolation for viscosity
-        log_visc = math.log(visc_low) + api_fraction * (math.log(visc_high) - math.log(visc_low))
-        
-        return math.exp(log_visc)
-    
-    @staticmethod
-    def _interpolate_temp_viscosity(temp_visc_dict, temperature_f):
-        """Helper to interpolate viscosity from temperature-viscosity dict"""
-        temps = sorted(temp_visc_dict.keys())
-        
-        if temperature_f <= temps[0]:
-            return temp_visc_dict[temps[0]]
-        if temperature_f >= temps[-1]:
-            return temp_visc_dict[temps[-1]]
-        
-        for i in range(len(temps) - 1):
-            if temps[i] <= temperature_f <= temps[i + 1]:
-                t1, t2 = temps[i], temps[i + 1]
-                v1, v2 = temp_visc_dict[t1], temp_visc_dict[t2]
-                # Logarithmic interpolation for viscosity
-                log_v = math.log(v1) + (math.log(v2) - math.log(v1)) * (temperature_f - t1) / (t2 - t1)
-                return math.exp(log_v)
-        
-        return 10.0  # Default
+        if isinstance(log_low, list):
+            return _exp([lo + api_fraction * (hi - lo) for lo, hi in zip(log_low, log_high)])
+        return _exp(log_low + api_fraction * (log_high - log_low))
     
     @staticmethod
     def get_pipe_roughness(material):
@@ -1663,56 +1779,92 @@ class FluidProperties:
         """
         Get fluid properties with temperature/pressure corrections
         
+        Scalar queries are rounded to PROPERTY_CACHE_DECIMALS and served
+        from an LRU cache, so repeated lookups (every GUI keystroke) cost a
+        dict lookup. The properties are computed at the rounded temperature
+        and pressure, so 99.999°F reads as 100°F.
+        
         Args:
             fluid_name: Name of fluid from FLUIDS dictionary
-            temperature_f: Temperature in Fahrenheit (default 60°F)
+            temperature_f: Temperature in Fahrenheit (default 60°F); with
+                NumPy an array gives array density/viscosity
             pressure_psi: Pressure in psia (default 14.7 psia)
             
         Returns:
-            dict with corrected fluid properties
-        """
-        props = FluidProperties.FLUIDS.get(fluid_name, FluidProperties.FLUIDS['Fresh Water']).copy()
-        base_density = props['density']  # Store base density at 60°F
-        
-        # Temperature correction for water
-        if 'Water' in fluid_name:
-            props['viscosity'] = FluidProperties.get_water_viscosity(temperature_f)
-            # Adjust viscosity for salt water (slightly higher)
-            if 'Salt' in fluid_name or 'Produced' in fluid_name:
-                props['viscosity'] *= 1.07  # Salt water ~7% higher viscosity
-            # Density correction (water expands with temperature)
-            props['density'] = base_density * (1 - 0.0002 * (temperature_f - 60))
-        
-        # Temperature correction for crude oils
-        elif 'Crude' in fluid_name and 'api_gravity' in props:
-            api = props['api_gravity']
-            props['viscosity'] = FluidProperties.get_crude_oil_viscosity(api, temperature_f)
-            # Density correction for thermal expansion
-            props['density'] *= (1 - 0.00045 * (temperature_f - 60))
-        
-        # Temperature correction for other petroleum products
-        elif props.get('api_gravity'):
-            # Use simplified temperature correction
-            temp_factor = math.exp(-0.025 * (temperature_f - 60))
-            props['viscosity'] *= temp_factor
-            props['density'] *= (1 - 0.00045 * (temperature_f - 60))
+            read-only mapping (types.MappingProxyType) of corrected fluid
+            properties - it cannot be modified or pickled; dict(props) gives
+            an editable, picklable copy
+        """
+        if not (isinstance(temperature_f, (int, float)) and isinstance(pressure_psi, (int, float))):
+            return MappingProxyType(FluidProperties._corrected_properties(fluid_name, temperature_f, pressure_psi))
+        
+        decimals = FluidProperties.PROPERTY_CACHE_DECIMALS
+        key = (fluid_name, round(temperature_f, decimals), round(pressure_psi, decimals))
+        cache = FluidProperties._property_cache
+        props = cache.get(key)
+        if props is not None:
+            cache.move_to_end(key)
+            return props
+        
+        props = MappingProxyType(FluidProperties._corrected_properties(*key))
+        cache[key] = props
+        if len(cache) > FluidProperties.PROPERTY_CACHE_SIZE:
+            cache.popitem(last=False)
+        return props
+    
+    @staticmethod
+    def clear_property_cache():
+        """Drop cached get_properties results (after editing FLUIDS)."""
+        FluidProperties._property_cache.clear()
+        FluidProperties.FLUID_CORRECTIONS = {name: _fluid_model(name, props)
+                                             for name, props in FluidProperties.FLUIDS.items()}
+    
+    @staticmethod
+    def _corrected_properties(fluid_name, temperature_f, pressure_psi):
+        """FLUIDS entry corrected to temperature and pressure (uncached get_properties)."""
+        base = FluidProperties.FLUIDS.get(fluid_name)
+        if base is None:
+            base = FluidProperties.FLUIDS['Fresh Water']
+            model = _fluid_model(fluid_name, base)
+        else:
+            model = FluidProperties.FLUID_CORRECTIONS.get(fluid_name) or _fluid_model(fluid_name, base)
+        density, viscosity = base['density'], base['viscosity']  # at 60°F
+        
+        # Temperature correction for water (salt water ~7% higher viscosity);
+        # water expands with temperature
+        if model in ('water', 'salt_water'):
+            viscosity = FluidProperties.get_water_viscosity(temperature_f)
+            if model == 'salt_water':
+                viscosity *= 1.07
+            density = density * (1 - 0.0002 * (temperature_f - 60))
+        
+        # Temperature correction for crude oils, with thermal expansion
+        elif model == 'crude':
+            viscosity = FluidProperties.get_crude_oil_viscosity(base['api_gravity'], temperature_f)
+            density *= (1 - 0.00045 * (temperature_f - 60))
+        
+        # Simplified temperature correction for other petroleum products
+        elif model == 'petroleum':
+            viscosity *= _exp(-0.025 * (temperature_f - 60))
+            density *= (1 - 0.00045 * (temperature_f - 60))
         
         # Temperature correction for glycols
-        elif 'Glycol' in fluid_name:
-            temp_factor = math.exp(-0.03 * (temperature_f - 60))
-            props['viscosity'] *= temp_factor
+        elif model == 'glycol':
+            viscosity *= _exp(-0.03 * (temperature_f - 60))
         
         # Pressure correction for gas density (ideal gas law)
-        if props['compressible']:
+        if base['compressible']:
             # ρ2 = ρ1 × (P2/P1) × (T1/T2)
             temp_r = temperature_f + 459.67  # Convert to Rankine
             base_temp_r = 519.67  # 60°F in Rankine
-            props['density'] *= (pressure_psi / 14.7) * (base_temp_r / temp_r)
+            density *= (pressure_psi / 14.7) * (base_temp_r / temp_r)
             
             # Gas viscosity increases slightly with temperature
-            temp_factor = (temp_r / base_temp_r) ** 0.7
-            props['viscosity'] *= temp_factor
+            viscosity *= (temp_r / base_temp_r) ** 0.7
         
+        props = dict(base)
+        props['density'] = density
+        props['viscosity'] = viscosity
         return props
     
     @staticmethod
@@ -1843,158 +1995,12 @@ class FluidProperties:
 class PipeData:
     """Pipe dimension database for standard schedules"""
     
+    # NPS: {Schedule: (OD, ID, Wall_Thickness)} - the B36.10M schedules of
+    # pipe_data_complete, NPS 1/8 - 48
     PIPE_DIMENSIONS = {
-        # NPS: {Schedule: (OD, ID, Wall_Thickness)}
-        '1/2': {
-            '5': (0.840, 0.710, 0.065),
-            '10': (0.840, 0.674, 0.083),
-            '40': (0.840, 0.622, 0.109),
-            '80': (0.840, 0.546, 0.147),
-            '160': (0.840, 0.466, 0.187),
-            'STD': (0.840, 0.622, 0.109),
-            'XS': (0.840, 0.546, 0.147),
-            'XXS': (0.840, 0.252, 0.294)
-        },
-        '3/4': {
-            '5': (1.050, 0.920, 0.065),
-            '10': (1.050, 0.884, 0.083),
-            '40': (1.050, 0.824, 0.113),
-            '80': (1.050, 0.742, 0.154),
-            '160': (1.050, 0.612, 0.219),
-            'STD': (1.050, 0.824, 0.113),
-            'XS': (1.050, 0.742, 0.154),
-            'XXS': (1.050, 0.434, 0.308)
-        },
-        '1': {
-            '5': (1.315, 1.185, 0.065),
-            '10': (1.315, 1.097, 0.109),
-            '40': (1.315, 1.049, 0.133),
-            '80': (1.315, 0.957, 0.179),
-            '160': (1.315, 0.815, 0.250),
-            'STD': (1.315, 1.049, 0.133),
-            'XS': (1.315, 0.957, 0.179),
-            'XXS': (1.315, 0.599, 0.358)
-        },
-        '1-1/4': {
-            '5': (1.660, 1.530, 0.065),
-            '10': (1.660, 1.442, 0.109),
-            '40': (1.660, 1.380, 0.140),
-            '80': (1.660, 1.278, 0.191),
-            '160': (1.660, 1.160, 0.250),
-            'STD': (1.660, 1.380, 0.140),
-            'XS': (1.660, 1.278, 0.191),
-            'XXS': (1.660, 0.896, 0.382)
-        },
-        '1-1/2': {
-            '5': (1.900, 1.770, 0.065),
-            '10': (1.900, 1.682, 0.109),
-            '40': (1.900, 1.610, 0.145),
-            '80': (1.900, 1.500, 0.200),
-            '160': (1.900, 1.338, 0.281),
-            'STD': (1.900, 1.610, 0.145),
-            'XS': (1.900, 1.500, 0.200),
-            'XXS': (1.900, 1.100, 0.400)
-        },
-        '2': {
-            '5': (2.375, 2.245, 0.065),
-            '10': (2.375, 2.157, 0.109),
-            '40': (2.375, 2.067, 0.154),
-            '80': (2.375, 1.939, 0.218),
-            '160': (2.375, 1.689, 0.343),
-            'STD': (2.375, 2.067, 0.154),
-            'XS': (2.375, 1.939, 0.218),
-            'XXS': (2.375, 1.503, 0.436)
-        },
-        '2-1/2': {
-            '5': (2.875, 2.709, 0.083),
-            '10': (2.875, 2.635, 0.120),
-            '40': (2.875, 2.469, 0.203),
-            '80': (2.875, 2.323, 0.276),
-            '160': (2.875, 2.125, 0.375),
-            'STD': (2.875, 2.469, 0.203),
-            'XS': (2.875, 2.323, 0.276),
-            'XXS': (2.875, 1.771, 0.552)
-        },
-        '3': {
-            '5': (3.500, 3.334, 0.083),
-            '10': (3.500, 3.260, 0.120),
-            '40': (3.500, 3.068, 0.216),
-            '80': (3.500, 2.900, 0.300),
-            '160': (3.500, 2.624, 0.438),
-            'STD': (3.500, 3.068, 0.216),
-            'XS': (3.500, 2.900, 0.300),
-            'XXS': (3.500, 2.300, 0.600)
-        },
-        '4': {
-            '5': (4.500, 4.334, 0.083),
-            '10': (4.500, 4.260, 0.120),
-            '40': (4.500, 4.026, 0.237),
-            '80': (4.500, 3.826, 0.337),
-            '120': (4.500, 3.624, 0.438),
-            '160': (4.500, 3.438, 0.531),
-            'STD': (4.500, 4.026, 0.237),
-            'XS': (4.500, 3.826, 0.337),
-            'XXS': (4.500, 3.152, 0.674)
-        },
-        '6': {
-            '5': (6.625, 6.407, 0.109),
-            '10': (6.625, 6.357, 0.134),
-            '40': (6.625, 6.065, 0.280),
-            '80': (6.625, 5.761, 0.432),
-            '120': (6.625, 5.501, 0.562),
-            '160': (6.625, 5.187, 0.719),
-            'STD': (6.625, 6.065, 0.280),
-            'XS': (6.625, 5.761, 0.432),
-            'XXS': (6.625, 4.897, 0.864)
-        },
-        '8': {
-            '5': (8.625, 8.407, 0.109),
-            '10': (8.625, 8.329, 0.148),
-            '20': (8.625, 8.125, 0.250),
-            '30': (8.625, 7.981, 0.322),
-            '40': (8.625, 7.981, 0.322),
-            '60': (8.625, 7.813, 0.406),
-            '80': (8.625, 7.625, 0.500),
-            '100': (8.625, 7.437, 0.594),
-            '120': (8.625, 7.187, 0.719),
-            '140': (8.625, 7.001, 0.812),
-            '160': (8.625, 7.001, 0.812),
-            'STD': (8.625, 7.981, 0.322),
-            'XS': (8.625, 7.625, 0.500),
-            'XXS': (8.625, 6.875, 0.875)
-        },
-        '10': {
-            '5': (10.750, 10.482, 0.134),
-            '10': (10.750, 10.420, 0.165),
-            '20': (10.750, 10.250, 0.250),
-            '30': (10.750, 10.136, 0.307),
-            '40': (10.750, 10.020, 0.365),
-            '60': (10.750, 9.750, 0.500),
-            '80': (10.750, 9.562, 0.594),
-            '100': (10.750, 9.312, 0.719),
-            '120': (10.750, 9.062, 0.844),
-            '140': (10.750, 8.750, 1.000),
-            '160': (10.750, 8.750, 1.000),
-            'STD': (10.750, 10.020, 0.365),
-            'XS': (10.750, 9.562, 0.594),
-            'XXS': (10.750, 8.500, 1.125)
-        },
-        '12': {
-            '5': (12.750, 12.438, 0.156),
-            '10': (12.750, 12.390, 0.180),
-            '20': (12.750, 12.250, 0.250),
-            '30': (12.750, 12.090, 0.330),
-            '40': (12.750, 11.938, 0.406),
-            'STD': (12.750, 11.938, 0.406),
-            '60': (12.750, 11.626, 0.562),
-            '80': (12.750, 11.374, 0.688),
-            'XS': (12.750, 11.374, 0.688),
-            '100': (12.750, 11.062, 0.844),
-            '120': (12.750, 10.750, 1.000),
-            '140': (12.750, 10.500, 1.125),
-            '160': (12.750, 10.750, 1.000),
-            'XXS': (12.750, 10.126, 1.312)
-        }
+        size: {schedule: (od, round(od - 2 * walls[schedule], 3), walls[schedule])
+               for schedule in B3610_SCHEDULES if schedule in walls}
+        for size, (od, walls) in PIPE_WALLS.items()
     }
     
     @staticmethod
@@ -2013,10 +2019,82 @@ class PipeData:
                 return PipeData.PIPE_DIMENSIONS[nps][schedule]
         return (0, 0, 0)
 
+    _grid = None
+
+    @staticmethod
+    def get_grid():
+        """
+        Every NPS x schedule cell of PIPE_DIMENSIONS as flat columns
+        (table order: sizes ascending, schedules as listed per size).
+
+        Returns:
+            dict: 'size', 'schedule' (tuples of str) and 'od', 'id', 'wall'
+                  (float arrays with NumPy, tuples without)
+        """
+        if PipeData._grid is None:
+            cells = [(size, schedule) + dims
+                     for size, schedules in PipeData.PIPE_DIMENSIONS.items()
+                     for schedule, dims in schedules.items()]
+            sizes, schedules, od, id_val, wall = (tuple(column) for column in zip(*cells))
+            if HAS_NUMPY:
+                od, id_val, wall = (np.array(column, dtype=float) for column in (od, id_val, wall))
+            PipeData._grid = {'size': sizes, 'schedule': schedules, 'od': od, 'id': id_val, 'wall': wall}
+        return PipeData._grid
+
+    _size_table = None
+
+    @staticmethod
+    def get_size_table():
+        """
+        PIPE_DIMENSIONS per NPS with the schedules in wall order, for bisection.
+
+        Returns:
+            tuple of dicts, NPS ascending: 'size', 'od', 'walls' (ascending,
+            duplicates such as 40/STD listed once under the first name),
+            'schedules' and 'ids' in the same order
+        """
+        if PipeData._size_table is None:
+            table = []
+            for size, schedules in PipeData.PIPE_DIMENSIONS.items():
+                by_wall = {}
+                for schedule, (od, id_val, wall) in schedules.items():
+                    by_wall.setdefault(wall, (schedule, id_val))
+                walls = tuple(sorted(by_wall))
+                table.append({
+                    'size': size,
+                    'od': next(iter(schedules.values()))[0],
+                    'walls': walls,
+                    'schedules': tuple(by_wall[wall][0] for wall in walls),
+                    'ids': tuple(by_wall[wall][1] for wall in walls),
+                })
+            PipeData._size_table = tuple(table)
+        return PipeData._size_table
+
 
 class FlowCalculator:
     """Enhanced flow calculator with proper engineering physics"""
     
+    # Allowable stress for A106 Grade B carbon steel (ASME B31.3), psi by °F
+    BARLOW_STRESS_TABLE = {
+        100: 20000,
+        200: 20000,
+        300: 20000,
+        400: 19100,
+        500: 17900,
+        600: 15700,
+        650: 14200
+    }
+    BARLOW_STRESS_TEMPS = tuple(sorted(BARLOW_STRESS_TABLE))
+    
+    # Columns of the size_pipe_grid result, per operating point (min / design / max)
+    SIZING_POINTS = ('min', 'design', 'max')
+    SIZING_FIELDS = (
+        [('size', 'U8'), ('schedule', 'U4'), ('od', 'f8'), ('id', 'f8'), ('wall', 'f8')]
+        + [(f'{name}_{point}', 'f8') for name in ('vel', 'reynolds', 'friction', 'dp')
+           for point in ('min', 'design', 'max')]
+        + [('rating', 'i8'), ('vel_deviation', 'f8')]
+    )
+    
     @staticmethod
     def calculate_reynolds_number(flow_gpm, id_inches, density_lb_ft3, viscosity_cp):
         """Calculate Reynolds number"""
@@ -2026,24 +2104,55 @@ class FlowCalculator:
         return reynolds
     
     @staticmethod
-    def calculate_friction_factor(reynolds, roughness=0.00015):
+    def relative_roughness(roughness_in, id_inches):
+        """ε/D from the absolute roughness (inches, as in PIPE_ROUGHNESS) and the pipe ID (inches)"""
+        return roughness_in / id_inches
+    
+    @staticmethod
+    def calculate_friction_factor(reynolds, roughness=0.00015, method='swamee_jain'):
         """
         Calculate Darcy-Weisbach friction factor
-        Uses Swamee-Jain equation for turbulent flow
+        Uses the turbulent friction method for turbulent flow (Swamee-Jain by default)
         Uses 64/Re for laminar flow
+        
+        With NumPy, reynolds and roughness may be arrays (element-wise result).
+        
+        Args:
+            reynolds: Reynolds number
+            roughness: Relative roughness ε/D
+            method: One of FRICTION_METHODS - 'swamee_jain' (explicit approximation),
+                    'colebrook' (exact Colebrook-White), 'colebrook_grid'
+                    (cached Colebrook lookup grid)
         """
+        if HAS_NUMPY and (np.ndim(reynolds) or np.ndim(roughness)):
+            reynolds = np.asarray(reynolds, dtype=float)
+            f_lam = 64.0 / reynolds
+            f_turb = FlowCalculator._turbulent_friction(reynolds, roughness, method)
+            transition_factor = (reynolds - 2300) / 1700
+            return np.where(reynolds < 2300, f_lam,
+                            np.where(reynolds < 4000, f_lam + transition_factor * (f_turb - f_lam), f_turb))
         if reynolds < 2300:
             # Laminar flow
             return 64.0 / reynolds
         elif reynolds < 4000:
             # Transitional - interpolate
             f_lam = 64.0 / reynolds
-            f_turb = FlowCalculator._swamee_jain_friction(reynolds, roughness, 1.0)
+            f_turb = FlowCalculator._turbulent_friction(reynolds, roughness, method)
             transition_factor = (reynolds - 2300) / 1700
             return f_lam + transition_factor * (f_turb - f_lam)
         else:
-            # Turbulent flow - Swamee-Jain
-            return FlowCalculator._swamee_jain_friction(reynolds, roughness, 1.0)
+            # Turbulent flow
+            return FlowCalculator._turbulent_friction(reynolds, roughness, method)
+    
+    @staticmethod
+    def _turbulent_friction(reynolds, relative_roughness, method):
+        if method == 'swamee_jain':
+            return FlowCalculator._swamee_jain_friction(reynolds, relative_roughness, 1.0)
+        if method == 'colebrook':
+            return FlowCalculator.colebrook_friction(reynolds, relative_roughness)
+        if method == 'colebrook_grid':
+            return FlowCalculator.colebrook_grid_friction(reynolds, relative_roughness)
+        raise ValueError(f"Unknown friction method: {method} (expected one of {FRICTION_METHODS})")
     
     @staticmethod
     def _swamee_jain_friction(reynolds, roughness, diameter):
@@ -2052,12 +2161,108 @@ class FlowCalculator:
         relative_roughness = roughness / diameter
         term1 = relative_roughness / 3.7
         term2 = 5.74 / (reynolds ** 0.9)
-        f = 0.25 / ((math.log10(term1 + term2)) ** 2)
+        f = 0.25 / ((_log10(term1 + term2)) ** 2)
         return f
     
+    @staticmethod
+    def colebrook_friction(reynolds, relative_roughness, tolerance=1e-12, max_iterations=10):
+        """
+        Colebrook-White friction factor, solved exactly
+        
+        1/√f = -2 log10(ε/(3.7D) + 2.51/(Re √f))
+        
+        Newton iteration on x = 1/√f, seeded from Swamee-Jain (within ~2%),
+        converges to machine precision in three or four steps. With NumPy,
+        reynolds and relative_roughness may be arrays.
+        
+        Args:
+            reynolds: Reynolds number
+            relative_roughness: ε/D
+            tolerance: Relative step size at which the iteration stops
+            max_iterations: Newton step limit
+        
+        Returns:
+            float (or array): Darcy friction factor
+        """
+        is_array = HAS_NUMPY and (np.ndim(reynolds) or np.ndim(relative_roughness))
+        if is_array:
+            reynolds = np.asarray(reynolds, dtype=float)
+            relative_roughness = np.asarray(relative_roughness, dtype=float)
+        x = 1 / FlowCalculator._swamee_jain_friction(reynolds, relative_roughness, 1.0) ** 0.5
+        a = relative_roughness / 3.7
+        b = 2.51 / reynolds
+        for _ in range(max_iterations):
+            # g(x) = x + 2 log10(a + b x) = 0
+            inner = a + b * x
+            step = (x + 2 * _log10(inner)) / (1 + 2 * b / (inner * LN_10))
+            x = x - step
+            if is_array:
+                if np.all(np.abs(step) <= tolerance * np.abs(x)):
+                    break
+            elif abs(step) <= tolerance * abs(x):
+                break
+        return 1 / x ** 2
+    
+    # Colebrook lookup grid: log10(Re) and log10(ε/D) axes as (start, stop, points)
+    COLEBROOK_GRID_REYNOLDS = (math.log10(2000), 8.0, 301)
+    COLEBROOK_GRID_ROUGHNESS = (-7.0, math.log10(0.05), 301)
+    _colebrook_grid = None
+    
+    @staticmethod
+    def _get_colebrook_grid():
+        """1/√f over the Colebrook lookup grid (closer to bilinear than f), solved once per process."""
+        if FlowCalculator._colebrook_grid is None:
+            log_re = np.linspace(*FlowCalculator.COLEBROOK_GRID_REYNOLDS)
+            log_rr = np.linspace(*FlowCalculator.COLEBROOK_GRID_ROUGHNESS)
+            re_mesh, rr_mesh = np.meshgrid(10 ** log_re, 10 ** log_rr, indexing='ij')
+            FlowCalculator._colebrook_grid = 1 / np.sqrt(FlowCalculator.colebrook_friction(re_mesh, rr_mesh))
+        return FlowCalculator._colebrook_grid
+    
+    @staticmethod
+    def colebrook_grid_friction(reynolds, relative_roughness):
+        """
+        Colebrook-White friction factor by bilinear interpolation in a cached grid
+        
+        The grid spans Re 2,000 - 10^8 and ε/D 10^-7 - 0.05 on log axes
+        (COLEBROOK_GRID_REYNOLDS / COLEBROOK_GRID_ROUGHNESS) and is solved
+        once, on first use. Within it the interpolation error is below
+        0.01%; ε/D under 10^-7 (hydraulically smooth) reads the 10^-7 edge.
+        Points outside the grid, and all points without NumPy, are solved
+        exactly with colebrook_friction.
+        
+        Returns:
+            float (or array): Darcy friction factor
+        """
+        if not HAS_NUMPY:
+            return FlowCalculator.colebrook_friction(reynolds, relative_roughness)
+        table = FlowCalculator._get_colebrook_grid()
+        re_start, re_stop, re_points = FlowCalculator.COLEBROOK_GRID_REYNOLDS
+        rr_start, rr_stop, rr_points = FlowCalculator.COLEBROOK_GRID_ROUGHNESS
+        
+        scalar = not (np.ndim(reynolds) or np.ndim(relative_roughness))
+        reynolds, relative_roughness = np.broadcast_arrays(np.atleast_1d(np.asarray(reynolds, dtype=float)),
+                                                           np.atleast_1d(np.asarray(relative_roughness, dtype=float)))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            u = (np.log10(reynolds) - re_start) / (re_stop - re_start) * (re_points - 1)
+            v = (np.log10(np.maximum(relative_roughness, 10 ** rr_start)) - rr_start) / (rr_stop - rr_start) * (rr_points - 1)
+        inside = (u >= 0) & (u <= re_points - 1) & (v <= rr_points - 1)
+        
+        i = np.clip(np.floor(np.where(inside, u, 0)).astype(int), 0, re_points - 2)
+        j = np.clip(np.floor(np.where(inside, v, 0)).astype(int), 0, rr_points - 2)
+        tu = np.where(inside, u, 0) - i
+        tv = np.where(inside, v, 0) - j
+        x = ((1 - tu) * (1 - tv) * table[i, j] + tu * (1 - tv) * table[i + 1, j]
+             + (1 - tu) * tv * table[i, j + 1] + tu * tv * table[i + 1, j + 1])
+        friction = 1 / x ** 2
+        
+        if not inside.all():
+            outside = ~inside
+            friction[outside] = FlowCalculator.colebrook_friction(reynolds[outside], relative_roughness[outside])
+        return float(friction[0]) if scalar else friction
+    
     @staticmethod
     def calculate_pressure_drop(flow_gpm, id_inches, length_ft, density_lb_ft3, viscosity_cp, 
-                                 roughness=0.0018, pipe_material=None):
+                                 roughness=0.0018, pipe_material=None, friction_method='swamee_jain'):
         """
         Calculate pressure drop using Darcy-Weisbach equation
         
@@ -2069,6 +2274,7 @@ class FlowCalculator:
             viscosity_cp: Fluid viscosity in centipoise
             roughness: Pipe roughness in inches (default 0.0018 for commercial steel)
             pipe_material: Optional pipe material name to look up roughness
+            friction_method: Turbulent friction method (see calculate_friction_factor)
             
         Returns:
             float: Pressure drop in psi
@@ -2084,7 +2290,8 @@ class FlowCalculator:
         reynolds = FlowCalculator.calculate_reynolds_number(flow_gpm, id_inches, density_lb_ft3, viscosity_cp)
         
         # Calculate friction factor
-        friction_factor = FlowCalculator.calculate_friction_factor(reynolds, roughness / (id_inches / 12))
+        relative_roughness = FlowCalculator.relative_roughness(roughness, id_inches)
+        friction_factor = FlowCalculator.calculate_friction_factor(reynolds, relative_roughness, friction_method)
         
         # Darcy-Weisbach: ΔP = f × (L/D) × (ρ × V²/2)
         # In US units: ΔP (psi) = f × (L/D) × (ρ × V²) / (2 × 32.2 × 144)
@@ -2095,7 +2302,8 @@ class FlowCalculator:
     
     @staticmethod
     def calculate_total_pressure_drop(flow_gpm, id_inches, length_ft, density_lb_ft3, viscosity_cp,
-                                       fittings=None, pipe_material='Commercial Steel'):
+                                       fittings=None, pipe_material='Commercial Steel',
+                                       friction_method='swamee_jain'):
         """
         Calculate total pressure drop including pipe and fittings
         
@@ -2107,6 +2315,7 @@ class FlowCalculator:
             viscosity_cp: Fluid viscosity in centipoise
             fittings: List of tuples [(fitting_name, quantity), ...]
             pipe_material: Pipe material name for roughness lookup
+            friction_method: Turbulent friction method (see calculate_friction_factor)
             
         Returns:
             dict: Breakdown of pressure drops
@@ -2122,7 +2331,8 @@ class FlowCalculator:
         
         # Pipe pressure drop
         pipe_dp = FlowCalculator.calculate_pressure_drop(
-            flow_gpm, id_inches, length_ft, density_lb_ft3, viscosity_cp, roughness
+            flow_gpm, id_inches, length_ft, density_lb_ft3, viscosity_cp, roughness,
+            friction_method=friction_method
         )
         
         # Fitting pressure drops
@@ -2383,21 +2593,7 @@ class FlowCalculator:
         Returns:
             int: Pressure rating in psi
         """
-        # Allowable stress for A106 Grade B carbon steel (ASME B31.3)
-        allowable_stress_table = {
-            100: 20000,   # psi at 100°F
-            200: 20000,
-            300: 20000,
-            400: 19100,
-            500: 17900,
-            600: 15700,
-            650: 14200
-        }
-        
-        # Find closest temperature
-        temps = sorted(allowable_stress_table.keys())
-        closest_temp = min(temps, key=lambda x: abs(x - temp_f))
-        S = allowable_stress_table[closest_temp]
+        S = FlowCalculator._barlow_stress(temp_f)
         
         # Get pipe dimensions
         od, id_val, wall = PipeData.get_pipe_dimensions(nps, schedule)
@@ -2408,6 +2604,793 @@ class FlowCalculator:
         pressure_rating = (2 * S * wall) / od
         
         return int(pressure_rating)
+    
+    @staticmethod
+    def _barlow_stress(temp_f):
+        """A106B allowable stress (psi) at the table temperature closest to temp_f"""
+        closest_temp = min(FlowCalculator.BARLOW_STRESS_TEMPS, key=lambda x: abs(x - temp_f))
+        return FlowCalculator.BARLOW_STRESS_TABLE[closest_temp]
+    
+    @staticmethod
+    def _grid_point(flow_gpm, id_inches, density_lb_ft3, viscosity_cp, roughness, length_ft, friction_method):
+        """
+        Velocity, Reynolds, friction factor and pressure drop for one flow on
+        every pipe ID at once - the same equations as calculate_velocity,
+        calculate_reynolds_number, calculate_friction_factor and
+        calculate_pressure_drop, on NumPy arrays. Zero flow gives zero drop.
+        """
+        velocity = FlowCalculator.calculate_velocity(flow_gpm, id_inches)
+        if flow_gpm <= 0:
+            zeros = np.zeros_like(id_inches)
+            return velocity, zeros, zeros, zeros
+        reynolds = FlowCalculator.calculate_reynolds_number(flow_gpm, id_inches, density_lb_ft3, viscosity_cp)
+        relative_roughness = FlowCalculator.relative_roughness(roughness, id_inches)
+        friction = FlowCalculator.calculate_friction_factor(reynolds, relative_roughness, friction_method)
+        
+        diameter_ft = id_inches / 12
+        pressure_drop = (friction * (length_ft / diameter_ft) * density_lb_ft3 * (velocity ** 2)) / (2 * 32.2 * 144)
+        return velocity, reynolds, friction, pressure_drop
+    
+    @staticmethod
+    def size_pipe_grid(flow_min_gpm, flow_design_gpm, flow_max_gpm, density_lb_ft3, viscosity_cp,
+                       pressure_psi, max_velocity_ft_s, roughness=0.0018, temp_f=100, length_ft=100,
+                       pressure_factor=1.2, target_velocity_fraction=0.7, friction_method='swamee_jain',
+                       fluid_name=None, gas_model='isothermal'):
+        """
+        Evaluate every NPS x schedule in PipeData.PIPE_DIMENSIONS for a flow range
+        and rank the ones that qualify.
+        
+        A cell qualifies when its velocity at max flow is within max_velocity_ft_s
+        and its Barlow rating is at least pressure_psi × pressure_factor. Qualifying
+        cells are ranked by how close the design-flow velocity is to
+        target_velocity_fraction × max_velocity_ft_s (ties keep table order).
+        Schedules with the same wall on one NPS (40 / STD, 80 / XS, ...) are
+        the same pipe and appear once, under the first schedule in table order.
+        
+        When fluid_name is a compressible fluid (gas / steam) the pressure drops
+        come from calculate_gas_pressure_drop, every cell marched from
+        pressure_psi (inlet, psia) at once; cells that choke do not qualify.
+        
+        With NumPy all cells and all three flows are evaluated in one array pass;
+        without it the cells are evaluated one at a time.
+        
+        Args:
+            flow_min_gpm, flow_design_gpm, flow_max_gpm: Operating flows (GPM)
+            density_lb_ft3: Fluid density in lb/ft³
+            viscosity_cp: Fluid viscosity in centipoise
+            pressure_psi: Operating pressure (psi)
+            max_velocity_ft_s: Velocity limit at max flow (ft/s)
+            roughness: Pipe roughness in inches
+            temp_f: Temperature for the allowable stress (°F)
+            length_ft: Pipe length for the pressure drops (default 100 ft)
+            pressure_factor: Required rating / operating pressure (default 1.2)
+            target_velocity_fraction: Design velocity target as a fraction of the limit
+            friction_method: Turbulent friction method (see calculate_friction_factor)
+            fluid_name: Fluid from FluidProperties.FLUIDS; compressible fluids
+                are sized with the gas engine (None: Darcy-Weisbach only)
+            gas_model: One of GAS_MODELS for compressible fluids
+        
+        Returns:
+            NumPy structured array with SIZING_FIELDS, best first
+            (list of dicts with the same keys without NumPy)
+        """
+        grid = PipeData.get_grid()
+        flows = (flow_min_gpm, flow_design_gpm, flow_max_gpm)
+        S = FlowCalculator._barlow_stress(temp_f)
+        target_velocity = max_velocity_ft_s * target_velocity_fraction
+        required_rating = pressure_psi * pressure_factor
+        gas = None
+        if fluid_name and FluidProperties.get_properties(fluid_name, temp_f, pressure_psi)['compressible']:
+            gas = {'fluid_name': fluid_name, 'inlet_pressure_psia': pressure_psi, 'temperature_f': temp_f,
+                   'roughness': roughness, 'model': gas_model, 'friction_method': friction_method}
+        
+        if not HAS_NUMPY:
+            return FlowCalculator._size_pipe_grid_cells(grid, flows, density_lb_ft3, viscosity_cp, roughness,
+                                                        length_ft, S, max_velocity_ft_s, required_rating,
+                                                        target_velocity, friction_method, gas)
+        
+        od, id_inches, wall = grid['od'], grid['id'], grid['wall']
+        rating = ((2 * S * wall) / od).astype(np.int64)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            points = [FlowCalculator._grid_point(flow, id_inches, density_lb_ft3, viscosity_cp, roughness, length_ft,
+                                                 friction_method)
+                      for flow in flows]
+        keep = (id_inches > 0) & (points[2][0] <= max_velocity_ft_s) & (rating >= required_rating)
+        if gas:
+            # Gas lines: marched drops replace the inlet-density ones, chokes are out
+            for i, flow in enumerate(flows):
+                pressure_drop = np.zeros_like(id_inches)
+                pressure_drop[keep] = FlowCalculator.calculate_gas_pressure_drop(
+                    flow, id_inches[keep], length_ft, **gas)['pressure_drop_psi']
+                points[i] = points[i][:3] + (pressure_drop,)
+                keep &= np.isfinite(pressure_drop)
+        vel_deviation = np.abs(points[1][0] - target_velocity)
+        
+        # One row per distinct pipe (40 / STD, 80 / XS share a wall)
+        distinct = {}
+        for i in np.flatnonzero(keep):
+            distinct.setdefault((grid['size'][i], wall[i]), i)
+        order = np.fromiter(distinct.values(), dtype=int, count=len(distinct))
+        order = order[np.argsort(vel_deviation[order], kind='stable')]
+        
+        ranked = np.zeros(len(order), dtype=FlowCalculator.SIZING_FIELDS)
+        ranked['size'] = np.array(grid['size'])[order]
+        ranked['schedule'] = np.array(grid['schedule'])[order]
+        ranked['od'] = od[order]
+        ranked['id'] = id_inches[order]
+        ranked['wall'] = wall[order]
+        for point, values in zip(FlowCalculator.SIZING_POINTS, points):
+            for name, column in zip(('vel', 'reynolds', 'friction', 'dp'), values):
+                ranked[f'{name}_{point}'] = column[order]
+        ranked['rating'] = rating[order]
+        ranked['vel_deviation'] = vel_deviation[order]
+        return ranked
+    
+    @staticmethod
+    def _size_pipe_grid_cells(grid, flows, density_lb_ft3, viscosity_cp, roughness, length_ft, S,
+                              max_velocity_ft_s, required_rating, target_velocity, friction_method, gas=None):
+        """size_pipe_grid without NumPy: the same cells, one at a time."""
+        results = []
+        seen = set()
+        for i, id_inches in enumerate(grid['id']):
+            if id_inches <= 0 or (grid['size'][i], grid['wall'][i]) in seen:
+                continue
+            od, wall = grid['od'][i], grid['wall'][i]
+            rating = int((2 * S * wall) / od)
+            velocities = [FlowCalculator.calculate_velocity(flow, id_inches) for flow in flows]
+            if velocities[2] > max_velocity_ft_s or rating < required_rating:
+                continue
+            
+            row = {'size': grid['size'][i], 'schedule': grid['schedule'][i],
+                   'od': od, 'id': id_inches, 'wall': wall}
+            for point, flow, velocity in zip(FlowCalculator.SIZING_POINTS, flows, velocities):
+                reynolds = friction = pressure_drop = 0.0
+                if flow > 0:
+                    reynolds = FlowCalculator.calculate_reynolds_number(flow, id_inches, density_lb_ft3, viscosity_cp)
+                    relative_roughness = FlowCalculator.relative_roughness(roughness, id_inches)
+                    friction = FlowCalculator.calculate_friction_factor(reynolds, relative_roughness, friction_method)
+                    pressure_drop = ((friction * (length_ft / (id_inches / 12)) * density_lb_ft3 * (velocity ** 2))
+                                     / (2 * 32.2 * 144))
+                    if gas:
+                        pressure_drop = FlowCalculator.calculate_gas_pressure_drop(
+                            flow, id_inches, length_ft, **gas)['pressure_drop_psi']
+                row[f'vel_{point}'] = velocity
+                row[f'reynolds_{point}'] = reynolds
+                row[f'friction_{point}'] = friction
+                row[f'dp_{point}'] = pressure_drop
+            if not all(math.isfinite(row[f'dp_{point}']) for point in FlowCalculator.SIZING_POINTS):
+                continue  # choked gas line
+            row['rating'] = rating
+            row['vel_deviation'] = abs(velocities[1] - target_velocity)
+            results.append(row)
+            seen.add((grid['size'][i], wall))
+        
+        results.sort(key=lambda x: x['vel_deviation'])
+        return results
+    
+    @staticmethod
+    def sizing_records(ranked, limit=None):
+        """
+        Rows of a size_pipe_grid result as plain dicts (Python str / float / int),
+        plus 'reynolds' and 'flow_regime' at the design point.
+        """
+        records = []
+        for row in ranked[:limit]:
+            record = {}
+            for name, dtype in FlowCalculator.SIZING_FIELDS:
+                convert = {'U': str, 'i': int}.get(dtype[0], float)
+                record[name] = convert(row[name])
+            record['reynolds'] = record['reynolds_design']
+            record['flow_regime'] = FlowCalculator.get_flow_regime(record['reynolds'])
+            records.append(record)
+        return records
+    
+    # ==========================================================================
+    # MINIMUM PIPE FOR A ΔP BUDGET
+    # ==========================================================================
+    
+    # find_minimum_pipe objectives: smallest NPS first, or lightest pipe (lb/ft)
+    PIPE_OBJECTIVES = ('size', 'weight')
+    # Grades find_minimum_pipe searches by default (PIPE_MATERIAL_GRADES category)
+    DEFAULT_PIPE_CATEGORY = 'Carbon Steel'
+    
+    # Diameter bisection: bracket (inches) and relative tolerance
+    MIN_ID_SEARCH_BRACKET = (0.05, 100.0)
+    MIN_ID_TOLERANCE = 1e-9
+    
+    @staticmethod
+    def find_minimum_pipe(flow_gpm, density_lb_ft3, viscosity_cp, pressure_psi, max_dp_psi, length_ft=100,
+                          fittings=None, fitting_k=0.0, max_velocity_ft_s=None, temp_f=100, materials=None,
+                          roughness_material='Commercial Steel', objective='size', pressure_factor=1.0,
+                          weld_efficiency=1.0, friction_method='colebrook', fluid_name=None,
+                          gas_model='isothermal'):
+        """
+        Smallest (or lightest) pipe that meets a total ΔP budget, a velocity
+        limit and the ASME B31.3 pressure rating at temperature
+        
+        Instead of evaluating every NPS × schedule × material:
+        
+        1. The hydraulic minimum ID is found by bisection on the diameter -
+           total ΔP (pipe + fittings) falls monotonically with the ID - and
+           from the velocity limit in closed form.
+        2. NPS smaller than that ID are cut off by bisection on the OD.
+        3. Per material, the B31.3 formula solved for the wall,
+           t = P·D / (2(S·E + P·Y)) + CA, bisects each NPS's sorted walls
+           for the thinnest one that holds the pressure; walls too thick
+           for the minimum ID are cut off the same way.
+        
+        Weight per foot stands in for cost only within one material. Across
+        materials it is not a cost ranking (titanium is the lightest pipe,
+        not the cheapest), so by default only the DEFAULT_PIPE_CATEGORY
+        grades are searched; pass materials to compare other grades.
+        
+        For a compressible fluid_name the pipe drop is marched by
+        calculate_gas_pressure_drop from pressure_psi (inlet, psia); a line
+        that chokes never meets the budget.
+        
+        Args:
+            flow_gpm: Flow rate in GPM
+            density_lb_ft3: Fluid density in lb/ft³
+            viscosity_cp: Fluid viscosity in centipoise
+            pressure_psi: Operating pressure (psi)
+            max_dp_psi: Allowable total pressure drop (psi)
+            length_ft: Pipe length in feet
+            fittings: List of tuples [(fitting_name, quantity), ...]
+            fitting_k: Additional total K not in FITTING_K_FACTORS (e.g. an estimate)
+            max_velocity_ft_s: Velocity limit (ft/s), None for no limit
+            temp_f: Design temperature (°F) for the allowable stress
+            materials: PIPE_MATERIAL_GRADES names to search (default: the
+                carbon-steel grades)
+            roughness_material: PIPE_ROUGHNESS name for the friction factor
+            objective: 'size' (smallest NPS, then lightest) or 'weight' (lightest lb/ft)
+            pressure_factor: Design pressure / operating pressure
+            weld_efficiency: Weld joint efficiency E
+            friction_method: Turbulent friction method (see calculate_friction_factor)
+            fluid_name: Fluid from FluidProperties.FLUIDS; compressible fluids
+                use the gas engine for the pipe drop (None: Darcy-Weisbach)
+            gas_model: One of GAS_MODELS for compressible fluids
+        
+        Returns:
+            dict ('size', 'schedule', 'material', 'od', 'id', 'wall',
+            'weight_lb_ft', 'velocity_fps', 'pipe_dp_psi', 'fitting_dp_psi',
+            'total_dp_psi', 'allowable_pressure_psi', 'min_id', 'dp_evaluations'),
+            or None when no pipe in PIPE_DIMENSIONS qualifies
+        """
+        if objective not in FlowCalculator.PIPE_OBJECTIVES:
+            raise ValueError(f"Unknown objective: {objective} (expected one of {FlowCalculator.PIPE_OBJECTIVES})")
+        evaluations = [0]
+        gas = None
+        if fluid_name and FluidProperties.get_properties(fluid_name, temp_f, pressure_psi)['compressible']:
+            gas = {'fluid_name': fluid_name, 'inlet_pressure_psia': pressure_psi, 'temperature_f': temp_f,
+                   'roughness': FluidProperties.get_pipe_roughness(roughness_material)[0],
+                   'model': gas_model, 'friction_method': friction_method}
+        
+        def total_dp(id_inches):
+            evaluations[0] += 1
+            drops = FlowCalculator.calculate_total_pressure_drop(
+                flow_gpm, id_inches, length_ft, density_lb_ft3, viscosity_cp, fittings, roughness_material,
+                friction_method=friction_method
+            )
+            if gas:
+                pipe_dp = FlowCalculator.calculate_gas_pressure_drop(
+                    flow_gpm, id_inches, length_ft, **gas)['pressure_drop_psi']
+                drops['total_dp_psi'] += pipe_dp - drops['pipe_dp_psi']
+                drops['pipe_dp_psi'] = pipe_dp
+            if fitting_k:
+                extra = FluidProperties.calculate_fitting_pressure_drop(
+                    fitting_k, drops['velocity_fps'], density_lb_ft3)
+                drops['fitting_dp_psi'] += extra
+                drops['total_dp_psi'] += extra
+            return drops
+        
+        # 1. Hydraulic minimum ID
+        size_table = PipeData.get_size_table()
+        largest_id = max(entry['ids'][0] for entry in size_table)
+        if flow_gpm <= 0:
+            min_id = 0.0
+        else:
+            if total_dp(largest_id)['total_dp_psi'] > max_dp_psi:
+                return None
+            low, high = FlowCalculator.MIN_ID_SEARCH_BRACKET[0], largest_id
+            while high - low > FlowCalculator.MIN_ID_TOLERANCE * high:
+                mid = (low * high) ** 0.5  # ΔP ~ D^-5: bisect on log D
+                if total_dp(mid)['total_dp_psi'] <= max_dp_psi:
+                    high = mid
+                else:
+                    low = mid
+            min_id = high
+            if max_velocity_ft_s:
+                min_id = max(min_id, FlowCalculator.calculate_min_pipe_size(flow_gpm, max_velocity_ft_s))
+        
+        # 2. NPS with room for the minimum ID
+        first_size = bisect_right([entry['od'] for entry in size_table], min_id)
+        
+        # 3. Thinnest rated wall per NPS and material
+        design_pressure = pressure_psi * pressure_factor
+        Y = 0.5 if temp_f > 900 else 0.4
+        best, best_key = None, None
+        if not materials:
+            materials = FluidProperties.get_material_grades_by_category()[FlowCalculator.DEFAULT_PIPE_CATEGORY]
+        for material in materials:
+            mat_props = FluidProperties.get_material_properties(material, temp_f)
+            if not mat_props['min_temp_f'] <= temp_f <= mat_props['max_temp_f']:
+                continue
+            S = mat_props['allowable_stress'] * weld_efficiency
+            CA = mat_props['corrosion_allowance']
+            metal_density = FluidProperties.PIPE_MATERIAL_GRADES.get(material, {}).get('density_lb_ft3', 490)
+            
+            for entry in size_table[first_size:]:
+                od, walls = entry['od'], entry['walls']
+                required_wall = design_pressure * od / (2 * (S + design_pressure * Y)) + CA
+                lightest = math.pi * (od - walls[0]) * walls[0] / 144 * metal_density
+                if objective == 'weight' and best is not None and lightest >= best['weight_lb_ft']:
+                    continue
+                
+                i = bisect_left(walls, required_wall)
+                j = bisect_right(walls, (od - min_id) / 2)
+                # The closed form and the rating formula can differ in the last bit
+                while i < j and FluidProperties.calculate_allowable_pressure(
+                        od, walls[i], material, temp_f, weld_efficiency) < design_pressure:
+                    i += 1
+                if i >= j:
+                    continue
+                
+                wall = walls[i]
+                weight = math.pi * (od - wall) * wall / 144 * metal_density
+                key = (od, weight) if objective == 'size' else (weight, od)
+                if best_key is None or key < best_key:
+                    best_key = key
+                    best = {
+                        'size': entry['size'],
+                        'schedule': entry['schedules'][i],
+                        'material': material,
+                        'od': od,
+                        'id': entry['ids'][i],
+                        'wall': wall,
+                        'weight_lb_ft': weight,
+                    }
+                if objective == 'size':
+                    break  # larger NPS of this material cannot win
+        
+        if best is None:
+            return None
+        drops = total_dp(best['id']) if flow_gpm > 0 else {
+            'velocity_fps': 0.0, 'pipe_dp_psi': 0.0, 'fitting_dp_psi': 0.0, 'total_dp_psi': 0.0}
+        best.update({
+            'velocity_fps': drops['velocity_fps'],
+            'pipe_dp_psi': drops['pipe_dp_psi'],
+            'fitting_dp_psi': drops['fitting_dp_psi'],
+            'total_dp_psi': drops['total_dp_psi'],
+            'allowable_pressure_psi': FluidProperties.calculate_allowable_pressure(
+                best['od'], best['wall'], best['material'], temp_f, weld_efficiency),
+            'min_id': min_id,
+            'dp_evaluations': evaluations[0],
+        })
+        return best
+    
+    # ==========================================================================
+    # OPERATING ENVELOPE SWEEP
+    # ==========================================================================
+    
+    # Flow regime names, indexed by the 'regime' codes of sweep_envelope
+    REGIMES = ('Laminar', 'Transitional', 'Turbulent')
+    
+    # Result columns of sweep_envelope, one value per grid point
+    ENVELOPE_FIELDS = ('flow_gpm', 'temp_f', 'pressure_psi', 'density', 'viscosity', 'velocity_fps',
+                       'reynolds', 'regime', 'pipe_dp_psi', 'fitting_dp_psi', 'total_dp_psi')
+    
+    @staticmethod
+    def sweep_envelope(fluid_name, nps, schedule, flows_gpm, temps_f, pressures_psi=(14.7,),
+                       length_ft=100, fittings=None, pipe_material='Commercial Steel',
+                       friction_method='swamee_jain'):
+        """
+        Evaluate one pipe over a flow × temperature × pressure grid
+        
+        Fluid properties come from FluidProperties.get_properties and pressure
+        drops from calculate_total_pressure_drop, both called once on the whole
+        grid when NumPy is installed (point by point without it).
+        
+        Args:
+            fluid_name: Name of fluid from FluidProperties.FLUIDS
+            nps, schedule: Pipe from PipeData.PIPE_DIMENSIONS
+            flows_gpm: Flow rates in GPM
+            temps_f: Temperatures in °F
+            pressures_psi: Pressures in psia (only gas densities depend on it)
+            length_ft: Pipe length in feet
+            fittings: List of tuples [(fitting_name, quantity), ...]
+            pipe_material: Pipe material name for roughness lookup
+            friction_method: Turbulent friction method (see calculate_friction_factor)
+        
+        Returns:
+            dict: ENVELOPE_FIELDS -> values over the grid, plus 'nps',
+                  'schedule', 'id' and 'shape' (flows, temps, pressures).
+                  Arrays of that shape with NumPy, flat row-major lists
+                  without. 'regime' indexes REGIMES.
+        """
+        id_inches = PipeData.get_pipe_id(nps, schedule)
+        if id_inches <= 0:
+            raise ValueError(f"No pipe data for NPS {nps} Schedule {schedule}")
+        flows_gpm, temps_f, pressures_psi = (tuple(float(v) for v in values)
+                                             for values in (flows_gpm, temps_f, pressures_psi))
+        shape = (len(flows_gpm), len(temps_f), len(pressures_psi))
+        
+        if HAS_NUMPY:
+            sweep = FlowCalculator._sweep_arrays(fluid_name, id_inches, shape, flows_gpm, temps_f, pressures_psi,
+                                                 length_ft, fittings, pipe_material, friction_method)
+        else:
+            sweep = {field: [] for field in FlowCalculator.ENVELOPE_FIELDS}
+            for flow in flows_gpm:
+                for temp in temps_f:
+                    for pressure in pressures_psi:
+                        point = FlowCalculator._sweep_point(fluid_name, id_inches, flow, temp, pressure,
+                                                            length_ft, fittings, pipe_material, friction_method)
+                        for field in FlowCalculator.ENVELOPE_FIELDS:
+                            sweep[field].append(point[field])
+        
+        sweep.update({'nps': nps, 'schedule': schedule, 'id': id_inches, 'shape': shape})
+        return sweep
+    
+    @staticmethod
+    def _sweep_arrays(fluid_name, id_inches, shape, flows_gpm, temps_f, pressures_psi, length_ft, fittings,
+                      pipe_material, friction_method):
+        """sweep_envelope on NumPy arrays: properties on the temp × pressure plane, drops on the full grid."""
+        flow, temp, pressure = np.meshgrid(flows_gpm, temps_f, pressures_psi, indexing='ij')
+        props = FluidProperties.get_properties(fluid_name, temp[:1], pressure[:1])
+        density = np.broadcast_to(props['density'], shape)
+        viscosity = np.broadcast_to(props['viscosity'], shape)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            drops = FlowCalculator.calculate_total_pressure_drop(flow, id_inches, length_ft, density, viscosity,
+                                                                 fittings, pipe_material, friction_method)
+            reynolds = FlowCalculator.calculate_reynolds_number(flow, id_inches, density, viscosity)
+        
+        # No flow, no drop (64/Re is undefined at Re = 0)
+        flowing = flow > 0
+        pipe_dp = np.where(flowing, drops['pipe_dp_psi'], 0.0)
+        fitting_dp = np.broadcast_to(drops['fitting_dp_psi'], shape)
+        return {
+            'flow_gpm': flow,
+            'temp_f': temp,
+            'pressure_psi': pressure,
+            'density': density,
+            'viscosity': viscosity,
+            'velocity_fps': drops['velocity_fps'],
+            'reynolds': reynolds,
+            'regime': np.searchsorted([2300, 4000], reynolds, side='right'),
+            'pipe_dp_psi': pipe_dp,
+            'fitting_dp_psi': fitting_dp,
+            'total_dp_psi': pipe_dp + fitting_dp,
+        }
+    
+    @staticmethod
+    def _sweep_point(fluid_name, id_inches, flow, temp, pressure, length_ft, fittings, pipe_material, friction_method):
+        """One sweep_envelope grid point without NumPy."""
+        props = FluidProperties.get_properties(fluid_name, temp, pressure)
+        density, viscosity = props['density'], props['viscosity']
+        reynolds = FlowCalculator.calculate_reynolds_number(flow, id_inches, density, viscosity)
+        if flow > 0:
+            drops = FlowCalculator.calculate_total_pressure_drop(flow, id_inches, length_ft, density, viscosity,
+                                                                 fittings, pipe_material, friction_method)
+        else:
+            drops = {'pipe_dp_psi': 0.0, 'fitting_dp_psi': 0.0, 'total_dp_psi': 0.0, 'velocity_fps': 0.0}
+        return {
+            'flow_gpm': flow,
+            'temp_f': temp,
+            'pressure_psi': pressure,
+            'density': density,
+            'viscosity': viscosity,
+            'velocity_fps': drops['velocity_fps'],
+            'reynolds': reynolds,
+            'regime': FlowCalculator.REGIMES.index(FlowCalculator.get_flow_regime(reynolds)),
+            'pipe_dp_psi': drops['pipe_dp_psi'],
+            'fitting_dp_psi': drops['fitting_dp_psi'],
+            'total_dp_psi': drops['total_dp_psi'],
+        }
+    
+    @staticmethod
+    def summarize_envelope(sweep, max_velocity_ft_s=None):
+        """
+        Envelope of a sweep_envelope result
+        
+        Args:
+            sweep: Result of sweep_envelope
+            max_velocity_ft_s: Velocity limit to count exceedances against (optional)
+        
+        Returns:
+            dict: 'points', min/max of 'velocity_fps' and 'total_dp_psi',
+                  'regime_fraction' (REGIMES name -> fraction of points),
+                  'over_velocity_fraction', and 'worst' - the
+                  (flow_gpm, temp_f, pressure_psi) of the highest total drop
+        """
+        if HAS_NUMPY:
+            velocity = np.ravel(sweep['velocity_fps'])
+            total_dp = np.ravel(sweep['total_dp_psi'])
+            regime_counts = np.bincount(np.ravel(sweep['regime']), minlength=len(FlowCalculator.REGIMES))
+            worst = int(np.argmax(total_dp))
+            over = int(np.count_nonzero(velocity > max_velocity_ft_s)) if max_velocity_ft_s else 0
+            velocity_range = (float(velocity.min()), float(velocity.max()))
+            dp_range = (float(total_dp.min()), float(total_dp.max()))
+            flat = {field: np.ravel(sweep[field]) for field in ('flow_gpm', 'temp_f', 'pressure_psi')}
+        else:
+            velocity, total_dp = sweep['velocity_fps'], sweep['total_dp_psi']
+            regime_counts = [sweep['regime'].count(code) for code in range(len(FlowCalculator.REGIMES))]
+            worst = max(range(len(total_dp)), key=total_dp.__getitem__)
+            over = sum(1 for v in velocity if v > max_velocity_ft_s) if max_velocity_ft_s else 0
+            velocity_range = (min(velocity), max(velocity))
+            dp_range = (min(total_dp), max(total_dp))
+            flat = sweep
+        
+        points = len(velocity)
+        return {
+            'points': points,
+            'velocity_min': velocity_range[0],
+            'velocity_max': velocity_range[1],
+            'dp_min': dp_range[0],
+            'dp_max': dp_range[1],
+            'regime_fraction': {name: int(count) / points
+                                for name, count in zip(FlowCalculator.REGIMES, regime_counts)},
+            'over_velocity_fraction': over / points,
+            'worst': tuple(float(flat[field][worst]) for field in ('flow_gpm', 'temp_f', 'pressure_psi')),
+        }
+    
+    # ==========================================================================
+    # COMPRESSIBLE GAS FLOW
+    # ==========================================================================
+    
+    # Density along a gas line: 'isothermal' (ρ ∝ P) or 'adiabatic' (Fanno:
+    # stagnation temperature constant, the gas cools as it speeds up)
+    GAS_MODELS = ('isothermal', 'adiabatic')
+    
+    # g in the Darcy-Weisbach terms, as in calculate_pressure_drop (ft/s²)
+    GAS_GRAVITY = 32.2
+    GPM_PER_CFS = 448.831
+    GAS_NEWTON_STEPS = 8
+    
+    @staticmethod
+    def calculate_gas_pressure_drop(flow_gpm, id_inches, length_ft, fluid_name, inlet_pressure_psia,
+                                    temperature_f=60, roughness=0.0018, model='isothermal',
+                                    friction_method='colebrook', max_step_drop=0.02):
+        """
+        Pressure drop of a compressible fluid (gas / steam) along a pipe
+        
+        calculate_pressure_drop uses one density for the whole pipe, which is
+        only right while the drop is small against the line pressure. Here the
+        pipe is marched from the inlet in steps; each step solves
+        
+            P1 - P2 = f (Δx/D) G² / (g (ρ1 + ρ2)) + (G²/g) (1/ρ2 - 1/ρ1)
+        
+        (friction at the mean density plus the acceleration of the expanding
+        gas) for P2, with ρ2 from the gas model. The mass flux G and the
+        Reynolds number stay constant along the pipe, so the friction factor
+        is evaluated once. Step lengths adapt so each step drops at most
+        max_step_drop of the local pressure, which also refines the steps as
+        the flow approaches choking.
+        
+        With NumPy, any of flow_gpm / id_inches / length_ft may be arrays
+        (e.g. every candidate ID of a sizing run); all lines are marched
+        together, each with its own step length.
+        
+        Args:
+            flow_gpm: Actual volumetric flow at inlet conditions (GPM)
+            id_inches: Pipe inside diameter in inches
+            length_ft: Pipe length in feet
+            fluid_name: Compressible fluid from FluidProperties.FLUIDS
+            inlet_pressure_psia: Inlet pressure (psia)
+            temperature_f: Inlet temperature (°F)
+            roughness: Pipe roughness in inches
+            model: One of GAS_MODELS
+            friction_method: Turbulent friction method (see calculate_friction_factor)
+            max_step_drop: Largest pressure drop per step, as a fraction of pressure
+        
+        Returns:
+            dict: 'pressure_drop_psi', 'outlet_pressure_psia', 'outlet_density',
+                  'outlet_temp_f', 'inlet_velocity_fps', 'outlet_velocity_fps',
+                  'outlet_mach', 'choked' (True where the line chokes before its
+                  end - the drop is then inf), 'choke_length_ft', 'steps'
+        """
+        if model not in FlowCalculator.GAS_MODELS:
+            raise ValueError(f"Unknown gas model: {model} (expected one of {FlowCalculator.GAS_MODELS})")
+        props = FluidProperties.get_properties(fluid_name, temperature_f, inlet_pressure_psia)
+        if not props['compressible']:
+            raise ValueError(f"{fluid_name} is not compressible - use calculate_pressure_drop")
+        density, viscosity = props['density'], props['viscosity']
+        k = props.get('specific_heat_ratio', 1.4)
+        
+        vectorized = HAS_NUMPY and (np.ndim(flow_gpm) or np.ndim(id_inches) or np.ndim(length_ft))
+        if vectorized:
+            flow_gpm, id_inches, length_ft = np.broadcast_arrays(np.asarray(flow_gpm, dtype=float),
+                                                                 np.asarray(id_inches, dtype=float),
+                                                                 np.asarray(length_ft, dtype=float))
+        
+        diameter_ft = id_inches / 12
+        area_ft2 = math.pi * diameter_ft ** 2 / 4
+        mass_flux = density * (flow_gpm / FlowCalculator.GPM_PER_CFS) / area_ft2  # lbm/(ft²·s)
+        
+        line = {
+            'pressure': inlet_pressure_psia * 144,  # lbf/ft²
+            'density': density,
+            'temp_r': temperature_f + 459.67,
+            'k': k,
+            'model': model,
+            'max_step_drop': max_step_drop,
+        }
+        if vectorized:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                reynolds = FlowCalculator.calculate_reynolds_number(flow_gpm, id_inches, density, viscosity)
+                relative_roughness = FlowCalculator.relative_roughness(roughness, id_inches)
+                friction = FlowCalculator.calculate_friction_factor(reynolds, relative_roughness, friction_method)
+            friction = np.where(flow_gpm > 0, friction, 0.0)
+            return FlowCalculator._march_gas_lines(line, mass_flux, friction / diameter_ft, length_ft)
+        
+        friction = 0.0
+        if flow_gpm > 0:
+            reynolds = FlowCalculator.calculate_reynolds_number(flow_gpm, id_inches, density, viscosity)
+            relative_roughness = FlowCalculator.relative_roughness(roughness, id_inches)
+            friction = FlowCalculator.calculate_friction_factor(reynolds, relative_roughness, friction_method)
+        return FlowCalculator._march_gas_line(line, mass_flux, friction / diameter_ft, length_ft)
+    
+    @staticmethod
+    def _gas_state(line, mass_flux):
+        """Constants of a gas line: R·T at the inlet, R, cp and the stagnation temperature."""
+        rt_in = line['pressure'] / line['density']  # R_s·T (ft·lbf/lbm)
+        gas_constant = rt_in / line['temp_r']
+        k = line['k']
+        cp = k / (k - 1) * gas_constant if k > 1 else math.inf
+        g = FlowCalculator.GAS_GRAVITY
+        stagnation_temp = line['temp_r'] + (mass_flux / line['density']) ** 2 / (2 * g * cp)
+        return gas_constant, cp, stagnation_temp
+    
+    @staticmethod
+    def _gas_density(line, pressure, mass_flux, gas_constant, cp, stagnation_temp, sqrt):
+        """
+        Density at a pressure and its derivative dρ/dP.
+        Isothermal: ρ = P / (R·T1). Adiabatic: static temperature from
+        cp·T + (G·R·T/P)²/(2g) = cp·T0, then ρ = P / (R·T).
+        """
+        if line['model'] == 'isothermal' or cp == math.inf:
+            density = pressure / (gas_constant * line['temp_r'])
+            return density, density / pressure
+        a = (mass_flux * gas_constant / pressure) ** 2 / (2 * FlowCalculator.GAS_GRAVITY * cp)
+        temp_r = 2 * stagnation_temp / (1 + sqrt(1 + 4 * a * stagnation_temp))
+        density = pressure / (gas_constant * temp_r)
+        dtemp_dp = 2 * a * temp_r ** 2 / (pressure * (1 + 2 * a * temp_r))
+        return density, density / pressure - density / temp_r * dtemp_dp
+    
+    @staticmethod
+    def _gas_result(line, pressure, density, temp_r, mass_flux, choked, choke_length, steps):
+        g = FlowCalculator.GAS_GRAVITY
+        inlet_pressure = line['pressure']
+        velocity = mass_flux / density
+        sound_speed = (line['k'] * g * pressure / density) ** 0.5
+        return {
+            'pressure_drop_psi': (inlet_pressure - pressure) / 144,
+            'outlet_pressure_psia': pressure / 144,
+            'outlet_density': density,
+            'outlet_temp_f': temp_r - 459.67,
+            'inlet_velocity_fps': mass_flux / line['density'],
+            'outlet_velocity_fps': velocity,
+            'outlet_mach': velocity / sound_speed,
+            'choked': choked,
+            'choke_length_ft': choke_length,
+            'steps': steps,
+        }
+    
+    @staticmethod
+    def _march_gas_line(line, mass_flux, friction_per_ft, length_ft):
+        """calculate_gas_pressure_drop for one line (plain floats)."""
+        g = FlowCalculator.GAS_GRAVITY
+        gas_constant, cp, stagnation_temp = FlowCalculator._gas_state(line, mass_flux)
+        g2 = mass_flux ** 2 / g
+        choke_mach2_factor = 1.0 if line['model'] == 'isothermal' else 1.0 / line['k']
+        
+        pressure, density = line['pressure'], line['density']
+        position, steps, choked = 0.0, 0, False
+        while position < length_ft and not choked:
+            # Local gradient (friction, amplified toward choking) sets the step
+            mach2 = g2 / (density * pressure) * choke_mach2_factor
+            if mach2 >= 1:
+                choked = True
+                break
+            gradient = friction_per_ft * g2 / (2 * density) / (1 - mach2)
+            dx = length_ft - position
+            if gradient > 0:
+                dx = min(dx, line['max_step_drop'] * pressure / gradient)
+            
+            # Newton on the step equation for the outlet pressure
+            p2 = pressure - gradient * dx
+            for _ in range(FlowCalculator.GAS_NEWTON_STEPS):
+                if p2 <= 0:
+                    choked = True
+                    break
+                rho2, drho = FlowCalculator._gas_density(line, p2, mass_flux, gas_constant, cp, stagnation_temp,
+                                                         math.sqrt)
+                residual = (pressure - p2 - friction_per_ft * dx * g2 / (density + rho2)
+                            - g2 * (1 / rho2 - 1 / density))
+                slope = -1 + friction_per_ft * dx * g2 * drho / (density + rho2) ** 2 + g2 * drho / rho2 ** 2
+                if slope >= 0:
+                    choked = True
+                    break
+                step = residual / slope
+                p2 -= step
+                if abs(step) <= 1e-12 * abs(p2):
+                    break
+            # Past the choke point the step equation only has a supersonic root
+            if choked or (gradient > 0 and p2 >= pressure):
+                choked = True
+                break
+            pressure = p2
+            density = FlowCalculator._gas_density(line, p2, mass_flux, gas_constant, cp, stagnation_temp,
+                                                  math.sqrt)[0]
+            position += dx
+            steps += 1
+        
+        temp_r = pressure / (gas_constant * density)
+        result = FlowCalculator._gas_result(line, pressure, density, temp_r, mass_flux, choked,
+                                            position if choked else None, steps)
+        if choked:
+            result['pressure_drop_psi'] = math.inf
+        return result
+    
+    @staticmethod
+    def _march_gas_lines(line, mass_flux, friction_per_ft, length_ft):
+        """calculate_gas_pressure_drop for many lines at once (NumPy arrays)."""
+        g = FlowCalculator.GAS_GRAVITY
+        gas_constant, cp, stagnation_temp = FlowCalculator._gas_state(line, mass_flux)
+        g2 = mass_flux ** 2 / g
+        choke_mach2_factor = 1.0 if line['model'] == 'isothermal' else 1.0 / line['k']
+        
+        def density_at(p):
+            return FlowCalculator._gas_density(line, p, mass_flux, gas_constant, cp, stagnation_temp, np.sqrt)
+        
+        shape = np.shape(length_ft)
+        pressure = np.full(shape, float(line['pressure']))
+        density = np.full(shape, float(line['density']))
+        position = np.zeros(shape)
+        steps = np.zeros(shape, dtype=int)
+        choked = np.zeros(shape, dtype=bool)
+        
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            while True:
+                active = (position < length_ft) & ~choked
+                if not active.any():
+                    break
+                mach2 = g2 / (density * pressure) * choke_mach2_factor
+                choked |= active & (mach2 >= 1)
+                active &= ~choked
+                
+                gradient = friction_per_ft * g2 / (2 * density) / (1 - mach2)
+                dx = np.where(gradient > 0,
+                              np.minimum(length_ft - position, line['max_step_drop'] * pressure / gradient),
+                              length_ft - position)
+                dx = np.where(active, dx, 0.0)
+                
+                p2 = pressure - gradient * dx
+                failed = np.zeros(shape, dtype=bool)
+                for _ in range(FlowCalculator.GAS_NEWTON_STEPS):
+                    failed |= active & (p2 <= 0)
+                    rho2, drho = density_at(p2)
+                    residual = (pressure - p2 - friction_per_ft * dx * g2 / (density + rho2)
+                                - g2 * (1 / rho2 - 1 / density))
+                    slope = -1 + friction_per_ft * dx * g2 * drho / (density + rho2) ** 2 + g2 * drho / rho2 ** 2
+                    failed |= active & (slope >= 0)
+                    step = np.where(active & ~failed, residual / slope, 0.0)
+                    p2 = p2 - step
+                    if np.all((np.abs(step) <= 1e-12 * np.abs(p2)) | ~active):
+                        break
+                # Past the choke point the step equation only has a supersonic root
+                failed |= active & (gradient > 0) & ~(p2 < pressure)
+                choked |= failed
+                advance = active & ~failed
+                pressure = np.where(advance, p2, pressure)
+                density = np.where(advance, density_at(pressure)[0], density)
+                position = position + np.where(advance, dx, 0.0)
+                steps += advance
+            
+            temp_r = pressure / (gas_constant * density)
+            result = FlowCalculator._gas_result(line, pressure, density, temp_r, mass_flux, choked,
+                                                np.where(choked, position, np.nan), steps)
+        result['pressure_drop_psi'] = np.where(choked, np.inf, result['pressure_drop_psi'])
+        return result
 
 
 def convert_flow_to_gpm(value, unit):
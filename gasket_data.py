@@ -12,6 +12,8 @@ Gasket Types:
 - Ring Joint: For RTJ flanges, oval or octagonal profiles
 """
 
+from nps_key import sorted_keys
+
 # ASME B16.5 Class 150 Flat Ring Gaskets
 B165_CLASS150_FLAT_RING_GASKETS = {
     '1/2': {'nps': '1/2', 'class': 150, 'gasket_type': 'flat_ring', 'id_inches': 0.84, 'id_mm': 21, 'od_inches': 1.88, 'od_mm': 48},
@@ -3088,6 +3090,60 @@ B1647B_CLASS300_FULL_FACE_GASKETS = {
 }
 
 
+# Table for each (pressure_class, gasket_type, series). series None is the
+# B16.5 table; a series without its own B16.47 table falls back to it.
+GASKET_TABLES = {
+    (150, 'full_face', None): B165_CLASS150_FULL_FACE_GASKETS,
+    (150, 'full_face', 'A'): B1647A_CLASS150_FULL_FACE_GASKETS,
+    (150, 'full_face', 'B'): B1647B_CLASS150_FULL_FACE_GASKETS,
+    (300, 'full_face', None): B165_CLASS300_FULL_FACE_GASKETS,
+    (300, 'full_face', 'A'): B1647A_CLASS300_FULL_FACE_GASKETS,
+    (300, 'full_face', 'B'): B1647B_CLASS300_FULL_FACE_GASKETS,
+    (400, 'full_face', None): B165_CLASS400_FULL_FACE_GASKETS,
+    (600, 'full_face', None): B165_CLASS600_FULL_FACE_GASKETS,
+    (900, 'full_face', None): B165_CLASS900_FULL_FACE_GASKETS,
+    (150, 'flat_ring', None): B165_CLASS150_FLAT_RING_GASKETS,
+    (150, 'flat_ring', 'A'): B1647A_CLASS150_FLAT_RING_GASKETS,
+    (300, 'flat_ring', None): B165_CLASS300_FLAT_RING_GASKETS,
+    (300, 'flat_ring', 'A'): B1647A_CLASS300_FLAT_RING_GASKETS,
+    (400, 'flat_ring', None): B165_CLASS400_FLAT_RING_GASKETS,
+    (400, 'flat_ring', 'A'): B1647A_CLASS400_FLAT_RING_GASKETS,
+    (600, 'flat_ring', None): B165_CLASS600_FLAT_RING_GASKETS,
+    (600, 'flat_ring', 'A'): B1647A_CLASS600_FLAT_RING_GASKETS,
+    (900, 'flat_ring', None): B165_CLASS900_FLAT_RING_GASKETS,
+    (150, 'spiral_wound', None): B165_CLASS150_SPIRAL_WOUND_GASKETS,
+    (150, 'spiral_wound', 'A'): B1647A_CLASS150_SPIRAL_WOUND_GASKETS,
+    (150, 'spiral_wound', 'B'): B1647B_CLASS150_SPIRAL_WOUND_GASKETS,
+    (300, 'spiral_wound', None): B165_CLASS300_SPIRAL_WOUND_GASKETS,
+    (300, 'spiral_wound', 'A'): B1647A_CLASS300_SPIRAL_WOUND_GASKETS,
+    (300, 'spiral_wound', 'B'): B1647B_CLASS300_SPIRAL_WOUND_GASKETS,
+    (400, 'spiral_wound', None): B165_CLASS400_SPIRAL_WOUND_GASKETS,
+    (400, 'spiral_wound', 'A'): B1647A_CLASS400_SPIRAL_WOUND_GASKETS,
+    (400, 'spiral_wound', 'B'): B1647B_CLASS400_SPIRAL_WOUND_GASKETS,
+    (600, 'spiral_wound', None): B165_CLASS600_SPIRAL_WOUND_GASKETS,
+    (600, 'spiral_wound', 'A'): B1647A_CLASS600_SPIRAL_WOUND_GASKETS,
+    (600, 'spiral_wound', 'B'): B1647B_CLASS600_SPIRAL_WOUND_GASKETS,
+    (900, 'spiral_wound', None): B165_CLASS900_SPIRAL_WOUND_GASKETS,
+    (900, 'spiral_wound', 'A'): B1647A_CLASS900_SPIRAL_WOUND_GASKETS,
+    (900, 'spiral_wound', 'B'): B1647B_CLASS900_SPIRAL_WOUND_GASKETS,
+    (1500, 'spiral_wound', None): B165_CLASS1500_SPIRAL_WOUND_GASKETS,
+    (2500, 'spiral_wound', None): B165_CLASS2500_SPIRAL_WOUND_GASKETS,
+}
+
+
+# Type R and Type RX ring numbers together
+RING_NUMBERS = tuple(sorted(list(RING_JOINT_TYPE_R_GASKETS.keys()) + list(RING_JOINT_TYPE_RX_GASKETS.keys())))
+
+
+def _gasket_table(pressure_class, gasket_type, series):
+    """Gasket table for a class/type/series, or None."""
+    if series in ('A', 'B'):
+        table = GASKET_TABLES.get((pressure_class, gasket_type, series))
+        if table is not None:
+            return table
+    return GASKET_TABLES.get((pressure_class, gasket_type, None))
+
+
 def get_gasket_info(nps, pressure_class, gasket_type='full_face', series=None):
     """
     Get gasket dimensions for a specific NPS, pressure class, and gasket type.
@@ -3101,85 +3157,17 @@ def get_gasket_info(nps, pressure_class, gasket_type='full_face', series=None):
     Returns:
         dict: Gasket dimensions or None if not found
     """
-    # Map to appropriate gasket dictionary
-    if pressure_class == 150 and gasket_type == 'full_face':
-        if series == 'A':
-            return B1647A_CLASS150_FULL_FACE_GASKETS.get(nps)
-        elif series == 'B':
-            return B1647B_CLASS150_FULL_FACE_GASKETS.get(nps)
-        return B165_CLASS150_FULL_FACE_GASKETS.get(nps)
-    elif pressure_class == 300 and gasket_type == 'full_face':
-        if series == 'A':
-            return B1647A_CLASS300_FULL_FACE_GASKETS.get(nps)
-        elif series == 'B':
-            return B1647B_CLASS300_FULL_FACE_GASKETS.get(nps)
-        return B165_CLASS300_FULL_FACE_GASKETS.get(nps)
-    elif pressure_class == 400 and gasket_type == 'full_face':
-        return B165_CLASS400_FULL_FACE_GASKETS.get(nps)
-    elif pressure_class == 600 and gasket_type == 'full_face':
-        return B165_CLASS600_FULL_FACE_GASKETS.get(nps)
-    elif pressure_class == 900 and gasket_type == 'full_face':
-        return B165_CLASS900_FULL_FACE_GASKETS.get(nps)
-    elif pressure_class == 150 and gasket_type == 'flat_ring':
-        if series == 'A':
-            return B1647A_CLASS150_FLAT_RING_GASKETS.get(nps)
-        return B165_CLASS150_FLAT_RING_GASKETS.get(nps)
-    elif pressure_class == 300 and gasket_type == 'flat_ring':
-        if series == 'A':
-            return B1647A_CLASS300_FLAT_RING_GASKETS.get(nps)
-        return B165_CLASS300_FLAT_RING_GASKETS.get(nps)
-    elif pressure_class == 400 and gasket_type == 'flat_ring':
-        if series == 'A':
-            return B1647A_CLASS400_FLAT_RING_GASKETS.get(nps)
-        return B165_CLASS400_FLAT_RING_GASKETS.get(nps)
-    elif pressure_class == 600 and gasket_type == 'flat_ring':
-        if series == 'A':
-            return B1647A_CLASS600_FLAT_RING_GASKETS.get(nps)
-        return B165_CLASS600_FLAT_RING_GASKETS.get(nps)
-    elif pressure_class == 900 and gasket_type == 'flat_ring':
-        return B165_CLASS900_FLAT_RING_GASKETS.get(nps)
-    elif pressure_class == 150 and gasket_type == 'spiral_wound':
-        if series == 'A':
-            return B1647A_CLASS150_SPIRAL_WOUND_GASKETS.get(nps)
-        elif series == 'B':
-            return B1647B_CLASS150_SPIRAL_WOUND_GASKETS.get(nps)
-        return B165_CLASS150_SPIRAL_WOUND_GASKETS.get(nps)
-    elif pressure_class == 300 and gasket_type == 'spiral_wound':
-        if series == 'A':
-            return B1647A_CLASS300_SPIRAL_WOUND_GASKETS.get(nps)
-        elif series == 'B':
-            return B1647B_CLASS300_SPIRAL_WOUND_GASKETS.get(nps)
-        return B165_CLASS300_SPIRAL_WOUND_GASKETS.get(nps)
-    elif pressure_class == 400 and gasket_type == 'spiral_wound':
-        if series == 'A':
-            return B1647A_CLASS400_SPIRAL_WOUND_GASKETS.get(nps)
-        elif series == 'B':
-            return B1647B_CLASS400_SPIRAL_WOUND_GASKETS.get(nps)
-        return B165_CLASS400_SPIRAL_WOUND_GASKETS.get(nps)
-    elif pressure_class == 600 and gasket_type == 'spiral_wound':
-        if series == 'A':
-            return B1647A_CLASS600_SPIRAL_WOUND_GASKETS.get(nps)
-        elif series == 'B':
-            return B1647B_CLASS600_SPIRAL_WOUND_GASKETS.get(nps)
-        return B165_CLASS600_SPIRAL_WOUND_GASKETS.get(nps)
-    elif pressure_class == 900 and gasket_type == 'spiral_wound':
-        if series == 'A':
-            return B1647A_CLASS900_SPIRAL_WOUND_GASKETS.get(nps)
-        elif series == 'B':
-            return B1647B_CLASS900_SPIRAL_WOUND_GASKETS.get(nps)
-        return B165_CLASS900_SPIRAL_WOUND_GASKETS.get(nps)
-    elif pressure_class == 1500 and gasket_type == 'spiral_wound':
-        return B165_CLASS1500_SPIRAL_WOUND_GASKETS.get(nps)
-    elif pressure_class == 2500 and gasket_type == 'spiral_wound':
-        return B165_CLASS2500_SPIRAL_WOUND_GASKETS.get(nps)
-    elif gasket_type == 'ring_joint':
+    if gasket_type == 'ring_joint':
         # Check if RX series (starts with 'RX-') or Type R (starts with 'R-')
         if nps.startswith('RX-'):
             return RING_JOINT_TYPE_RX_GASKETS.get(nps)
         else:
             return RING_JOINT_TYPE_R_GASKETS.get(nps)
     
-    return None
+    table = _gasket_table(pressure_class, gasket_type, series)
+    if table is None:
+        return None
+    return table.get(nps)
 
 
 def list_gasket_sizes(pressure_class, gasket_type='full_face', series=None):
@@ -3192,98 +3180,15 @@ def list_gasket_sizes(pressure_class, gasket_type='full_face', series=None):
         series (str): For B16.47 flanges, specify 'A' or 'B'. None for B16.5 flanges.
     
     Returns:
-        list: Available sizes sorted
+        tuple: Available sizes sorted (cached - the same tuple every call)
     """
-    def nps_to_float(nps_str):
-        """Convert fractional NPS string to float for sorting."""
-        if '-' in nps_str and '/' in nps_str:
-            parts = nps_str.split('-')
-            whole = float(parts[0])
-            frac_parts = parts[1].split('/')
-            frac = float(frac_parts[0]) / float(frac_parts[1])
-            return whole + frac
-        elif '/' in nps_str:
-            parts = nps_str.split('/')
-            return float(parts[0]) / float(parts[1])
-        else:
-            return float(nps_str)
-    
-    if pressure_class == 150 and gasket_type == 'full_face':
-        if series == 'A':
-            return sorted(B1647A_CLASS150_FULL_FACE_GASKETS.keys(), key=nps_to_float)
-        elif series == 'B':
-            return sorted(B1647B_CLASS150_FULL_FACE_GASKETS.keys(), key=nps_to_float)
-        return sorted(B165_CLASS150_FULL_FACE_GASKETS.keys(), key=nps_to_float)
-    elif pressure_class == 300 and gasket_type == 'full_face':
-        if series == 'A':
-            return sorted(B1647A_CLASS300_FULL_FACE_GASKETS.keys(), key=nps_to_float)
-        elif series == 'B':
-            return sorted(B1647B_CLASS300_FULL_FACE_GASKETS.keys(), key=nps_to_float)
-        return sorted(B165_CLASS300_FULL_FACE_GASKETS.keys(), key=nps_to_float)
-    elif pressure_class == 400 and gasket_type == 'full_face':
-        return sorted(B165_CLASS400_FULL_FACE_GASKETS.keys(), key=nps_to_float)
-    elif pressure_class == 600 and gasket_type == 'full_face':
-        return sorted(B165_CLASS600_FULL_FACE_GASKETS.keys(), key=nps_to_float)
-    elif pressure_class == 900 and gasket_type == 'full_face':
-        return sorted(B165_CLASS900_FULL_FACE_GASKETS.keys(), key=nps_to_float)
-    elif pressure_class == 150 and gasket_type == 'flat_ring':
-        if series == 'A':
-            return sorted(B1647A_CLASS150_FLAT_RING_GASKETS.keys(), key=nps_to_float)
-        return sorted(B165_CLASS150_FLAT_RING_GASKETS.keys(), key=nps_to_float)
-    elif pressure_class == 300 and gasket_type == 'flat_ring':
-        if series == 'A':
-            return sorted(B1647A_CLASS300_FLAT_RING_GASKETS.keys(), key=nps_to_float)
-        return sorted(B165_CLASS300_FLAT_RING_GASKETS.keys(), key=nps_to_float)
-    elif pressure_class == 400 and gasket_type == 'flat_ring':
-        if series == 'A':
-            return sorted(B1647A_CLASS400_FLAT_RING_GASKETS.keys(), key=nps_to_float)
-        return sorted(B165_CLASS400_FLAT_RING_GASKETS.keys(), key=nps_to_float)
-    elif pressure_class == 600 and gasket_type == 'flat_ring':
-        if series == 'A':
-            return sorted(B1647A_CLASS600_FLAT_RING_GASKETS.keys(), key=nps_to_float)
-        return sorted(B165_CLASS600_FLAT_RING_GASKETS.keys(), key=nps_to_float)
-    elif pressure_class == 900 and gasket_type == 'flat_ring':
-        return sorted(B165_CLASS900_FLAT_RING_GASKETS.keys(), key=nps_to_float)
-    elif pressure_class == 150 and gasket_type == 'spiral_wound':
-        if series == 'A':
-            return sorted(B1647A_CLASS150_SPIRAL_WOUND_GASKETS.keys(), key=nps_to_float)
-        elif series == 'B':
-            return sorted(B1647B_CLASS150_SPIRAL_WOUND_GASKETS.keys(), key=nps_to_float)
-        return sorted(B165_CLASS150_SPIRAL_WOUND_GASKETS.keys(), key=nps_to_float)
-    elif pressure_class == 300 and gasket_type == 'spiral_wound':
-        if series == 'A':
-            return sorted(B1647A_CLASS300_SPIRAL_WOUND_GASKETS.keys(), key=nps_to_float)
-        elif series == 'B':
-            return sorted(B1647B_CLASS300_SPIRAL_WOUND_GASKETS.keys(), key=nps_to_float)
-        return sorted(B165_CLASS300_SPIRAL_WOUND_GASKETS.keys(), key=nps_to_float)
-    elif pressure_class == 400 and gasket_type == 'spiral_wound':
-        if series == 'A':
-            return sorted(B1647A_CLASS400_SPIRAL_WOUND_GASKETS.keys(), key=nps_to_float)
-        elif series == 'B':
-            return sorted(B1647B_CLASS400_SPIRAL_WOUND_GASKETS.keys(), key=nps_to_float)
-        return sorted(B165_CLASS400_SPIRAL_WOUND_GASKETS.keys(), key=nps_to_float)
-    elif pressure_class == 600 and gasket_type == 'spiral_wound':
-        if series == 'A':
-            return sorted(B1647A_CLASS600_SPIRAL_WOUND_GASKETS.keys(), key=nps_to_float)
-        elif series == 'B':
-            return sorted(B1647B_CLASS600_SPIRAL_WOUND_GASKETS.keys(), key=nps_to_float)
-        return sorted(B165_CLASS600_SPIRAL_WOUND_GASKETS.keys(), key=nps_to_float)
-    elif pressure_class == 900 and gasket_type == 'spiral_wound':
-        if series == 'A':
-            return sorted(B1647A_CLASS900_SPIRAL_WOUND_GASKETS.keys(), key=nps_to_float)
-        elif series == 'B':
-            return sorted(B1647B_CLASS900_SPIRAL_WOUND_GASKETS.keys(), key=nps_to_float)
-        return sorted(B165_CLASS900_SPIRAL_WOUND_GASKETS.keys(), key=nps_to_float)
-    elif pressure_class == 1500 and gasket_type == 'spiral_wound':
-        return sorted(B165_CLASS1500_SPIRAL_WOUND_GASKETS.keys(), key=nps_to_float)
-    elif pressure_class == 2500 and gasket_type == 'spiral_wound':
-        return sorted(B165_CLASS2500_SPIRAL_WOUND_GASKETS.keys(), key=nps_to_float)
-    elif gasket_type == 'ring_joint':
-        # Combine both Type R and Type RX rings
-        all_rings = list(RING_JOINT_TYPE_R_GASKETS.keys()) + list(RING_JOINT_TYPE_RX_GASKETS.keys())
-        return sorted(all_rings)
-    
-    return []
+    table = _gasket_table(pressure_class, gasket_type, series)
+    if table is not None:
+        return sorted_keys(table)
+    if gasket_type == 'ring_joint':
+        return RING_NUMBERS
+    
+    return ()
 
 
 # Example usage and testing
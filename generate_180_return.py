@@ -19,15 +19,14 @@ from OCC.Core.gp import gp_Ax2, gp_Pnt, gp_Dir
 from OCC.Core.TopAbs import TopAbs_EDGE, TopAbs_FACE
 from OCC.Core.TopTools import TopTools_IndexedDataMapOfShapeListOfShape, TopTools_IndexedMapOfShape, TopTools_ListIteratorOfListOfShape
 from OCC.Core.TopExp import topexp
-from OCC.Core.STEPControl import STEPControl_Writer, STEPControl_AsIs
 from OCC.Core.IFSelect import IFSelect_RetDone
-from OCC.Core.Interface import Interface_Static
+from step_writer import write_step
 from OCC.Core.BRepAdaptor import BRepAdaptor_Curve, BRepAdaptor_Surface
 from OCC.Core.GeomAbs import GeomAbs_Circle, GeomAbs_Torus
 from OCC.Core.TopoDS import topods
 
-# Set STEP export units to INCHES
-Interface_Static.SetCVal("write.step.unit", "IN")
+# STEP export units: INCHES
+STEP_UNIT = "IN"  # applied per write by step_writer
 
 # CLR multipliers for return types
 RETURN_TYPES = {
@@ -194,9 +193,7 @@ def generate_180_return(
         output_file = f"Return180-{return_type}-NPS{nps_str}-Sch{schedule}.step"
     
     # Export STEP file
-    writer = STEPControl_Writer()
-    writer.Transfer(return_bend, STEPControl_AsIs)
-    status = writer.Write(output_file)
+    status = write_step(return_bend, output_file, unit=STEP_UNIT)
     if status == IFSelect_RetDone:
         print(f"Exported: {output_file}")
     else:
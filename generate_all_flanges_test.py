@@ -3,7 +3,10 @@ API 6A/6BX Flange Generator - All Pressure Classes Test Suite
 Generates WN and Blind flanges for each pressure class
 Tests both small sizes (no pocket/simple) and large sizes (with pocket)
 
-Wedding Cake Approach: Build up layers, then cut features
+Revolved Approach (default): the whole axisymmetric body - bore, hub taper,
+weld bevel, raised face, ring groove, OD chamfers - is one closed half-section
+revolved once; only the bolt holes are booleans.
+Wedding Cake Approach (BUILD_MODE = "layered"): Build up layers, then cut features
 """
 
 import math
@@ -12,8 +15,8 @@ from OCC.Core.gp import gp_Pnt, gp_Dir, gp_Ax1, gp_Ax2
 from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakeCylinder, BRepPrimAPI_MakeRevol
 from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Cut, BRepAlgoAPI_Fuse
 from OCC.Core.BRepBuilderAPI import BRepBuilderAPI_MakeEdge, BRepBuilderAPI_MakeWire, BRepBuilderAPI_MakeFace
-from OCC.Core.STEPControl import STEPControl_Writer, STEPControl_AsIs
-from OCC.Core.Interface import Interface_Static
+from step_writer import write_step
+from bolt_pattern import cut_bolt_pattern
 
 # =============================================================================
 # CONSTANTS
@@ -21,6 +24,13 @@ from OCC.Core.Interface import Interface_Static
 BEVEL_ANGLE = 37.5  # weld prep bevel angle
 LAND_HEIGHT = 1.6   # mm
 RING_GROOVE_ANGLE = 23.0  # degrees
+OD_CHAMFER = 6.0    # mm, front and back OD edges
+
+# Body construction:
+#   "revolve" - whole axisymmetric body from one closed half-section and a
+#               single BRepPrimAPI_MakeRevol (only bolt holes are booleans)
+#   "layered" - wedding cake: stacked cylinders, fused hub, cut groove/chamfers
+BUILD_MODE = "revolve"
 
 # =============================================================================
 # BX RING DATA: Ring Number -> dimensions from API 6A specification
@@ -218,7 +228,7 @@ def make_tapered_back_protrusion(j1_r, height, z_bottom):
     return BRepPrimAPI_MakeRevol(face, axis, 2 * math.pi).Shape()
 
 
-def add_od_chamfers(shape, od_r, z_bottom, z_top, chamfer=6.0):
+def add_od_chamfers(shape, od_r, z_bottom, z_top, chamfer=OD_CHAMFER):
     """Add chamfers at OD edges (front and back)."""
     # Front chamfer (at z_bottom)
     front_cham_pts = [
@@ -255,6 +265,25 @@ def add_od_chamfers(shape, od_r, z_bottom, z_top, chamfer=6.0):
     return shape
 
 
+def ring_groove_radii(g_r, ring, Q):
+    """
+    BX groove radii, worked outside-in from G.
+    Returns (flat_outer_r, flat_inner_r, inner_face_r).
+    """
+    tan_23 = math.tan(math.radians(RING_GROOVE_ANGLE))
+    
+    # Outer taper: from G/2 at face, 23° inward, down to flat at depth Q
+    flat_outer_r = g_r - Q * tan_23
+    
+    # Ring flat width determines flat at bottom (ALWAYS use ring flat)
+    flat_inner_r = flat_outer_r - ring['flat']
+    
+    # Inner taper: from flat_inner back up 23° to face level
+    inner_face_r = flat_inner_r - Q * tan_23
+    
+    return flat_outer_r, flat_inner_r, inner_face_r
+
+
 def cut_ring_groove(shape, g_r, ring, Q, z_face, z_base_top, bore_r=None):
     """
     Cut the BX ring groove with 23° walls.
@@ -269,17 +298,7 @@ def cut_ring_groove(shape, g_r, ring, Q, z_face, z_base_top, bore_r=None):
     B is just the bore - it doesn't control the groove geometry.
     The ring flat is the critical dimension - work outside to inside.
     """
-    angle_rad = math.radians(RING_GROOVE_ANGLE)
-    tan_23 = math.tan(angle_rad)
-    
-    # Outer taper: from G/2 at face, 23° inward, down to flat at depth Q
-    flat_outer_r = g_r - Q * tan_23
-    
-    # Ring flat width determines flat at bottom (ALWAYS use ring flat)
-    flat_inner_r = flat_outer_r - ring['flat']
-    
-    # Inner taper: from flat_inner back up 23° to face level
-    inner_face_r = flat_inner_r - Q * tan_23
+    flat_outer_r, flat_inner_r, inner_face_r = ring_groove_radii(g_r, ring, Q)
     
     ext = 1.0
     
@@ -327,20 +346,8 @@ def cut_ring_groove(shape, g_r, ring, Q, z_face, z_base_top, bore_r=None):
 
 
 def add_bolt_holes(shape, BC, N, H, z_min, z_max):
-    """Add bolt holes in circular pattern."""
-    result = shape
-    bolt_r = H / 2
-    bc_r = BC / 2
-    
-    for i in range(N):
-        angle = 2 * math.pi * i / N
-        x = bc_r * math.cos(angle)
-        y = bc_r * math.sin(angle)
-        ax = gp_Ax2(gp_Pnt(x, y, z_min - 5), gp_Dir(0, 0, 1))
-        hole = BRepPrimAPI_MakeCylinder(ax, bolt_r, z_max - z_min + 10).Shape()
-        result = BRepAlgoAPI_Cut(result, hole).Shape()
-    
-    return result
+    """Add bolt holes in circular pattern (single boolean for all holes)."""
+    return cut_bolt_pattern(shape, BC / 2, N, H, z_min - 5, z_max - z_min + 10)
 
 
 def cut_front_pocket(shape, pocket_r, pocket_depth, z_face):
@@ -357,12 +364,153 @@ def cut_back_relief(shape, relief_r, relief_depth, z_bottom):
     return BRepAlgoAPI_Cut(shape, relief).Shape()
 
 
+# =============================================================================
+# REVOLVED HALF-SECTION CONSTRUCTION
+# Profiles are (r, z) points in the XZ plane, walked around the material.
+# Points on r=0 close the section along the axis (solid centre).
+# =============================================================================
+
+def revolve_section(points):
+    """Revolve a closed (r, z) half-section 360° about Z into a solid."""
+    # Drop zero-length edges (e.g. K == G, no chamfer room)
+    pts = []
+    for r, z in points:
+        if not pts or abs(r - pts[-1][0]) > 1e-6 or abs(z - pts[-1][1]) > 1e-6:
+            pts.append((r, z))
+    if abs(pts[0][0] - pts[-1][0]) <= 1e-6 and abs(pts[0][1] - pts[-1][1]) <= 1e-6:
+        pts.pop()
+    
+    wire = BRepBuilderAPI_MakeWire()
+    for i in range(len(pts)):
+        r1, z1 = pts[i]
+        r2, z2 = pts[(i + 1) % len(pts)]
+        wire.Add(BRepBuilderAPI_MakeEdge(gp_Pnt(r1, 0, z1), gp_Pnt(r2, 0, z2)).Edge())
+    
+    face = BRepBuilderAPI_MakeFace(wire.Wire()).Face()
+    axis = gp_Ax1(gp_Pnt(0, 0, 0), gp_Dir(0, 0, 1))
+    return BRepPrimAPI_MakeRevol(face, axis, 2 * math.pi).Shape()
+
+
+def od_chamfer_points(od_r, z_bottom, z_top, chamfer=OD_CHAMFER):
+    """OD edge of a disc with both corners chamfered, bottom to top."""
+    return [
+        (od_r - chamfer, z_bottom),
+        (od_r, z_bottom + chamfer),
+        (od_r, z_top - chamfer),
+        (od_r - chamfer, z_top),
+    ]
+
+
+def wn_half_section(bore_r, od_r, k_r, g_r, ring, Q, T, hub_base_r=None, hub_length=None, land_r=None):
+    """
+    Half-section of a WN flange: bevel, land, hub taper, chamfered base
+    disc, raised face (K) and BX groove down to the base disc.
+    Same geometry as the layered build. Returns None when the groove or
+    hub does not fit in the section (caller falls back to layered).
+    """
+    flat_outer_r, flat_inner_r, inner_face_r = ring_groove_radii(g_r, ring, Q)
+    z_base_top = T - Q
+    
+    if not (bore_r < inner_face_r < flat_inner_r < flat_outer_r < g_r <= k_r < od_r - OD_CHAMFER):
+        return None
+    if z_base_top < 2 * OD_CHAMFER:
+        return None
+    
+    if hub_length:
+        if not (bore_r < land_r < hub_base_r < od_r - OD_CHAMFER):
+            return None
+        z_hub_end = -hub_length
+        z_land_bottom = z_hub_end - LAND_HEIGHT
+        z_bevel_tip = z_land_bottom - (land_r - bore_r) / math.tan(math.radians(BEVEL_ANGLE))
+        points = [
+            (bore_r, z_bevel_tip),      # Bevel tip at bore
+            (land_r, z_land_bottom),    # Bottom of land
+            (land_r, z_hub_end),        # Hub taper ends at land
+            (hub_base_r, 0),            # Hub base at back of flange
+        ]
+    else:
+        points = [(bore_r, 0)]
+    
+    points += od_chamfer_points(od_r, 0, z_base_top)
+    points += [
+        (k_r, z_base_top),              # Step up to raised face
+        (k_r, T),
+        (g_r, T),                       # G at face (outer taper starts)
+        (flat_outer_r, z_base_top),     # Outer flat edge at bottom
+        (flat_inner_r, z_base_top),     # Inner flat edge at bottom
+        (inner_face_r, T),              # Inner taper meets face
+        (bore_r, T),                    # Bore edge at face
+    ]
+    return points
+
+
+def blind_half_section(od_r, k_r, g_r, bore_r, ring, Q, T, E1=None, J1=None, J4=None):
+    """
+    Half-section of a Blind flange.
+    
+    With E1/J4 (large sizes): 15° tapered back protrusion (J1), chamfered
+    main disc, K ring face with the BX groove and B centre pocket E1 deep.
+    Without: chamfered solid disc and K ring face with the standard groove.
+    
+    Same geometry as the layered build. Returns None when the section is
+    not a simple profile (caller falls back to layered).
+    """
+    if E1 and J4:
+        tan_23 = math.tan(math.radians(RING_GROOVE_ANGLE))
+        j1_r = J1 / 2
+        back_face_r = j1_r - J4 * math.tan(math.radians(15.0))
+        z_disc_top = T - E1
+        flat_outer_r = g_r - E1 * tan_23
+        flat_inner_r = bore_r + E1 * tan_23
+        
+        if not (0 < bore_r < flat_inner_r < flat_outer_r < g_r <= k_r < od_r - OD_CHAMFER):
+            return None
+        if not (0 < back_face_r < j1_r < od_r - OD_CHAMFER and z_disc_top - J4 >= 2 * OD_CHAMFER):
+            return None
+        
+        points = [
+            (0, 0),                     # Centre of back face
+            (back_face_r, 0),           # Back face of protrusion
+            (j1_r, J4),                 # J1 where protrusion meets main disc
+        ]
+        points += od_chamfer_points(od_r, J4, z_disc_top)
+        points += [
+            (k_r, z_disc_top),          # Step up to ring face
+            (k_r, T),
+            (g_r, T),                   # G at face
+            (flat_outer_r, z_disc_top), # Outer flat edge at bottom
+            (flat_inner_r, z_disc_top), # Inner flat edge at bottom
+            (bore_r, T),                # Inner taper up to B at face
+            (bore_r, z_disc_top),       # Pocket wall
+            (0, z_disc_top),            # Pocket floor to centre
+        ]
+        return points
+    
+    flat_outer_r, flat_inner_r, inner_face_r = ring_groove_radii(g_r, ring, Q)
+    z_base_top = T - Q
+    
+    if not (0 < inner_face_r < flat_inner_r < flat_outer_r < g_r <= k_r < od_r - OD_CHAMFER):
+        return None
+    if z_base_top < 2 * OD_CHAMFER:
+        return None
+    
+    points = [(0, 0)]
+    points += od_chamfer_points(od_r, 0, z_base_top)
+    points += [
+        (k_r, z_base_top),
+        (k_r, T),
+        (g_r, T),
+        (flat_outer_r, z_base_top),
+        (flat_inner_r, z_base_top),
+        (inner_face_r, T),
+        (0, T),                         # Solid centre at face
+    ]
+    return points
+
+
 def save_step(shape, filename):
     """Save shape to STEP file."""
-    writer = STEPControl_Writer()
-    Interface_Static.SetCVal("write.step.schema", "AP214")
-    writer.Transfer(shape, STEPControl_AsIs)
-    writer.Write(filename)
+    write_step(shape, filename, unit="MM", schema="AP214")
     print(f"    Saved: {filename}")
 
 
@@ -370,8 +518,8 @@ def save_step(shape, filename):
 # WN FLANGE GENERATOR
 # =============================================================================
 
-def generate_wn_flange(pressure_class, size, data, output_dir):
-    """Generate a WN flange."""
+def generate_wn_flange(pressure_class, size, data, output_dir, build_mode=None):
+    """Generate a WN flange. build_mode overrides BUILD_MODE ("revolve"/"layered")."""
     B, OD, C, E1, Q, G, K, T, J1, J2, J3, J4, R, BC, N, H, ring_no = data
     ring = BX_RINGS.get(ring_no, {"od": 100, "h": 10, "flat": 8})
     
@@ -395,27 +543,39 @@ def generate_wn_flange(pressure_class, size, data, output_dir):
     z_base_top = T - Q  # Top of base disc = bottom of ring groove
     z_face = T          # Top surface (ring sealing face)
     
-    # Layer 1: Base disc
-    layer1 = make_cylinder(od_r, T - Q, z_base_bottom)
-    bore_cut = make_cylinder(bore_r, T - Q + 2, z_base_bottom - 1)
-    layer1 = BRepAlgoAPI_Cut(layer1, bore_cut).Shape()
-    layer1 = add_od_chamfers(layer1, od_r, z_base_bottom, z_base_top)
-    
-    # Layer 2: Ring face (K diameter)
-    layer2 = make_cylinder(k_r, Q, z_base_top)
-    bore_cut2 = make_cylinder(bore_r, Q + 2, z_base_top - 1)
-    layer2 = BRepAlgoAPI_Cut(layer2, bore_cut2).Shape()
-    
-    # Fuse layers
-    body = BRepAlgoAPI_Fuse(layer1, layer2).Shape()
-    
-    # Cut ring groove - pass ring object for OTD-based flat position
-    body = cut_ring_groove(body, g_r, ring, Q, z_face, z_base_top, bore_r=bore_r)
+    body = None
+    if (build_mode or BUILD_MODE) == "revolve":
+        # Bore, hub, bevel, raised face, groove and chamfers in one revolve
+        section = wn_half_section(bore_r, od_r, k_r, g_r, ring, Q, T,
+                                  hub_base_r=j2_r, hub_length=J3, land_r=land_r)
+        if section:
+            body = revolve_section(section)
+            print(f"    Revolved half-section: {len(section)} points")
+        else:
+            print("    Section not revolvable, using layered construction")
     
-    # Add hub + bevel (uses J2 for hub base, J3 for length)
-    if J3:
-        hub = make_hub_and_bevel(bore_r, j2_r, J3, land_r, z_base_bottom)
-        body = BRepAlgoAPI_Fuse(body, hub).Shape()
+    if body is None:
+        # Layer 1: Base disc
+        layer1 = make_cylinder(od_r, T - Q, z_base_bottom)
+        bore_cut = make_cylinder(bore_r, T - Q + 2, z_base_bottom - 1)
+        layer1 = BRepAlgoAPI_Cut(layer1, bore_cut).Shape()
+        layer1 = add_od_chamfers(layer1, od_r, z_base_bottom, z_base_top)
+        
+        # Layer 2: Ring face (K diameter)
+        layer2 = make_cylinder(k_r, Q, z_base_top)
+        bore_cut2 = make_cylinder(bore_r, Q + 2, z_base_top - 1)
+        layer2 = BRepAlgoAPI_Cut(layer2, bore_cut2).Shape()
+        
+        # Fuse layers
+        body = BRepAlgoAPI_Fuse(layer1, layer2).Shape()
+        
+        # Cut ring groove - pass ring object for OTD-based flat position
+        body = cut_ring_groove(body, g_r, ring, Q, z_face, z_base_top, bore_r=bore_r)
+        
+        # Add hub + bevel (uses J2 for hub base, J3 for length)
+        if J3:
+            hub = make_hub_and_bevel(bore_r, j2_r, J3, land_r, z_base_bottom)
+            body = BRepAlgoAPI_Fuse(body, hub).Shape()
     
     # Add bolt holes
     z_min = -J3 if J3 else z_base_bottom
@@ -429,9 +589,9 @@ def generate_wn_flange(pressure_class, size, data, output_dir):
 # BLIND FLANGE GENERATOR
 # =============================================================================
 
-def generate_blind_flange(pressure_class, size, data, output_dir):
+def generate_blind_flange(pressure_class, size, data, output_dir, build_mode=None):
     """
-    Generate a Blind flange.
+    Generate a Blind flange. build_mode overrides BUILD_MODE ("revolve"/"layered").
     
     For sizes WITH E1/J4 (larger sizes):
         - Main disc: OD diameter, thickness = T - J4 - E1
@@ -451,6 +611,7 @@ def generate_blind_flange(pressure_class, size, data, output_dir):
     
     has_e1 = E1 is not None and E1 > 0
     has_j4 = J4 is not None and J4 > 0
+    revolve = (build_mode or BUILD_MODE) == "revolve"
     
     print(f"\n  Generating {pressure_class} {size} BLIND")
     print(f"    B={B}, OD={OD}, T={T}, Q={Q}, G={G}, K={K}")
@@ -484,88 +645,98 @@ def generate_blind_flange(pressure_class, size, data, output_dir):
         z_main_disc_top = T - E1    # Also bottom of front ring face
         z_face = T                   # Top surface
         
-        # Layer 1: Back protrusion with 15° taper (J1 at base, tapers inward)
-        j1_r = J1 / 2
-        layer1 = make_tapered_back_protrusion(j1_r, J4, z_back_protrusion_bottom)
-        print(f"    Layer 1: Back protrusion J1={J1} tapered 15° over {J4}mm, z=0 to z={J4}")
-        
-        # Layer 2: Main disc (OD diameter, from J4 to T-E1)
-        layer2 = make_cylinder(od_r, main_disc_thickness, z_back_protrusion_top)
-        layer2 = add_od_chamfers(layer2, od_r, z_back_protrusion_top, z_main_disc_top)
-        print(f"    Layer 2: Main disc OD={OD}, z={J4} to z={T-E1:.1f}")
-        
-        # Layer 3: Front ring face (K diameter, E1 height)
-        layer3 = make_cylinder(k_r, E1, z_main_disc_top)
-        print(f"    Layer 3: Front ring face K={K}, z={T-E1:.1f} to z={T}")
-        
-        # Fuse all layers
-        body = BRepAlgoAPI_Fuse(layer1, layer2).Shape()
-        body = BRepAlgoAPI_Fuse(body, layer3).Shape()
-        
-        # Cut ring groove into front face
-        # Controlling dimensions (outside-in): K, G, B
-        # Outer taper starts at G, goes down 23° to flat
-        # Inner taper goes from flat up 23° to B (pocket edge)
-        
-        bore_r = B / 2  # Inner wall at B (pocket edge)
-        flat_top_width = (K - G) / 2  # Width of flat top between K and G
-        
-        # Calculate flat positions from G, B, and taper geometry
-        angle_rad = math.radians(23.0)
-        tan_23 = math.tan(angle_rad)
-        
-        # Outer taper: from G/2 at face, 23° inward, down to flat at depth E1
-        flat_outer_r = g_r - E1 * tan_23
-        
-        # Inner taper: from B/2 at face, 23° outward, down to flat at depth E1
-        flat_inner_r = bore_r + E1 * tan_23
-        
-        # Flat width is whatever geometry gives us
-        flat_width = flat_outer_r - flat_inner_r
-        
-        print(f"    Cutting ring groove (Blind BX geometry):")
-        print(f"      K/2={k_r}, G/2={g_r}, B/2={bore_r}")
-        print(f"      Flat top width (K-G)/2 = {flat_top_width:.2f}")
-        print(f"      Groove depth E1 = {E1}")
-        print(f"      Flat at bottom: outer_r={flat_outer_r:.2f}, inner_r={flat_inner_r:.2f}, width={flat_width:.2f}")
-        
-        # Build groove cutter profile (in XZ plane, will revolve around Z)
-        ext = 1.0
-        
-        # Groove bottom z = z_face - E1 (groove depth = E1)
-        z_groove_bottom = z_face - E1
-        
-        # The groove profile for large Blind:
-        # - G at face (outer taper starts)
-        # - 23° taper down to flat_outer at bottom
-        # - Flat at bottom from flat_outer to flat_inner
-        # - 23° taper up to B at face (pocket edge)
-        
-        p1 = gp_Pnt(g_r + ext, 0, z_face + ext)       # Above face, outside G
-        p2 = gp_Pnt(g_r, 0, z_face)                    # G at face (outer taper starts)
-        p3 = gp_Pnt(flat_outer_r, 0, z_groove_bottom)  # Outer flat edge at bottom
-        p4 = gp_Pnt(flat_inner_r, 0, z_groove_bottom)  # Inner flat edge at bottom
-        p5 = gp_Pnt(bore_r, 0, z_face)                 # B at face (pocket edge)
-        p6 = gp_Pnt(bore_r - ext, 0, z_face + ext)     # Above face, inside B
-        
-        wire = BRepBuilderAPI_MakeWire()
-        wire.Add(BRepBuilderAPI_MakeEdge(p1, p2).Edge())
-        wire.Add(BRepBuilderAPI_MakeEdge(p2, p3).Edge())
-        wire.Add(BRepBuilderAPI_MakeEdge(p3, p4).Edge())
-        wire.Add(BRepBuilderAPI_MakeEdge(p4, p5).Edge())
-        wire.Add(BRepBuilderAPI_MakeEdge(p5, p6).Edge())
-        wire.Add(BRepBuilderAPI_MakeEdge(p6, p1).Edge())
-        
-        groove_face = BRepBuilderAPI_MakeFace(wire.Wire()).Face()
-        axis = gp_Ax1(gp_Pnt(0, 0, 0), gp_Dir(0, 0, 1))
-        groove_cutter = BRepPrimAPI_MakeRevol(groove_face, axis, 2 * math.pi).Shape()
-        body = BRepAlgoAPI_Cut(body, groove_cutter).Shape()
-        
-        # Cut center pocket (B diameter, E1 deep from face)
-        print(f"    Cutting center pocket: B={B} (r={bore_r}), depth={E1}")
-        center_pocket = make_cylinder(bore_r, E1 + 1, z_groove_bottom)
-        body = BRepAlgoAPI_Cut(body, center_pocket).Shape()
-        
+        body = None
+        if revolve:
+            section = blind_half_section(od_r, k_r, g_r, B / 2, ring, Q, T, E1=E1, J1=J1, J4=J4)
+            if section:
+                body = revolve_section(section)
+                print(f"    Revolved half-section: {len(section)} points")
+            else:
+                print("    Section not revolvable, using layered construction")
+        
+        if body is None:
+            # Layer 1: Back protrusion with 15° taper (J1 at base, tapers inward)
+            j1_r = J1 / 2
+            layer1 = make_tapered_back_protrusion(j1_r, J4, z_back_protrusion_bottom)
+            print(f"    Layer 1: Back protrusion J1={J1} tapered 15° over {J4}mm, z=0 to z={J4}")
+            
+            # Layer 2: Main disc (OD diameter, from J4 to T-E1)
+            layer2 = make_cylinder(od_r, main_disc_thickness, z_back_protrusion_top)
+            layer2 = add_od_chamfers(layer2, od_r, z_back_protrusion_top, z_main_disc_top)
+            print(f"    Layer 2: Main disc OD={OD}, z={J4} to z={T-E1:.1f}")
+            
+            # Layer 3: Front ring face (K diameter, E1 height)
+            layer3 = make_cylinder(k_r, E1, z_main_disc_top)
+            print(f"    Layer 3: Front ring face K={K}, z={T-E1:.1f} to z={T}")
+            
+            # Fuse all layers
+            body = BRepAlgoAPI_Fuse(layer1, layer2).Shape()
+            body = BRepAlgoAPI_Fuse(body, layer3).Shape()
+            
+            # Cut ring groove into front face
+            # Controlling dimensions (outside-in): K, G, B
+            # Outer taper starts at G, goes down 23° to flat
+            # Inner taper goes from flat up 23° to B (pocket edge)
+            
+            bore_r = B / 2  # Inner wall at B (pocket edge)
+            flat_top_width = (K - G) / 2  # Width of flat top between K and G
+            
+            # Calculate flat positions from G, B, and taper geometry
+            angle_rad = math.radians(23.0)
+            tan_23 = math.tan(angle_rad)
+            
+            # Outer taper: from G/2 at face, 23° inward, down to flat at depth E1
+            flat_outer_r = g_r - E1 * tan_23
+            
+            # Inner taper: from B/2 at face, 23° outward, down to flat at depth E1
+            flat_inner_r = bore_r + E1 * tan_23
+            
+            # Flat width is whatever geometry gives us
+            flat_width = flat_outer_r - flat_inner_r
+            
+            print(f"    Cutting ring groove (Blind BX geometry):")
+            print(f"      K/2={k_r}, G/2={g_r}, B/2={bore_r}")
+            print(f"      Flat top width (K-G)/2 = {flat_top_width:.2f}")
+            print(f"      Groove depth E1 = {E1}")
+            print(f"      Flat at bottom: outer_r={flat_outer_r:.2f}, inner_r={flat_inner_r:.2f}, width={flat_width:.2f}")
+            
+            # Build groove cutter profile (in XZ plane, will revolve around Z)
+            ext = 1.0
+            
+            # Groove bottom z = z_face - E1 (groove depth = E1)
+            z_groove_bottom = z_face - E1
+            
+            # The groove profile for large Blind:
+            # - G at face (outer taper starts)
+            # - 23° taper down to flat_outer at bottom
+            # - Flat at bottom from flat_outer to flat_inner
+            # - 23° taper up to B at face (pocket edge)
+            
+            p1 = gp_Pnt(g_r + ext, 0, z_face + ext)       # Above face, outside G
+            p2 = gp_Pnt(g_r, 0, z_face)                    # G at face (outer taper starts)
+            p3 = gp_Pnt(flat_outer_r, 0, z_groove_bottom)  # Outer flat edge at bottom
+            p4 = gp_Pnt(flat_inner_r, 0, z_groove_bottom)  # Inner flat edge at bottom
+            p5 = gp_Pnt(bore_r, 0, z_face)                 # B at face (pocket edge)
+            p6 = gp_Pnt(bore_r - ext, 0, z_face + ext)     # Above face, inside B
+            
+            wire = BRepBuilderAPI_MakeWire()
+            wire.Add(BRepBuilderAPI_MakeEdge(p1, p2).Edge())
+            wire.Add(BRepBuilderAPI_MakeEdge(p2, p3).Edge())
+            wire.Add(BRepBuilderAPI_MakeEdge(p3, p4).Edge())
+            wire.Add(BRepBuilderAPI_MakeEdge(p4, p5).Edge())
+            wire.Add(BRepBuilderAPI_MakeEdge(p5, p6).Edge())
+            wire.Add(BRepBuilderAPI_MakeEdge(p6, p1).Edge())
+            
+            groove_face = BRepBuilderAPI_MakeFace(wire.Wire()).Face()
+            axis = gp_Ax1(gp_Pnt(0, 0, 0), gp_Dir(0, 0, 1))
+            groove_cutter = BRepPrimAPI_MakeRevol(groove_face, axis, 2 * math.pi).Shape()
+            body = BRepAlgoAPI_Cut(body, groove_cutter).Shape()
+            
+            # Cut center pocket (B diameter, E1 deep from face)
+            print(f"    Cutting center pocket: B={B} (r={bore_r}), depth={E1}")
+            center_pocket = make_cylinder(bore_r, E1 + 1, z_groove_bottom)
+            body = BRepAlgoAPI_Cut(body, center_pocket).Shape()
+            
         # Add bolt holes (through full thickness)
         body = add_bolt_holes(body, BC, N, H, z_back_protrusion_bottom - 5, z_face + 5)
         
@@ -583,18 +754,27 @@ def generate_blind_flange(pressure_class, size, data, output_dir):
         z_base_top = T - Q  # Top of base disc = bottom of ring groove
         z_face = T          # Top surface
         
-        # Layer 1: Base disc (OD diameter, solid)
-        layer1 = make_cylinder(od_r, T - Q, z_base_bottom)
-        layer1 = add_od_chamfers(layer1, od_r, z_base_bottom, z_base_top)
-        
-        # Layer 2: Ring face (K diameter)
-        layer2 = make_cylinder(k_r, Q, z_base_top)
-        
-        # Fuse layers
-        body = BRepAlgoAPI_Fuse(layer1, layer2).Shape()
-        
-        # Cut ring groove - B controls inner wall position
-        body = cut_ring_groove(body, g_r, ring, Q, z_face, z_base_top, bore_r=bore_r)
+        body = None
+        if revolve:
+            section = blind_half_section(od_r, k_r, g_r, bore_r, ring, Q, T)
+            if section:
+                body = revolve_section(section)
+            else:
+                print("    Section not revolvable, using layered construction")
+        
+        if body is None:
+            # Layer 1: Base disc (OD diameter, solid)
+            layer1 = make_cylinder(od_r, T - Q, z_base_bottom)
+            layer1 = add_od_chamfers(layer1, od_r, z_base_bottom, z_base_top)
+            
+            # Layer 2: Ring face (K diameter)
+            layer2 = make_cylinder(k_r, Q, z_base_top)
+            
+            # Fuse layers
+            body = BRepAlgoAPI_Fuse(layer1, layer2).Shape()
+            
+            # Cut ring groove - B controls inner wall position
+            body = cut_ring_groove(body, g_r, ring, Q, z_face, z_base_top, bore_r=bore_r)
         
         # Add bolt holes
         body = add_bolt_holes(body, BC, N, H, z_base_bottom - 10, z_face + 5)
@@ -719,8 +899,12 @@ if __name__ == "__main__":
     parser.add_argument("--class", dest="pressure_class", help="Pressure class (2K, 3K, 5K, 10K, 15K, 20K)")
     parser.add_argument("--size", help="Size (e.g., 26-3/4, 4-1/16)")
     parser.add_argument("--type", dest="flange_type", help="Flange type (WN, Blind)")
+    parser.add_argument("--build", choices=["revolve", "layered"], help="Body construction (default: revolve)")
     args = parser.parse_args()
     
+    if args.build:
+        BUILD_MODE = args.build
+    
     output_dir = r"C:\ParadiseSuite\test_flanges"
     os.makedirs(output_dir, exist_ok=True)
     
@@ -28,15 +28,14 @@ Ring groove geometry:
 """
 
 import math
-from OCC.Core.gp import gp_Pnt, gp_Dir, gp_Ax1, gp_Ax2
-from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakeRevol, BRepPrimAPI_MakeCylinder
-from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Cut
+from OCC.Core.gp import gp_Pnt, gp_Dir, gp_Ax1
+from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakeRevol
 from OCC.Core.BRepBuilderAPI import BRepBuilderAPI_MakeEdge, BRepBuilderAPI_MakeWire, BRepBuilderAPI_MakeFace
-from OCC.Core.STEPControl import STEPControl_Writer, STEPControl_AsIs
-from OCC.Core.Interface import Interface_Static
+from step_writer import write_step
+from bolt_pattern import cut_bolt_pattern
 
-# Set STEP file units to millimeters
-Interface_Static.SetCVal("write.step.unit", "MM")
+# STEP file units: millimeters
+STEP_UNIT = "MM"  # applied per write by step_writer
 
 # =============================================================================
 # API 6BX FLANGE DATA (dimensions in mm)
@@ -211,25 +210,8 @@ def build_wn_flange_profile(B, OD, C, Q, G, K, T, J1, J2, J3, R, include_bevel=T
 
 
 def add_bolt_holes(flange_body, BC, N, H, z_min, z_max):
-    """Add bolt holes in circular pattern."""
-    result = flange_body
-    bolt_radius = H / 2
-    bolt_circle_radius = BC / 2
-    
-    for i in range(N):
-        angle = 2 * math.pi * i / N
-        x = bolt_circle_radius * math.cos(angle)
-        y = bolt_circle_radius * math.sin(angle)
-        
-        bolt_hole = BRepPrimAPI_MakeCylinder(
-            gp_Ax2(gp_Pnt(x, y, z_min - 5), gp_Dir(0, 0, 1)),
-            bolt_radius,
-            (z_max - z_min) + 10
-        ).Shape()
-        
-        result = BRepAlgoAPI_Cut(result, bolt_hole).Shape()
-    
-    return result
+    """Add bolt holes in circular pattern (single boolean for all holes)."""
+    return cut_bolt_pattern(flange_body, BC / 2, N, H, z_min - 5, (z_max - z_min) + 10)
 
 
 def generate_api_6bx_wn_flange(pressure: int, size: str, output_file: str = None, include_bevel: bool = True):
@@ -280,10 +262,7 @@ def generate_api_6bx_wn_flange(pressure: int, size: str, output_file: str = None
     
     # Export
     if output_file:
-        writer = STEPControl_Writer()
-        Interface_Static.SetCVal("write.step.schema", "AP214")
-        writer.Transfer(flange_complete, STEPControl_AsIs)
-        writer.Write(output_file)
+        write_step(flange_complete, output_file, unit=STEP_UNIT, schema="AP214")
         print(f"  Saved: {output_file}")
     
     return flange_complete
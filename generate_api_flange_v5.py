@@ -8,11 +8,11 @@ from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakeCylinder, BRepPrimAPI_MakeCone
 from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Cut, BRepAlgoAPI_Fuse
 from OCC.Core.BRepBuilderAPI import BRepBuilderAPI_MakeEdge, BRepBuilderAPI_MakeWire, BRepBuilderAPI_MakeFace
 from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakeRevol
-from OCC.Core.STEPControl import STEPControl_Writer, STEPControl_AsIs
-from OCC.Core.Interface import Interface_Static
+from step_writer import write_step
+from bolt_pattern import cut_bolt_pattern
 
-# Set STEP file units to millimeters
-Interface_Static.SetCVal("write.step.unit", "MM")
+# STEP file units: millimeters
+STEP_UNIT = "MM"  # applied per write by step_writer
 
 # =============================================================================
 # API 6BX 20000 PSI DATA (corrected)
@@ -199,21 +199,8 @@ def make_hub_and_bevel(bore_r, j1_r, j3, land_r, T, z_back):
 
 
 def add_bolt_holes(shape, BC, N, H, z_min, z_max):
-    """Add bolt holes in circular pattern."""
-    result = shape
-    bolt_r = H / 2
-    bc_r = BC / 2
-    
-    for i in range(N):
-        angle = 2 * math.pi * i / N
-        x = bc_r * math.cos(angle)
-        y = bc_r * math.sin(angle)
-        
-        ax = gp_Ax2(gp_Pnt(x, y, z_min - 5), gp_Dir(0, 0, 1))
-        hole = BRepPrimAPI_MakeCylinder(ax, bolt_r, z_max - z_min + 10).Shape()
-        result = BRepAlgoAPI_Cut(result, hole).Shape()
-    
-    return result
+    """Add bolt holes in circular pattern (single boolean for all holes)."""
+    return cut_bolt_pattern(shape, BC / 2, N, H, z_min - 5, z_max - z_min + 10)
 
 
 def generate_6bx_wn_flange(size: str, output_file: str = None):
@@ -371,10 +358,7 @@ def generate_6bx_wn_flange(size: str, output_file: str = None):
     # EXPORT
     # =========================================================================
     if output_file:
-        writer = STEPControl_Writer()
-        Interface_Static.SetCVal("write.step.schema", "AP214")
-        writer.Transfer(body, STEPControl_AsIs)
-        writer.Write(output_file)
+        write_step(body, output_file, unit=STEP_UNIT, schema="AP214")
         print(f"\n  Saved: {output_file}")
     
     return body
@@ -16,13 +16,13 @@ from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Cut, BRepAlgoAPI_Fuse
 from OCC.Core.BRepBuilderAPI import BRepBuilderAPI_MakeWire, BRepBuilderAPI_MakeEdge, BRepBuilderAPI_MakeFace
 from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakePrism
 from OCC.Core.gp import gp_Pnt, gp_Vec, gp_Dir, gp_Ax2
-from OCC.Core.STEPControl import STEPControl_Writer, STEPControl_AsIs
 from OCC.Core.IFSelect import IFSelect_RetDone
 from OCC.Core.TopoDS import TopoDS_Shape
-from OCC.Core.Interface import Interface_Static
+from step_writer import write_step
+from shape_templates import template, translation, place
 
-# Set STEP units to INCH
-Interface_Static.SetCVal("write.step.unit", "IN")
+# STEP units: INCH
+STEP_UNIT = "IN"  # applied per write by step_writer
 
 
 # Load CFS data
@@ -37,10 +37,12 @@ def load_cfs_data():
 CFS_DATA = load_cfs_data()
 
 
+@template("cfs_punchout")
 def create_stadium_shape(height: float, width: float, thickness: float, center_z: float) -> TopoDS_Shape:
     """
     Create a stadium (rounded rectangle) shaped solid for punchout.
     VERTICAL ORIENTATION: height is vertical (Z), width is horizontal (Y along member)
+    Cached per size - the returned shape is shared, position it with place().
     
     Parameters:
         height: Height of punchout (vertical dimension on web) - typically 4"
@@ -257,26 +259,21 @@ def add_punchouts(shape: TopoDS_Shape, web: float, length: float, thickness: flo
     # Center Z position for punchouts on web
     center_z = web / 2
     
+    # Create stadium punchout shape once (vertical orientation)
+    # Height = 4" (vertical), Width = 1.5" (horizontal along member)
+    punchout = create_stadium_shape(
+        punchout_height,   # 4" tall (vertical)
+        punchout_width,    # 1.5" wide (horizontal)
+        thickness * 2,     # Extra thick to ensure clean cut
+        center_z           # Centered on web
+    )
+    
     result = shape
     for y_pos in positions:
-        # Create stadium punchout shape (vertical orientation)
-        # Height = 4" (vertical), Width = 1.5" (horizontal along member)
-        punchout = create_stadium_shape(
-            punchout_height,   # 4" tall (vertical)
-            punchout_width,    # 1.5" wide (horizontal)
-            thickness * 2,     # Extra thick to ensure clean cut
-            center_z           # Centered on web
-        )
-        
         # Move punchout to correct position
         # X: position at web face (-thickness/2 to cut through web)
         # Y: along length of member
-        from OCC.Core.BRepBuilderAPI import BRepBuilderAPI_Transform
-        from OCC.Core.gp import gp_Trsf
-        
-        trsf = gp_Trsf()
-        trsf.SetTranslation(gp_Vec(-thickness, y_pos, 0))
-        punchout_positioned = BRepBuilderAPI_Transform(punchout, trsf).Shape()
+        punchout_positioned = place(punchout, translation(-thickness, y_pos, 0))
         
         # Cut punchout from shape
         cut_op = BRepAlgoAPI_Cut(result, punchout_positioned)
@@ -347,9 +344,7 @@ def generate_cfs_stud(size: str, gauge: str, length_ft: float,
             output_file = f"Stud-{stud_data['designation']}-{gauge}-{len_str}ft.step"
         
         # Export STEP
-        writer = STEPControl_Writer()
-        writer.Transfer(shape, STEPControl_AsIs)
-        status = writer.Write(output_file)
+        status = write_step(shape, output_file, unit=STEP_UNIT)
         
         if status == IFSelect_RetDone:
             print(f"Exported: {output_file}")
@@ -406,9 +401,7 @@ def generate_cfs_track(size: str, gauge: str, length_ft: float,
             output_file = f"Track-{track_data['designation']}-{gauge}-{len_str}ft.step"
         
         # Export STEP
-        writer = STEPControl_Writer()
-        writer.Transfer(shape, STEPControl_AsIs)
-        status = writer.Write(output_file)
+        status = write_step(shape, output_file, unit=STEP_UNIT)
         
         if status == IFSelect_RetDone:
             print(f"Exported: {output_file}")
@@ -480,9 +473,7 @@ def generate_cfs_joist(size: str, gauge: str, length_ft: float,
             output_file = f"Joist-{joist_data['designation']}-{gauge}-{len_str}ft.step"
         
         # Export STEP
-        writer = STEPControl_Writer()
-        writer.Transfer(shape, STEPControl_AsIs)
-        status = writer.Write(output_file)
+        status = write_step(shape, output_file, unit=STEP_UNIT)
         
         if status == IFSelect_RetDone:
             print(f"Exported: {output_file}")
@@ -3,14 +3,12 @@ Gasket Generator - Full Face, Flat Ring, Spiral Wound, Ring Joint
 Generates STEP files for gaskets per ASME B16.5, B16.47, B16.20, API 6A
 """
 
-import math
 from OCC.Core.gp import gp_Pnt, gp_Dir, gp_Ax1, gp_Ax2, gp_Vec, gp_Circ
 from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakeCylinder, BRepPrimAPI_MakeRevol
 from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Cut, BRepAlgoAPI_Fuse
 from OCC.Core.BRepBuilderAPI import (BRepBuilderAPI_MakeEdge, BRepBuilderAPI_MakeWire, 
                                        BRepBuilderAPI_MakeFace)
-from OCC.Core.STEPControl import STEPControl_Writer, STEPControl_AsIs
-from OCC.Core.Interface import Interface_Static
+from step_writer import write_step
 
 # Import data
 import sys
@@ -18,8 +16,9 @@ import os
 script_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, script_dir)
 
-from gasket_data import get_gasket_info, list_gasket_sizes
-from flange_data import get_flange_info  # For bolt hole pattern
+from standards_catalog import get_gasket_info
+from standards_catalog import get_flange_info  # For bolt hole pattern
+from bolt_pattern import cut_bolt_pattern
 
 
 def make_flat_disc(id_mm, od_mm, thickness_mm):
@@ -61,24 +60,8 @@ def add_bolt_holes(gasket_shape, bolt_circle_diameter_mm, num_bolts, bolt_hole_d
     Returns:
         TopoDS_Shape: Gasket with bolt holes
     """
-    bc_radius = bolt_circle_diameter_mm / 2.0
-    hole_radius = bolt_hole_diameter_mm / 2.0
-    
-    result = gasket_shape
-    
-    for i in range(num_bolts):
-        angle = (2 * math.pi * i) / num_bolts
-        x = bc_radius * math.cos(angle)
-        y = bc_radius * math.sin(angle)
-        
-        # Create bolt hole
-        ax = gp_Ax2(gp_Pnt(x, y, -1), gp_Dir(0, 0, 1))
-        hole = BRepPrimAPI_MakeCylinder(ax, hole_radius, thickness_mm + 2).Shape()
-        
-        # Cut hole from gasket
-        result = BRepAlgoAPI_Cut(result, hole).Shape()
-    
-    return result
+    return cut_bolt_pattern(gasket_shape, bolt_circle_diameter_mm / 2.0, num_bolts,
+                            bolt_hole_diameter_mm, -1, thickness_mm + 2)
 
 
 def generate_full_face_gasket(nps, pressure_class, series=None, thickness_mm=1.5, output_dir=None):
@@ -134,11 +117,7 @@ def generate_full_face_gasket(nps, pressure_class, series=None, thickness_mm=1.5
     filepath = os.path.join(output_dir, filename)
     
     # Write STEP file
-    step_writer = STEPControl_Writer()
-    Interface_Static.SetCVal("write.step.schema", "AP214")
-    Interface_Static.SetCVal("write.step.unit", "MM")
-    step_writer.Transfer(gasket, STEPControl_AsIs)
-    status = step_writer.Write(filepath)
+    status = write_step(gasket, filepath, unit="MM", schema="AP214")
     
     if status == 1:
         print(f"[SUCCESS] Created: {filepath}")
@@ -189,11 +168,7 @@ def generate_flat_ring_gasket(nps, pressure_class, series=None, thickness_mm=1.5
     filepath = os.path.join(output_dir, filename)
     
     # Write STEP file
-    step_writer = STEPControl_Writer()
-    Interface_Static.SetCVal("write.step.schema", "AP214")
-    Interface_Static.SetCVal("write.step.unit", "MM")
-    step_writer.Transfer(gasket, STEPControl_AsIs)
-    status = step_writer.Write(filepath)
+    status = write_step(gasket, filepath, unit="MM", schema="AP214")
     
     if status == 1:
         print(f"[SUCCESS] Created: {filepath}")
@@ -264,11 +239,7 @@ def generate_spiral_wound_gasket(nps, pressure_class, series=None, thickness_mm=
     filepath = os.path.join(output_dir, filename)
     
     # Write STEP file
-    step_writer = STEPControl_Writer()
-    Interface_Static.SetCVal("write.step.schema", "AP214")
-    Interface_Static.SetCVal("write.step.unit", "MM")
-    step_writer.Transfer(gasket, STEPControl_AsIs)
-    status = step_writer.Write(filepath)
+    status = write_step(gasket, filepath, unit="MM", schema="AP214")
     
     if status == 1:
         print(f"[SUCCESS] Created: {filepath}")
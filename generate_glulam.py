@@ -12,12 +12,11 @@ import os
 from pathlib import Path
 from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakeBox
 from OCC.Core.gp import gp_Pnt
-from OCC.Core.STEPControl import STEPControl_Writer, STEPControl_AsIs
 from OCC.Core.IFSelect import IFSelect_RetDone
-from OCC.Core.Interface import Interface_Static
+from step_writer import write_step
 
-# Set STEP units to INCH for US construction
-Interface_Static.SetCVal("write.step.unit", "IN")
+# STEP units: INCH for US construction
+STEP_UNIT = "IN"  # applied per write by step_writer
 
 # Glulam data: size -> (width, depth)
 GLULAM_SIZES = {
@@ -91,9 +90,7 @@ def generate_glulam(size: str, length_ft: float, output_file: str = None):
         filename = Path(output_file).name
     
     # Export to STEP
-    step_writer = STEPControl_Writer()
-    step_writer.Transfer(beam, STEPControl_AsIs)
-    status = step_writer.Write(output_file)
+    status = write_step(beam, output_file, unit=STEP_UNIT)
     
     if status == IFSelect_RetDone:
         print(f"[SUCCESS] Generated: {output_file}")
@@ -9,8 +9,7 @@ from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakeCylinder, BRepPrimAPI_MakePrism
 from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Cut, BRepAlgoAPI_Fuse
 from OCC.Core.BRepBuilderAPI import BRepBuilderAPI_MakeEdge, BRepBuilderAPI_MakeWire, BRepBuilderAPI_MakeFace
 from OCC.Core.BRepFilletAPI import BRepFilletAPI_MakeChamfer
-from OCC.Core.STEPControl import STEPControl_Writer, STEPControl_AsIs
-from OCC.Core.Interface import Interface_Static
+from step_writer import write_step
 from OCC.Core.TopAbs import TopAbs_EDGE, TopAbs_FACE
 from OCC.Core.TopExp import TopExp_Explorer
 
@@ -20,7 +19,8 @@ import os
 script_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, script_dir)
 
-from heavy_hex_nut_data import get_heavy_hex_nut_info, list_heavy_hex_nut_sizes
+from standards_catalog import get_heavy_hex_nut_info, list_heavy_hex_nut_sizes
+from shape_templates import template
 
 
 def make_hexagonal_prism(width_across_flats_mm, thickness_mm, z_base=0):
@@ -211,6 +211,42 @@ def add_chamfers(shape, total_thickness_mm, chamfer_distance_mm=3.048):
     return shape
 
 
+@template("hex_nut")
+def make_hex_nut_body(width_flat_mm, total_thickness_mm, thread_diameter_mm,
+                      washer_thickness_mm=0.4064, chamfer_distance_mm=3.048):
+    """
+    Build a complete hex nut: hex prism, washer face, threaded hole, top chamfers.
+    Cached per size - the returned shape is shared, place it with
+    shape_templates.place() rather than modifying it.
+    
+    Args:
+        width_flat_mm: Width across flats (mm)
+        total_thickness_mm: Total nut thickness including washer face (mm)
+        thread_diameter_mm: Nominal thread diameter (mm)
+        washer_thickness_mm: Washer face height (mm)
+        chamfer_distance_mm: Top chamfer distance (mm)
+    
+    Returns:
+        TopoDS_Shape: Nut with washer face bottom at z=-washer_thickness_mm
+    """
+    hex_body_height_mm = total_thickness_mm - washer_thickness_mm
+    
+    # Create hexagonal body (height = total thickness - washer height)
+    hex_body = make_hexagonal_prism(width_flat_mm, hex_body_height_mm, z_base=0)
+    
+    # Add integrated washer face on bottom (extends below z=0)
+    hex_body_with_washer = add_washer_face(hex_body, width_flat_mm, total_thickness_mm, washer_thickness_mm)
+    
+    # Create threaded hole through entire nut (extends through washer)
+    hole = make_threaded_hole(thread_diameter_mm, total_thickness_mm + 1, z_base=-washer_thickness_mm)
+    
+    # Cut hole from body
+    nut = BRepAlgoAPI_Cut(hex_body_with_washer, hole).Shape()
+    
+    # Add 15-degree chamfers to top edges (0.12" = 3.048mm per ASME B18.2.2)
+    return add_chamfers(nut, total_thickness_mm, chamfer_distance_mm=chamfer_distance_mm)
+
+
 def generate_hex_nut(nut_type, nominal_size, output_dir=None):
     """
     Generate STEP file for hex nut.
@@ -245,20 +281,9 @@ def generate_hex_nut(nut_type, nominal_size, output_dir=None):
     print(f"  Washer Face Height: {washer_thickness_mm:.2f}mm")
     print(f"  Thread: {thread_diameter_mm:.2f}mm")
     
-    # Create hexagonal body (height = total thickness - washer height)
-    hex_body = make_hexagonal_prism(width_flat_mm, hex_body_height_mm, z_base=0)
-    
-    # Add integrated washer face on bottom (extends below z=0)
-    hex_body_with_washer = add_washer_face(hex_body, width_flat_mm, total_thickness_mm, washer_thickness_mm)
-    
-    # Create threaded hole through entire nut (extends through washer)
-    hole = make_threaded_hole(thread_diameter_mm, total_thickness_mm + 1, z_base=-washer_thickness_mm)
-    
-    # Cut hole from body
-    nut = BRepAlgoAPI_Cut(hex_body_with_washer, hole).Shape()
-    
-    # Add 15-degree chamfers to top edges (0.12" = 3.048mm per ASME B18.2.2)
-    nut = add_chamfers(nut, total_thickness_mm, chamfer_distance_mm=3.048)
+    # Hex body + washer face + threaded hole + top chamfers (cached per size)
+    nut = make_hex_nut_body(width_flat_mm, total_thickness_mm, thread_diameter_mm,
+                            washer_thickness_mm, chamfer_distance_mm=3.048)
     
     # Generate filename
     size_str = nominal_size.replace('/', '-').replace(' ', '')
@@ -273,11 +298,7 @@ def generate_hex_nut(nut_type, nominal_size, output_dir=None):
     filepath = os.path.join(output_dir, filename)
     
     # Write STEP file
-    step_writer = STEPControl_Writer()
-    Interface_Static.SetCVal("write.step.schema", "AP214")
-    Interface_Static.SetCVal("write.step.unit", "MM")
-    step_writer.Transfer(nut, STEPControl_AsIs)
-    status = step_writer.Write(filepath)
+    status = write_step(nut, filepath, unit="MM", schema="AP214")
     
     if status == 1:  # IFSelect_RetDone
         print(f"[SUCCESS] Created: {filepath}")
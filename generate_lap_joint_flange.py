@@ -11,21 +11,19 @@ Lap Joint Features:
 
 import sys
 import os
-import math
 from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakeCylinder, BRepPrimAPI_MakeRevol
 from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Fuse, BRepAlgoAPI_Cut
 from OCC.Core.BRepFilletAPI import BRepFilletAPI_MakeFillet
 from OCC.Core.gp import gp_Pnt, gp_Ax1, gp_Dir, gp_Ax2
 from OCC.Core.BRepBuilderAPI import BRepBuilderAPI_MakeEdge, BRepBuilderAPI_MakeWire, BRepBuilderAPI_MakeFace
-from OCC.Core.STEPControl import STEPControl_Writer, STEPControl_AsIs
 from OCC.Core.IFSelect import IFSelect_RetDone
-from OCC.Core.Interface import Interface_Static
+from step_writer import write_step
 from OCC.Extend.TopologyUtils import TopologyExplorer
 from OCC.Core.TopExp import TopExp_Explorer
 from OCC.Core.TopAbs import TopAbs_EDGE
 
-# Set STEP file units to millimeters
-Interface_Static.SetCVal("write.step.unit", "MM")
+# STEP file units: millimeters
+STEP_UNIT = "MM"  # applied per write by step_writer
 
 # Import flange data
 sys.path.append(r'C:\ParadiseSuite\scripts')
@@ -33,6 +31,7 @@ from flange_data import (
     CLASS_150_RF_WN, CLASS_300_RF_WN, CLASS_400_RF_WN,
     CLASS_600_RF_WN, CLASS_900_RF_WN, CLASS_1500_RF_WN, CLASS_2500_RF_WN
 )
+from bolt_pattern import cut_bolt_pattern
 
 # Constants
 RF_HEIGHT = 1.6  # Raised face height in mm
@@ -58,27 +57,9 @@ def make_cylinder(radius, height, z_start=0.0):
 
 
 def cut_bolt_holes(shape, bolt_circle_radius, num_bolts, bolt_hole_diameter, thickness, z_bottom):
-    """Cut bolt holes around the bolt circle."""
-    result = shape
-    bolt_hole_radius = bolt_hole_diameter / 2.0
-    
-    for i in range(num_bolts):
-        angle = (2.0 * math.pi * i) / num_bolts
-        x = bolt_circle_radius * math.cos(angle)
-        y = bolt_circle_radius * math.sin(angle)
-        
-        bolt_hole = make_cylinder(bolt_hole_radius, thickness + 20, z_bottom - 5)
-        
-        # Translate bolt hole to position
-        from OCC.Core.gp import gp_Vec, gp_Trsf
-        from OCC.Core.BRepBuilderAPI import BRepBuilderAPI_Transform
-        trsf = gp_Trsf()
-        trsf.SetTranslation(gp_Vec(x, y, 0))
-        bolt_hole = BRepBuilderAPI_Transform(bolt_hole, trsf).Shape()
-        
-        result = BRepAlgoAPI_Cut(result, bolt_hole).Shape()
-    
-    return result
+    """Cut bolt holes around the bolt circle (single boolean for all holes)."""
+    return cut_bolt_pattern(shape, bolt_circle_radius, num_bolts, bolt_hole_diameter,
+                            z_bottom - 5, thickness + 20)
 
 
 def generate_lap_joint_flange(nps, pressure_class, facing='RF', output_dir=None):
@@ -194,9 +175,7 @@ def generate_lap_joint_flange(nps, pressure_class, facing='RF', output_dir=None)
     
     print(f"\nExporting to: {output_path}")
     
-    step_writer = STEPControl_Writer()
-    step_writer.Transfer(body, STEPControl_AsIs)
-    status = step_writer.Write(output_path)
+    status = write_step(body, output_path, unit=STEP_UNIT)
     
     if status != IFSelect_RetDone:
         raise Exception("Error writing STEP file")
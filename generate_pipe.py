@@ -17,15 +17,14 @@ from OCC.Core.gp import gp_Ax2, gp_Pnt, gp_Dir
 from OCC.Core.TopAbs import TopAbs_EDGE, TopAbs_FACE
 from OCC.Core.TopTools import TopTools_IndexedDataMapOfShapeListOfShape, TopTools_IndexedMapOfShape, TopTools_ListIteratorOfListOfShape
 from OCC.Core.TopExp import topexp
-from OCC.Core.STEPControl import STEPControl_Writer, STEPControl_AsIs
 from OCC.Core.IFSelect import IFSelect_RetDone
 from OCC.Core.BRepAdaptor import BRepAdaptor_Curve
 from OCC.Core.GeomAbs import GeomAbs_Circle
 from OCC.Core.TopoDS import topods
-from OCC.Core.Interface import Interface_Static
+from step_writer import write_step
 
-# Set STEP units to INCH for US piping
-Interface_Static.SetCVal("write.step.unit", "IN")
+# STEP units: INCH for US piping
+STEP_UNIT = "IN"  # applied per write by step_writer
 
 # Import complete pipe data
 from pipe_data_complete import PIPE_DATA, get_pipe_dimensions
@@ -141,9 +140,7 @@ def generate_pipe(
         output_file = f"Pipe_{nps:.1f}in_Sch{schedule}_{length_ft}ft.step".replace('.', '-')
     
     # Export to STEP
-    writer = STEPControl_Writer()
-    writer.Transfer(pipe, STEPControl_AsIs)
-    status = writer.Write(output_file)
+    status = write_step(pipe, output_file, unit=STEP_UNIT)
     
     if status == IFSelect_RetDone:
         print(f"✓ Exported: {output_file}")
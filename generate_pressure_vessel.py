@@ -21,13 +21,12 @@ from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakeRevol
 from OCC.Core.gp import gp_Ax1, gp_Ax2, gp_Pnt, gp_Dir, gp_Vec, gp_Circ
 from OCC.Core.GC import GC_MakeArcOfEllipse, GC_MakeArcOfCircle, GC_MakeSegment
 from OCC.Core.Geom import Geom_Ellipse
-from OCC.Core.STEPControl import STEPControl_Writer, STEPControl_AsIs
 from OCC.Core.IFSelect import IFSelect_RetDone
-from OCC.Core.Interface import Interface_Static
+from step_writer import write_step
 from OCC.Core.TopoDS import TopoDS_Shape
 
-# Set STEP export units to INCHES
-Interface_Static.SetCVal("write.step.unit", "IN")
+# STEP export units: INCHES
+STEP_UNIT = "IN"  # applied per write by step_writer
 
 
 # Standard wall thicknesses (inches) for reference
@@ -368,9 +367,7 @@ def generate_pressure_vessel(
         output_file = f"PressureVessel-ID{id_str}-Wall{wall}-L{int(shell_length)}-{top_type[:4].title()}-{bottom_type[:4].title()}.step"
     
     # Export STEP file
-    writer = STEPControl_Writer()
-    writer.Transfer(vessel, STEPControl_AsIs)
-    status = writer.Write(output_file)
+    status = write_step(vessel, output_file, unit=STEP_UNIT)
     if status == IFSelect_RetDone:
         print(f"\nExported: {output_file}")
     else:
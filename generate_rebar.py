@@ -10,12 +10,11 @@ import os
 from pathlib import Path
 from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakeCylinder
 from OCC.Core.gp import gp_Ax2, gp_Pnt, gp_Dir
-from OCC.Core.STEPControl import STEPControl_Writer, STEPControl_AsIs
 from OCC.Core.IFSelect import IFSelect_RetDone
-from OCC.Core.Interface import Interface_Static
+from step_writer import write_step
 
-# Set STEP export units to INCHES
-Interface_Static.SetCVal("write.step.unit", "IN")
+# STEP export units: INCHES
+STEP_UNIT = "IN"  # applied per write by step_writer
 
 # Rebar data: bar_number -> diameter_inches
 REBAR_SIZES = {
@@ -101,9 +100,7 @@ def generate_rebar(bar_size: str, length_ft: float, material: str = "Steel", out
         filename = Path(output_file).name
     
     # Export to STEP
-    step_writer = STEPControl_Writer()
-    step_writer.Transfer(cylinder, STEPControl_AsIs)
-    status = step_writer.Write(output_file)
+    status = write_step(cylinder, output_file, unit=STEP_UNIT)
     
     if status == IFSelect_RetDone:
         print(f"[SUCCESS] Generated: {output_file}")
@@ -21,49 +21,18 @@ from OCC.Core.gp import gp_Ax2, gp_Pnt, gp_Dir, gp_Circ
 from OCC.Core.TopAbs import TopAbs_EDGE, TopAbs_FACE
 from OCC.Core.TopTools import TopTools_IndexedDataMapOfShapeListOfShape, TopTools_IndexedMapOfShape, TopTools_ListIteratorOfListOfShape
 from OCC.Core.TopExp import topexp
-from OCC.Core.STEPControl import STEPControl_Writer, STEPControl_AsIs
 from OCC.Core.IFSelect import IFSelect_RetDone
-from OCC.Core.Interface import Interface_Static
+from step_writer import write_step
 from OCC.Core.BRepAdaptor import BRepAdaptor_Curve, BRepAdaptor_Surface
 from OCC.Core.GeomAbs import GeomAbs_Circle, GeomAbs_Cone, GeomAbs_BSplineSurface
 from OCC.Core.TopoDS import topods
 from OCC.Core.BRepBuilderAPI import BRepBuilderAPI_MakeEdge, BRepBuilderAPI_MakeWire
 
-# Set STEP export units to INCHES
-Interface_Static.SetCVal("write.step.unit", "IN")
+# STEP export units: INCHES
+STEP_UNIT = "IN"  # applied per write by step_writer
 
-# Pipe schedule data: NPS -> {Schedule -> (OD, Wall)}
-PIPE_DATA = {
-    0.5:  {'40': (0.840, 0.109), '80': (0.840, 0.147), '160': (0.840, 0.187)},
-    0.75: {'40': (1.050, 0.113), '80': (1.050, 0.154), '160': (1.050, 0.218)},
-    1:    {'40': (1.315, 0.133), '80': (1.315, 0.179), '160': (1.315, 0.250)},
-    1.25: {'40': (1.660, 0.140), '80': (1.660, 0.191), '160': (1.660, 0.250)},
-    1.5:  {'40': (1.900, 0.145), '80': (1.900, 0.200), '160': (1.900, 0.281)},
-    2:    {'40': (2.375, 0.154), '80': (2.375, 0.218), '160': (2.375, 0.343)},
-    2.5:  {'40': (2.875, 0.203), '80': (2.875, 0.276), '160': (2.875, 0.375)},
-    3:    {'40': (3.500, 0.216), '80': (3.500, 0.300), '160': (3.500, 0.437)},
-    3.5:  {'40': (4.000, 0.226), '80': (4.000, 0.318)},
-    4:    {'40': (4.500, 0.237), '80': (4.500, 0.337), '160': (4.500, 0.531)},
-    5:    {'40': (5.563, 0.258), '80': (5.563, 0.375), '160': (5.563, 0.625)},
-    6:    {'40': (6.625, 0.280), '80': (6.625, 0.432), '160': (6.625, 0.718)},
-    8:    {'40': (8.625, 0.322), '80': (8.625, 0.500), '160': (8.625, 0.906)},
-    10:   {'40': (10.75, 0.365), '80': (10.75, 0.593), '160': (10.75, 1.125)},
-    12:   {'40': (12.75, 0.406), '80': (12.75, 0.687), '160': (12.75, 1.312)},
-    14:   {'40': (14.0, 0.437), '80': (14.0, 0.750), '160': (14.0, 1.406)},
-    16:   {'40': (16.0, 0.500), '80': (16.0, 0.843), '160': (16.0, 1.593)},
-    18:   {'40': (18.0, 0.562), '80': (18.0, 0.937), '160': (18.0, 1.781)},
-    20:   {'40': (20.0, 0.593), '80': (20.0, 1.031), '160': (20.0, 1.969)},
-    24:   {'40': (24.0, 0.687), '80': (24.0, 1.218), '160': (24.0, 2.343)},
-}
-
-
-def get_pipe_dimensions(nps: float, schedule: str) -> tuple:
-    """Get OD and Wall thickness for given NPS and Schedule"""
-    if nps not in PIPE_DATA:
-        raise ValueError(f"NPS {nps} not in database. Available: {list(PIPE_DATA.keys())}")
-    if schedule not in PIPE_DATA[nps]:
-        raise ValueError(f"Schedule {schedule} not available for NPS {nps}. Available: {list(PIPE_DATA[nps].keys())}")
-    return PIPE_DATA[nps][schedule]
+# Import complete pipe data
+from pipe_data_complete import get_pipe_dimensions
 
 
 def generate_reducer(
@@ -262,9 +231,7 @@ def generate_reducer(
         output_file = f"Reducer-{type_str}-{large_str}x{small_str}-Sch{large_schedule}.step"
     
     # Export STEP file
-    writer = STEPControl_Writer()
-    writer.Transfer(reducer, STEPControl_AsIs)
-    status = writer.Write(output_file)
+    status = write_step(reducer, output_file, unit=STEP_UNIT)
     if status == IFSelect_RetDone:
         print(f"Exported: {output_file}")
     else:
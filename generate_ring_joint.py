@@ -11,8 +11,7 @@ from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Cut
 from OCC.Core.BRepBuilderAPI import (BRepBuilderAPI_MakeEdge, BRepBuilderAPI_MakeWire, 
                                        BRepBuilderAPI_MakeFace)
 from OCC.Core.GC import GC_MakeArcOfCircle, GC_MakeSegment
-from OCC.Core.STEPControl import STEPControl_Writer, STEPControl_AsIs
-from OCC.Core.Interface import Interface_Static
+from step_writer import write_step
 
 # Import data
 import sys
@@ -20,7 +19,7 @@ import os
 script_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, script_dir)
 
-from gasket_data import get_gasket_info
+from standards_catalog import get_gasket_info
 
 
 def make_octagonal_profile_r(pitch_radius_mm, width_mm, octagonal_height_mm, 
@@ -304,11 +303,7 @@ def generate_ring_joint_r(ring_number, profile_type='octagonal', material='SoftI
     filepath = os.path.join(output_dir, filename)
     
     # Write STEP file
-    step_writer = STEPControl_Writer()
-    Interface_Static.SetCVal("write.step.schema", "AP214")
-    Interface_Static.SetCVal("write.step.unit", "MM")
-    step_writer.Transfer(ring, STEPControl_AsIs)
-    status = step_writer.Write(filepath)
+    status = write_step(ring, filepath, unit="MM", schema="AP214")
     
     if status == 1:
         print(f"✓ Successfully created: {filepath}")
@@ -377,11 +372,7 @@ def generate_ring_joint_rx(ring_number, material='316SS', output_dir=None):
     filepath = os.path.join(output_dir, filename)
     
     # Write STEP file
-    step_writer = STEPControl_Writer()
-    Interface_Static.SetCVal("write.step.schema", "AP214")
-    Interface_Static.SetCVal("write.step.unit", "MM")
-    step_writer.Transfer(ring, STEPControl_AsIs)
-    status = step_writer.Write(filepath)
+    status = write_step(ring, filepath, unit="MM", schema="AP214")
     
     if status == 1:
         print(f"✓ Successfully created: {filepath}")
@@ -402,7 +393,7 @@ def generate_all_ring_joints_r(profile_type='octagonal', material='SoftIron', ou
     Returns:
         list: List of generated file paths
     """
-    from gasket_data import list_gasket_sizes
+    from standards_catalog import list_gasket_sizes
     
     all_rings = list_gasket_sizes(None, 'ring_joint')
     r_rings = [r for r in all_rings if r.startswith('R-')]
@@ -450,7 +441,7 @@ def generate_all_ring_joints_rx(material='316SS', output_dir=None):
     Returns:
         list: List of generated file paths
     """
-    from gasket_data import list_gasket_sizes
+    from standards_catalog import list_gasket_sizes
     
     all_rings = list_gasket_sizes(None, 'ring_joint')
     rx_rings = [r for r in all_rings if r.startswith('RX-')]
@@ -17,13 +17,12 @@ from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakeBox, BRepPrimAPI_MakePrism
 from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Cut, BRepAlgoAPI_Fuse
 from OCC.Core.BRepBuilderAPI import BRepBuilderAPI_MakeFace, BRepBuilderAPI_MakePolygon, BRepBuilderAPI_MakeWire
 from OCC.Core.gp import gp_Pnt, gp_Vec, gp_Pln, gp_Ax2, gp_Dir
-from OCC.Core.STEPControl import STEPControl_Writer, STEPControl_AsIs
 from OCC.Core.IFSelect import IFSelect_RetDone
-from OCC.Core.Interface import Interface_Static
+from step_writer import write_step
 import os
 
-# Set STEP export units to INCHES
-Interface_Static.SetCVal("write.step.unit", "IN")
+# STEP export units: INCHES
+STEP_UNIT = "IN"  # applied per write by step_writer
 
 
 def inches_to_mm(inches: float) -> float:
@@ -282,9 +281,7 @@ def generate_sheet_steel(
             output_file = os.path.join(output_dir, filename)
         
         # Write STEP file
-        step_writer = STEPControl_Writer()
-        step_writer.Transfer(sheet, STEPControl_AsIs)
-        status = step_writer.Write(output_file)
+        status = write_step(sheet, output_file, unit=STEP_UNIT)
         
         if status == IFSelect_RetDone:
             print(f"[SUCCESS] Generated: {output_file}")
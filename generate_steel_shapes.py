@@ -28,36 +28,17 @@ from OCC.Core.gp import gp_Pnt, gp_Vec, gp_Ax1, gp_Dir, gp_Trsf, gp_Ax2
 from OCC.Core.TopExp import TopExp_Explorer
 from OCC.Core.TopAbs import TopAbs_EDGE
 from OCC.Core.TopoDS import topods
-from OCC.Extend.DataExchange import write_step_file
 from OCC.Core.BRepOffsetAPI import BRepOffsetAPI_MakeOffset
 from OCC.Core.GeomAbs import GeomAbs_Arc
-from OCC.Core.Interface import Interface_Static
+from OCC.Core.IFSelect import IFSelect_RetDone
+from step_writer import write_step
 import math
 
-# Set STEP units to INCH for US structural steel
-Interface_Static.SetCVal("write.step.unit", "IN")
+# STEP units: INCH for US structural steel
+STEP_UNIT = "IN"  # applied per write by step_writer
 
-# Import AISC database
-try:
-    from aisc_shapes import AISC_SHAPES
-except ImportError:
-    print("Error: aisc_shapes.py not found. Run generate_steel_data_modules.py first.")
-    AISC_SHAPES = {}
-
-try:
-    from hss_a1085 import HSS_A1085
-except ImportError:
-    print("Warning: hss_a1085.py not found. HSS shapes will use AISC database.")
-    HSS_A1085 = {}
-
-
-# Imperial to Metric W-shape mapping (approximate depths)
-IMPERIAL_W_DEPTHS = {
-    'W44': 'W1100', 'W40': 'W1000', 'W36': 'W920', 'W33': 'W840',
-    'W30': 'W760', 'W27': 'W690', 'W24': 'W610', 'W21': 'W530',
-    'W18': 'W460', 'W16': 'W410', 'W14': 'W360', 'W12': 'W310',
-    'W10': 'W250', 'W8': 'W200', 'W6': 'W150', 'W5': 'W130', 'W4': 'W100'
-}
+# AISC / HSS_A1085 databases, indexed by designation (see steel_shape_index.py)
+import steel_shape_index
 
 
 def find_imperial_w_shape(designation):
@@ -67,53 +48,7 @@ def find_imperial_w_shape(designation):
     
     Returns: (metric_designation, imperial_label) or (None, None)
     """
-    if not designation.startswith('W'):
-        return None, None
-    
-    # Parse imperial designation (e.g., W12X26)
-    parts = designation.replace('x', 'X').split('X')
-    if len(parts) != 2:
-        return None, None
-    
-    try:
-        imperial_depth = parts[0]  # e.g., 'W12'
-        imperial_weight = float(parts[1])  # lb/ft
-    except:
-        return None, None
-    
-    # Get metric depth prefix
-    metric_prefix = IMPERIAL_W_DEPTHS.get(imperial_depth)
-    if not metric_prefix:
-        return None, None
-    
-    # Find all shapes with that metric prefix
-    candidates = [k for k in AISC_SHAPES.keys() if k.startswith(metric_prefix + 'X')]
-    
-    if not candidates:
-        return None, None
-    
-    # Convert imperial weight (lb/ft) to metric (kg/m): lb/ft * 1.488 = kg/m
-    metric_weight = imperial_weight * 1.488
-    
-    # Find closest match by weight
-    best_match = None
-    best_diff = float('inf')
-    
-    for candidate in candidates:
-        shape_weight = AISC_SHAPES[candidate].get('W', 0)
-        diff = abs(shape_weight - metric_weight)
-        if diff < best_diff:
-            best_diff = diff
-            best_match = candidate
-    
-    if best_match:
-        # Create imperial label for display
-        actual_metric_weight = AISC_SHAPES[best_match].get('W', 0)
-        actual_imperial_weight = actual_metric_weight / 1.488
-        imperial_label = f"{imperial_depth}x{actual_imperial_weight:.1f}"
-        return best_match, imperial_label
-    
-    return None, None
+    return steel_shape_index.find_imperial_w(designation)
 
 
 # Constants for weld bevels
@@ -465,8 +400,10 @@ def generate_steel_shape(designation, length_inches,
     metric_designation = designation
     
     # Try HSS_A1085 first (imperial HSS database)
-    if designation.startswith('HSS') and designation in HSS_A1085:
-        props = HSS_A1085[designation]
+    hss_props = steel_shape_index.lookup_hss(designation) if designation.startswith('HSS') else None
+    direct_props = steel_shape_index.lookup(designation)
+    if hss_props:
+        props = hss_props
         shape_type = 'HSS'
     # Try imperial W-shape lookup
     elif designation.startswith('W') and 'X' in designation:
@@ -479,12 +416,12 @@ def generate_steel_shape(designation, length_inches,
                 'shape': None,
                 'imperial_label': designation
             }
-        props = AISC_SHAPES[metric_designation]
-        shape_type = props.get('﻿Type', props.get('Type', 'W'))
+        props = steel_shape_index.lookup(metric_designation)
+        shape_type = props['Type'] or 'W'
     # Fall back to direct AISC lookup (metric designations)
-    elif designation in AISC_SHAPES:
-        props = AISC_SHAPES[designation]
-        shape_type = props.get('﻿Type', props.get('Type', 'UNKNOWN'))
+    elif direct_props:
+        props = direct_props
+        shape_type = props['Type'] or 'UNKNOWN'
         metric_designation = designation
     else:
         return {
@@ -574,7 +511,8 @@ def generate_steel_shape(designation, length_inches,
             output_file = f"{clean_desig}-{int(length_inches)}in{bevel_suffix}.step"
         
         # Write STEP file
-        write_step_file(steel_shape, output_file)
+        if write_step(steel_shape, output_file, unit=STEP_UNIT, schema="AP203") != IFSelect_RetDone:
+            raise IOError(f"Failed to write STEP file: {output_file}")
         
         return {
             'success': True,
@@ -595,52 +533,23 @@ def generate_steel_shape(designation, length_inches,
 
 
 def get_available_shapes_by_type():
-    """Get all available shapes organized by type"""
-    shapes_by_type = {}
-    
-    for designation, props in AISC_SHAPES.items():
-        shape_type = props.get('﻿Type', props.get('Type', 'UNKNOWN'))
-        if shape_type is None:
-            shape_type = 'UNKNOWN'
-        if shape_type not in shapes_by_type:
-            shapes_by_type[shape_type] = []
-        shapes_by_type[shape_type].append(designation)
-    
-    # Sort each list
-    for shape_type in shapes_by_type:
-        shapes_by_type[shape_type].sort()
-    
-    return shapes_by_type
+    """Get all available shapes organized by type (sorted tuples, built once)"""
+    return steel_shape_index.shapes_by_type()
 
 
 def get_shape_info(designation):
-    """Get dimensions and properties for a shape"""
-    if designation in AISC_SHAPES:
-        return AISC_SHAPES[designation]
-    else:
-        return None
+    """Get profile dimensions for a shape (see steel_shape_index.FIELDS)"""
+    return steel_shape_index.lookup(designation)
 
 
 def get_available_imperial_w_shapes():
     """Get list of available W-shapes in imperial format"""
-    imperial_shapes = {}
-    
-    for imperial_prefix, metric_prefix in IMPERIAL_W_DEPTHS.items():
-        candidates = [k for k in AISC_SHAPES.keys() if k.startswith(metric_prefix + 'X')]
-        imperial_shapes[imperial_prefix] = []
-        
-        for metric_desig in candidates:
-            metric_weight = AISC_SHAPES[metric_desig].get('W', 0)
-            imperial_weight = metric_weight / 1.488
-            imperial_desig = f"{imperial_prefix}X{imperial_weight:.0f}"
-            imperial_shapes[imperial_prefix].append(imperial_desig)
-    
-    return imperial_shapes
+    return steel_shape_index.imperial_w_shapes()
 
 
 def get_available_hss_shapes():
     """Get list of available HSS shapes in imperial format"""
-    return list(HSS_A1085.keys())
+    return list(steel_shape_index.hss_shapes())
 
 
 if __name__ == "__main__":
@@ -654,7 +563,7 @@ if __name__ == "__main__":
     print("\nDatabase Inventory:")
     for shape_type, shapes in sorted(shapes_by_type.items()):
         print(f"  {shape_type}: {len(shapes)} shapes")
-    print(f"  HSS (Imperial): {len(HSS_A1085)} shapes")
+    print(f"  HSS (Imperial): {len(get_available_hss_shapes())} shapes")
     
     # Test imperial W-beam
     print("\n1. W12X50 beam, 10 ft (120\") long, beveled both ends at 30°")
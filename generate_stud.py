@@ -7,8 +7,7 @@ import math
 from OCC.Core.gp import gp_Pnt, gp_Dir, gp_Ax1, gp_Ax2
 from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakeCylinder
 from OCC.Core.BRepFilletAPI import BRepFilletAPI_MakeChamfer
-from OCC.Core.STEPControl import STEPControl_Writer, STEPControl_AsIs
-from OCC.Core.Interface import Interface_Static
+from step_writer import write_step
 from OCC.Core.TopAbs import TopAbs_EDGE
 from OCC.Core.TopExp import TopExp_Explorer
 
@@ -18,9 +17,10 @@ import os
 script_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, script_dir)
 
-from asme_b165_stud_data import get_b165_stud_info, list_b165_sizes
+from standards_catalog import get_b165_stud_info, list_b165_sizes
 from api_6b_stud_data import get_api_6b_stud_info as get_6b_stud_info, list_api_6b_sizes as list_6b_sizes
 from api_6bx_stud_data import get_api_6bx_stud_info as get_6bx_stud_info, list_api_6bx_sizes as list_6bx_sizes
+from shape_templates import template
 
 
 def inches_to_mm(inches):
@@ -51,10 +51,13 @@ def parse_thread_size(thread_size_str):
         return float(thread_size_str)
 
 
+@template("stud")
 def make_stud_cylinder(diameter_mm, length_mm, chamfer_mm=2.0):
     """
     Create a cylindrical stud with chamfered ends.
     Simplified - no actual thread geometry (would be too slow and large).
+    Cached per size - the returned shape is shared, place it with
+    shape_templates.place() rather than modifying it.
     
     Args:
         diameter_mm: Thread diameter in mm
@@ -131,11 +134,7 @@ def generate_stud(standard, nps, pressure_class, series=None, facing_type='RF',
     filepath = os.path.join(output_dir, filename)
     
     # Write STEP file
-    step_writer = STEPControl_Writer()
-    Interface_Static.SetCVal("write.step.schema", "AP214")
-    Interface_Static.SetCVal("write.step.unit", "MM")
-    step_writer.Transfer(stud, STEPControl_AsIs)
-    status = step_writer.Write(filepath)
+    status = write_step(stud, filepath, unit="MM", schema="AP214")
     
     if status == 1:  # IFSelect_RetDone
         print(f"[SUCCESS] Created: {filepath}")
@@ -20,16 +20,15 @@ from OCC.Core.gp import gp_Ax2, gp_Pnt, gp_Dir, gp_Trsf, gp_Vec
 from OCC.Core.TopAbs import TopAbs_EDGE, TopAbs_FACE
 from OCC.Core.TopTools import TopTools_IndexedDataMapOfShapeListOfShape, TopTools_IndexedMapOfShape, TopTools_ListIteratorOfListOfShape
 from OCC.Core.TopExp import topexp
-from OCC.Core.STEPControl import STEPControl_Writer, STEPControl_AsIs
 from OCC.Core.IFSelect import IFSelect_RetDone
-from OCC.Core.Interface import Interface_Static
+from step_writer import write_step
 from OCC.Core.BRepAdaptor import BRepAdaptor_Curve, BRepAdaptor_Surface
 from OCC.Core.GeomAbs import GeomAbs_Circle, GeomAbs_Cylinder
 from OCC.Core.TopoDS import topods
 from OCC.Core.BRepBuilderAPI import BRepBuilderAPI_Transform
 
-# Set STEP export units to INCHES
-Interface_Static.SetCVal("write.step.unit", "IN")
+# STEP export units: INCHES
+STEP_UNIT = "IN"  # applied per write by step_writer
 
 # Import complete pipe data
 from pipe_data_complete import PIPE_DATA, get_pipe_dimensions
@@ -243,9 +242,7 @@ def generate_tee(
             output_file = f"Tee-Reducing-{run_str}x{branch_str}-Sch{run_schedule}.step"
     
     # Export STEP file
-    writer = STEPControl_Writer()
-    writer.Transfer(tee, STEPControl_AsIs)
-    status = writer.Write(output_file)
+    status = write_step(tee, output_file, unit=STEP_UNIT)
     if status == IFSelect_RetDone:
         print(f"Exported: {output_file}")
     else:
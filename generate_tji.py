@@ -21,12 +21,11 @@ from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Fuse
 from OCC.Core.gp import gp_Pnt, gp_Vec
 from OCC.Core.BRepBuilderAPI import BRepBuilderAPI_Transform
 from OCC.Core.gp import gp_Trsf
-from OCC.Core.STEPControl import STEPControl_Writer, STEPControl_AsIs
 from OCC.Core.IFSelect import IFSelect_RetDone
-from OCC.Core.Interface import Interface_Static
+from step_writer import write_step
 
-# Set STEP units to INCH for US construction
-Interface_Static.SetCVal("write.step.unit", "IN")
+# STEP units: INCH for US construction
+STEP_UNIT = "IN"  # applied per write by step_writer
 
 
 def load_tji_data():
@@ -199,9 +198,7 @@ def generate_tji(
             output_file = os.path.join(output_dir, filename)
         
         # Write STEP file
-        step_writer = STEPControl_Writer()
-        step_writer.Transfer(tji_beam, STEPControl_AsIs)
-        status = step_writer.Write(output_file)
+        status = write_step(tji_beam, output_file, unit=STEP_UNIT)
         
         if status == IFSelect_RetDone:
             print(f"[SUCCESS] Generated: {output_file}")
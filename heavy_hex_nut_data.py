@@ -16,6 +16,8 @@ CAD Modeling Notes:
 - Bottom face = Flat washer surface (no chamfer)
 """
 
+from nps_key import sorted_keys
+
 # Geometric constants for CAD modeling
 NUT_WASHER_FACE_HEIGHT = 0.016  # inches, raised bearing surface (included in total thickness H)
 NUT_CHAMFER_HEIGHT = 0.020  # inches, shallow edge break on top face (~0.016-0.020")
@@ -750,29 +752,12 @@ def list_heavy_hex_nut_sizes(nut_type='standard'):
         nut_type (str): 'standard' or '2h' for double height
     
     Returns:
-        list: Available sizes sorted
+        tuple: Available sizes sorted (cached - the same tuple every call)
     """
-    def size_to_float(size_str):
-        """Convert fractional size string to float for sorting."""
-        if '-' in size_str and '/' in size_str:
-            # Handle '1-1/4' format
-            parts = size_str.split('-')
-            whole = float(parts[0])
-            frac_parts = parts[1].split('/')
-            frac = float(frac_parts[0]) / float(frac_parts[1])
-            return whole + frac
-        elif '/' in size_str:
-            # Handle '1/2' format
-            parts = size_str.split('/')
-            return float(parts[0]) / float(parts[1])
-        else:
-            # Handle '1', '2', etc.
-            return float(size_str)
-    
     if nut_type.lower() in ['2h', 'double', 'double_height']:
-        return sorted(HEAVY_HEX_2H_NUTS.keys(), key=size_to_float)
+        return sorted_keys(HEAVY_HEX_2H_NUTS)
     else:
-        return sorted(HEAVY_HEX_NUTS.keys(), key=size_to_float)
+        return sorted_keys(HEAVY_HEX_NUTS)
 
 
 # Example usage and testing
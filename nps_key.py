@@ -0,0 +1,127 @@
+"""
+NPS Size Keys
+Canonical, interned size keys with an exact rational value.
+
+Sizes appear throughout the tables and the GUI as strings - '1/2', '1-1/4',
+'13-5/8', '24' - and used to be parsed by hand wherever a number was needed
+(several float parsers, eval() on fractions, '1-1/4'.replace('-', '.')).
+NPS is the one parser:
+
+    size = NPS('1-1/4')
+    size == '1-1/4'           # True - still a plain dict key for every table
+    size.value                # Fraction(5, 4)
+    size.inches               # 1.25
+    NPS('1-1/4') is size      # True - interned
+
+    nps_float('2-1/2"')       # 2.5
+    sorted_keys(B165_CLASS_150_STUDS)   # cached tuple in numeric order
+
+NPS subclasses str and keeps the canonical spelling ('1 1/4', '1-1/4"' and
+'1-1/4' are all NPS('1-1/4')), so it hashes and compares equal to the string
+keys the data modules already use.
+"""
+
+import threading
+from fractions import Fraction
+
+_interned = {}
+_sorted_cache = {}
+_lock = threading.Lock()
+
+
+class NPS(str):
+    """Interned size key: a str with an exact Fraction value."""
+
+    def __new__(cls, text):
+        if isinstance(text, NPS):
+            return text
+        key = _interned.get(text)
+        if key is not None:
+            return key
+
+        value = parse_size(text)
+        canonical = format_size(value)
+        with _lock:
+            key = _interned.get(canonical)
+            if key is None:
+                key = super().__new__(cls, canonical)
+                key.value = value
+                _interned[canonical] = key
+            # Alternate spellings ('1 1/4', '1-1/4"') resolve to the same key
+            _interned[text] = key
+        return key
+
+    @property
+    def inches(self):
+        """Size as a float (for the OCC generators)."""
+        return float(self.value)
+
+    def __reduce__(self):
+        # Workers re-intern on unpickle
+        return (NPS, (str(self),))
+
+
+def parse_size(text):
+    """
+    Exact value of a size string.
+
+    Accepts '1/2', '1-1/4', '1 1/4', '13-5/8', '24', with or without a
+    trailing '"', and plain ints/floats/Fractions.
+
+    Raises:
+        ValueError: not a size (e.g. a ring number 'R-11')
+    """
+    if isinstance(text, (int, Fraction)):
+        return Fraction(text)
+    if isinstance(text, float):
+        return Fraction(text).limit_denominator(64)
+    parts = str(text).strip().rstrip('"').replace('-', ' ').split()
+    if not parts or len(parts) > 2:
+        raise ValueError(f"Not a size: {text!r}")
+    try:
+        return sum((Fraction(part) for part in parts), Fraction(0))
+    except (ValueError, ZeroDivisionError):
+        raise ValueError(f"Not a size: {text!r}") from None
+
+
+def format_size(value):
+    """Canonical spelling of a size value: Fraction(5, 4) -> '1-1/4'."""
+    whole, rest = divmod(Fraction(value), 1)
+    if rest == 0:
+        return str(int(whole))
+    if whole == 0:
+        return f"{rest.numerator}/{rest.denominator}"
+    return f"{int(whole)}-{rest.numerator}/{rest.denominator}"
+
+
+def nps_float(text):
+    """Size string to float inches ('2-1/2' -> 2.5)."""
+    return NPS(text).inches
+
+
+def size_sort_key(text):
+    """Sort key for size strings; anything that is not a size sorts last."""
+    try:
+        return (0, NPS(text).value, '')
+    except ValueError:
+        return (1, Fraction(0), str(text))
+
+
+def sort_sizes(sizes):
+    """Size strings in numeric order, as a tuple."""
+    return tuple(sorted(sizes, key=size_sort_key))
+
+
+def sorted_keys(table):
+    """
+    Keys of a constant size-keyed table in numeric order.
+
+    Sorted once per table and cached; later calls return the same tuple.
+    """
+    cached = _sorted_cache.get(id(table))
+    if cached is not None and cached[0] is table:
+        return cached[1]
+    keys = sort_sizes(table.keys())
+    # Keep the table referenced so its id cannot be reused
+    _sorted_cache[id(table)] = (table, keys)
+    return keys
@@ -0,0 +1,399 @@
+"""
+Option Model - precomputed dropdown contents for the GUI option panels
+Every valid (standard, flange type, class, size) and fastener/steel/lumber/
+CFS option list, computed once and served from dicts.
+
+The option panels used to import data modules, rebuild class maps and
+re-sort size lists on every combobox change. This module does that work
+once, writes the result to a JSON cache and answers each panel from a dict:
+
+    import option_model
+
+    option_model.flange_type_classes('Socket Weld')       # ('150', '300', ...)
+    option_model.flange_type_sizes('Weld Neck', '600')    # ('1/2', '3/4', ...)
+    option_model.flange_standard_pressures('API_6BX', '13-5/8')
+    option_model.fastener_sizes('B16.5 Stud')
+    option_model.cfs_options('Track')                     # (sizes, gauges)
+
+Every list is a tuple in display order. The cache is rebuilt when a source
+data module changes (size or mtime), or explicitly:
+
+    python option_model.py --build
+
+Layout:
+    ~/.equationparadise/option_model.json
+        signature              source module signature
+        flange_standards       standard -> size -> [pressure classes]
+        flange_type_sizes      flange type -> class -> [sizes]
+        fastener_sizes         fastener type -> [sizes]
+"""
+
+import os
+import sys
+import json
+import time
+import tempfile
+import argparse
+import importlib
+import threading
+from pathlib import Path
+
+from nps_key import sort_sizes
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, script_dir)
+
+OPTION_MODEL_PATH = Path.home() / ".equationparadise" / "option_model.json"
+OPTION_MODEL_VERSION = 1
+
+# =============================================================================
+# FLANGE SOURCES
+# =============================================================================
+
+ASME_CLASS_ORDER = ['150', '300', '400', '600', '900', '1500', '2500']
+API_PRESSURE_ORDER = ['2K', '3K', '5K', '10K', '15K', '20K']
+
+# standard -> (module, {pressure class: table attribute}); None = the module's
+# ALL_PRESSURE_CLASSES map
+FLANGE_STANDARD_TABLES = {
+    'API_6BX': ('generate_all_flanges_test', None),
+    'ASME_B16_5': ('flange_data', {
+        '150': 'CLASS_150_RF_WN',
+        '300': 'CLASS_300_RF_WN',
+        '400': 'CLASS_400_RF_WN',
+        '600': 'CLASS_600_RF_WN',
+        '900': 'CLASS_900_RF_WN',
+        '1500': 'CLASS_1500_RF_WN',
+        '2500': 'CLASS_2500_RF_WN',
+    }),
+    'ASME_B16_47A': ('flange_data', {
+        '150': 'B1647_SERIES_A_RF_WN',
+        '300': 'B1647_SERIES_A_CLASS300_RF_WN',
+        '600': 'B1647_SERIES_A_CLASS600_RF_WN',
+        '900': 'B1647_SERIES_A_CLASS900_RF_WN',
+    }),
+    'ASME_B16_47B': ('flange_data', {
+        '150': 'B1647_SERIES_B_RF_WN',
+        '300': 'B1647_SERIES_B_CLASS300_RF_WN',
+        '600': 'B1647_SERIES_B_CLASS600_RF_WN',
+        '900': 'B1647_SERIES_B_CLASS900_RF_WN',
+    }),
+}
+
+# B16.5 flange type -> pressure classes offered
+FLANGE_TYPE_CLASSES = {
+    'Weld Neck': ('150', '300', '400', '600', '900', '1500', '2500'),
+    'Blind': ('150', '300', '400', '600', '900', '1500', '2500'),
+    'Lap Joint': ('150', '300', '400', '600', '900', '1500', '2500'),
+    'Socket Weld': ('150', '300', '400', '600', '1500'),  # No 900, 2500
+    'Slip-On': ('150', '300', '400', '600', '900', '1500'),  # No 2500
+    'Threaded': ('150', '300', '400', '600', '900', '1500', '2500'),
+}
+
+# Flange types with their own dimension module: (module, class -> table map).
+# Every other type takes its sizes from the B16.5 weld neck tables.
+FLANGE_TYPE_TABLES = {
+    'Socket Weld': ('socket_weld_flange_data', 'SOCKET_WELD_DATA_MAP'),
+    'Slip-On': ('slip_on_flange_data', 'SLIP_ON_DATA_MAP'),
+    'Threaded': ('threaded_flange_data', 'THREADED_DATA_MAP'),
+}
+
+# =============================================================================
+# FASTENER SOURCES
+# =============================================================================
+
+# Fastener type -> (module, table) listing every size of the standard
+FASTENER_TABLES = {
+    'B16.5 Stud': ('asme_b165_stud_data', 'B165_CLASS_150_STUDS'),
+    'B16.47 Series A Stud': ('asme_b165_stud_data', 'B1647A_CLASS_150_STUDS'),
+    'B16.47 Series B Stud': ('asme_b165_stud_data', 'B1647B_CLASS_150_STUDS'),
+    'API 6B Stud': ('api_6b_stud_data', 'API_6B_5000_STUDS'),
+    'API 6BX Stud': ('api_6bx_stud_data', 'API_6BX_10000_STUDS'),
+}
+
+FASTENER_FALLBACK_SIZES = ('1/2', '3/4', '1', '1-1/2', '2')
+
+# =============================================================================
+# STRUCTURAL / LUMBER / CFS (fixed lists)
+# =============================================================================
+
+STEEL_SIZES = {
+    'W-Beam': ('W4X13', 'W6X9', 'W8X10', 'W8X31', 'W10X12', 'W10X33', 'W12X14', 'W12X26', 'W12X50',
+               'W14X22', 'W14X43', 'W16X26', 'W16X31', 'W18X35', 'W21X44', 'W24X55', 'W27X84', 'W30X90'),
+    'HSS Rectangular': ('HSS4X4X1/4', 'HSS4X4X3/8', 'HSS6X6X1/4', 'HSS6X6X3/8', 'HSS8X4X1/4', 'HSS8X4X3/8',
+                        'HSS8X8X1/4', 'HSS8X8X3/8', 'HSS8X8X1/2', 'HSS10X10X1/2', 'HSS12X12X1/2',
+                        'HSS16X16X5/8'),
+    'HSS Round': ('HSS2.375X0.188', 'HSS3.500X0.250', 'HSS4.500X0.250', 'HSS6.625X0.312',
+                  'HSS8.625X0.322', 'HSS10.000X0.500', 'HSS12.750X0.500'),
+    'Channel': ('C3X4.1', 'C4X5.4', 'C6X8.2', 'C8X11.5', 'C10X15.3', 'C12X20.7', 'C15X33.9'),
+    'Angle': ('L2X2X1/4', 'L3X3X1/4', 'L3X3X3/8', 'L4X4X1/4', 'L4X4X3/8', 'L4X4X1/2',
+              'L6X6X3/8', 'L6X6X1/2', 'L8X8X1/2'),
+}
+
+LUMBER_SIZES = {
+    'Dimensional': ('2x4', '2x6', '2x8', '2x10', '2x12', '4x4', '4x6', '4x8', '4x10', '4x12',
+                    '6x6', '6x8', '6x10', '6x12', '8x8', '8x10', '8x12', '10x10', '10x12', '12x12'),
+    # Wall studs are typically 2x4 or 2x6
+    'Wall Studs': ('2x4', '2x6', '2x3'),
+    # Common glulam sizes (width x depth in inches)
+    'Glulam': ('3-1/8x9', '3-1/8x10-1/2', '3-1/8x12', '3-1/8x13-1/2', '3-1/8x15', '3-1/8x16-1/2', '3-1/8x18',
+               '5-1/8x9', '5-1/8x10-1/2', '5-1/8x12', '5-1/8x13-1/2', '5-1/8x15', '5-1/8x16-1/2', '5-1/8x18',
+               '5-1/8x21', '5-1/8x24',
+               '6-3/4x9', '6-3/4x10-1/2', '6-3/4x12', '6-3/4x13-1/2', '6-3/4x15', '6-3/4x16-1/2', '6-3/4x18',
+               '6-3/4x21', '6-3/4x24'),
+    # LVL/Microlam sizes (thickness x depth)
+    'LVL (Microlam)': ('1-3/4x9-1/2', '1-3/4x11-7/8', '1-3/4x14', '1-3/4x16', '1-3/4x18',
+                       '3-1/2x9-1/2', '3-1/2x11-7/8', '3-1/2x14', '3-1/2x16', '3-1/2x18', '3-1/2x20', '3-1/2x24',
+                       '5-1/4x9-1/2', '5-1/4x11-7/8', '5-1/4x14', '5-1/4x16', '5-1/4x18', '5-1/4x20', '5-1/4x24'),
+    # PSL/Parallam sizes
+    'PSL (Parallam)': ('3-1/2x9-1/4', '3-1/2x11-1/4', '3-1/2x11-7/8', '3-1/2x14', '3-1/2x16', '3-1/2x18',
+                       '5-1/4x9-1/4', '5-1/4x11-1/4', '5-1/4x11-7/8', '5-1/4x14', '5-1/4x16', '5-1/4x18',
+                       '7x9-1/4', '7x11-1/4', '7x11-7/8', '7x14', '7x16', '7x18'),
+    # TJI I-joists (Series + Depth)
+    'TJI': ('TJI 110  9 1/2', 'TJI 110 117/8', 'TJI 110 14', 'TJI 110 16',
+            'TJI 210 9 1/2', 'TJI 210 11 7/8', 'TJI 210 14', 'TJI 210 16',
+            'TJI 230 9 1/2', 'TJI 230 11 7/8', 'TJI 230 14', 'TJI 230 16',
+            'TJI 360 11 7/8', 'TJI 360 14', 'TJI 360 16',
+            'TJI 560 11 7/8', 'TJI 560 14', 'TJI 560 16 '),
+}
+
+CFS_OPTIONS = {
+    'Stud': (('250S (2-1/2")', '350S (3-1/2")', '362S (3-5/8")', '400S (4")', '600S (6")', '800S (8")'),
+             ('33 (20 ga)', '43 (18 ga)', '54 (16 ga)', '68 (14 ga)')),
+    'Track': (('250T (2-1/2")', '350T (3-1/2")', '362T (3-5/8")', '400T (4")', '600T (6")', '800T (8")'),
+              ('33 (20 ga)', '43 (18 ga)', '54 (16 ga)', '68 (14 ga)')),
+    'Floor Joist': (('600J (6")', '800J (8")', '1000J (10")', '1200J (12")', '1400J (14")'),
+                    ('43 (18 ga)', '54 (16 ga)', '68 (14 ga)', '97 (12 ga)')),
+}
+
+SOURCE_MODULES = sorted({module for module, _ in FLANGE_STANDARD_TABLES.values()} |
+                        {module for module, _ in FLANGE_TYPE_TABLES.values()} |
+                        {module for module, _ in FASTENER_TABLES.values()})
+
+_lock = threading.Lock()
+_model = None
+
+
+# =============================================================================
+# BUILD
+# =============================================================================
+
+def _source_signature():
+    """Size and mtime of every source module - any edit forces a rebuild."""
+    parts = [f"v{OPTION_MODEL_VERSION}"]
+    for module in SOURCE_MODULES:
+        path = os.path.join(script_dir, module + ".py")
+        try:
+            stat = os.stat(path)
+            parts.append(f"{module}:{stat.st_size}:{stat.st_mtime_ns}")
+        except OSError:
+            parts.append(f"{module}:missing")
+    return "|".join(parts)
+
+
+def _source_tables(module_name, attr, errors):
+    """
+    A table from a source module, or None if it can't be loaded.
+
+    A module that is not installed is simply absent (the signature records
+    it, so installing it triggers a rebuild); any other failure is reported
+    in errors.
+    """
+    try:
+        return getattr(importlib.import_module(module_name), attr)
+    except ModuleNotFoundError as e:
+        if e.name != module_name:
+            errors.append(f"{module_name}.{attr}: {e}")
+        return None
+    except Exception as e:
+        errors.append(f"{module_name}.{attr}: {e}")
+        return None
+
+
+def _build_flange_standards(errors):
+    """standard -> size -> [pressure classes], classes in rating order."""
+    standards = {}
+    for standard, (module_name, class_tables) in FLANGE_STANDARD_TABLES.items():
+        if class_tables is None:
+            tables = _source_tables(module_name, 'ALL_PRESSURE_CLASSES', errors) or {}
+            order = API_PRESSURE_ORDER
+        else:
+            tables = {pressure: _source_tables(module_name, attr, errors) or {}
+                      for pressure, attr in class_tables.items()}
+            order = ASME_CLASS_ORDER
+
+        sizes = {}
+        for pressure, table in tables.items():
+            for size in table:
+                sizes.setdefault(size, []).append(pressure)
+        for size in sizes:
+            sizes[size].sort(key=lambda x: order.index(x) if x in order else 99)
+        standards[standard] = sizes
+    return standards
+
+
+def _build_flange_type_sizes(standards, errors):
+    """flange type -> class -> [sizes], sizes in numeric order."""
+    weld_neck = {}
+    for size, pressures in standards.get('ASME_B16_5', {}).items():
+        for pressure in pressures:
+            weld_neck.setdefault(pressure, []).append(size)
+
+    type_sizes = {}
+    for flange_type, classes in FLANGE_TYPE_CLASSES.items():
+        if flange_type in FLANGE_TYPE_TABLES:
+            module_name, map_name = FLANGE_TYPE_TABLES[flange_type]
+            data_map = _source_tables(module_name, map_name, errors) or {}
+            tables = {pressure: list(data_map.get(pressure) or ()) for pressure in classes}
+        else:  # WN, Blind, Lap Joint - all sizes from flange_data
+            tables = {pressure: weld_neck.get(pressure, []) for pressure in classes}
+        type_sizes[flange_type] = {pressure: list(sort_sizes(sizes)) for pressure, sizes in tables.items()}
+    return type_sizes
+
+
+def _build_fastener_sizes(errors):
+    """fastener type -> [sizes], sizes in numeric order."""
+    sizes = {}
+    for fastener_type, (module_name, table) in FASTENER_TABLES.items():
+        sizes[fastener_type] = list(sort_sizes(_source_tables(module_name, table, errors) or ()))
+    return sizes
+
+
+def build_option_model(path=None):
+    """
+    Compute every data-driven option list and write the JSON cache.
+
+    A source module that fails to import (e.g. a generator whose OCC
+    dependency is missing) leaves its lists empty; that model is returned
+    but not written, so the next start tries again.
+
+    Args:
+        path: Cache file (default: OPTION_MODEL_PATH)
+
+    Returns:
+        dict: the model
+    """
+    path = Path(path or OPTION_MODEL_PATH)
+    errors = []
+    standards = _build_flange_standards(errors)
+    model = {
+        'signature': _source_signature(),
+        'built': time.strftime("%Y-%m-%d %H:%M:%S"),
+        'flange_standards': standards,
+        'flange_type_sizes': _build_flange_type_sizes(standards, errors),
+        'fastener_sizes': _build_fastener_sizes(errors),
+    }
+
+    for error in errors:
+        print(f"Error loading options from {error}")
+    if not errors:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file and swap it in - another GUI may be reading
+            fd, tmp_path = tempfile.mkstemp(prefix=".option_model_", suffix=".json", dir=str(path.parent))
+            with os.fdopen(fd, 'w') as f:
+                json.dump(model, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Warning: could not write option cache {path}: {e}")
+    return model
+
+
+def _freeze(model):
+    """Lists -> tuples, so the panels can hand them straight to ttk."""
+    return {
+        'flange_standards': {standard: {size: tuple(pressures) for size, pressures in sizes.items()}
+                             for standard, sizes in model['flange_standards'].items()},
+        'flange_standard_sizes': {standard: sort_sizes(sizes)
+                                  for standard, sizes in model['flange_standards'].items()},
+        'flange_type_sizes': {flange_type: {pressure: tuple(sizes) for pressure, sizes in classes.items()}
+                              for flange_type, classes in model['flange_type_sizes'].items()},
+        'fastener_sizes': {fastener_type: tuple(sizes)
+                           for fastener_type, sizes in model['fastener_sizes'].items()},
+    }
+
+
+def load():
+    """The option model, from the JSON cache when it is current (once per process)."""
+    global _model
+    if _model is None:
+        with _lock:
+            if _model is None:
+                model = None
+                try:
+                    with open(OPTION_MODEL_PATH) as f:
+                        model = json.load(f)
+                    if model.get('signature') != _source_signature():
+                        model = None
+                except (OSError, ValueError):
+                    model = None
+                _model = _freeze(model or build_option_model(OPTION_MODEL_PATH))
+    return _model
+
+
+# =============================================================================
+# LOOKUP
+# =============================================================================
+
+def flange_standards():
+    """standard -> size -> (pressure classes)"""
+    return load()['flange_standards']
+
+
+def all_flange_sizes():
+    """Every flange size of every standard."""
+    return {size for sizes in flange_standards().values() for size in sizes}
+
+
+def flange_standard_sizes(standard):
+    """Sizes of a flange standard ('API_6BX', 'ASME_B16_5', ...) in numeric order."""
+    return load()['flange_standard_sizes'].get(standard, ())
+
+
+def flange_standard_pressures(standard, size):
+    """Pressure classes of one size of a flange standard."""
+    return flange_standards().get(standard, {}).get(size, ())
+
+
+def flange_type_classes(flange_type):
+    """Pressure classes offered for a B16.5 flange type."""
+    return FLANGE_TYPE_CLASSES.get(flange_type, ())
+
+
+def flange_type_sizes(flange_type, pressure_class):
+    """Sizes of a B16.5 flange type and class in numeric order."""
+    return load()['flange_type_sizes'].get(flange_type, {}).get(pressure_class, ())
+
+
+def fastener_sizes(fastener_type):
+    """Stud sizes of a fastener standard in numeric order."""
+    return load()['fastener_sizes'].get(fastener_type, ())
+
+
+def steel_sizes(shape_type):
+    return STEEL_SIZES.get(shape_type, ())
+
+
+def lumber_sizes(lumber_type):
+    return LUMBER_SIZES.get(lumber_type, ())
+
+
+def cfs_options(member_type):
+    """(sizes, gauges) for a CFS member type; anything else is a floor joist."""
+    return CFS_OPTIONS.get(member_type, CFS_OPTIONS['Floor Joist'])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Precompute the GUI option lists")
+    parser.add_argument("--build", action="store_true", help="Rebuild the option cache now")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    model = build_option_model() if args.build else load()
+    if args.build:
+        model = _freeze(model)
+    print(f"✓ Option model ({time.perf_counter() - start:.2f}s): {OPTION_MODEL_PATH}")
+    for standard, sizes in model['flange_standard_sizes'].items():
+        print(f"  {standard}: {len(sizes)} sizes")
+    for fastener_type, sizes in model['fastener_sizes'].items():
+        print(f"  {fastener_type}: {len(sizes)} sizes")
@@ -0,0 +1,249 @@
+"""
+Pipe Dimensions Database
+ASME B36.10M (welded and seamless wrought steel pipe) and ASME B36.19M
+(stainless steel pipe), NPS 1/8 - 48
+
+All dimensions in inches. This is the one pipe table: the piping
+generators and the flow calculator (flow_calculator_enhanced.PipeData)
+both read it.
+
+    from pipe_data_complete import PIPE_DATA, get_pipe_dimensions
+
+    od, wall = get_pipe_dimensions(4, '80')      # (4.5, 0.337)
+    PIPE_DATA[4]['40S']                          # (4.5, 0.237)
+
+Schedules 5 and 10 below NPS 14 carry the B36.19M 5S / 10S walls, as
+they are ordered for carbon steel. Above NPS 12 schedule 10 is the
+B36.10M wall and there is no schedule 5 - the thin walls there are
+B36.19M 5S only.
+
+The same rows are also one table in NPS order, schedules in SCHEDULES
+order - a NumPy structured array (PIPE_TABLE_DTYPE) when NumPy is
+installed, a dict of column tuples without it - with index maps by NPS
+and schedule for the vectorized sizing sweeps:
+
+    PIPE_TABLE['od'][row_index('4', '80')]       # 4.5
+    PIPE_TABLE[size_rows('4')]                   # the 4" rows (NumPy)
+    PIPE_TABLE['wall'][schedule_rows('STD')]     # every STD wall (NumPy)
+"""
+
+from nps_key import NPS
+
+# NumPy is optional - without it PIPE_TABLE is a dict of column tuples
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+# B36.10M schedules and weight classes, in table order
+B3610_SCHEDULES = ('5', '10', '20', '30', '40', 'STD', '60', '80', 'XS',
+                   '100', '120', '140', '160', 'XXS')
+# B36.19M stainless schedules
+B3619_SCHEDULES = ('5S', '10S', '40S', '80S')
+SCHEDULES = B3610_SCHEDULES + B3619_SCHEDULES
+
+# NPS: (OD, {schedule: wall})
+PIPE_WALLS = {
+    '1/8': (0.405, {
+        '10': 0.049, '30': 0.057, '40': 0.068, 'STD': 0.068, '80': 0.095, 'XS': 0.095,
+        '10S': 0.049, '40S': 0.068, '80S': 0.095}),
+    '1/4': (0.540, {
+        '10': 0.065, '30': 0.073, '40': 0.088, 'STD': 0.088, '80': 0.119, 'XS': 0.119,
+        '10S': 0.065, '40S': 0.088, '80S': 0.119}),
+    '3/8': (0.675, {
+        '10': 0.065, '30': 0.073, '40': 0.091, 'STD': 0.091, '80': 0.126, 'XS': 0.126,
+        '10S': 0.065, '40S': 0.091, '80S': 0.126}),
+    '1/2': (0.840, {
+        '5': 0.065, '10': 0.083, '30': 0.095, '40': 0.109, 'STD': 0.109, '80': 0.147, 'XS': 0.147,
+        '160': 0.188, 'XXS': 0.294,
+        '5S': 0.065, '10S': 0.083, '40S': 0.109, '80S': 0.147}),
+    '3/4': (1.050, {
+        '5': 0.065, '10': 0.083, '30': 0.095, '40': 0.113, 'STD': 0.113, '80': 0.154, 'XS': 0.154,
+        '160': 0.219, 'XXS': 0.308,
+        '5S': 0.065, '10S': 0.083, '40S': 0.113, '80S': 0.154}),
+    '1': (1.315, {
+        '5': 0.065, '10': 0.109, '30': 0.114, '40': 0.133, 'STD': 0.133, '80': 0.179, 'XS': 0.179,
+        '160': 0.250, 'XXS': 0.358,
+        '5S': 0.065, '10S': 0.109, '40S': 0.133, '80S': 0.179}),
+    '1-1/4': (1.660, {
+        '5': 0.065, '10': 0.109, '30': 0.117, '40': 0.140, 'STD': 0.140, '80': 0.191, 'XS': 0.191,
+        '160': 0.250, 'XXS': 0.382,
+        '5S': 0.065, '10S': 0.109, '40S': 0.140, '80S': 0.191}),
+    '1-1/2': (1.900, {
+        '5': 0.065, '10': 0.109, '30': 0.125, '40': 0.145, 'STD': 0.145, '80': 0.200, 'XS': 0.200,
+        '160': 0.281, 'XXS': 0.400,
+        '5S': 0.065, '10S': 0.109, '40S': 0.145, '80S': 0.200}),
+    '2': (2.375, {
+        '5': 0.065, '10': 0.109, '30': 0.125, '40': 0.154, 'STD': 0.154, '80': 0.218, 'XS': 0.218,
+        '160': 0.344, 'XXS': 0.436,
+        '5S': 0.065, '10S': 0.109, '40S': 0.154, '80S': 0.218}),
+    '2-1/2': (2.875, {
+        '5': 0.083, '10': 0.120, '30': 0.188, '40': 0.203, 'STD': 0.203, '80': 0.276, 'XS': 0.276,
+        '160': 0.375, 'XXS': 0.552,
+        '5S': 0.083, '10S': 0.120, '40S': 0.203, '80S': 0.276}),
+    '3': (3.500, {
+        '5': 0.083, '10': 0.120, '30': 0.188, '40': 0.216, 'STD': 0.216, '80': 0.300, 'XS': 0.300,
+        '160': 0.438, 'XXS': 0.600,
+        '5S': 0.083, '10S': 0.120, '40S': 0.216, '80S': 0.300}),
+    '3-1/2': (4.000, {
+        '5': 0.083, '10': 0.120, '30': 0.188, '40': 0.226, 'STD': 0.226, '80': 0.318, 'XS': 0.318,
+        'XXS': 0.636,
+        '5S': 0.083, '10S': 0.120, '40S': 0.226, '80S': 0.318}),
+    '4': (4.500, {
+        '5': 0.083, '10': 0.120, '30': 0.188, '40': 0.237, 'STD': 0.237, '80': 0.337, 'XS': 0.337,
+        '120': 0.438, '160': 0.531, 'XXS': 0.674,
+        '5S': 0.083, '10S': 0.120, '40S': 0.237, '80S': 0.337}),
+    '5': (5.563, {
+        '5': 0.109, '10': 0.134, '40': 0.258, 'STD': 0.258, '80': 0.375, 'XS': 0.375,
+        '120': 0.500, '160': 0.625, 'XXS': 0.750,
+        '5S': 0.109, '10S': 0.134, '40S': 0.258, '80S': 0.375}),
+    '6': (6.625, {
+        '5': 0.109, '10': 0.134, '40': 0.280, 'STD': 0.280, '80': 0.432, 'XS': 0.432,
+        '120': 0.562, '160': 0.719, 'XXS': 0.864,
+        '5S': 0.109, '10S': 0.134, '40S': 0.280, '80S': 0.432}),
+    '8': (8.625, {
+        '5': 0.109, '10': 0.148, '20': 0.250, '30': 0.277, '40': 0.322, 'STD': 0.322,
+        '60': 0.406, '80': 0.500, 'XS': 0.500, '100': 0.594, '120': 0.719, '140': 0.812,
+        '160': 0.906, 'XXS': 0.875,
+        '5S': 0.109, '10S': 0.148, '40S': 0.322, '80S': 0.500}),
+    '10': (10.750, {
+        '5': 0.134, '10': 0.165, '20': 0.250, '30': 0.307, '40': 0.365, 'STD': 0.365,
+        '60': 0.500, 'XS': 0.500, '80': 0.594, '100': 0.719, '120': 0.844, '140': 1.000,
+        '160': 1.125, 'XXS': 1.000,
+        '5S': 0.134, '10S': 0.165, '40S': 0.365, '80S': 0.500}),
+    '12': (12.750, {
+        '5': 0.156, '10': 0.180, '20': 0.250, '30': 0.330, 'STD': 0.375, '40': 0.406,
+        'XS': 0.500, '60': 0.562, '80': 0.688, '100': 0.844, '120': 1.000, '140': 1.125,
+        '160': 1.312, 'XXS': 1.000,
+        '5S': 0.156, '10S': 0.180, '40S': 0.375, '80S': 0.500}),
+    '14': (14.000, {
+        '10': 0.250, '20': 0.312, '30': 0.375, 'STD': 0.375, '40': 0.438,
+        'XS': 0.500, '60': 0.594, '80': 0.750, '100': 0.938, '120': 1.094, '140': 1.250,
+        '160': 1.406,
+        '5S': 0.156, '10S': 0.188, '40S': 0.375, '80S': 0.500}),
+    '16': (16.000, {
+        '10': 0.250, '20': 0.312, '30': 0.375, 'STD': 0.375, '40': 0.500,
+        'XS': 0.500, '60': 0.656, '80': 0.844, '100': 1.031, '120': 1.219, '140': 1.438,
+        '160': 1.594,
+        '5S': 0.165, '10S': 0.188, '40S': 0.375, '80S': 0.500}),
+    '18': (18.000, {
+        '10': 0.250, '20': 0.312, 'STD': 0.375, '30': 0.438, 'XS': 0.500,
+        '40': 0.562, '60': 0.750, '80': 0.938, '100': 1.156, '120': 1.375, '140': 1.562,
+        '160': 1.781,
+        '5S': 0.165, '10S': 0.188, '40S': 0.375, '80S': 0.500}),
+    '20': (20.000, {
+        '10': 0.250, '20': 0.375, 'STD': 0.375, '30': 0.500, 'XS': 0.500,
+        '40': 0.594, '60': 0.812, '80': 1.031, '100': 1.281, '120': 1.500, '140': 1.750,
+        '160': 1.969,
+        '5S': 0.188, '10S': 0.218, '40S': 0.375, '80S': 0.500}),
+    '22': (22.000, {
+        '10': 0.250, '20': 0.375, 'STD': 0.375, '30': 0.500, 'XS': 0.500,
+        '60': 0.875, '80': 1.125, '100': 1.375, '120': 1.625, '140': 1.875, '160': 2.125,
+        '5S': 0.188, '10S': 0.218, '40S': 0.375, '80S': 0.500}),
+    '24': (24.000, {
+        '10': 0.250, '20': 0.375, 'STD': 0.375, 'XS': 0.500, '30': 0.562,
+        '40': 0.688, '60': 0.969, '80': 1.219, '100': 1.531, '120': 1.812, '140': 2.062,
+        '160': 2.344,
+        '5S': 0.218, '10S': 0.250, '40S': 0.375, '80S': 0.500}),
+    '26': (26.000, {
+        '10': 0.312, 'STD': 0.375, '20': 0.500, 'XS': 0.500}),
+    '28': (28.000, {
+        '10': 0.312, 'STD': 0.375, '20': 0.500, 'XS': 0.500, '30': 0.625}),
+    '30': (30.000, {
+        '10': 0.312, 'STD': 0.375, '20': 0.500, 'XS': 0.500, '30': 0.625,
+        '5S': 0.250, '10S': 0.312}),
+    '32': (32.000, {
+        '10': 0.312, 'STD': 0.375, '20': 0.500, 'XS': 0.500, '30': 0.625, '40': 0.688}),
+    '34': (34.000, {
+        '10': 0.344, 'STD': 0.375, '20': 0.500, 'XS': 0.500, '30': 0.625, '40': 0.688}),
+    '36': (36.000, {
+        '10': 0.312, 'STD': 0.375, '20': 0.500, 'XS': 0.500, '30': 0.625, '40': 0.750}),
+    '38': (38.000, {'STD': 0.375, 'XS': 0.500}),
+    '40': (40.000, {'STD': 0.375, 'XS': 0.500}),
+    '42': (42.000, {
+        'STD': 0.375, '20': 0.500, 'XS': 0.500, '30': 0.625, '40': 0.750}),
+    '44': (44.000, {'STD': 0.375, 'XS': 0.500}),
+    '46': (46.000, {'STD': 0.375, 'XS': 0.500}),
+    '48': (48.000, {'STD': 0.375, 'XS': 0.500}),
+}
+
+# Generator view - NPS (float): {schedule: (OD, wall)}, schedules in SCHEDULES order
+PIPE_DATA = {
+    NPS(size).inches: {schedule: (od, walls[schedule]) for schedule in SCHEDULES if schedule in walls}
+    for size, (od, walls) in PIPE_WALLS.items()
+}
+
+
+# ==========================================================================
+# TABLE AND INDEX MAPS
+# ==========================================================================
+
+PIPE_TABLE_FIELDS = ('nps', 'size', 'schedule', 'od', 'wall', 'id')
+PIPE_TABLE_DTYPE = [('nps', 'f8'), ('size', 'U6'), ('schedule', 'U3'),
+                    ('od', 'f8'), ('wall', 'f8'), ('id', 'f8')]
+
+PIPE_ROWS = tuple(
+    (NPS(size).inches, size, schedule, od, wall, round(od - 2 * wall, 3))
+    for size in PIPE_WALLS
+    for schedule, (od, wall) in PIPE_DATA[NPS(size).inches].items()
+)
+
+if HAS_NUMPY:
+    PIPE_TABLE = np.array(list(PIPE_ROWS), dtype=PIPE_TABLE_DTYPE)
+else:
+    PIPE_TABLE = dict(zip(PIPE_TABLE_FIELDS, (tuple(column) for column in zip(*PIPE_ROWS))))
+
+# (size, schedule) -> row; size -> slice of its rows; schedule -> rows
+ROW_INDEX = {(row[1], row[2]): i for i, row in enumerate(PIPE_ROWS)}
+_starts = [i for i, row in enumerate(PIPE_ROWS) if i == 0 or row[1] != PIPE_ROWS[i - 1][1]]
+SIZE_ROWS = {PIPE_ROWS[start][1]: slice(start, stop)
+             for start, stop in zip(_starts, _starts[1:] + [len(PIPE_ROWS)])}
+SCHEDULE_ROWS = {schedule: tuple(i for i, row in enumerate(PIPE_ROWS) if row[2] == schedule)
+                 for schedule in SCHEDULES}
+
+
+def _size(nps):
+    """Table size key ('1-1/4') for an NPS given as a number or a string."""
+    try:
+        return str(NPS(nps))
+    except ValueError:
+        raise ValueError(f"NPS {nps} not in database. Available: {list(PIPE_WALLS.keys())}") from None
+
+
+def get_pipe_dimensions(nps, schedule):
+    """Get OD and Wall thickness for given NPS and Schedule"""
+    size = _size(nps)
+    if size not in PIPE_WALLS:
+        raise ValueError(f"NPS {nps} not in database. Available: {list(PIPE_WALLS.keys())}")
+    schedules = PIPE_DATA[NPS(size).inches]
+    if schedule not in schedules:
+        raise ValueError(f"Schedule {schedule} not available for NPS {nps}. Available: {list(schedules.keys())}")
+    return schedules[schedule]
+
+
+def list_schedules(nps):
+    """Schedules available for an NPS, in SCHEDULES order."""
+    return tuple(PIPE_DATA.get(NPS(_size(nps)).inches, {}))
+
+
+def row_index(nps, schedule):
+    """PIPE_TABLE row of an NPS / schedule, or None."""
+    return ROW_INDEX.get((_size(nps), schedule))
+
+
+def size_rows(nps):
+    """Slice of the PIPE_TABLE rows of an NPS (empty when it is not listed)."""
+    return SIZE_ROWS.get(_size(nps), slice(0, 0))
+
+
+def schedule_rows(schedule):
+    """PIPE_TABLE rows of a schedule, NPS ascending (an index array with NumPy)."""
+    rows = SCHEDULE_ROWS.get(schedule, ())
+    return np.array(rows, dtype=int) if HAS_NUMPY else rows
+
+
+if __name__ == "__main__":
+    print(f"✓ {len(PIPE_ROWS)} pipes, NPS {next(iter(PIPE_WALLS))} - {list(PIPE_WALLS)[-1]}")
+    for size, (od, walls) in PIPE_WALLS.items():
+        print(f"  {size:>6}\"  OD {od:7.3f}  {', '.join(list_schedules(size))}")
@@ -0,0 +1,373 @@
+"""
+Pipe Network Solver - flow split and node pressures of branched / looped piping
+Newton-Raphson (global gradient) solution over a sparse node matrix.
+
+FlowCalculator.calculate_total_pressure_drop covers one pipe of one size.
+Headers and manifolds are graphs: segments of different NPS / schedule /
+length / fittings between nodes with elevations, demands and supply
+pressures, with branches and loops. This module solves the whole graph at
+once - every segment flow and every node pressure - using the same friction
+and fitting equations as the flow calculator:
+
+    from pipe_network import make_node, make_segment, solve_network, format_report
+
+    nodes = [
+        make_node('Pump', pressure=150),                 # fixed pressure (psig)
+        make_node('A', elevation=20, demand=300),        # GPM drawn off
+        make_node('B', elevation=10, demand=200),
+    ]
+    segments = [
+        make_segment('S1', 'Pump', 'A', '6', '40', 400, fittings=[('90° Elbow (LR)', 2)]),
+        make_segment('S2', 'A', 'B', '4', '40', 250),
+        make_segment('S3', 'Pump', 'B', '4', '40', 600),   # closes a loop
+    ]
+    result = solve_network(nodes, segments, fluid_name='Fresh Water', temperature_f=80)
+    print(format_report(result))
+
+or from a JSON file with "nodes" and "segments" lists (plus optional
+"fluid", "temperature_f", "pipe_material"):
+
+    python pipe_network.py header.json
+
+Method: every segment obeys Ψ_from - Ψ_to = ΔP(Q) and every free node
+continuity (inflow - outflow = demand), with Ψ = P + ρz/144 the
+piezometric pressure. Each Newton step eliminates the flows and solves the
+node-sized weighted Laplacian A^T D^-1 A for the pressures (the global
+gradient algorithm of EPANET). The matrix is assembled sparse and solved with
+scipy.sparse when SciPy is installed, densely with NumPy otherwise.
+
+Liquids are treated as incompressible at the given temperature and
+reference pressure.
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+from collections import deque
+
+import numpy as np
+
+# SciPy is optional - without it the node matrix is solved densely
+try:
+    from scipy.sparse import csr_matrix
+    from scipy.sparse.linalg import spsolve
+    HAS_SCIPY = True
+except ImportError:
+    HAS_SCIPY = False
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, script_dir)
+
+from flow_calculator_enhanced import FluidProperties, FlowCalculator, PipeData
+
+# Newton iteration limits
+MAX_ITERATIONS = 100
+FLOW_TOLERANCE_GPM = 1e-6
+
+# Flow used for a segment's first Newton step: 3 ft/s
+INITIAL_VELOCITY_FT_S = 3.0
+
+# Floor on |Q| in the loss derivative (no flow -> laminar slope)
+MIN_FLOW_GPM = 1e-9
+
+
+# =============================================================================
+# NETWORK DESCRIPTION
+# =============================================================================
+
+def make_node(name, elevation=0.0, demand=0.0, pressure=None):
+    """
+    Build a network node dict.
+
+    Args:
+        name: Node name, referred to by segments
+        elevation: Elevation in feet
+        demand: Flow drawn off at the node in GPM (negative = injected)
+        pressure: Fixed pressure in psig (supply / tank / discharge); None = solved
+
+    Returns:
+        dict: Node description
+    """
+    node = {'name': name, 'elevation': float(elevation), 'demand': float(demand)}
+    if pressure is not None:
+        node['pressure'] = float(pressure)
+    return node
+
+
+def make_segment(name, from_node, to_node, nps, schedule, length, fittings=None, material=None):
+    """
+    Build a network segment dict.
+
+    Args:
+        name: Segment name
+        from_node, to_node: Node names; positive flow runs from -> to
+        nps, schedule: Pipe from PipeData.PIPE_DIMENSIONS ('4', '40')
+        length: Pipe length in feet
+        fittings: List of tuples [(FITTING_K_FACTORS name, quantity), ...]
+        material: Pipe material for roughness (default: the network's)
+
+    Returns:
+        dict: Segment description
+    """
+    segment = {
+        'name': name,
+        'from': from_node,
+        'to': to_node,
+        'nps': str(nps),
+        'schedule': str(schedule),
+        'length': float(length),
+        'fittings': [(fitting, qty) for fitting, qty in (fittings or [])],
+    }
+    if material:
+        segment['material'] = material
+    return segment
+
+
+def load_network(path):
+    """Network JSON file -> dict with 'nodes', 'segments' and solver options."""
+    with open(path) as f:
+        data = json.load(f)
+    return {
+        'nodes': [make_node(n['name'], n.get('elevation', 0), n.get('demand', 0), n.get('pressure'))
+                  for n in data['nodes']],
+        'segments': [make_segment(s['name'], s['from'], s['to'], s['nps'], s['schedule'], s['length'],
+                                  s.get('fittings'), s.get('material'))
+                     for s in data['segments']],
+        'fluid_name': data.get('fluid', 'Fresh Water'),
+        'temperature_f': data.get('temperature_f', 60),
+        'pipe_material': data.get('pipe_material', 'Commercial Steel'),
+    }
+
+
+# =============================================================================
+# SOLVER
+# =============================================================================
+
+def _check_network(nodes, segments):
+    """Validate names and connectivity; returns the node name -> index map."""
+    index = {}
+    for i, node in enumerate(nodes):
+        if node['name'] in index:
+            raise ValueError(f"Duplicate node name: {node['name']}")
+        index[node['name']] = i
+    if not any('pressure' in node for node in nodes):
+        raise ValueError("Network needs at least one fixed-pressure node")
+
+    neighbours = {i: [] for i in range(len(nodes))}
+    for segment in segments:
+        for end in ('from', 'to'):
+            if segment[end] not in index:
+                raise ValueError(f"Segment {segment['name']}: unknown node {segment[end]}")
+        if PipeData.get_pipe_id(segment['nps'], segment['schedule']) <= 0:
+            raise ValueError(f"Segment {segment['name']}: no pipe data for NPS {segment['nps']} "
+                             f"Schedule {segment['schedule']}")
+        for fitting, qty in segment['fittings']:
+            if fitting not in FluidProperties.FITTING_K_FACTORS:
+                raise ValueError(f"Segment {segment['name']}: unknown fitting {fitting}")
+        if segment['length'] <= 0 and not any(qty > 0 for _, qty in segment['fittings']):
+            raise ValueError(f"Segment {segment['name']}: needs a length or fittings")
+        i, j = index[segment['from']], index[segment['to']]
+        neighbours[i].append(j)
+        neighbours[j].append(i)
+
+    # Every node must reach a fixed pressure, or its pressure is undefined
+    reached = {i for i, node in enumerate(nodes) if 'pressure' in node}
+    queue = deque(reached)
+    while queue:
+        for j in neighbours[queue.popleft()]:
+            if j not in reached:
+                reached.add(j)
+                queue.append(j)
+    floating = [node['name'] for i, node in enumerate(nodes) if i not in reached]
+    if floating:
+        raise ValueError(f"Nodes not connected to a fixed-pressure node: {', '.join(floating)}")
+    return index
+
+
+def _segment_losses(flow, id_inches, length, roughness, k_total, density, viscosity, friction_method):
+    """
+    Pressure drop (psi, signed with the flow) and its derivative d(ΔP)/dQ
+    for every segment at once.
+    """
+    q = np.maximum(np.abs(flow), MIN_FLOW_GPM)
+    pipe_dp = FlowCalculator.calculate_pressure_drop(q, id_inches, length, density, viscosity, roughness,
+                                                     friction_method=friction_method)
+    velocity = FlowCalculator.calculate_velocity(q, id_inches)
+    fitting_dp = FluidProperties.calculate_fitting_pressure_drop(k_total, velocity, density)
+
+    # ΔP ∝ Q in laminar pipe flow, ∝ Q² otherwise (and always for fittings)
+    reynolds = FlowCalculator.calculate_reynolds_number(q, id_inches, density, viscosity)
+    pipe_exponent = np.where(reynolds < 2300, 1.0, 2.0)
+    derivative = (pipe_exponent * pipe_dp + 2 * fitting_dp) / q
+    return np.sign(flow) * (pipe_dp + fitting_dp), derivative, velocity
+
+
+def _solve_nodes(matrix_rows, matrix_cols, matrix_values, rhs, size):
+    """Solve the node matrix (given as COO triplets) for the pressure step."""
+    if HAS_SCIPY:
+        matrix = csr_matrix((matrix_values, (matrix_rows, matrix_cols)), shape=(size, size))
+        return np.atleast_1d(spsolve(matrix, rhs))
+    matrix = np.zeros((size, size))
+    np.add.at(matrix, (matrix_rows, matrix_cols), matrix_values)
+    return np.linalg.solve(matrix, rhs)
+
+
+def solve_network(nodes, segments, fluid_name='Fresh Water', temperature_f=60, pressure_psi=14.7,
+                  pipe_material='Commercial Steel', friction_method='colebrook',
+                  max_iterations=MAX_ITERATIONS, tolerance_gpm=FLOW_TOLERANCE_GPM):
+    """
+    Solve a piping network for segment flows and node pressures.
+
+    Args:
+        nodes: List of make_node dicts (at least one with a fixed pressure)
+        segments: List of make_segment dicts
+        fluid_name: Fluid from FluidProperties.FLUIDS
+        temperature_f: Fluid temperature (°F)
+        pressure_psi: Reference pressure for the fluid properties (psia)
+        pipe_material: Default pipe material for roughness
+        friction_method: Turbulent friction method (see FlowCalculator.calculate_friction_factor)
+        max_iterations: Newton iteration limit
+        tolerance_gpm: Converged when no segment flow changes by more than this
+
+    Returns:
+        dict: 'converged', 'iterations', 'fluid', 'density', 'viscosity',
+              'flows' / 'velocities' / 'pressure_drops' per segment name
+              (GPM signed with the segment direction, ft/s, psi),
+              'pressures' per node name (psig), 'supply' per fixed node
+              (GPM leaving the node into the network),
+              'continuity_error' (largest node imbalance, GPM)
+    """
+    index = _check_network(nodes, segments)
+    props = FluidProperties.get_properties(fluid_name, temperature_f, pressure_psi)
+    density, viscosity = props['density'], props['viscosity']
+
+    # Segment columns
+    n_nodes = len(nodes)
+    from_index = np.array([index[s['from']] for s in segments], dtype=int)
+    to_index = np.array([index[s['to']] for s in segments], dtype=int)
+    id_inches = np.array([PipeData.get_pipe_id(s['nps'], s['schedule']) for s in segments])
+    length = np.array([s['length'] for s in segments])
+    roughness = np.array([FluidProperties.get_pipe_roughness(s.get('material', pipe_material))[0]
+                          for s in segments])
+    k_total = np.array([sum(FluidProperties.get_fitting_k_factor(fitting) * qty for fitting, qty in s['fittings'])
+                        for s in segments])
+
+    # Nodes: piezometric pressure Ψ = P + ρz/144, free nodes numbered 0..n_free-1
+    elevation_head = np.array([node['elevation'] for node in nodes]) * density / 144
+    demand = np.array([node['demand'] for node in nodes])
+    fixed = np.array(['pressure' in node for node in nodes])
+    free_number = np.full(n_nodes, -1)
+    free_number[~fixed] = np.arange(np.count_nonzero(~fixed))
+    n_free = int(np.count_nonzero(~fixed))
+
+    psi = np.empty(n_nodes)
+    fixed_pressures = [node['pressure'] for node in nodes if 'pressure' in node]
+    psi[fixed] = np.array(fixed_pressures) + elevation_head[fixed]
+    psi[~fixed] = np.mean(psi[fixed])
+
+    flow = INITIAL_VELOCITY_FT_S * id_inches ** 2 / 0.408
+    free_from, free_to = free_number[from_index], free_number[to_index]
+    both_free = (free_from >= 0) & (free_to >= 0)
+
+    converged = False
+    iteration = 0
+    for iteration in range(1, max_iterations + 1):
+        loss, derivative, velocity = _segment_losses(flow, id_inches, length, roughness, k_total,
+                                                     density, viscosity, friction_method)
+        weight = 1 / derivative
+
+        # Residuals: segment energy balance and free-node continuity
+        energy_residual = loss - (psi[from_index] - psi[to_index])
+        outflow = np.bincount(from_index, flow, n_nodes) - np.bincount(to_index, flow, n_nodes)
+        continuity_residual = (outflow + demand)[~fixed]
+
+        # (A^T D^-1 A) δΨ = A^T D^-1 F1 - continuity residual
+        weighted = weight * energy_residual
+        rhs = -continuity_residual
+        for ends, sign in ((free_from, 1.0), (free_to, -1.0)):
+            on = ends >= 0
+            rhs += sign * np.bincount(ends[on], weighted[on], n_free)
+
+        rows = np.concatenate([free_from[free_from >= 0], free_to[free_to >= 0],
+                               free_from[both_free], free_to[both_free]])
+        cols = np.concatenate([free_from[free_from >= 0], free_to[free_to >= 0],
+                               free_to[both_free], free_from[both_free]])
+        values = np.concatenate([weight[free_from >= 0], weight[free_to >= 0],
+                                 -weight[both_free], -weight[both_free]])
+        delta_free = _solve_nodes(rows, cols, values, rhs, n_free) if n_free else np.zeros(0)
+
+        delta_psi = np.zeros(n_nodes)
+        delta_psi[~fixed] = delta_free
+        delta_flow = weight * (delta_psi[from_index] - delta_psi[to_index] - energy_residual)
+        flow = flow + delta_flow
+        psi = psi + delta_psi
+
+        if np.max(np.abs(delta_flow), initial=0.0) <= tolerance_gpm:
+            converged = True
+            break
+
+    loss, _, velocity = _segment_losses(flow, id_inches, length, roughness, k_total,
+                                        density, viscosity, friction_method)
+    outflow = np.bincount(from_index, flow, n_nodes) - np.bincount(to_index, flow, n_nodes)
+    pressure = psi - elevation_head
+
+    names = [s['name'] for s in segments]
+    return {
+        'converged': converged,
+        'iterations': iteration,
+        'fluid': fluid_name,
+        'density': density,
+        'viscosity': viscosity,
+        'flows': dict(zip(names, flow.tolist())),
+        'velocities': dict(zip(names, (np.sign(flow) * velocity).tolist())),
+        'pressure_drops': dict(zip(names, loss.tolist())),
+        'pressures': {node['name']: float(pressure[i]) for i, node in enumerate(nodes)},
+        'supply': {node['name']: float(outflow[i]) for i, node in enumerate(nodes) if fixed[i]},
+        'continuity_error': float(np.max(np.abs((outflow + demand)[~fixed]), initial=0.0)),
+    }
+
+
+def format_report(result, limit=None):
+    """Multi-line report of a solve_network result (segments up to limit)."""
+    status = "✓ Converged" if result['converged'] else "✗ Did not converge"
+    lines = [f"{status} in {result['iterations']} iteration(s) - {result['fluid']} "
+             f"({result['density']:.2f} lb/ft³, {result['viscosity']:.2f} cP)"]
+    lines.append("  Supply:")
+    for name, supply in result['supply'].items():
+        lines.append(f"    {name:<20} {supply:10.1f} GPM")
+    lines.append("  Segments:              flow GPM    vel ft/s     ΔP psi")
+    segments = list(result['flows'])
+    shown = segments if limit is None else segments[:limit]
+    for name in shown:
+        lines.append(f"    {name:<20} {result['flows'][name]:10.1f} {result['velocities'][name]:10.2f} "
+                     f"{result['pressure_drops'][name]:10.3f}")
+    if len(shown) < len(segments):
+        lines.append(f"    ... and {len(segments) - len(shown)} more")
+    lines.append("  Nodes:                 pressure psig")
+    nodes = list(result['pressures'])
+    shown = nodes if limit is None else nodes[:limit]
+    for name in shown:
+        lines.append(f"    {name:<20} {result['pressures'][name]:10.2f}")
+    if len(shown) < len(nodes):
+        lines.append(f"    ... and {len(nodes) - len(shown)} more")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Solve a piping network (JSON: nodes, segments)")
+    parser.add_argument("network", help="Network JSON file")
+    parser.add_argument("--friction", default='colebrook', help="swamee_jain, colebrook or colebrook_grid")
+    parser.add_argument("--limit", type=int, default=50, help="Rows listed (default 50, 0 = all)")
+    args = parser.parse_args()
+
+    network = load_network(args.network)
+    start = time.perf_counter()
+    solved = solve_network(network['nodes'], network['segments'], network['fluid_name'],
+                           network['temperature_f'], pipe_material=network['pipe_material'],
+                           friction_method=args.friction)
+    elapsed = time.perf_counter() - start
+    print(format_report(solved, limit=args.limit or None))
+    print(f"Solved {len(network['segments'])} segments in {elapsed * 1000:.1f} ms")
+    sys.exit(0 if solved['converged'] else 1)
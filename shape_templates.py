@@ -0,0 +1,128 @@
+"""
+Shape Template Cache - pythonocc
+In-process LRU cache of primitive solids keyed on rounded dimensions.
+
+Studs, nut bodies, CFS punchouts and bolt-hole cylinders are built once per
+distinct size and reused. A cached TopoDS_Shape is shared - never modify it;
+put it where it belongs with place(), which returns a new shape that
+references the same geometry under a gp_Trsf location (no rebuild, no copy).
+
+    @template("stud")
+    def make_stud_cylinder(diameter_mm, length_mm): ...
+
+    stud = make_stud_cylinder(22.2, 165.1)       # built
+    stud = make_stud_cylinder(22.2, 165.1)       # cached
+    moved = place(stud, translation(100, 0, 0))  # shares stud's geometry
+"""
+
+import functools
+import threading
+from collections import OrderedDict
+from OCC.Core.gp import gp_Trsf, gp_Vec, gp_Ax1, gp_Pnt, gp_Dir
+from OCC.Core.TopLoc import TopLoc_Location
+from OCC.Core.BRepBuilderAPI import BRepBuilderAPI_Transform
+
+MAX_TEMPLATES = 256  # distinct shapes kept per process
+KEY_DIGITS = 4       # dimensions equal to 4 decimals share a template
+
+_templates = OrderedDict()
+_lock = threading.Lock()
+_stats = {'hits': 0, 'misses': 0}
+
+
+def _round(value):
+    if isinstance(value, float):
+        return round(value, KEY_DIGITS)
+    return value
+
+
+def template_key(kind, *args, **kwargs):
+    """Cache key: template kind plus rounded positional and keyword arguments."""
+    return (kind,
+            tuple(_round(a) for a in args),
+            tuple(sorted((k, _round(v)) for k, v in kwargs.items())))
+
+
+def get_template(kind, builder, *args, **kwargs):
+    """
+    Return the cached shape for these dimensions, building it on a miss.
+
+    Args:
+        kind: Template family name ('stud', 'hex_nut', ...)
+        builder: Function building the shape from args/kwargs
+    """
+    key = template_key(kind, *args, **kwargs)
+    with _lock:
+        shape = _templates.get(key)
+        if shape is not None:
+            _templates.move_to_end(key)
+            _stats['hits'] += 1
+            return shape
+
+    # Build outside the lock - OCC builds can take a while
+    shape = builder(*args, **kwargs)
+
+    with _lock:
+        _stats['misses'] += 1
+        _templates[key] = shape
+        _templates.move_to_end(key)
+        while len(_templates) > MAX_TEMPLATES:
+            _templates.popitem(last=False)
+    return shape
+
+
+def template(kind):
+    """Decorator: cache a primitive builder's result with get_template."""
+    def decorator(builder):
+        @functools.wraps(builder)
+        def wrapper(*args, **kwargs):
+            return get_template(kind, builder, *args, **kwargs)
+        wrapper.uncached = builder
+        return wrapper
+    return decorator
+
+
+def translation(dx, dy, dz):
+    """gp_Trsf moving by (dx, dy, dz)."""
+    trsf = gp_Trsf()
+    trsf.SetTranslation(gp_Vec(dx, dy, dz))
+    return trsf
+
+
+def rotation_z(angle_rad):
+    """gp_Trsf rotating about the Z axis through the origin."""
+    trsf = gp_Trsf()
+    trsf.SetRotation(gp_Ax1(gp_Pnt(0, 0, 0), gp_Dir(0, 0, 1)), angle_rad)
+    return trsf
+
+
+def place(shape, trsf, copy=False):
+    """
+    Position a template.
+
+    Args:
+        shape: Template shape (left untouched)
+        trsf: gp_Trsf placement
+        copy: True to duplicate the geometry (only needed if the result is
+              going to be modified in place); False shares it via a location
+
+    Returns:
+        TopoDS_Shape
+    """
+    if copy:
+        return BRepBuilderAPI_Transform(shape, trsf, True).Shape()
+    return shape.Moved(TopLoc_Location(trsf))
+
+
+def clear_templates():
+    """Drop every cached template."""
+    with _lock:
+        _templates.clear()
+        _stats['hits'] = 0
+        _stats['misses'] = 0
+
+
+def template_stats():
+    """Cache size and hit/miss counts."""
+    with _lock:
+        return {'templates': len(_templates), 'hits': _stats['hits'], 'misses': _stats['misses']}
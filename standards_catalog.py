@@ -0,0 +1,685 @@
+"""
+Standards Catalog - compiled SQLite lookup tables
+Lazily loaded replacement for importing the standards data modules.
+
+gasket_data, flange_data, asme_b165_stud_data and heavy_hex_nut_data are
+large dict literals; importing one parses and materializes every table in
+it, in every worker process, even when a job needs one gasket. This module
+compiles the answers of their accessors into one SQLite file and serves
+each call with a single indexed row read:
+
+    from standards_catalog import get_gasket_info, get_flange_info
+
+    gasket = get_gasket_info('4', 150, 'spiral_wound')
+    flange = get_flange_info('4', '150')
+
+The accessors keep the data modules' signatures and results. The build
+step calls every accessor over its whole argument domain (classes, types,
+series and every size key found in the module) and stores the non-empty
+answers, so the catalog cannot disagree with the dispatch logic in the data
+modules. Arguments outside that domain (e.g. a class passed as '150'
+instead of 150) fall through to the original accessor.
+
+On top of the accessors the catalog joins every bolted joint - flange,
+gasket, ring number, stud and nut - into one record keyed on
+(standard, series, class, facing, nps), with secondary indexes by stud
+size and ring number. API 6BX joints take their flange and BX ring from
+the tables in generate_all_flanges_test, read as literals so the build
+does not need OCC. The index is loaded into dicts once per process:
+
+    joint = get_joint('B16.5', '4', 600, 'RTJ')
+    joint['ring_number'], joint['stud']['stud_length_mm'], joint['nut_size']
+
+    joints_by_stud_size('7/8')     # every joint bolted with 7/8" studs
+    joints_by_ring_number('R37')   # every joint sealed with an R37 ring
+
+Every flange table row and every ring gasket is listed as well, so the
+tables can be checked against each other (see standards_validator.py):
+
+    list_flange_rows()             # (standard, series, class, nps, ring)
+    get_ring_info('BX-156')
+
+The catalog is rebuilt automatically when a data module changes (size or
+mtime), or explicitly:
+
+    python standards_catalog.py --build
+
+Layout:
+    ~/.equationparadise/standards_catalog.sqlite
+        records(id, data)          distinct JSON records
+        lookups(key, record_id)    accessor + arguments -> record
+        domains(accessor, data)    argument values compiled per accessor
+        joints(standard, series, pressure_class, facing, nps,
+               stud_size, ring_number, data)    joined joint records
+        flange_rows(standard, series, pressure_class, nps, ring_number)
+        rings(ring_number, data)   R, RX and BX ring gaskets
+        meta(name, value)          source signature, build time
+"""
+
+import os
+import sys
+import ast
+import json
+import re
+import time
+import sqlite3
+import tempfile
+import argparse
+import importlib
+import itertools
+import threading
+from fractions import Fraction
+from pathlib import Path
+
+from nps_key import format_size, parse_size
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, script_dir)
+
+CATALOG_PATH = Path.home() / ".equationparadise" / "standards_catalog.sqlite"
+CATALOG_VERSION = 3
+
+# Argument domains compiled for each data module accessor. 'nps' / 'size'
+# domains are filled from the keys of every table in the module at build time.
+ACCESSORS = {
+    'get_gasket_info': {
+        'module': 'gasket_data',
+        'args': ('nps', 'pressure_class', 'gasket_type', 'series'),
+        'domain': {
+            # None: ring joint lookups by ring number ignore the class
+            'pressure_class': (None, 150, 300, 400, 600, 900, 1500, 2500),
+            'gasket_type': ('full_face', 'flat_ring', 'ring', 'spiral_wound', 'ring_joint'),
+            'series': (None, 'A', 'B'),
+        },
+    },
+    'list_gasket_sizes': {
+        'module': 'gasket_data',
+        'args': ('pressure_class', 'gasket_type', 'series'),
+        'domain': {
+            'pressure_class': (150, 300, 400, 600, 900, 1500, 2500),
+            'gasket_type': ('full_face', 'flat_ring', 'ring', 'spiral_wound', 'ring_joint'),
+            'series': (None, 'A', 'B'),
+        },
+    },
+    'get_flange_info': {
+        'module': 'flange_data',
+        'args': ('nps', 'pressure_class', 'flange_type', 'series'),
+        'domain': {
+            'pressure_class': ('150', '300', '400', '600', '900', '1500', '2500'),
+            'flange_type': ('RF-WN', 'RF-BLIND'),
+            'series': ('B16.5', 'B16.47-A', 'B16.47-B'),
+        },
+    },
+    'list_available_sizes': {
+        'module': 'flange_data',
+        'args': ('pressure_class', 'series'),
+        'domain': {
+            'pressure_class': ('150', '300', '400', '600', '900', '1500', '2500'),
+            'series': ('B16.5', 'B16.47-A', 'B16.47-B'),
+        },
+    },
+    'get_b165_stud_info': {
+        'module': 'asme_b165_stud_data',
+        'args': ('nps', 'pressure_class', 'facing_type'),
+        'domain': {
+            'pressure_class': (150, 300, 400, 600, 900, 1500, 2500),
+            'facing_type': ('RF', 'RTJ'),
+        },
+    },
+    'list_b165_sizes': {
+        'module': 'asme_b165_stud_data',
+        'args': ('pressure_class',),
+        'domain': {
+            'pressure_class': (150, 300, 400, 600, 900, 1500, 2500),
+        },
+    },
+    'get_heavy_hex_nut_info': {
+        'module': 'heavy_hex_nut_data',
+        'args': ('size', 'nut_type'),
+        'domain': {
+            'nut_type': ('standard', '2h'),
+        },
+    },
+    'list_heavy_hex_nut_sizes': {
+        'module': 'heavy_hex_nut_data',
+        'args': ('nut_type',),
+        'domain': {
+            'nut_type': ('standard', '2h'),
+        },
+    },
+}
+
+# Stud tables that define the joints: (module, table name pattern)
+# -> (standard, series, class, facing)
+JOINT_TABLES = (
+    ('asme_b165_stud_data', re.compile(r'B165_CLASS_(\d+)(_RTJ)?_STUDS$'), 'B16.5'),
+    ('asme_b165_stud_data', re.compile(r'B1647([AB])_CLASS_(\d+)(_RTJ)?_STUDS$'), 'B16.47'),
+    ('api_6b_stud_data', re.compile(r'API_6B_(\d+)_STUDS$'), 'API 6B'),
+    ('api_6bx_stud_data', re.compile(r'API_6BX_(\d+)_STUDS$'), 'API 6BX'),
+)
+
+# API 6BX flange and BX ring tables live in the OCC flange generator
+API_FLANGE_MODULE = 'generate_all_flanges_test'
+API_6BX_FLANGE_TABLE = re.compile(r'API_6BX_(\d+)K$')
+API_6BX_FLANGE_FIELDS = ('B', 'OD', 'C', 'E1', 'Q', 'G', 'K', 'T', 'J1', 'J2', 'J3',
+                         'J4', 'R', 'BC', 'N', 'H', 'RingNo')
+
+# Standards generate_stud can build a stud for (B16.5 RF tables only)
+STUD_GENERATOR_STANDARDS = {('B16.5', 'RF'), ('API 6B', 'RTJ'), ('API 6BX', 'RTJ')}
+
+STANDARD_ALIASES = {
+    'ASME B16.5': 'B16.5', 'B165': 'B16.5',
+    'ASME B16.47': 'B16.47', 'B1647': 'B16.47',
+    '6B': 'API 6B', 'API6B': 'API 6B',
+    '6BX': 'API 6BX', 'API6BX': 'API 6BX',
+}
+
+SOURCE_MODULES = sorted({spec['module'] for spec in ACCESSORS.values()} |
+                        {module for module, _, _ in JOINT_TABLES} |
+                        {API_FLANGE_MODULE})
+
+_local = threading.local()
+_build_lock = threading.Lock()
+_domains = None
+_joint_index = None
+_flange_rows = None
+_size_lists = {}
+
+
+def inches_to_nut_size(diameter_inches):
+    """Stud diameter in inches to a nut size key: 0.625 -> '5/8', 1.125 -> '1-1/8'."""
+    return format_size(Fraction(diameter_inches).limit_denominator(16))
+
+
+def _size_key(size):
+    """Canonical stud size key from '5/8', '1-1/8', '1', 0.625 ..."""
+    return format_size(parse_size(size))
+
+
+def ring_key(ring_number):
+    """'R-37', 'r37', 'RX 37' -> 'R37' / 'RX37'."""
+    return ring_number.upper().replace('-', '').replace(' ', '') if ring_number else None
+
+
+# =============================================================================
+# BUILD
+# =============================================================================
+
+def _source_signature():
+    """Size and mtime of every source data module - any edit forces a rebuild."""
+    parts = [f"v{CATALOG_VERSION}"]
+    for module in SOURCE_MODULES:
+        path = os.path.join(script_dir, module + ".py")
+        try:
+            stat = os.stat(path)
+            parts.append(f"{module}:{stat.st_size}:{stat.st_mtime_ns}")
+        except OSError:
+            parts.append(f"{module}:missing")
+    return "|".join(parts)
+
+
+def _table_keys(module):
+    """Every key of every dict-of-dicts table in a data module."""
+    keys = set()
+    for value in vars(module).values():
+        if isinstance(value, dict) and value and all(isinstance(v, dict) for v in value.values()):
+            keys.update(k for k in value if isinstance(k, str))
+    return sorted(keys)
+
+
+def _lookup_key(accessor, args):
+    return json.dumps([accessor] + list(args))
+
+
+def build_catalog(path=None):
+    """
+    Compile the data module accessors into the SQLite catalog.
+
+    Args:
+        path: Catalog file (default: CATALOG_PATH)
+
+    Returns:
+        dict with 'path', 'records', 'lookups', 'elapsed'
+    """
+    start = time.perf_counter()
+    path = Path(path or CATALOG_PATH)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    signature = _source_signature()
+
+    records = {}
+    lookups = []
+    domains = {}
+    for accessor, spec in ACCESSORS.items():
+        module = importlib.import_module(spec['module'])
+        function = getattr(module, accessor)
+        domain = dict(spec['domain'])
+        for size_arg in ('nps', 'size'):
+            if size_arg in spec['args']:
+                domain[size_arg] = tuple(_table_keys(module))
+        domains[accessor] = {name: list(values) for name, values in domain.items()}
+
+        for args in itertools.product(*(domain[name] for name in spec['args'])):
+            result = function(*args)
+            if not result:
+                continue
+            data = json.dumps(result, sort_keys=True)
+            record_id = records.setdefault(data, len(records) + 1)
+            lookups.append((_lookup_key(accessor, args), record_id))
+
+    joints = _build_joints()
+    flange_rows = _build_flange_rows()
+    rings = _ring_tables()
+
+    # Write to a temporary file and swap it in - other processes may be reading
+    fd, tmp_path = tempfile.mkstemp(prefix=".catalog_", suffix=".sqlite", dir=str(path.parent))
+    os.close(fd)
+    try:
+        conn = sqlite3.connect(tmp_path)
+        conn.executescript("""
+            CREATE TABLE records (id INTEGER PRIMARY KEY, data TEXT NOT NULL);
+            CREATE TABLE lookups (key TEXT PRIMARY KEY, record_id INTEGER NOT NULL) WITHOUT ROWID;
+            CREATE TABLE domains (accessor TEXT PRIMARY KEY, data TEXT NOT NULL);
+            CREATE TABLE joints (
+                standard TEXT, series TEXT, pressure_class INTEGER, facing TEXT, nps TEXT,
+                stud_size TEXT, ring_number TEXT, data TEXT NOT NULL,
+                PRIMARY KEY (standard, series, pressure_class, facing, nps));
+            CREATE INDEX joints_stud_size ON joints (stud_size);
+            CREATE INDEX joints_ring_number ON joints (ring_number);
+            CREATE TABLE flange_rows (
+                standard TEXT, series TEXT, pressure_class INTEGER, nps TEXT, ring_number TEXT,
+                PRIMARY KEY (standard, series, pressure_class, nps));
+            CREATE TABLE rings (ring_number TEXT PRIMARY KEY, data TEXT NOT NULL);
+            CREATE TABLE meta (name TEXT PRIMARY KEY, value TEXT);
+        """)
+        conn.executemany("INSERT OR REPLACE INTO joints VALUES (?, ?, ?, ?, ?, ?, ?, ?)", (
+            (j['standard'], j['series'] or '', j['pressure_class'], j['facing'], j['nps'],
+             j['nut_size'], ring_key(j['ring_number']), json.dumps(j, sort_keys=True))
+            for j in joints))
+        conn.executemany("INSERT OR REPLACE INTO flange_rows VALUES (?, ?, ?, ?, ?)", (
+            (standard, series or '', pressure_class, nps, ring_number)
+            for standard, series, pressure_class, nps, ring_number in flange_rows))
+        conn.executemany("INSERT INTO rings VALUES (?, ?)", (
+            (ring_key(number), json.dumps(ring, sort_keys=True)) for number, ring in rings.items()))
+        conn.executemany("INSERT INTO records VALUES (?, ?)", ((i, d) for d, i in records.items()))
+        conn.executemany("INSERT INTO lookups VALUES (?, ?)", lookups)
+        conn.executemany("INSERT INTO domains VALUES (?, ?)",
+                         ((a, json.dumps(d)) for a, d in domains.items()))
+        conn.executemany("INSERT INTO meta VALUES (?, ?)", [
+            ('signature', signature),
+            ('built', time.strftime("%Y-%m-%d %H:%M:%S")),
+        ])
+        conn.commit()
+        conn.close()
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+    return {
+        'path': str(path),
+        'records': len(records),
+        'lookups': len(lookups),
+        'joints': len(joints),
+        'flange_rows': len(flange_rows),
+        'rings': len(rings),
+        'elapsed': time.perf_counter() - start,
+    }
+
+
+def _module_literals(module_name, pattern):
+    """
+    Top-level literal assignments whose names match pattern, read from the
+    module source without importing it (so no OCC import for generator
+    modules). Returns {} when the module is not installed.
+    """
+    path = os.path.join(script_dir, module_name + ".py")
+    if not os.path.isfile(path):
+        return {}
+    with open(path, encoding='utf-8') as f:
+        tree = ast.parse(f.read(), path)
+    tables = {}
+    for node in tree.body:
+        if (isinstance(node, ast.Assign) and len(node.targets) == 1
+                and isinstance(node.targets[0], ast.Name) and pattern.match(node.targets[0].id)):
+            tables[node.targets[0].id] = ast.literal_eval(node.value)
+    return tables
+
+
+def _api_6bx_tables():
+    """API 6BX flanges {rating psi: {nps: dict}} and BX rings {'BX-156': dict}."""
+    literals = _module_literals(API_FLANGE_MODULE, re.compile(r'(API_6BX_\d+K|BX_RINGS)$'))
+    flanges = {}
+    for name, table in literals.items():
+        match = API_6BX_FLANGE_TABLE.match(name)
+        if match:
+            flanges[int(match.group(1)) * 1000] = {
+                nps: dict(zip(API_6BX_FLANGE_FIELDS, row)) for nps, row in table.items()}
+    bx_rings = {f"BX-{number}": dict(ring, ring_number=f"BX-{number}")
+                for number, ring in literals.get('BX_RINGS', {}).items()}
+    return flanges, bx_rings
+
+
+def _ring_tables():
+    """Every ring gasket by its table ring number ('R-37', 'RX-37', 'BX-156')."""
+    gasket_data = importlib.import_module('gasket_data')
+    rings = {}
+    rings.update(gasket_data.RING_JOINT_TYPE_R_GASKETS)
+    rings.update(gasket_data.RING_JOINT_TYPE_RX_GASKETS)
+    rings.update(_api_6bx_tables()[1])
+    return rings
+
+
+def _build_flange_rows():
+    """(standard, series, class, nps, ring number) of every flange table row."""
+    flange_data = importlib.import_module('flange_data')
+    rows = []
+    for (flange_series, flange_type), class_map in flange_data.FLANGE_TABLES.items():
+        if flange_type != 'RF-WN':
+            continue
+        standard, _, series = flange_series.partition('-')
+        for pressure_class, table in class_map.items():
+            rows.extend((standard, series or None, int(pressure_class), nps, None) for nps in table)
+    api_flanges, _ = _api_6bx_tables()
+    for rating, table in api_flanges.items():
+        rows.extend(('API 6BX', None, rating, nps, f"BX-{flange['RingNo']}") for nps, flange in table.items())
+    return rows
+
+
+def _build_joints():
+    """Join flange, gasket, ring, stud and nut data for every stud table row."""
+    gasket_data = importlib.import_module('gasket_data')
+    flange_data = importlib.import_module('flange_data')
+    nut_data = importlib.import_module('heavy_hex_nut_data')
+    rings = {ring_key(k): v for k, v in _ring_tables().items()}
+    api_flanges, _ = _api_6bx_tables()
+
+    joints = []
+    for module_name, pattern, standard in JOINT_TABLES:
+        module = importlib.import_module(module_name)
+        for table_name, table in sorted(vars(module).items()):
+            match = pattern.match(table_name)
+            if not match or not isinstance(table, dict):
+                continue
+            groups = match.groups()
+            series = groups[0] if standard == 'B16.47' else None
+            pressure_class = int(groups[1] if series else groups[0])
+            if standard.startswith('API'):
+                facing = 'RTJ'
+            else:
+                facing = 'RTJ' if groups[-1] else 'RF'
+
+            for nps, stud in table.items():
+                nut_size = inches_to_nut_size(stud['stud_diameter_inches'])
+                ring_number = stud.get('ring_number')
+                flange = None
+                gasket = None
+                if standard in ('B16.5', 'B16.47'):
+                    flange_series = 'B16.5' if standard == 'B16.5' else f"B16.47-{series}"
+                    flange = flange_data.get_flange_info(nps, str(pressure_class), 'RF-WN', flange_series)
+                    if facing == 'RTJ':
+                        gasket = rings.get(ring_key(ring_number))
+                    else:
+                        gasket = gasket_data.get_gasket_info(nps, pressure_class, 'spiral_wound', series)
+                elif standard == 'API 6BX':
+                    flange = api_flanges.get(pressure_class, {}).get(nps)
+                    if flange:
+                        ring_number = f"BX-{flange['RingNo']}"
+                        gasket = rings.get(ring_key(ring_number))
+                joints.append({
+                    'standard': standard,
+                    'series': series,
+                    'pressure_class': pressure_class,
+                    'facing': facing,
+                    'nps': nps,
+                    'flange': flange,
+                    'gasket': gasket,
+                    'ring_number': ring_number,
+                    'stud': stud,
+                    'nut_size': nut_size,
+                    'nut': nut_data.get_heavy_hex_nut_info(nut_size, '2h'),
+                })
+    return joints
+
+
+# =============================================================================
+# LOOKUP
+# =============================================================================
+
+def _catalog_is_current(path):
+    try:
+        conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        try:
+            row = conn.execute("SELECT value FROM meta WHERE name = 'signature'").fetchone()
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        return False
+    return row is not None and row[0] == _source_signature()
+
+
+def _connection():
+    """Read-only connection for this thread, building the catalog first if stale."""
+    conn = getattr(_local, 'conn', None)
+    if conn is not None:
+        return conn
+    with _build_lock:
+        if not _catalog_is_current(CATALOG_PATH):
+            build_catalog(CATALOG_PATH)
+    conn = sqlite3.connect(f"file:{CATALOG_PATH}?mode=ro", uri=True)
+    _local.conn = conn
+    return conn
+
+
+def _domain(accessor):
+    global _domains
+    if _domains is None:
+        rows = _connection().execute("SELECT accessor, data FROM domains").fetchall()
+        # Typed members, so 150 and '150' (or 1 and True) are told apart
+        _domains = {a: {name: {(type(v).__name__, v) for v in values} for name, values in json.loads(d).items()}
+                    for a, d in rows}
+    return _domains[accessor]
+
+
+def _lookup(accessor, *args):
+    """
+    Answer one accessor call from the catalog.
+
+    Arguments inside the compiled domain are answered by one row read
+    (None when the table has no such row); anything else is passed to the
+    original accessor in its data module.
+    """
+    spec = ACCESSORS[accessor]
+    domain = _domain(accessor)
+    try:
+        in_domain = all((type(value).__name__, value) in domain[name]
+                        for name, value in zip(spec['args'], args))
+    except TypeError:  # unhashable argument
+        in_domain = False
+    if not in_domain:
+        module = importlib.import_module(spec['module'])
+        return getattr(module, accessor)(*args)
+
+    row = _connection().execute(
+        "SELECT records.data FROM lookups JOIN records ON records.id = lookups.record_id "
+        "WHERE lookups.key = ?", (_lookup_key(accessor, args),)
+    ).fetchone()
+    if row is None:
+        return None
+    return json.loads(row[0])
+
+
+# =============================================================================
+# JOINT INDEX
+# =============================================================================
+
+def _joints():
+    """Load the joint records into in-memory indexes (once per process)."""
+    global _joint_index
+    if _joint_index is None:
+        rows = _connection().execute("SELECT data FROM joints").fetchall()
+        by_key, by_stud, by_ring, longest = {}, {}, {}, {}
+        for (data,) in rows:
+            joint = json.loads(data)
+            by_key[(joint['standard'], joint['series'], joint['pressure_class'],
+                    joint['facing'], joint['nps'])] = joint
+            by_stud.setdefault(joint['nut_size'], []).append(joint)
+            if joint['ring_number']:
+                by_ring.setdefault(ring_key(joint['ring_number']), []).append(joint)
+            if (joint['standard'], joint['facing']) in STUD_GENERATOR_STANDARDS:
+                best = longest.get(joint['nut_size'])
+                if best is None or joint['stud']['stud_length_mm'] > best['stud']['stud_length_mm']:
+                    longest[joint['nut_size']] = joint
+        _joint_index = {'key': by_key, 'stud': by_stud, 'ring': by_ring, 'longest': longest}
+    return _joint_index
+
+
+def get_joint(standard, nps, pressure_class, facing='RF', series=None):
+    """
+    Joined record for one bolted joint.
+
+    Args:
+        standard: 'B16.5', 'B16.47', 'API 6B', 'API 6BX' (or 'ASME B16.5', '6BX', ...)
+        nps: Size key ('4', '1-1/2', '13-5/8')
+        pressure_class: 150 ... 2500, or API rating psi (5000)
+        facing: 'RF' or 'RTJ' (API joints are always 'RTJ')
+        series: 'A' or 'B' for B16.47, None otherwise
+
+    Returns:
+        dict with 'flange', 'gasket', 'ring_number', 'stud', 'nut', 'nut_size'
+        (flange/gasket None where the catalog has no table), or None
+    """
+    standard = STANDARD_ALIASES.get(standard.upper(), standard) if isinstance(standard, str) else standard
+    if standard.startswith('API'):
+        facing = 'RTJ'
+    try:
+        pressure_class = int(str(pressure_class).upper().replace('K', '000'))
+    except ValueError:
+        return None
+    return _joints()['key'].get((standard, series, pressure_class, facing.upper(), nps))
+
+
+def joints_by_stud_size(size):
+    """Every joint bolted with this stud size ('7/8', '1-1/8', 0.875)."""
+    return list(_joints()['stud'].get(_size_key(size), ()))
+
+
+def joints_by_ring_number(ring_number):
+    """Every joint sealed with this ring ('R37', 'R-37', 'RX37')."""
+    return list(_joints()['ring'].get(ring_key(ring_number), ()))
+
+
+def longest_stud_for_size(size):
+    """
+    Joint with the longest stud of this size that generate_stud can build
+    (B16.5 RF, API 6B, API 6BX), or None.
+    """
+    return _joints()['longest'].get(_size_key(size))
+
+
+def list_joints():
+    """Every joint record in the catalog."""
+    return tuple(_joints()['key'].values())
+
+
+def list_flange_rows():
+    """
+    (standard, series, pressure_class, nps, ring_number) of every flange
+    table row: B16.5 / B16.47 weld neck tables and the API 6BX tables.
+    """
+    global _flange_rows
+    if _flange_rows is None:
+        rows = _connection().execute(
+            "SELECT standard, series, pressure_class, nps, ring_number FROM flange_rows").fetchall()
+        _flange_rows = tuple((standard, series or None, pressure_class, nps, ring_number)
+                             for standard, series, pressure_class, nps, ring_number in rows)
+    return _flange_rows
+
+
+def list_ring_numbers():
+    """Normalized numbers of every R, RX and BX ring ('R37', 'RX37', 'BX156')."""
+    return frozenset(row[0] for row in _connection().execute("SELECT ring_number FROM rings"))
+
+
+def get_ring_info(ring_number):
+    """Ring gasket dimensions by ring number ('R-37', 'RX37', 'BX-156') or None."""
+    row = _connection().execute("SELECT data FROM rings WHERE ring_number = ?",
+                                (ring_key(ring_number),)).fetchone()
+    return json.loads(row[0]) if row else None
+
+
+# =============================================================================
+# ACCESSORS (same signatures as the data modules)
+# =============================================================================
+
+def _lookup_sizes(accessor, *args):
+    """Size list accessor answer as a tuple, cached per typed argument set."""
+    key = (accessor,) + tuple((type(a).__name__, a) for a in args)
+    try:
+        return _size_lists[key]
+    except KeyError:
+        pass
+    except TypeError:  # unhashable argument
+        return tuple(_lookup(accessor, *args) or ())
+    sizes = tuple(_lookup(accessor, *args) or ())
+    _size_lists[key] = sizes
+    return sizes
+
+
+def get_gasket_info(nps, pressure_class, gasket_type='full_face', series=None):
+    """Gasket dimensions (see gasket_data.get_gasket_info) or None."""
+    return _lookup('get_gasket_info', nps, pressure_class, gasket_type, series)
+
+
+def list_gasket_sizes(pressure_class, gasket_type='full_face', series=None):
+    """Sorted gasket sizes (see gasket_data.list_gasket_sizes)."""
+    return _lookup_sizes('list_gasket_sizes', pressure_class, gasket_type, series)
+
+
+def get_flange_info(nps, pressure_class='150', flange_type='RF-WN', series='B16.5'):
+    """Flange dimensions (see flange_data.get_flange_info) or None."""
+    return _lookup('get_flange_info', nps, pressure_class, flange_type, series)
+
+
+def list_available_sizes(pressure_class='150', series='B16.5'):
+    """Sorted flange sizes (see flange_data.list_available_sizes)."""
+    return _lookup_sizes('list_available_sizes', pressure_class, series)
+
+
+def get_b165_stud_info(nps, pressure_class, facing_type='RF'):
+    """B16.5 stud dimensions (see asme_b165_stud_data.get_b165_stud_info) or None."""
+    return _lookup('get_b165_stud_info', nps, pressure_class, facing_type)
+
+
+def list_b165_sizes(pressure_class):
+    """Sorted B16.5 stud sizes (see asme_b165_stud_data.list_b165_sizes)."""
+    return _lookup_sizes('list_b165_sizes', pressure_class)
+
+
+def get_heavy_hex_nut_info(size, nut_type='standard'):
+    """Heavy hex nut dimensions (see heavy_hex_nut_data.get_heavy_hex_nut_info) or None."""
+    return _lookup('get_heavy_hex_nut_info', size, nut_type)
+
+
+def list_heavy_hex_nut_sizes(nut_type='standard'):
+    """Sorted heavy hex nut sizes (see heavy_hex_nut_data.list_heavy_hex_nut_sizes)."""
+    return _lookup_sizes('list_heavy_hex_nut_sizes', nut_type)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compile the standards data modules into the SQLite catalog")
+    parser.add_argument("--build", action="store_true", help="Rebuild the catalog now")
+    parser.add_argument("--path", default=None, help=f"Catalog file (default: {CATALOG_PATH})")
+    args = parser.parse_args()
+
+    if args.path:
+        CATALOG_PATH = Path(args.path)
+
+    if args.build or not _catalog_is_current(CATALOG_PATH):
+        stats = build_catalog(CATALOG_PATH)
+        print(f"[SUCCESS] Built {stats['path']}")
+        print(f"  {stats['lookups']} lookups -> {stats['records']} records, "
+              f"{stats['joints']} joints, {stats['flange_rows']} flange rows, "
+              f"{stats['rings']} rings in {stats['elapsed']:.2f}s")
+    else:
+        print(f"✓ Catalog is current: {CATALOG_PATH}")
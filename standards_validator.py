@@ -0,0 +1,221 @@
+"""
+Standards Validator - cross-table consistency check of the standards catalog
+Finds the table rows a generation run would trip over, before it starts.
+
+Every check is a join over the compiled catalog (see standards_catalog.py):
+the joint records (flange + gasket + ring + stud + nut), the flange table
+rows and the ring gasket tables. One pass over them reports:
+
+    flange_without_stud     flange table row with no stud/bolting record
+    stud_without_flange     stud record with no flange table row
+    flange_without_gasket   joint with no gasket for its facing
+    ring_without_gasket     ring number with no R / RX / BX ring record
+    stud_without_nut        stud size with no 2H heavy hex nut
+    bolt_count_mismatch     flange bolt holes != stud count
+    bolt_size_mismatch      flange bolt size != stud diameter
+
+    from standards_validator import validate, format_report
+
+    issues = validate()                            # whole catalog
+    issues = validate('B16.5', 600, 'RTJ')         # one selection
+    print(format_report(issues))
+
+Also used as the pre-generation gate of cadgen batch, or on its own:
+
+    python standards_validator.py                  # exit status 1 on issues
+    python standards_validator.py --standard B16.47 --check flange_without_gasket
+"""
+
+import os
+import sys
+import argparse
+import time
+from fractions import Fraction
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, script_dir)
+
+import standards_catalog as catalog
+from nps_key import parse_size, size_sort_key
+
+CHECKS = {
+    'flange_without_stud': "Flange table row with no stud/bolting record",
+    'stud_without_flange': "Stud record with no flange table row",
+    'flange_without_gasket': "Joint with no gasket for its facing",
+    'ring_without_gasket': "Ring number with no R / RX / BX ring record",
+    'stud_without_nut': "Stud size with no 2H heavy hex nut",
+    'bolt_count_mismatch': "Flange bolt holes differ from stud count",
+    'bolt_size_mismatch': "Flange bolt size differs from stud diameter",
+}
+
+# Standards the catalog has flange tables for
+FLANGE_TABLE_STANDARDS = ('B16.5', 'B16.47', 'API 6BX')
+
+# Flange bolt sizes above this are in mm (B16.47 tables), below in inches
+BOLT_SIZE_MM_THRESHOLD = 6
+BOLT_SIZE_TOLERANCE_IN = Fraction(1, 32)
+
+
+def _issue(check, standard, series, pressure_class, facing, nps, detail):
+    return {
+        'check': check,
+        'standard': standard,
+        'series': series,
+        'pressure_class': pressure_class,
+        'facing': facing,
+        'nps': nps,
+        'detail': detail,
+    }
+
+
+def _bolt_size_inches(bolt_size):
+    """Flange table bolt size ('5/8', '1-1/8', '31.8' mm) as inches, or None."""
+    try:
+        value = parse_size(bolt_size)
+    except ValueError:
+        return None
+    return value / Fraction(254, 10) if value > BOLT_SIZE_MM_THRESHOLD else value
+
+
+def _joint_issues(joint, rings):
+    standard, series = joint['standard'], joint['series']
+    pressure_class, facing, nps = joint['pressure_class'], joint['facing'], joint['nps']
+    flange, stud = joint['flange'], joint['stud']
+
+    def issue(check, detail):
+        return _issue(check, standard, series, pressure_class, facing, nps, detail)
+
+    issues = []
+    if flange is None and standard in FLANGE_TABLE_STANDARDS:
+        issues.append(issue('stud_without_flange', "no flange table row"))
+
+    ring_number = joint['ring_number']
+    if ring_number and catalog.ring_key(ring_number) not in rings:
+        issues.append(issue('ring_without_gasket', f"ring {ring_number} not in the ring tables"))
+    elif flange is not None and joint['gasket'] is None and not ring_number:
+        gasket = 'ring gasket' if facing == 'RTJ' else 'spiral wound gasket'
+        issues.append(issue('flange_without_gasket', f"no {gasket}"))
+
+    if joint['nut'] is None:
+        issues.append(issue('stud_without_nut', f"no 2H nut for {joint['nut_size']}\" studs"))
+
+    if flange is not None:
+        holes = flange.get('bolt_holes', flange.get('N'))
+        studs = stud.get('number_of_bolts')
+        if holes and studs and holes != studs:
+            issues.append(issue('bolt_count_mismatch', f"flange has {holes} holes, stud table {studs} studs"))
+
+        bolt_inches = _bolt_size_inches(flange.get('bolt_size'))
+        stud_inches = Fraction(stud['stud_diameter_inches']).limit_denominator(64)
+        if bolt_inches is not None and abs(bolt_inches - stud_inches) > BOLT_SIZE_TOLERANCE_IN:
+            issues.append(issue('bolt_size_mismatch',
+                                f"flange bolt {flange['bolt_size']}, stud {joint['nut_size']}\""))
+    return issues
+
+
+def validate(standard=None, pressure_class=None, facing=None, series=None, sizes=None, checks=None):
+    """
+    Cross-check the standards tables.
+
+    Every argument narrows the selection; None means all.
+
+    Args:
+        standard: 'B16.5', 'B16.47', 'API 6B', 'API 6BX' (aliases as in get_joint)
+        pressure_class: 150 ... 2500, or API rating (5000 / '5K')
+        facing: 'RF' or 'RTJ'
+        series: 'A' or 'B' for B16.47
+        sizes: Iterable of NPS keys
+        checks: Iterable of CHECKS names
+
+    Returns:
+        list of issue dicts ('check', 'standard', 'series', 'pressure_class',
+        'facing', 'nps', 'detail'), in catalog order
+    """
+    if isinstance(standard, str):
+        standard = catalog.STANDARD_ALIASES.get(standard.upper(), standard)
+    if pressure_class is not None:
+        pressure_class = int(str(pressure_class).upper().replace('K', '000'))
+    facing = facing.upper() if facing else None
+    sizes = set(sizes) if sizes is not None else None
+    checks = set(checks) if checks is not None else set(CHECKS)
+
+    def selected(row_standard, row_series, row_class, row_facing, row_nps):
+        return ((standard is None or row_standard == standard)
+                and (series is None or row_series == series)
+                and (pressure_class is None or row_class == pressure_class)
+                and (facing is None or row_facing is None or row_facing == facing)
+                and (sizes is None or row_nps in sizes))
+
+    rings = catalog.list_ring_numbers()
+    joints = catalog.list_joints()
+
+    issues = []
+    joint_keys = set()
+    for joint in joints:
+        key = (joint['standard'], joint['series'], joint['pressure_class'], joint['facing'], joint['nps'])
+        joint_keys.add(key[:3] + key[4:])
+        if selected(*key):
+            issues.extend(_joint_issues(joint, rings))
+
+    for row_standard, row_series, row_class, row_nps, ring_number in catalog.list_flange_rows():
+        if not selected(row_standard, row_series, row_class, None, row_nps):
+            continue
+        if (row_standard, row_series, row_class, row_nps) not in joint_keys:
+            issues.append(_issue('flange_without_stud', row_standard, row_series, row_class, None, row_nps,
+                                 "no stud table row"))
+            # Rings of flanges with a joint are checked with the joint
+            if ring_number and catalog.ring_key(ring_number) not in rings:
+                issues.append(_issue('ring_without_gasket', row_standard, row_series, row_class, None,
+                                     row_nps, f"ring {ring_number} not in the ring tables"))
+
+    return [issue for issue in issues if issue['check'] in checks]
+
+
+def summarize(issues):
+    """check -> number of issues, in CHECKS order."""
+    counts = {check: 0 for check in CHECKS}
+    for issue in issues:
+        counts[issue['check']] += 1
+    return {check: count for check, count in counts.items() if count}
+
+
+def describe(issue):
+    """One line for an issue: 'B16.47-A Class 300 RTJ NPS 26: ...'"""
+    standard = issue['standard'] + (f"-{issue['series']}" if issue['series'] else '')
+    facing = f" {issue['facing']}" if issue['facing'] else ''
+    return (f"{standard} Class {issue['pressure_class']}{facing} NPS {issue['nps']}: "
+            f"{issue['check']} - {issue['detail']}")
+
+
+def format_report(issues, limit=None):
+    """Multi-line report: counts per check, then one line per issue (up to limit)."""
+    if not issues:
+        return "✓ Standards tables are consistent"
+    lines = [f"✗ {len(issues)} standards table issue(s):"]
+    for check, count in summarize(issues).items():
+        lines.append(f"  {check}: {count} ({CHECKS[check]})")
+    ordered = sorted(issues, key=lambda i: (i['check'], i['standard'], i['series'] or '',
+                                            i['pressure_class'], i['facing'] or '', size_sort_key(i['nps'])))
+    shown = ordered if limit is None else ordered[:limit]
+    lines.extend(f"  {describe(issue)}" for issue in shown)
+    if len(shown) < len(ordered):
+        lines.append(f"  ... and {len(ordered) - len(shown)} more")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Cross-check the standards tables in the compiled catalog")
+    parser.add_argument("--standard", default=None, help="B16.5, B16.47, API 6B or API 6BX")
+    parser.add_argument("--class", dest="pressure_class", default=None, help="Pressure class (150, 600, 5K ...)")
+    parser.add_argument("--facing", default=None, help="RF or RTJ")
+    parser.add_argument("--series", default=None, help="A or B (B16.47)")
+    parser.add_argument("--check", action="append", choices=list(CHECKS), help="Only these checks")
+    parser.add_argument("--limit", type=int, default=50, help="Issues listed (default 50, 0 = all)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    found = validate(args.standard, args.pressure_class, args.facing, args.series, checks=args.check)
+    elapsed = time.perf_counter() - start
+    print(format_report(found, limit=args.limit or None))
+    print(f"Checked in {elapsed * 1000:.1f} ms")
+    sys.exit(1 if found else 0)
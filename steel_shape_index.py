@@ -0,0 +1,325 @@
+"""
+Steel Shape Index - column-array index of the AISC shape databases
+Constant-time designation lookups without scanning AISC_SHAPES.
+
+aisc_shapes.AISC_SHAPES holds 2,300 shapes as dicts of every AISC column,
+and the generator only needs a handful of them. The old lookups scanned all
+keys with startswith() on every call (imperial W-shapes) or regrouped and
+re-sorted the whole database (shape listings). This module reads both
+databases once, keeps the profile dimensions in column arrays and resolves
+every designation through dicts:
+
+    import steel_shape_index as shapes
+
+    shapes.lookup('W310X74')            # {'Type': 'W', 'd': 12.1, 'bf': ...}
+    shapes.lookup_hss('HSS8X8X1/2')     # HSS_A1085 record
+    shapes.find_imperial_w('W12X50')    # ('W310X74', 'W12x49.7')
+    shapes.shapes_by_type()['C']        # sorted tuple of channel designations
+
+Records carry the shape type plus FIELDS (None where the database has no
+value). The index is cached in a JSON file and rebuilt when aisc_shapes.py
+or hss_a1085.py changes (size or mtime), so a normal start never iterates
+the databases:
+
+    python steel_shape_index.py --build
+
+Layout:
+    ~/.equationparadise/steel_shape_index.json
+        signature          source module signature
+        designations       one name per row (AISC rows, then HSS_A1085 rows)
+        types              shape type per row
+        columns            field -> value per row (null = missing)
+        aisc_rows          number of AISC rows
+        imperial_w         imperial prefix -> listed imperial designations
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import tempfile
+import argparse
+import importlib
+import threading
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, script_dir)
+
+INDEX_PATH = Path.home() / ".equationparadise" / "steel_shape_index.json"
+INDEX_VERSION = 1
+
+SOURCE_MODULES = ('aisc_shapes', 'hss_a1085')
+
+# Profile dimensions (inches) and nominal weight kept per shape
+FIELDS = ('d', 'bf', 'tw', 'tf', 'Ht', 'B', 'OD', 'tdes', 'W')
+
+# Imperial to Metric W-shape mapping (approximate depths)
+IMPERIAL_W_DEPTHS = {
+    'W44': 'W1100', 'W40': 'W1000', 'W36': 'W920', 'W33': 'W840',
+    'W30': 'W760', 'W27': 'W690', 'W24': 'W610', 'W21': 'W530',
+    'W18': 'W460', 'W16': 'W410', 'W14': 'W360', 'W12': 'W310',
+    'W10': 'W250', 'W8': 'W200', 'W6': 'W150', 'W5': 'W130', 'W4': 'W100'
+}
+
+# lb/ft -> kg/m
+LB_FT_TO_KG_M = 1.488
+
+_lock = threading.Lock()
+_index = None
+
+
+# =============================================================================
+# BUILD
+# =============================================================================
+
+def _source_signature():
+    """Size and mtime of both shape databases - any edit forces a rebuild."""
+    parts = [f"v{INDEX_VERSION}"]
+    for module in SOURCE_MODULES:
+        path = os.path.join(script_dir, module + ".py")
+        try:
+            stat = os.stat(path)
+            parts.append(f"{module}:{stat.st_size}:{stat.st_mtime_ns}")
+        except OSError:
+            parts.append(f"{module}:missing")
+    return "|".join(parts)
+
+
+def _load_database(module_name, table):
+    try:
+        return getattr(importlib.import_module(module_name), table)
+    except ImportError:
+        if module_name == 'aisc_shapes':
+            print("Error: aisc_shapes.py not found. Run generate_steel_data_modules.py first.")
+        else:
+            print("Warning: hss_a1085.py not found. HSS shapes will use AISC database.")
+        return {}
+
+
+def _shape_type(props):
+    # Column header of the AISC export carries a byte order mark
+    return props.get('﻿Type', props.get('Type'))
+
+
+def _number(value):
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def build_index(path=None):
+    """
+    Read both shape databases into column form and write the JSON cache.
+
+    Args:
+        path: Cache file (default: INDEX_PATH)
+
+    Returns:
+        dict: the raw index (as stored in the cache)
+    """
+    path = Path(path or INDEX_PATH)
+    aisc = _load_database('aisc_shapes', 'AISC_SHAPES')
+    hss = _load_database('hss_a1085', 'HSS_A1085')
+
+    designations, types = [], []
+    columns = {field: [] for field in FIELDS}
+    for database, default_type in ((aisc, None), (hss, 'HSS')):
+        for designation, props in database.items():
+            designations.append(designation)
+            types.append(_shape_type(props) or default_type)
+            for field in FIELDS:
+                columns[field].append(_number(props.get(field)))
+
+    # Imperial W listing in database order, as get_available_imperial_w_shapes showed it
+    imperial_w = {prefix: [] for prefix in IMPERIAL_W_DEPTHS}
+    metric_to_imperial = {metric: imperial for imperial, metric in IMPERIAL_W_DEPTHS.items()}
+    for row, designation in enumerate(designations[:len(aisc)]):
+        imperial_prefix = metric_to_imperial.get(designation.split('X', 1)[0]) if 'X' in designation else None
+        if imperial_prefix:
+            imperial_weight = (columns['W'][row] or 0) / LB_FT_TO_KG_M
+            imperial_w[imperial_prefix].append(f"{imperial_prefix}X{imperial_weight:.0f}")
+
+    raw = {
+        'signature': _source_signature(),
+        'built': time.strftime("%Y-%m-%d %H:%M:%S"),
+        'designations': designations,
+        'types': types,
+        'columns': columns,
+        'aisc_rows': len(aisc),
+        'imperial_w': imperial_w,
+    }
+
+    # Nothing to cache without the databases - try again next start
+    if aisc or hss:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(prefix=".steel_index_", suffix=".json", dir=str(path.parent))
+            with os.fdopen(fd, 'w') as f:
+                json.dump(raw, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Warning: could not write steel shape index {path}: {e}")
+    return raw
+
+
+def _compile(raw):
+    """Cached raw index -> column arrays, designation maps and sorted listings."""
+    designations = raw['designations']
+    types = raw['types']
+    aisc_rows = raw['aisc_rows']
+    columns = {field: array('d', (math.nan if v is None else v for v in values))
+               for field, values in raw['columns'].items()}
+
+    rows = {}
+    by_type = {}
+    w_series = {}
+    for row in range(aisc_rows):
+        designation = designations[row]
+        # First occurrence wins, as a dict lookup on the database would
+        rows.setdefault(designation, row)
+        by_type.setdefault(types[row] or 'UNKNOWN', []).append(designation)
+        if 'X' in designation:
+            w_series.setdefault(designation.split('X', 1)[0], []).append(row)
+    hss_rows = {designations[row]: row for row in range(aisc_rows, len(designations))}
+
+    # Weight-sorted rows per metric prefix; ties keep database order
+    weight = columns['W']
+    for prefix, series_rows in w_series.items():
+        series_rows.sort(key=lambda r: (0.0 if math.isnan(weight[r]) else weight[r], r))
+        w_series[prefix] = (array('d', (0.0 if math.isnan(weight[r]) else weight[r] for r in series_rows)),
+                            tuple(series_rows))
+
+    return {
+        'designations': designations,
+        'types': types,
+        'columns': columns,
+        'rows': rows,
+        'hss_rows': hss_rows,
+        'by_type': {shape_type: tuple(sorted(names)) for shape_type, names in by_type.items()},
+        'w_series': w_series,
+        'imperial_w': {prefix: tuple(names) for prefix, names in raw['imperial_w'].items()},
+        'imperial_matches': {},
+    }
+
+
+def _load():
+    """The compiled index, from the JSON cache when it is current (once per process)."""
+    global _index
+    if _index is None:
+        with _lock:
+            if _index is None:
+                raw = None
+                try:
+                    with open(INDEX_PATH) as f:
+                        raw = json.load(f)
+                    if raw.get('signature') != _source_signature():
+                        raw = None
+                except (OSError, ValueError):
+                    raw = None
+                _index = _compile(raw or build_index(INDEX_PATH))
+    return _index
+
+
+# =============================================================================
+# LOOKUP
+# =============================================================================
+
+def _record(index, row):
+    columns = index['columns']
+    record = {'Type': index['types'][row]}
+    for field in FIELDS:
+        value = columns[field][row]
+        record[field] = None if math.isnan(value) else value
+    return record
+
+
+def lookup(designation):
+    """AISC record for a database designation ('W310X74', 'C12X20.7'), or None."""
+    index = _load()
+    row = index['rows'].get(designation)
+    return _record(index, row) if row is not None else None
+
+
+def lookup_hss(designation):
+    """HSS_A1085 record for an imperial HSS designation, or None."""
+    index = _load()
+    row = index['hss_rows'].get(designation)
+    return _record(index, row) if row is not None else None
+
+
+def _closest_weight_row(weights, series_rows, target):
+    """Row whose weight is nearest target; on a tie the first in database order."""
+    i = bisect_left(weights, target)
+    candidates = []
+    if i < len(weights):
+        candidates.append(i)  # bisect_left: first of its run of equal weights
+    if i > 0:
+        candidates.append(bisect_left(weights, weights[i - 1]))
+    best = min(candidates, key=lambda c: (abs(weights[c] - target), series_rows[c]))
+    return series_rows[best]
+
+
+def find_imperial_w(designation):
+    """
+    Find metric designation from imperial W-shape designation
+    Example: 'W12X26' -> closest weight in the W310 series
+
+    Returns: (metric_designation, imperial_label) or (None, None)
+    """
+    index = _load()
+    match = index['imperial_matches'].get(designation)
+    if match is not None:
+        return match
+
+    match = (None, None)
+    parts = designation.replace('x', 'X').split('X') if designation.startswith('W') else ()
+    metric_prefix = IMPERIAL_W_DEPTHS.get(parts[0]) if len(parts) == 2 else None
+    series = index['w_series'].get(metric_prefix) if metric_prefix else None
+    if series:
+        try:
+            imperial_weight = float(parts[1])  # lb/ft
+        except ValueError:
+            imperial_weight = None
+        if imperial_weight is not None:
+            weights, series_rows = series
+            row = _closest_weight_row(weights, series_rows, imperial_weight * LB_FT_TO_KG_M)
+            actual_imperial_weight = index['columns']['W'][row] / LB_FT_TO_KG_M
+            match = (index['designations'][row], f"{parts[0]}x{actual_imperial_weight:.1f}")
+
+    index['imperial_matches'][designation] = match
+    return match
+
+
+def shapes_by_type():
+    """shape type -> sorted tuple of AISC designations"""
+    return _load()['by_type']
+
+
+def imperial_w_shapes():
+    """imperial prefix ('W12') -> tuple of imperial designations"""
+    return _load()['imperial_w']
+
+
+def hss_shapes():
+    """Every HSS_A1085 designation in database order."""
+    return tuple(_load()['hss_rows'])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the AISC steel shape index")
+    parser.add_argument("--build", action="store_true", help="Rebuild the index cache now")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    if args.build:
+        _index = _compile(build_index())
+    index = _load()
+    print(f"✓ Steel shape index ({time.perf_counter() - start:.2f}s): {INDEX_PATH}")
+    print(f"  {len(index['rows'])} AISC shapes, {len(index['hss_rows'])} HSS_A1085 shapes")
+    for shape_type, names in sorted(index['by_type'].items()):
+        print(f"  {shape_type}: {len(names)} shapes")
@@ -0,0 +1,284 @@
+"""
+STEP Assembly Writer - pythonocc XCAF
+Writes multi-instance STEP assemblies in which every instance references a
+single shared part definition, so N identical parts cost one B-rep in the
+file instead of N copies.
+
+    write_instanced_assembly          N copies of one part, side by side
+    write_flange_connection_assembly  bolted flange joint: two flanges mated
+                                      on the gasket, studs on the bolt circle,
+                                      a nut on each stud end
+"""
+
+from OCC.Core.STEPControl import STEPControl_Reader
+from OCC.Core.TDocStd import TDocStd_Document
+from OCC.Core.XCAFDoc import XCAFDoc_DocumentTool
+from OCC.Core.TCollection import TCollection_ExtendedString
+from OCC.Core.TDataStd import TDataStd_Name
+from OCC.Core.TopLoc import TopLoc_Location
+from OCC.Core.IFSelect import IFSelect_RetDone
+from OCC.Core.Bnd import Bnd_Box
+from OCC.Core.BRepBndLib import brepbndlib
+from OCC.Core.gp import gp_Trsf, gp_Vec, gp_Pnt, gp_Dir, gp_Ax1, gp_Lin
+from OCC.Core.IntCurvesFace import IntCurvesFace_ShapeIntersector
+from step_writer import StepWriteContext
+from standards_catalog import get_joint
+
+import os
+import math
+
+
+def read_step(filepath):
+    """Read a STEP file and return its shape."""
+    reader = STEPControl_Reader()
+    status = reader.ReadFile(str(filepath))
+    if status != IFSelect_RetDone:
+        raise RuntimeError(f"Failed to read STEP file: {filepath}")
+    reader.TransferRoots()
+    return reader.OneShape()
+
+
+def new_assembly_document():
+    """Create an XCAF document; returns (doc, shape_tool)."""
+    doc = TDocStd_Document(TCollection_ExtendedString("MDTV-CAF"))
+    shape_tool = XCAFDoc_DocumentTool.ShapeTool(doc.Main())
+    return doc, shape_tool
+
+
+def set_label_name(label, name):
+    """Attach a product name to an XCAF label."""
+    TDataStd_Name.Set(label, TCollection_ExtendedString(name))
+
+
+def write_assembly_document(doc, output_file):
+    """Write an XCAF document to STEP (AP214, mm)."""
+    # Parts read back from STEP are in the session unit (mm), so the
+    # assembly is written in mm - physical size is preserved either way
+    status = StepWriteContext("MM", "AP214").write_document(doc, output_file)
+    if status != IFSelect_RetDone:
+        raise RuntimeError(f"Failed to write STEP assembly: {output_file}")
+    return str(output_file)
+
+
+def write_instanced_assembly(part_file, count, output_file, name=None, gap_ratio=0.25):
+    """
+    Write a STEP assembly holding `count` instances of one part.
+
+    The part is added once as a shared product; each instance is a located
+    reference to it. Instances are laid out side by side along X with a gap
+    of gap_ratio times the part width so they can be picked individually.
+
+    Args:
+        part_file: STEP file of the single part
+        count: Number of instances
+        output_file: Assembly STEP path
+        name: Product name (default: part file name)
+        gap_ratio: Spacing between instances as a fraction of part width
+
+    Returns:
+        str: Output file path
+    """
+    shape = read_step(part_file)
+    name = name or os.path.splitext(os.path.basename(str(part_file)))[0]
+
+    bbox = Bnd_Box()
+    brepbndlib.Add(shape, bbox)
+    xmin, _, _, xmax, _, _ = bbox.Get()
+    pitch = (xmax - xmin) * (1.0 + gap_ratio)
+
+    doc, shape_tool = new_assembly_document()
+    assembly_label = shape_tool.NewShape()
+    set_label_name(assembly_label, f"{name}_x{count}")
+    part_label = shape_tool.AddShape(shape, False)
+    set_label_name(part_label, name)
+
+    for i in range(count):
+        trsf = gp_Trsf()
+        trsf.SetTranslation(gp_Vec(i * pitch, 0, 0))
+        shape_tool.AddComponent(assembly_label, part_label, TopLoc_Location(trsf))
+
+    shape_tool.UpdateAssemblies()
+    return write_assembly_document(doc, output_file)
+
+
+# =============================================================================
+# FLANGE CONNECTION ASSEMBLY
+# All parts are modelled on the Z axis: flanges with the gasket face at +Z,
+# gasket/stud from z=0 up, nut with its washer face at the bottom.
+# =============================================================================
+
+def flange_connection_layout(nps, pressure_class, facing='RF', series='B16.5'):
+    """
+    Bolting layout of an ASME B16.5 / B16.47 flange joint from the
+    standards catalog joint index.
+
+    Args:
+        series: 'B16.5', 'B16.47-A' or 'B16.47-B'
+
+    Returns:
+        dict with 'num_bolts', 'bolt_circle_diameter' (mm),
+        'stud_length_mm', 'stud_diameter_inches', 'nut_size', or None
+    """
+    if series.startswith('B16.47'):
+        joint = get_joint('B16.47', nps, pressure_class, facing, series=series[-1])
+    else:
+        joint = get_joint('B16.5', nps, pressure_class, facing)
+    if not joint or not joint['flange']:
+        return None
+    stud_info = joint['stud']
+    return {
+        'num_bolts': stud_info['number_of_bolts'],
+        'bolt_circle_diameter': joint['flange']['bolt_circle_diameter'],
+        'stud_length_mm': stud_info['stud_length_mm'],
+        'stud_diameter_inches': stud_info['stud_diameter_inches'],
+        'nut_size': joint['nut_size'],
+    }
+
+
+def _z_range(shape):
+    bbox = Bnd_Box()
+    brepbndlib.Add(shape, bbox)
+    _, _, zmin, _, _, zmax = bbox.Get()
+    return zmin, zmax
+
+
+def _z_hits(shape, x, y):
+    """Sorted Z values where a line parallel to Z through (x, y) crosses the shape."""
+    intersector = IntCurvesFace_ShapeIntersector()
+    intersector.Load(shape, 1e-6)
+    intersector.Perform(gp_Lin(gp_Pnt(x, y, 0), gp_Dir(0, 0, 1)), -1e9, 1e9)
+    return sorted(intersector.Pnt(i).Z() for i in range(1, intersector.NbPnt() + 1))
+
+
+def flange_bolting_geometry(flange, bolt_circle_radius, num_bolts):
+    """
+    Find where a flange's bolt holes are and where its nuts seat.
+
+    Probes the bolt circle on the hole centreline and halfway between holes:
+    one passes through a hole, the other through the flange ring.
+
+    Returns:
+        (start_angle, z_back, z_face): angle of the first hole, Z of the
+        nut-seat (back) face of the ring, Z of the gasket face
+    """
+    _, z_face = _z_range(flange)
+    half_pitch = math.pi / num_bolts
+    for start_angle, probe_angle in ((0.0, half_pitch), (half_pitch, 0.0)):
+        hole_hits = _z_hits(flange, bolt_circle_radius * math.cos(start_angle),
+                            bolt_circle_radius * math.sin(start_angle))
+        ring_hits = _z_hits(flange, bolt_circle_radius * math.cos(probe_angle),
+                            bolt_circle_radius * math.sin(probe_angle))
+        if not hole_hits and ring_hits:
+            return start_angle, ring_hits[0], z_face
+
+    print("Warning: could not locate flange bolt holes, using bounding box")
+    z_min, _ = _z_range(flange)
+    return 0.0, z_min, z_face
+
+
+def _placement(x=0.0, y=0.0, z=0.0, flip=False):
+    """
+    Location moving an on-axis part to (x, y, z), optionally turned upside
+    down first (half turn about X, applied before the translation).
+    """
+    trsf = gp_Trsf()
+    trsf.SetTranslation(gp_Vec(x, y, z))
+    if flip:
+        rotation = gp_Trsf()
+        rotation.SetRotation(gp_Ax1(gp_Pnt(0, 0, 0), gp_Dir(1, 0, 0)), math.pi)
+        trsf.Multiply(rotation)
+    return TopLoc_Location(trsf)
+
+
+def write_flange_connection_assembly(flange_a_file, flange_b_file, gasket_file, stud_file, nut_file,
+                                     output_file, nps=None, pressure_class=None, facing='RF',
+                                     bolt_circle_diameter=None, num_bolts=None, name=None):
+    """
+    Write a complete bolted flange joint as one STEP assembly.
+
+    Flange A sits below the gasket with its face up, flange B is turned over
+    onto the gasket. Studs are patterned on the bolt circle, centred between
+    the two nut seats, with a nut on each end. Each part file is added once
+    and every stud/nut is a located reference to it.
+
+    Args:
+        flange_a_file, flange_b_file: Flange STEP files (may be the same file)
+        gasket_file, stud_file, nut_file: Part STEP files
+        output_file: Assembly STEP path
+        nps, pressure_class, facing: Look up the bolting layout
+            (flange_connection_layout) when bolt_circle_diameter/num_bolts
+            are not given
+        bolt_circle_diameter: Bolt circle (mm)
+        num_bolts: Number of studs
+        name: Assembly product name (default: output file name)
+
+    Returns:
+        str: Output file path
+    """
+    if bolt_circle_diameter is None or num_bolts is None:
+        layout = flange_connection_layout(nps, pressure_class, facing)
+        if not layout:
+            raise ValueError(f"No bolting data for NPS {nps} Class {pressure_class} {facing}")
+        bolt_circle_diameter = bolt_circle_diameter or layout['bolt_circle_diameter']
+        num_bolts = num_bolts or layout['num_bolts']
+    bc_radius = bolt_circle_diameter / 2.0
+    name = name or os.path.splitext(os.path.basename(str(output_file)))[0]
+
+    doc, shape_tool = new_assembly_document()
+    assembly_label = shape_tool.NewShape()
+    set_label_name(assembly_label, name)
+
+    # One product per distinct file - WN-to-WN shares a single flange
+    parts = {}
+
+    def part(path):
+        key = os.path.realpath(str(path))
+        if key not in parts:
+            shape = read_step(path)
+            label = shape_tool.AddShape(shape, False)
+            set_label_name(label, os.path.splitext(os.path.basename(str(path)))[0])
+            parts[key] = (shape, label)
+        return parts[key]
+
+    def add(path, location, component_name):
+        component = shape_tool.AddComponent(assembly_label, part(path)[1], location)
+        set_label_name(component, component_name)
+
+    flange_a, _ = part(flange_a_file)
+    flange_b, _ = part(flange_b_file)
+    gasket, _ = part(gasket_file)
+    stud, _ = part(stud_file)
+    nut, _ = part(nut_file)
+
+    # Gasket from z=0 to its thickness
+    gasket_bottom, gasket_top = _z_range(gasket)
+    gasket_thickness = gasket_top - gasket_bottom
+    add(gasket_file, _placement(z=-gasket_bottom), "Gasket")
+
+    # Flange A face up, face on the gasket bottom (z=0)
+    start_angle, a_back, a_face = flange_bolting_geometry(flange_a, bc_radius, num_bolts)
+    add(flange_a_file, _placement(z=-a_face), "Flange A")
+    z_seat_a = a_back - a_face
+
+    # Flange B turned over, face on the gasket top (z -> -z when flipped)
+    _, b_back, b_face = flange_bolting_geometry(flange_b, bc_radius, num_bolts)
+    add(flange_b_file, _placement(z=gasket_thickness + b_face, flip=True), "Flange B")
+    z_seat_b = gasket_thickness + b_face - b_back
+
+    # Studs centred between the nut seats, nuts washer face against each flange
+    stud_bottom, stud_top = _z_range(stud)
+    nut_bottom, _ = _z_range(nut)
+    stud_z = (z_seat_a + z_seat_b) / 2.0 - (stud_bottom + stud_top) / 2.0
+
+    for i in range(num_bolts):
+        angle = start_angle + 2.0 * math.pi * i / num_bolts
+        x, y = bc_radius * math.cos(angle), bc_radius * math.sin(angle)
+        add(stud_file, _placement(x, y, stud_z), f"Stud {i + 1}")
+        # Lower nut turned over so its washer face bears up against flange A
+        add(nut_file, _placement(x, y, z_seat_a + nut_bottom, flip=True), f"Nut {i + 1}A")
+        add(nut_file, _placement(x, y, z_seat_b - nut_bottom), f"Nut {i + 1}B")
+
+    shape_tool.UpdateAssemblies()
+    print(f"[SUCCESS] Flange connection assembly: {len(parts)} parts, "
+          f"{3 + 3 * num_bolts} instances -> {output_file}")
+    return write_assembly_document(doc, output_file)
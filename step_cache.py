@@ -0,0 +1,350 @@
+"""
+STEP Output Cache
+Content-addressed on-disk cache of generated STEP files.
+
+A cache key is the hash of:
+    - generator name ('generate_pipe.generate_pipe')
+    - generator source version (hash of the generator module, every local
+      module it imports - directly or through another local module - and
+      the standards data modules it reads dimensions from)
+    - normalized parameters (output location removed, floats rounded)
+
+On a hit the cached STEP is copied to the requested output path instead of
+re-running OCC. A copy, not a link: generators and CAD tools overwrite
+their output in place, which would rewrite a linked cache entry.
+
+Layout (safe for several worker processes at once - no shared index file):
+    ~/.equationparadise/step_cache/
+        ab/abcdef...step     cached STEP file
+        ab/abcdef...json     metadata (generator, module, filename, params)
+
+Last-use time is the STEP file's mtime, which drives LRU eviction once the
+cache grows past MAX_CACHE_BYTES. Each process scans the cache size once
+and then keeps a running total, so storing a part does not re-scan it.
+"""
+
+import os
+import sys
+import ast
+import json
+import shutil
+import hashlib
+import importlib.util
+from pathlib import Path
+
+CACHE_DIR = Path.home() / ".equationparadise" / "step_cache"
+MAX_CACHE_BYTES = 2 * 1024 ** 3  # 2 GB
+
+# Parameters that only say where to write the file - not part of the geometry
+OUTPUT_PARAMS = ('output_file', 'output_dir', 'output_path')
+
+# Dimension tables the generators read from. A change to any of these
+# changes the geometry, so they are part of every generator's version.
+DATA_MODULES = (
+    'flange_data',
+    'gasket_data',
+    'asme_b165_stud_data',
+    'api_6b_stud_data',
+    'api_6bx_stud_data',
+    'heavy_hex_nut_data',
+    'pipe_data_complete',
+)
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+
+_version_cache = {}
+_dependency_cache = {}
+
+# Running cache size of this process (None until the first scan)
+_cache_bytes = None
+
+
+def _local_source(module_name):
+    """Path of a module's source file in script_dir, or None (stdlib, OCC, missing)."""
+    path = os.path.join(script_dir, *module_name.split('.')) + ".py"
+    return path if os.path.isfile(path) else None
+
+
+def _module_source_hash(module_name):
+    """MD5 of a module's source file, or '' if it can't be found."""
+    if script_dir not in sys.path:
+        sys.path.insert(0, script_dir)
+    try:
+        spec = importlib.util.find_spec(module_name)
+    except (ImportError, ValueError):
+        spec = None
+    if spec is None or not spec.origin or not os.path.isfile(spec.origin):
+        return ''
+    with open(spec.origin, 'rb') as f:
+        return hashlib.md5(f.read()).hexdigest()
+
+
+def _imported_names(path):
+    """Top-level names of every module a source file imports (function-level imports too)."""
+    try:
+        with open(path, 'rb') as f:
+            tree = ast.parse(f.read(), filename=path)
+    except (OSError, SyntaxError, ValueError):
+        return set()
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names.add(node.module)
+    return names
+
+
+def dependencies(module_name):
+    """
+    The local modules a generator depends on: itself plus everything it
+    imports from script_dir, transitively (bolt_pattern, step_writer,
+    standards_catalog, nps_key ...). Memoized per process.
+    """
+    if module_name not in _dependency_cache:
+        found = set()
+        pending = [module_name]
+        while pending:
+            name = pending.pop()
+            path = _local_source(name)
+            if name in found or path is None:
+                continue
+            found.add(name)
+            pending.extend(_imported_names(path) - found)
+        found.add(module_name)
+        _dependency_cache[module_name] = tuple(sorted(found))
+    return _dependency_cache[module_name]
+
+
+def source_version(module_name):
+    """
+    Version string for a generator module: hash of its own source, its
+    local imports and the shared data modules. Memoized per process.
+    """
+    if module_name not in _version_cache:
+        digest = hashlib.md5()
+        for name in sorted(set(dependencies(module_name)) | set(DATA_MODULES)):
+            digest.update(f"{name}:{_module_source_hash(name)};".encode('utf-8'))
+        _version_cache[module_name] = digest.hexdigest()
+    return _version_cache[module_name]
+
+
+def _normalize(value):
+    """Make parameters hash-stable (round floats, sort dicts, stringify paths)."""
+    if isinstance(value, bool) or value is None:
+        return value
+    if isinstance(value, float):
+        value = round(value, 6)
+        return int(value) if value.is_integer() else value
+    if isinstance(value, (int, str)):
+        return value
+    if isinstance(value, dict):
+        return {str(k): _normalize(v) for k, v in sorted(value.items(), key=lambda kv: str(kv[0]))}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value]
+    return str(value)
+
+
+def normalize_params(kwargs):
+    """Generator kwargs without output-location parameters, hash-stable."""
+    return _normalize({k: v for k, v in kwargs.items() if k not in OUTPUT_PARAMS})
+
+
+def make_key(module_name, function_name, kwargs):
+    """Cache key for one generator call."""
+    payload = {
+        'generator': f"{module_name}.{function_name}",
+        'version': source_version(module_name),
+        'params': normalize_params(kwargs),
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def _entry_paths(key):
+    folder = CACHE_DIR / key[:2]
+    return folder / f"{key}.step", folder / f"{key}.json"
+
+
+def _place(src, dest):
+    """Copy src to dest. Never a link - an in-place save of dest would rewrite the cache entry."""
+    dest = Path(dest)
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    if dest.exists():
+        dest.unlink()  # may be a hard link placed by an older version
+    shutil.copy2(src, dest)
+
+
+def lookup(key, output_file=None, output_dir=None):
+    """
+    Place a cached STEP at the requested location.
+
+    Args:
+        key: Cache key from make_key
+        output_file: Exact destination path, or
+        output_dir: Destination folder (file keeps the generator's own name)
+
+    Returns:
+        str: Path of the placed file, or None on a cache miss
+    """
+    step_path, meta_path = _entry_paths(key)
+    if not step_path.exists():
+        return None
+
+    if output_file:
+        dest = Path(output_file)
+    else:
+        try:
+            with open(meta_path, 'r') as f:
+                filename = json.load(f)['filename']
+        except Exception:
+            return None
+        dest = Path(output_dir or os.getcwd()) / filename
+
+    try:
+        _place(step_path, dest)
+        os.utime(step_path)  # mark as recently used
+    except OSError:
+        return None
+    return str(dest)
+
+
+def store(key, module_name, function_name, kwargs, produced_file):
+    """
+    Add a freshly generated STEP to the cache. Failures are ignored - the
+    cache must never break generation.
+    """
+    produced_file = Path(produced_file)
+    if not produced_file.is_file():
+        return False
+
+    step_path, meta_path = _entry_paths(key)
+    try:
+        step_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write under a temp name then rename, so a concurrent reader never
+        # sees a half-written file
+        tmp_step = step_path.with_suffix(f".{os.getpid()}.tmp")
+        shutil.copy2(produced_file, tmp_step)
+        os.replace(tmp_step, step_path)
+        meta = {
+            'generator': f"{module_name}.{function_name}",
+            'module': module_name,
+            'filename': produced_file.name,
+            'params': normalize_params(kwargs),
+        }
+        tmp_meta = meta_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_meta, 'w') as f:
+            json.dump(meta, f, indent=2)
+        os.replace(tmp_meta, meta_path)
+    except Exception as e:
+        print(f"[Cache] Could not store {produced_file.name}: {e}")
+        return False
+
+    if _add_bytes(produced_file.stat().st_size) > MAX_CACHE_BYTES:
+        evict()
+    return True
+
+
+def _add_bytes(size):
+    """Running cache size after adding size bytes - scans the cache only the first time."""
+    global _cache_bytes
+    if _cache_bytes is None:
+        _cache_bytes = sum(entry_size for _, entry_size, _ in _entries())  # includes the new file
+    else:
+        _cache_bytes += size
+    return _cache_bytes
+
+
+def _entries():
+    """All cached STEP files as (path, size, last_used)."""
+    entries = []
+    if not CACHE_DIR.exists():
+        return entries
+    for step_path in CACHE_DIR.glob("*/*.step"):
+        try:
+            st = step_path.stat()
+        except OSError:
+            continue
+        entries.append((step_path, st.st_size, st.st_mtime))
+    return entries
+
+
+def _remove(step_path):
+    for path in (step_path, step_path.with_suffix('.json')):
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+
+def evict(max_bytes=None):
+    """Delete least recently used entries until the cache fits in max_bytes."""
+    global _cache_bytes
+    max_bytes = MAX_CACHE_BYTES if max_bytes is None else max_bytes
+    entries = _entries()
+    total = sum(size for _, size, _ in entries)
+    _cache_bytes = total
+    if total <= max_bytes:
+        return 0
+
+    removed = 0
+    for step_path, size, _ in sorted(entries, key=lambda e: e[2]):
+        if total <= max_bytes:
+            break
+        _remove(step_path)
+        total -= size
+        removed += 1
+    _cache_bytes = total
+    return removed
+
+
+def invalidate_module(module_name):
+    """
+    Drop every entry produced by a generator module or by a generator that
+    imports it. Updating a data module clears the whole cache since every
+    generator depends on it.
+    """
+    global _cache_bytes
+    _version_cache.clear()
+    _dependency_cache.clear()
+    _cache_bytes = None
+    if module_name in DATA_MODULES:
+        return clear()
+
+    removed = 0
+    for step_path, _, _ in _entries():
+        try:
+            with open(step_path.with_suffix('.json'), 'r') as f:
+                owner = json.load(f).get('module')
+        except Exception:
+            owner = None
+        # Entries without readable metadata are dropped too
+        if owner is None or module_name in dependencies(owner):
+            _remove(step_path)
+            removed += 1
+    return removed
+
+
+def clear():
+    """Delete the whole cache."""
+    global _cache_bytes
+    _cache_bytes = None
+    count = len(_entries())
+    if CACHE_DIR.exists():
+        shutil.rmtree(CACHE_DIR, ignore_errors=True)
+    return count
+
+
+def stats():
+    """Entry count and total size in bytes."""
+    entries = _entries()
+    return {'entries': len(entries), 'bytes': sum(size for _, size, _ in entries), 'path': str(CACHE_DIR)}
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == 'clear':
+        print(f"Removed {clear()} cached STEP files")
+    else:
+        info = stats()
+        print(f"STEP cache: {info['path']}")
+        print(f"  {info['entries']} files, {info['bytes'] / 1024 ** 2:.1f} MB "
+              f"(limit {MAX_CACHE_BYTES / 1024 ** 2:.0f} MB)")
@@ -0,0 +1,111 @@
+"""
+STEP Writer - pythonocc
+Per-job STEP unit and schema for shape export.
+
+write.step.unit and write.step.schema are Interface_Static settings - one
+value for the whole process. When every generator sets them at import time,
+whichever module was imported last decides the unit of every file written
+afterwards, so pipe (IN) and flange (MM) jobs cannot share a process.
+
+StepWriteContext holds the unit and schema of one write and applies them
+under a process-wide lock around STEPControl_Writer Transfer/Write, then
+restores the previous values. Generators of any unit can run interleaved in
+one long-lived worker process, or in threads.
+
+    status = write_step(shape, "Pipe.step", unit="IN")
+
+    with StepWriteContext("MM", "AP214"):
+        ...  # any other exporter that reads Interface_Static
+"""
+
+import threading
+from OCC.Core.STEPControl import STEPControl_Writer, STEPControl_AsIs
+from OCC.Core.Interface import Interface_Static
+
+# Interface_Static is global to the process, so all STEP writes share one lock.
+# Re-entrant so a context can wrap a helper that opens its own.
+_write_lock = threading.RLock()
+
+
+class StepWriteContext:
+    """
+    STEP unit and schema for one write.
+
+    Args:
+        unit: 'IN', 'MM', ... (None leaves the session default)
+        schema: 'AP214', 'AP203', ... (None leaves the session default)
+    """
+
+    def __init__(self, unit=None, schema=None):
+        self.unit = unit
+        self.schema = schema
+        self._saved = []
+
+    def _apply(self, name, value):
+        if value is None:
+            return
+        self._saved.append((name, Interface_Static.CVal(name)))
+        Interface_Static.SetCVal(name, value)
+
+    def __enter__(self):
+        _write_lock.acquire()
+        try:
+            self._saved = []
+            self._apply("write.step.unit", self.unit)
+            self._apply("write.step.schema", self.schema)
+        except Exception:
+            _write_lock.release()
+            raise
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            for name, value in reversed(self._saved):
+                Interface_Static.SetCVal(name, value)
+            self._saved = []
+        finally:
+            _write_lock.release()
+        return False
+
+    def write(self, shape, output_file, mode=STEPControl_AsIs):
+        """
+        Transfer and write one shape.
+
+        Returns:
+            IFSelect_ReturnStatus from STEPControl_Writer.Write
+        """
+        with self:
+            writer = STEPControl_Writer()
+            writer.Transfer(shape, mode)
+            return writer.Write(str(output_file))
+
+    def write_document(self, doc, output_file, name_mode=True):
+        """
+        Transfer and write an XCAF document (assemblies with names).
+
+        Returns:
+            IFSelect_ReturnStatus from STEPCAFControl_Writer.Write
+        """
+        from OCC.Core.STEPCAFControl import STEPCAFControl_Writer
+
+        with self:
+            writer = STEPCAFControl_Writer()
+            writer.SetNameMode(name_mode)
+            writer.Transfer(doc, STEPControl_AsIs)
+            return writer.Write(str(output_file))
+
+
+def write_step(shape, output_file, unit=None, schema=None):
+    """
+    Write a shape to STEP in the given unit and schema.
+
+    Args:
+        shape: TopoDS_Shape
+        output_file: Output path
+        unit: 'IN', 'MM', ... (None = session default)
+        schema: 'AP214', 'AP203', ... (None = session default)
+
+    Returns:
+        IFSelect_ReturnStatus (IFSelect_RetDone on success)
+    """
+    return StepWriteContext(unit, schema).write(shape, output_file)